@@ -10,7 +10,7 @@ from VirtualBox_types import *
 import urlparse, types
 from pyremotevbox.ZSI.TCcompound import ComplexType, Struct
 from pyremotevbox.ZSI import client
-from pyremotevbox.ZSI.schema import GED, GTD
+from pyremotevbox.ZSI.schema import GED, GTD, LazyPyclass
 from pyremotevbox.ZSI.generate.pyclass import pyclass_type
 
 # Locator
@@ -11610,4634 +11610,4634 @@ class vboxBindingSOAP:
         response = self.binding.Receive(INATNetworkPortForwardEvent_getGuestPortResultMsg.typecode)
         return response
 
-IVirtualBoxErrorInfo_getResultCodeRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultCode").pyclass
+IVirtualBoxErrorInfo_getResultCodeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultCode")
 
-IVirtualBoxErrorInfo_getResultCodeResultMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultCodeResponse").pyclass
+IVirtualBoxErrorInfo_getResultCodeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultCodeResponse")
 
-IVirtualBoxErrorInfo_getResultDetailRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultDetail").pyclass
+IVirtualBoxErrorInfo_getResultDetailRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultDetail")
 
-IVirtualBoxErrorInfo_getResultDetailResultMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultDetailResponse").pyclass
+IVirtualBoxErrorInfo_getResultDetailResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getResultDetailResponse")
 
-IVirtualBoxErrorInfo_getInterfaceIDRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getInterfaceID").pyclass
+IVirtualBoxErrorInfo_getInterfaceIDRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getInterfaceID")
 
-IVirtualBoxErrorInfo_getInterfaceIDResultMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getInterfaceIDResponse").pyclass
+IVirtualBoxErrorInfo_getInterfaceIDResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getInterfaceIDResponse")
 
-IVirtualBoxErrorInfo_getComponentRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getComponent").pyclass
+IVirtualBoxErrorInfo_getComponentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getComponent")
 
-IVirtualBoxErrorInfo_getComponentResultMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getComponentResponse").pyclass
+IVirtualBoxErrorInfo_getComponentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getComponentResponse")
 
-IVirtualBoxErrorInfo_getTextRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getText").pyclass
+IVirtualBoxErrorInfo_getTextRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getText")
 
-IVirtualBoxErrorInfo_getTextResultMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getTextResponse").pyclass
+IVirtualBoxErrorInfo_getTextResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getTextResponse")
 
-IVirtualBoxErrorInfo_getNextRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getNext").pyclass
+IVirtualBoxErrorInfo_getNextRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getNext")
 
-IVirtualBoxErrorInfo_getNextResultMsg = GED("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getNextResponse").pyclass
+IVirtualBoxErrorInfo_getNextResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBoxErrorInfo_getNextResponse")
 
-INATNetwork_getNetworkNameRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getNetworkName").pyclass
+INATNetwork_getNetworkNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getNetworkName")
 
-INATNetwork_getNetworkNameResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getNetworkNameResponse").pyclass
+INATNetwork_getNetworkNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getNetworkNameResponse")
 
-INATNetwork_setNetworkNameRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setNetworkName").pyclass
+INATNetwork_setNetworkNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setNetworkName")
 
-INATNetwork_setNetworkNameResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setNetworkNameResponse").pyclass
+INATNetwork_setNetworkNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setNetworkNameResponse")
 
-INATNetwork_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getEnabled").pyclass
+INATNetwork_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getEnabled")
 
-INATNetwork_getEnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getEnabledResponse").pyclass
+INATNetwork_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getEnabledResponse")
 
-INATNetwork_setEnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setEnabled").pyclass
+INATNetwork_setEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setEnabled")
 
-INATNetwork_setEnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setEnabledResponse").pyclass
+INATNetwork_setEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setEnabledResponse")
 
-INATNetwork_getNetworkRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getNetwork").pyclass
+INATNetwork_getNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getNetwork")
 
-INATNetwork_getNetworkResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getNetworkResponse").pyclass
+INATNetwork_getNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getNetworkResponse")
 
-INATNetwork_setNetworkRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setNetwork").pyclass
+INATNetwork_setNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setNetwork")
 
-INATNetwork_setNetworkResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setNetworkResponse").pyclass
+INATNetwork_setNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setNetworkResponse")
 
-INATNetwork_getGatewayRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getGateway").pyclass
+INATNetwork_getGatewayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getGateway")
 
-INATNetwork_getGatewayResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getGatewayResponse").pyclass
+INATNetwork_getGatewayResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getGatewayResponse")
 
-INATNetwork_getIPv6EnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getIPv6Enabled").pyclass
+INATNetwork_getIPv6EnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getIPv6Enabled")
 
-INATNetwork_getIPv6EnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getIPv6EnabledResponse").pyclass
+INATNetwork_getIPv6EnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getIPv6EnabledResponse")
 
-INATNetwork_setIPv6EnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setIPv6Enabled").pyclass
+INATNetwork_setIPv6EnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setIPv6Enabled")
 
-INATNetwork_setIPv6EnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setIPv6EnabledResponse").pyclass
+INATNetwork_setIPv6EnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setIPv6EnabledResponse")
 
-INATNetwork_getIPv6PrefixRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getIPv6Prefix").pyclass
+INATNetwork_getIPv6PrefixRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getIPv6Prefix")
 
-INATNetwork_getIPv6PrefixResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getIPv6PrefixResponse").pyclass
+INATNetwork_getIPv6PrefixResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getIPv6PrefixResponse")
 
-INATNetwork_setIPv6PrefixRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setIPv6Prefix").pyclass
+INATNetwork_setIPv6PrefixRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setIPv6Prefix")
 
-INATNetwork_setIPv6PrefixResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setIPv6PrefixResponse").pyclass
+INATNetwork_setIPv6PrefixResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setIPv6PrefixResponse")
 
-INATNetwork_getAdvertiseDefaultIPv6RouteEnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getAdvertiseDefaultIPv6RouteEnabled").pyclass
+INATNetwork_getAdvertiseDefaultIPv6RouteEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getAdvertiseDefaultIPv6RouteEnabled")
 
-INATNetwork_getAdvertiseDefaultIPv6RouteEnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getAdvertiseDefaultIPv6RouteEnabledResponse").pyclass
+INATNetwork_getAdvertiseDefaultIPv6RouteEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getAdvertiseDefaultIPv6RouteEnabledResponse")
 
-INATNetwork_setAdvertiseDefaultIPv6RouteEnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setAdvertiseDefaultIPv6RouteEnabled").pyclass
+INATNetwork_setAdvertiseDefaultIPv6RouteEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setAdvertiseDefaultIPv6RouteEnabled")
 
-INATNetwork_setAdvertiseDefaultIPv6RouteEnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setAdvertiseDefaultIPv6RouteEnabledResponse").pyclass
+INATNetwork_setAdvertiseDefaultIPv6RouteEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setAdvertiseDefaultIPv6RouteEnabledResponse")
 
-INATNetwork_getNeedDhcpServerRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getNeedDhcpServer").pyclass
+INATNetwork_getNeedDhcpServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getNeedDhcpServer")
 
-INATNetwork_getNeedDhcpServerResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getNeedDhcpServerResponse").pyclass
+INATNetwork_getNeedDhcpServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getNeedDhcpServerResponse")
 
-INATNetwork_setNeedDhcpServerRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setNeedDhcpServer").pyclass
+INATNetwork_setNeedDhcpServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setNeedDhcpServer")
 
-INATNetwork_setNeedDhcpServerResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setNeedDhcpServerResponse").pyclass
+INATNetwork_setNeedDhcpServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setNeedDhcpServerResponse")
 
-INATNetwork_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getEventSource").pyclass
+INATNetwork_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getEventSource")
 
-INATNetwork_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getEventSourceResponse").pyclass
+INATNetwork_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getEventSourceResponse")
 
-INATNetwork_getPortForwardRules4RequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules4").pyclass
+INATNetwork_getPortForwardRules4RequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules4")
 
-INATNetwork_getPortForwardRules4ResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules4Response").pyclass
+INATNetwork_getPortForwardRules4ResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules4Response")
 
-INATNetwork_getLocalMappingsRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getLocalMappings").pyclass
+INATNetwork_getLocalMappingsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getLocalMappings")
 
-INATNetwork_getLocalMappingsResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getLocalMappingsResponse").pyclass
+INATNetwork_getLocalMappingsResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getLocalMappingsResponse")
 
-INATNetwork_getLoopbackIp6RequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getLoopbackIp6").pyclass
+INATNetwork_getLoopbackIp6RequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getLoopbackIp6")
 
-INATNetwork_getLoopbackIp6ResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getLoopbackIp6Response").pyclass
+INATNetwork_getLoopbackIp6ResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getLoopbackIp6Response")
 
-INATNetwork_setLoopbackIp6RequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_setLoopbackIp6").pyclass
+INATNetwork_setLoopbackIp6RequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setLoopbackIp6")
 
-INATNetwork_setLoopbackIp6ResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_setLoopbackIp6Response").pyclass
+INATNetwork_setLoopbackIp6ResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_setLoopbackIp6Response")
 
-INATNetwork_getPortForwardRules6RequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules6").pyclass
+INATNetwork_getPortForwardRules6RequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules6")
 
-INATNetwork_getPortForwardRules6ResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules6Response").pyclass
+INATNetwork_getPortForwardRules6ResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_getPortForwardRules6Response")
 
-INATNetwork_addLocalMappingRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_addLocalMapping").pyclass
+INATNetwork_addLocalMappingRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_addLocalMapping")
 
-INATNetwork_addLocalMappingResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_addLocalMappingResponse").pyclass
+INATNetwork_addLocalMappingResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_addLocalMappingResponse")
 
-INATNetwork_addPortForwardRuleRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_addPortForwardRule").pyclass
+INATNetwork_addPortForwardRuleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_addPortForwardRule")
 
-INATNetwork_addPortForwardRuleResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_addPortForwardRuleResponse").pyclass
+INATNetwork_addPortForwardRuleResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_addPortForwardRuleResponse")
 
-INATNetwork_removePortForwardRuleRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_removePortForwardRule").pyclass
+INATNetwork_removePortForwardRuleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_removePortForwardRule")
 
-INATNetwork_removePortForwardRuleResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_removePortForwardRuleResponse").pyclass
+INATNetwork_removePortForwardRuleResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_removePortForwardRuleResponse")
 
-INATNetwork_startRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_start").pyclass
+INATNetwork_startRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_start")
 
-INATNetwork_startResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_startResponse").pyclass
+INATNetwork_startResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_startResponse")
 
-INATNetwork_stopRequestMsg = GED("http://www.virtualbox.org/", "INATNetwork_stop").pyclass
+INATNetwork_stopRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_stop")
 
-INATNetwork_stopResultMsg = GED("http://www.virtualbox.org/", "INATNetwork_stopResponse").pyclass
+INATNetwork_stopResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetwork_stopResponse")
 
-IDHCPServer_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getEventSource").pyclass
+IDHCPServer_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getEventSource")
 
-IDHCPServer_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getEventSourceResponse").pyclass
+IDHCPServer_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getEventSourceResponse")
 
-IDHCPServer_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getEnabled").pyclass
+IDHCPServer_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getEnabled")
 
-IDHCPServer_getEnabledResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getEnabledResponse").pyclass
+IDHCPServer_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getEnabledResponse")
 
-IDHCPServer_setEnabledRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_setEnabled").pyclass
+IDHCPServer_setEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_setEnabled")
 
-IDHCPServer_setEnabledResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_setEnabledResponse").pyclass
+IDHCPServer_setEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_setEnabledResponse")
 
-IDHCPServer_getIPAddressRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getIPAddress").pyclass
+IDHCPServer_getIPAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getIPAddress")
 
-IDHCPServer_getIPAddressResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getIPAddressResponse").pyclass
+IDHCPServer_getIPAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getIPAddressResponse")
 
-IDHCPServer_getNetworkMaskRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getNetworkMask").pyclass
+IDHCPServer_getNetworkMaskRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getNetworkMask")
 
-IDHCPServer_getNetworkMaskResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getNetworkMaskResponse").pyclass
+IDHCPServer_getNetworkMaskResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getNetworkMaskResponse")
 
-IDHCPServer_getNetworkNameRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getNetworkName").pyclass
+IDHCPServer_getNetworkNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getNetworkName")
 
-IDHCPServer_getNetworkNameResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getNetworkNameResponse").pyclass
+IDHCPServer_getNetworkNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getNetworkNameResponse")
 
-IDHCPServer_getLowerIPRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getLowerIP").pyclass
+IDHCPServer_getLowerIPRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getLowerIP")
 
-IDHCPServer_getLowerIPResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getLowerIPResponse").pyclass
+IDHCPServer_getLowerIPResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getLowerIPResponse")
 
-IDHCPServer_getUpperIPRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getUpperIP").pyclass
+IDHCPServer_getUpperIPRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getUpperIP")
 
-IDHCPServer_getUpperIPResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getUpperIPResponse").pyclass
+IDHCPServer_getUpperIPResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getUpperIPResponse")
 
-IDHCPServer_getGlobalOptionsRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getGlobalOptions").pyclass
+IDHCPServer_getGlobalOptionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getGlobalOptions")
 
-IDHCPServer_getGlobalOptionsResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getGlobalOptionsResponse").pyclass
+IDHCPServer_getGlobalOptionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getGlobalOptionsResponse")
 
-IDHCPServer_getVmConfigsRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getVmConfigs").pyclass
+IDHCPServer_getVmConfigsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getVmConfigs")
 
-IDHCPServer_getVmConfigsResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getVmConfigsResponse").pyclass
+IDHCPServer_getVmConfigsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getVmConfigsResponse")
 
-IDHCPServer_addGlobalOptionRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_addGlobalOption").pyclass
+IDHCPServer_addGlobalOptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_addGlobalOption")
 
-IDHCPServer_addGlobalOptionResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_addGlobalOptionResponse").pyclass
+IDHCPServer_addGlobalOptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_addGlobalOptionResponse")
 
-IDHCPServer_addVmSlotOptionRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_addVmSlotOption").pyclass
+IDHCPServer_addVmSlotOptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_addVmSlotOption")
 
-IDHCPServer_addVmSlotOptionResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_addVmSlotOptionResponse").pyclass
+IDHCPServer_addVmSlotOptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_addVmSlotOptionResponse")
 
-IDHCPServer_removeVmSlotOptionsRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_removeVmSlotOptions").pyclass
+IDHCPServer_removeVmSlotOptionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_removeVmSlotOptions")
 
-IDHCPServer_removeVmSlotOptionsResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_removeVmSlotOptionsResponse").pyclass
+IDHCPServer_removeVmSlotOptionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_removeVmSlotOptionsResponse")
 
-IDHCPServer_getVmSlotOptionsRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getVmSlotOptions").pyclass
+IDHCPServer_getVmSlotOptionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getVmSlotOptions")
 
-IDHCPServer_getVmSlotOptionsResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getVmSlotOptionsResponse").pyclass
+IDHCPServer_getVmSlotOptionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getVmSlotOptionsResponse")
 
-IDHCPServer_getMacOptionsRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getMacOptions").pyclass
+IDHCPServer_getMacOptionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getMacOptions")
 
-IDHCPServer_getMacOptionsResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_getMacOptionsResponse").pyclass
+IDHCPServer_getMacOptionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_getMacOptionsResponse")
 
-IDHCPServer_setConfigurationRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_setConfiguration").pyclass
+IDHCPServer_setConfigurationRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_setConfiguration")
 
-IDHCPServer_setConfigurationResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_setConfigurationResponse").pyclass
+IDHCPServer_setConfigurationResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_setConfigurationResponse")
 
-IDHCPServer_startRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_start").pyclass
+IDHCPServer_startRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_start")
 
-IDHCPServer_startResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_startResponse").pyclass
+IDHCPServer_startResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_startResponse")
 
-IDHCPServer_stopRequestMsg = GED("http://www.virtualbox.org/", "IDHCPServer_stop").pyclass
+IDHCPServer_stopRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_stop")
 
-IDHCPServer_stopResultMsg = GED("http://www.virtualbox.org/", "IDHCPServer_stopResponse").pyclass
+IDHCPServer_stopResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDHCPServer_stopResponse")
 
-IVirtualBox_getVersionRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getVersion").pyclass
+IVirtualBox_getVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getVersion")
 
-IVirtualBox_getVersionResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getVersionResponse").pyclass
+IVirtualBox_getVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getVersionResponse")
 
-IVirtualBox_getVersionNormalizedRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getVersionNormalized").pyclass
+IVirtualBox_getVersionNormalizedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getVersionNormalized")
 
-IVirtualBox_getVersionNormalizedResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getVersionNormalizedResponse").pyclass
+IVirtualBox_getVersionNormalizedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getVersionNormalizedResponse")
 
-IVirtualBox_getRevisionRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getRevision").pyclass
+IVirtualBox_getRevisionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getRevision")
 
-IVirtualBox_getRevisionResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getRevisionResponse").pyclass
+IVirtualBox_getRevisionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getRevisionResponse")
 
-IVirtualBox_getPackageTypeRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getPackageType").pyclass
+IVirtualBox_getPackageTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getPackageType")
 
-IVirtualBox_getPackageTypeResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getPackageTypeResponse").pyclass
+IVirtualBox_getPackageTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getPackageTypeResponse")
 
-IVirtualBox_getAPIVersionRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getAPIVersion").pyclass
+IVirtualBox_getAPIVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getAPIVersion")
 
-IVirtualBox_getAPIVersionResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getAPIVersionResponse").pyclass
+IVirtualBox_getAPIVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getAPIVersionResponse")
 
-IVirtualBox_getHomeFolderRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getHomeFolder").pyclass
+IVirtualBox_getHomeFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getHomeFolder")
 
-IVirtualBox_getHomeFolderResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getHomeFolderResponse").pyclass
+IVirtualBox_getHomeFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getHomeFolderResponse")
 
-IVirtualBox_getSettingsFilePathRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getSettingsFilePath").pyclass
+IVirtualBox_getSettingsFilePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getSettingsFilePath")
 
-IVirtualBox_getSettingsFilePathResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getSettingsFilePathResponse").pyclass
+IVirtualBox_getSettingsFilePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getSettingsFilePathResponse")
 
-IVirtualBox_getHostRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getHost").pyclass
+IVirtualBox_getHostRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getHost")
 
-IVirtualBox_getHostResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getHostResponse").pyclass
+IVirtualBox_getHostResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getHostResponse")
 
-IVirtualBox_getSystemPropertiesRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getSystemProperties").pyclass
+IVirtualBox_getSystemPropertiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getSystemProperties")
 
-IVirtualBox_getSystemPropertiesResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getSystemPropertiesResponse").pyclass
+IVirtualBox_getSystemPropertiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getSystemPropertiesResponse")
 
-IVirtualBox_getMachinesRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachines").pyclass
+IVirtualBox_getMachinesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachines")
 
-IVirtualBox_getMachinesResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachinesResponse").pyclass
+IVirtualBox_getMachinesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachinesResponse")
 
-IVirtualBox_getMachineGroupsRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachineGroups").pyclass
+IVirtualBox_getMachineGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachineGroups")
 
-IVirtualBox_getMachineGroupsResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachineGroupsResponse").pyclass
+IVirtualBox_getMachineGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachineGroupsResponse")
 
-IVirtualBox_getHardDisksRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getHardDisks").pyclass
+IVirtualBox_getHardDisksRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getHardDisks")
 
-IVirtualBox_getHardDisksResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getHardDisksResponse").pyclass
+IVirtualBox_getHardDisksResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getHardDisksResponse")
 
-IVirtualBox_getDVDImagesRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getDVDImages").pyclass
+IVirtualBox_getDVDImagesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getDVDImages")
 
-IVirtualBox_getDVDImagesResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getDVDImagesResponse").pyclass
+IVirtualBox_getDVDImagesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getDVDImagesResponse")
 
-IVirtualBox_getFloppyImagesRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getFloppyImages").pyclass
+IVirtualBox_getFloppyImagesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getFloppyImages")
 
-IVirtualBox_getFloppyImagesResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getFloppyImagesResponse").pyclass
+IVirtualBox_getFloppyImagesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getFloppyImagesResponse")
 
-IVirtualBox_getProgressOperationsRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getProgressOperations").pyclass
+IVirtualBox_getProgressOperationsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getProgressOperations")
 
-IVirtualBox_getProgressOperationsResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getProgressOperationsResponse").pyclass
+IVirtualBox_getProgressOperationsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getProgressOperationsResponse")
 
-IVirtualBox_getGuestOSTypesRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getGuestOSTypes").pyclass
+IVirtualBox_getGuestOSTypesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getGuestOSTypes")
 
-IVirtualBox_getGuestOSTypesResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getGuestOSTypesResponse").pyclass
+IVirtualBox_getGuestOSTypesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getGuestOSTypesResponse")
 
-IVirtualBox_getSharedFoldersRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getSharedFolders").pyclass
+IVirtualBox_getSharedFoldersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getSharedFolders")
 
-IVirtualBox_getSharedFoldersResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getSharedFoldersResponse").pyclass
+IVirtualBox_getSharedFoldersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getSharedFoldersResponse")
 
-IVirtualBox_getPerformanceCollectorRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getPerformanceCollector").pyclass
+IVirtualBox_getPerformanceCollectorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getPerformanceCollector")
 
-IVirtualBox_getPerformanceCollectorResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getPerformanceCollectorResponse").pyclass
+IVirtualBox_getPerformanceCollectorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getPerformanceCollectorResponse")
 
-IVirtualBox_getDHCPServersRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getDHCPServers").pyclass
+IVirtualBox_getDHCPServersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getDHCPServers")
 
-IVirtualBox_getDHCPServersResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getDHCPServersResponse").pyclass
+IVirtualBox_getDHCPServersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getDHCPServersResponse")
 
-IVirtualBox_getNATNetworksRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getNATNetworks").pyclass
+IVirtualBox_getNATNetworksRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getNATNetworks")
 
-IVirtualBox_getNATNetworksResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getNATNetworksResponse").pyclass
+IVirtualBox_getNATNetworksResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getNATNetworksResponse")
 
-IVirtualBox_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getEventSource").pyclass
+IVirtualBox_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getEventSource")
 
-IVirtualBox_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getEventSourceResponse").pyclass
+IVirtualBox_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getEventSourceResponse")
 
-IVirtualBox_getInternalNetworksRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getInternalNetworks").pyclass
+IVirtualBox_getInternalNetworksRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getInternalNetworks")
 
-IVirtualBox_getInternalNetworksResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getInternalNetworksResponse").pyclass
+IVirtualBox_getInternalNetworksResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getInternalNetworksResponse")
 
-IVirtualBox_getGenericNetworkDriversRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getGenericNetworkDrivers").pyclass
+IVirtualBox_getGenericNetworkDriversRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getGenericNetworkDrivers")
 
-IVirtualBox_getGenericNetworkDriversResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getGenericNetworkDriversResponse").pyclass
+IVirtualBox_getGenericNetworkDriversResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getGenericNetworkDriversResponse")
 
-IVirtualBox_composeMachineFilenameRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_composeMachineFilename").pyclass
+IVirtualBox_composeMachineFilenameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_composeMachineFilename")
 
-IVirtualBox_composeMachineFilenameResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_composeMachineFilenameResponse").pyclass
+IVirtualBox_composeMachineFilenameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_composeMachineFilenameResponse")
 
-IVirtualBox_createMachineRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createMachine").pyclass
+IVirtualBox_createMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createMachine")
 
-IVirtualBox_createMachineResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createMachineResponse").pyclass
+IVirtualBox_createMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createMachineResponse")
 
-IVirtualBox_openMachineRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_openMachine").pyclass
+IVirtualBox_openMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_openMachine")
 
-IVirtualBox_openMachineResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_openMachineResponse").pyclass
+IVirtualBox_openMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_openMachineResponse")
 
-IVirtualBox_registerMachineRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_registerMachine").pyclass
+IVirtualBox_registerMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_registerMachine")
 
-IVirtualBox_registerMachineResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_registerMachineResponse").pyclass
+IVirtualBox_registerMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_registerMachineResponse")
 
-IVirtualBox_findMachineRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_findMachine").pyclass
+IVirtualBox_findMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_findMachine")
 
-IVirtualBox_findMachineResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_findMachineResponse").pyclass
+IVirtualBox_findMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_findMachineResponse")
 
-IVirtualBox_getMachinesByGroupsRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachinesByGroups").pyclass
+IVirtualBox_getMachinesByGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachinesByGroups")
 
-IVirtualBox_getMachinesByGroupsResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachinesByGroupsResponse").pyclass
+IVirtualBox_getMachinesByGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachinesByGroupsResponse")
 
-IVirtualBox_getMachineStatesRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachineStates").pyclass
+IVirtualBox_getMachineStatesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachineStates")
 
-IVirtualBox_getMachineStatesResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getMachineStatesResponse").pyclass
+IVirtualBox_getMachineStatesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getMachineStatesResponse")
 
-IVirtualBox_createApplianceRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createAppliance").pyclass
+IVirtualBox_createApplianceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createAppliance")
 
-IVirtualBox_createApplianceResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createApplianceResponse").pyclass
+IVirtualBox_createApplianceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createApplianceResponse")
 
-IVirtualBox_createHardDiskRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createHardDisk").pyclass
+IVirtualBox_createHardDiskRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createHardDisk")
 
-IVirtualBox_createHardDiskResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createHardDiskResponse").pyclass
+IVirtualBox_createHardDiskResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createHardDiskResponse")
 
-IVirtualBox_openMediumRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_openMedium").pyclass
+IVirtualBox_openMediumRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_openMedium")
 
-IVirtualBox_openMediumResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_openMediumResponse").pyclass
+IVirtualBox_openMediumResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_openMediumResponse")
 
-IVirtualBox_getGuestOSTypeRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getGuestOSType").pyclass
+IVirtualBox_getGuestOSTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getGuestOSType")
 
-IVirtualBox_getGuestOSTypeResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getGuestOSTypeResponse").pyclass
+IVirtualBox_getGuestOSTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getGuestOSTypeResponse")
 
-IVirtualBox_createSharedFolderRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createSharedFolder").pyclass
+IVirtualBox_createSharedFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createSharedFolder")
 
-IVirtualBox_createSharedFolderResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createSharedFolderResponse").pyclass
+IVirtualBox_createSharedFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createSharedFolderResponse")
 
-IVirtualBox_removeSharedFolderRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_removeSharedFolder").pyclass
+IVirtualBox_removeSharedFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_removeSharedFolder")
 
-IVirtualBox_removeSharedFolderResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_removeSharedFolderResponse").pyclass
+IVirtualBox_removeSharedFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_removeSharedFolderResponse")
 
-IVirtualBox_getExtraDataKeysRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getExtraDataKeys").pyclass
+IVirtualBox_getExtraDataKeysRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getExtraDataKeys")
 
-IVirtualBox_getExtraDataKeysResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getExtraDataKeysResponse").pyclass
+IVirtualBox_getExtraDataKeysResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getExtraDataKeysResponse")
 
-IVirtualBox_getExtraDataRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getExtraData").pyclass
+IVirtualBox_getExtraDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getExtraData")
 
-IVirtualBox_getExtraDataResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_getExtraDataResponse").pyclass
+IVirtualBox_getExtraDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_getExtraDataResponse")
 
-IVirtualBox_setExtraDataRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_setExtraData").pyclass
+IVirtualBox_setExtraDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_setExtraData")
 
-IVirtualBox_setExtraDataResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_setExtraDataResponse").pyclass
+IVirtualBox_setExtraDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_setExtraDataResponse")
 
-IVirtualBox_setSettingsSecretRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_setSettingsSecret").pyclass
+IVirtualBox_setSettingsSecretRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_setSettingsSecret")
 
-IVirtualBox_setSettingsSecretResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_setSettingsSecretResponse").pyclass
+IVirtualBox_setSettingsSecretResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_setSettingsSecretResponse")
 
-IVirtualBox_createDHCPServerRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createDHCPServer").pyclass
+IVirtualBox_createDHCPServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createDHCPServer")
 
-IVirtualBox_createDHCPServerResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createDHCPServerResponse").pyclass
+IVirtualBox_createDHCPServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createDHCPServerResponse")
 
-IVirtualBox_findDHCPServerByNetworkNameRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_findDHCPServerByNetworkName").pyclass
+IVirtualBox_findDHCPServerByNetworkNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_findDHCPServerByNetworkName")
 
-IVirtualBox_findDHCPServerByNetworkNameResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_findDHCPServerByNetworkNameResponse").pyclass
+IVirtualBox_findDHCPServerByNetworkNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_findDHCPServerByNetworkNameResponse")
 
-IVirtualBox_removeDHCPServerRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_removeDHCPServer").pyclass
+IVirtualBox_removeDHCPServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_removeDHCPServer")
 
-IVirtualBox_removeDHCPServerResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_removeDHCPServerResponse").pyclass
+IVirtualBox_removeDHCPServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_removeDHCPServerResponse")
 
-IVirtualBox_createNATNetworkRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createNATNetwork").pyclass
+IVirtualBox_createNATNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createNATNetwork")
 
-IVirtualBox_createNATNetworkResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_createNATNetworkResponse").pyclass
+IVirtualBox_createNATNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_createNATNetworkResponse")
 
-IVirtualBox_findNATNetworkByNameRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_findNATNetworkByName").pyclass
+IVirtualBox_findNATNetworkByNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_findNATNetworkByName")
 
-IVirtualBox_findNATNetworkByNameResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_findNATNetworkByNameResponse").pyclass
+IVirtualBox_findNATNetworkByNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_findNATNetworkByNameResponse")
 
-IVirtualBox_removeNATNetworkRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_removeNATNetwork").pyclass
+IVirtualBox_removeNATNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_removeNATNetwork")
 
-IVirtualBox_removeNATNetworkResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_removeNATNetworkResponse").pyclass
+IVirtualBox_removeNATNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_removeNATNetworkResponse")
 
-IVirtualBox_checkFirmwarePresentRequestMsg = GED("http://www.virtualbox.org/", "IVirtualBox_checkFirmwarePresent").pyclass
+IVirtualBox_checkFirmwarePresentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_checkFirmwarePresent")
 
-IVirtualBox_checkFirmwarePresentResultMsg = GED("http://www.virtualbox.org/", "IVirtualBox_checkFirmwarePresentResponse").pyclass
+IVirtualBox_checkFirmwarePresentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualBox_checkFirmwarePresentResponse")
 
-IVFSExplorer_getPathRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_getPath").pyclass
+IVFSExplorer_getPathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_getPath")
 
-IVFSExplorer_getPathResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_getPathResponse").pyclass
+IVFSExplorer_getPathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_getPathResponse")
 
-IVFSExplorer_getTypeRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_getType").pyclass
+IVFSExplorer_getTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_getType")
 
-IVFSExplorer_getTypeResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_getTypeResponse").pyclass
+IVFSExplorer_getTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_getTypeResponse")
 
-IVFSExplorer_updateRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_update").pyclass
+IVFSExplorer_updateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_update")
 
-IVFSExplorer_updateResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_updateResponse").pyclass
+IVFSExplorer_updateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_updateResponse")
 
-IVFSExplorer_cdRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_cd").pyclass
+IVFSExplorer_cdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_cd")
 
-IVFSExplorer_cdResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_cdResponse").pyclass
+IVFSExplorer_cdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_cdResponse")
 
-IVFSExplorer_cdUpRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_cdUp").pyclass
+IVFSExplorer_cdUpRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_cdUp")
 
-IVFSExplorer_cdUpResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_cdUpResponse").pyclass
+IVFSExplorer_cdUpResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_cdUpResponse")
 
-IVFSExplorer_entryListRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_entryList").pyclass
+IVFSExplorer_entryListRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_entryList")
 
-IVFSExplorer_entryListResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_entryListResponse").pyclass
+IVFSExplorer_entryListResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_entryListResponse")
 
-IVFSExplorer_existsRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_exists").pyclass
+IVFSExplorer_existsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_exists")
 
-IVFSExplorer_existsResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_existsResponse").pyclass
+IVFSExplorer_existsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_existsResponse")
 
-IVFSExplorer_removeRequestMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_remove").pyclass
+IVFSExplorer_removeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_remove")
 
-IVFSExplorer_removeResultMsg = GED("http://www.virtualbox.org/", "IVFSExplorer_removeResponse").pyclass
+IVFSExplorer_removeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVFSExplorer_removeResponse")
 
-IAppliance_getPathRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_getPath").pyclass
+IAppliance_getPathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getPath")
 
-IAppliance_getPathResultMsg = GED("http://www.virtualbox.org/", "IAppliance_getPathResponse").pyclass
+IAppliance_getPathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getPathResponse")
 
-IAppliance_getDisksRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_getDisks").pyclass
+IAppliance_getDisksRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getDisks")
 
-IAppliance_getDisksResultMsg = GED("http://www.virtualbox.org/", "IAppliance_getDisksResponse").pyclass
+IAppliance_getDisksResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getDisksResponse")
 
-IAppliance_getVirtualSystemDescriptionsRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_getVirtualSystemDescriptions").pyclass
+IAppliance_getVirtualSystemDescriptionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getVirtualSystemDescriptions")
 
-IAppliance_getVirtualSystemDescriptionsResultMsg = GED("http://www.virtualbox.org/", "IAppliance_getVirtualSystemDescriptionsResponse").pyclass
+IAppliance_getVirtualSystemDescriptionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getVirtualSystemDescriptionsResponse")
 
-IAppliance_getMachinesRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_getMachines").pyclass
+IAppliance_getMachinesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getMachines")
 
-IAppliance_getMachinesResultMsg = GED("http://www.virtualbox.org/", "IAppliance_getMachinesResponse").pyclass
+IAppliance_getMachinesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getMachinesResponse")
 
-IAppliance_readRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_read").pyclass
+IAppliance_readRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_read")
 
-IAppliance_readResultMsg = GED("http://www.virtualbox.org/", "IAppliance_readResponse").pyclass
+IAppliance_readResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_readResponse")
 
-IAppliance_interpretRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_interpret").pyclass
+IAppliance_interpretRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_interpret")
 
-IAppliance_interpretResultMsg = GED("http://www.virtualbox.org/", "IAppliance_interpretResponse").pyclass
+IAppliance_interpretResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_interpretResponse")
 
-IAppliance_importMachinesRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_importMachines").pyclass
+IAppliance_importMachinesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_importMachines")
 
-IAppliance_importMachinesResultMsg = GED("http://www.virtualbox.org/", "IAppliance_importMachinesResponse").pyclass
+IAppliance_importMachinesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_importMachinesResponse")
 
-IAppliance_createVFSExplorerRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_createVFSExplorer").pyclass
+IAppliance_createVFSExplorerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_createVFSExplorer")
 
-IAppliance_createVFSExplorerResultMsg = GED("http://www.virtualbox.org/", "IAppliance_createVFSExplorerResponse").pyclass
+IAppliance_createVFSExplorerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_createVFSExplorerResponse")
 
-IAppliance_writeRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_write").pyclass
+IAppliance_writeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_write")
 
-IAppliance_writeResultMsg = GED("http://www.virtualbox.org/", "IAppliance_writeResponse").pyclass
+IAppliance_writeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_writeResponse")
 
-IAppliance_getWarningsRequestMsg = GED("http://www.virtualbox.org/", "IAppliance_getWarnings").pyclass
+IAppliance_getWarningsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getWarnings")
 
-IAppliance_getWarningsResultMsg = GED("http://www.virtualbox.org/", "IAppliance_getWarningsResponse").pyclass
+IAppliance_getWarningsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAppliance_getWarningsResponse")
 
-IVirtualSystemDescription_getCountRequestMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getCount").pyclass
+IVirtualSystemDescription_getCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getCount")
 
-IVirtualSystemDescription_getCountResultMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getCountResponse").pyclass
+IVirtualSystemDescription_getCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getCountResponse")
 
-IVirtualSystemDescription_getDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescription").pyclass
+IVirtualSystemDescription_getDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescription")
 
-IVirtualSystemDescription_getDescriptionResultMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescriptionResponse").pyclass
+IVirtualSystemDescription_getDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescriptionResponse")
 
-IVirtualSystemDescription_getDescriptionByTypeRequestMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescriptionByType").pyclass
+IVirtualSystemDescription_getDescriptionByTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescriptionByType")
 
-IVirtualSystemDescription_getDescriptionByTypeResultMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescriptionByTypeResponse").pyclass
+IVirtualSystemDescription_getDescriptionByTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getDescriptionByTypeResponse")
 
-IVirtualSystemDescription_getValuesByTypeRequestMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getValuesByType").pyclass
+IVirtualSystemDescription_getValuesByTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getValuesByType")
 
-IVirtualSystemDescription_getValuesByTypeResultMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_getValuesByTypeResponse").pyclass
+IVirtualSystemDescription_getValuesByTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_getValuesByTypeResponse")
 
-IVirtualSystemDescription_setFinalValuesRequestMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_setFinalValues").pyclass
+IVirtualSystemDescription_setFinalValuesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_setFinalValues")
 
-IVirtualSystemDescription_setFinalValuesResultMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_setFinalValuesResponse").pyclass
+IVirtualSystemDescription_setFinalValuesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_setFinalValuesResponse")
 
-IVirtualSystemDescription_addDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_addDescription").pyclass
+IVirtualSystemDescription_addDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_addDescription")
 
-IVirtualSystemDescription_addDescriptionResultMsg = GED("http://www.virtualbox.org/", "IVirtualSystemDescription_addDescriptionResponse").pyclass
+IVirtualSystemDescription_addDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVirtualSystemDescription_addDescriptionResponse")
 
-IBIOSSettings_getLogoFadeInRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeIn").pyclass
+IBIOSSettings_getLogoFadeInRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeIn")
 
-IBIOSSettings_getLogoFadeInResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeInResponse").pyclass
+IBIOSSettings_getLogoFadeInResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeInResponse")
 
-IBIOSSettings_setLogoFadeInRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeIn").pyclass
+IBIOSSettings_setLogoFadeInRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeIn")
 
-IBIOSSettings_setLogoFadeInResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeInResponse").pyclass
+IBIOSSettings_setLogoFadeInResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeInResponse")
 
-IBIOSSettings_getLogoFadeOutRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeOut").pyclass
+IBIOSSettings_getLogoFadeOutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeOut")
 
-IBIOSSettings_getLogoFadeOutResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeOutResponse").pyclass
+IBIOSSettings_getLogoFadeOutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoFadeOutResponse")
 
-IBIOSSettings_setLogoFadeOutRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeOut").pyclass
+IBIOSSettings_setLogoFadeOutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeOut")
 
-IBIOSSettings_setLogoFadeOutResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeOutResponse").pyclass
+IBIOSSettings_setLogoFadeOutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoFadeOutResponse")
 
-IBIOSSettings_getLogoDisplayTimeRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoDisplayTime").pyclass
+IBIOSSettings_getLogoDisplayTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoDisplayTime")
 
-IBIOSSettings_getLogoDisplayTimeResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoDisplayTimeResponse").pyclass
+IBIOSSettings_getLogoDisplayTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoDisplayTimeResponse")
 
-IBIOSSettings_setLogoDisplayTimeRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoDisplayTime").pyclass
+IBIOSSettings_setLogoDisplayTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoDisplayTime")
 
-IBIOSSettings_setLogoDisplayTimeResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoDisplayTimeResponse").pyclass
+IBIOSSettings_setLogoDisplayTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoDisplayTimeResponse")
 
-IBIOSSettings_getLogoImagePathRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoImagePath").pyclass
+IBIOSSettings_getLogoImagePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoImagePath")
 
-IBIOSSettings_getLogoImagePathResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getLogoImagePathResponse").pyclass
+IBIOSSettings_getLogoImagePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getLogoImagePathResponse")
 
-IBIOSSettings_setLogoImagePathRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoImagePath").pyclass
+IBIOSSettings_setLogoImagePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoImagePath")
 
-IBIOSSettings_setLogoImagePathResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setLogoImagePathResponse").pyclass
+IBIOSSettings_setLogoImagePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setLogoImagePathResponse")
 
-IBIOSSettings_getBootMenuModeRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getBootMenuMode").pyclass
+IBIOSSettings_getBootMenuModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getBootMenuMode")
 
-IBIOSSettings_getBootMenuModeResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getBootMenuModeResponse").pyclass
+IBIOSSettings_getBootMenuModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getBootMenuModeResponse")
 
-IBIOSSettings_setBootMenuModeRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setBootMenuMode").pyclass
+IBIOSSettings_setBootMenuModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setBootMenuMode")
 
-IBIOSSettings_setBootMenuModeResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setBootMenuModeResponse").pyclass
+IBIOSSettings_setBootMenuModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setBootMenuModeResponse")
 
-IBIOSSettings_getACPIEnabledRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getACPIEnabled").pyclass
+IBIOSSettings_getACPIEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getACPIEnabled")
 
-IBIOSSettings_getACPIEnabledResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getACPIEnabledResponse").pyclass
+IBIOSSettings_getACPIEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getACPIEnabledResponse")
 
-IBIOSSettings_setACPIEnabledRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setACPIEnabled").pyclass
+IBIOSSettings_setACPIEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setACPIEnabled")
 
-IBIOSSettings_setACPIEnabledResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setACPIEnabledResponse").pyclass
+IBIOSSettings_setACPIEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setACPIEnabledResponse")
 
-IBIOSSettings_getIOAPICEnabledRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getIOAPICEnabled").pyclass
+IBIOSSettings_getIOAPICEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getIOAPICEnabled")
 
-IBIOSSettings_getIOAPICEnabledResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getIOAPICEnabledResponse").pyclass
+IBIOSSettings_getIOAPICEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getIOAPICEnabledResponse")
 
-IBIOSSettings_setIOAPICEnabledRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setIOAPICEnabled").pyclass
+IBIOSSettings_setIOAPICEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setIOAPICEnabled")
 
-IBIOSSettings_setIOAPICEnabledResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setIOAPICEnabledResponse").pyclass
+IBIOSSettings_setIOAPICEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setIOAPICEnabledResponse")
 
-IBIOSSettings_getTimeOffsetRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getTimeOffset").pyclass
+IBIOSSettings_getTimeOffsetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getTimeOffset")
 
-IBIOSSettings_getTimeOffsetResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getTimeOffsetResponse").pyclass
+IBIOSSettings_getTimeOffsetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getTimeOffsetResponse")
 
-IBIOSSettings_setTimeOffsetRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setTimeOffset").pyclass
+IBIOSSettings_setTimeOffsetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setTimeOffset")
 
-IBIOSSettings_setTimeOffsetResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setTimeOffsetResponse").pyclass
+IBIOSSettings_setTimeOffsetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setTimeOffsetResponse")
 
-IBIOSSettings_getPXEDebugEnabledRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getPXEDebugEnabled").pyclass
+IBIOSSettings_getPXEDebugEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getPXEDebugEnabled")
 
-IBIOSSettings_getPXEDebugEnabledResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getPXEDebugEnabledResponse").pyclass
+IBIOSSettings_getPXEDebugEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getPXEDebugEnabledResponse")
 
-IBIOSSettings_setPXEDebugEnabledRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setPXEDebugEnabled").pyclass
+IBIOSSettings_setPXEDebugEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setPXEDebugEnabled")
 
-IBIOSSettings_setPXEDebugEnabledResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_setPXEDebugEnabledResponse").pyclass
+IBIOSSettings_setPXEDebugEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_setPXEDebugEnabledResponse")
 
-IBIOSSettings_getNonVolatileStorageFileRequestMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getNonVolatileStorageFile").pyclass
+IBIOSSettings_getNonVolatileStorageFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getNonVolatileStorageFile")
 
-IBIOSSettings_getNonVolatileStorageFileResultMsg = GED("http://www.virtualbox.org/", "IBIOSSettings_getNonVolatileStorageFileResponse").pyclass
+IBIOSSettings_getNonVolatileStorageFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBIOSSettings_getNonVolatileStorageFileResponse")
 
-IPCIAddress_getBusRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_getBus").pyclass
+IPCIAddress_getBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_getBus")
 
-IPCIAddress_getBusResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_getBusResponse").pyclass
+IPCIAddress_getBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_getBusResponse")
 
-IPCIAddress_setBusRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_setBus").pyclass
+IPCIAddress_setBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_setBus")
 
-IPCIAddress_setBusResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_setBusResponse").pyclass
+IPCIAddress_setBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_setBusResponse")
 
-IPCIAddress_getDeviceRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_getDevice").pyclass
+IPCIAddress_getDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_getDevice")
 
-IPCIAddress_getDeviceResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_getDeviceResponse").pyclass
+IPCIAddress_getDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_getDeviceResponse")
 
-IPCIAddress_setDeviceRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_setDevice").pyclass
+IPCIAddress_setDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_setDevice")
 
-IPCIAddress_setDeviceResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_setDeviceResponse").pyclass
+IPCIAddress_setDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_setDeviceResponse")
 
-IPCIAddress_getDevFunctionRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_getDevFunction").pyclass
+IPCIAddress_getDevFunctionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_getDevFunction")
 
-IPCIAddress_getDevFunctionResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_getDevFunctionResponse").pyclass
+IPCIAddress_getDevFunctionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_getDevFunctionResponse")
 
-IPCIAddress_setDevFunctionRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_setDevFunction").pyclass
+IPCIAddress_setDevFunctionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_setDevFunction")
 
-IPCIAddress_setDevFunctionResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_setDevFunctionResponse").pyclass
+IPCIAddress_setDevFunctionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_setDevFunctionResponse")
 
-IPCIAddress_asLongRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_asLong").pyclass
+IPCIAddress_asLongRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_asLong")
 
-IPCIAddress_asLongResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_asLongResponse").pyclass
+IPCIAddress_asLongResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_asLongResponse")
 
-IPCIAddress_fromLongRequestMsg = GED("http://www.virtualbox.org/", "IPCIAddress_fromLong").pyclass
+IPCIAddress_fromLongRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_fromLong")
 
-IPCIAddress_fromLongResultMsg = GED("http://www.virtualbox.org/", "IPCIAddress_fromLongResponse").pyclass
+IPCIAddress_fromLongResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPCIAddress_fromLongResponse")
 
-IMachine_getParentRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getParent").pyclass
+IMachine_getParentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getParent")
 
-IMachine_getParentResultMsg = GED("http://www.virtualbox.org/", "IMachine_getParentResponse").pyclass
+IMachine_getParentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getParentResponse")
 
-IMachine_getIconRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getIcon").pyclass
+IMachine_getIconRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getIcon")
 
-IMachine_getIconResultMsg = GED("http://www.virtualbox.org/", "IMachine_getIconResponse").pyclass
+IMachine_getIconResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getIconResponse")
 
-IMachine_setIconRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setIcon").pyclass
+IMachine_setIconRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setIcon")
 
-IMachine_setIconResultMsg = GED("http://www.virtualbox.org/", "IMachine_setIconResponse").pyclass
+IMachine_setIconResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setIconResponse")
 
-IMachine_getAccessibleRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAccessible").pyclass
+IMachine_getAccessibleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccessible")
 
-IMachine_getAccessibleResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAccessibleResponse").pyclass
+IMachine_getAccessibleResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccessibleResponse")
 
-IMachine_getAccessErrorRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAccessError").pyclass
+IMachine_getAccessErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccessError")
 
-IMachine_getAccessErrorResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAccessErrorResponse").pyclass
+IMachine_getAccessErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccessErrorResponse")
 
-IMachine_getNameRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getName").pyclass
+IMachine_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getName")
 
-IMachine_getNameResultMsg = GED("http://www.virtualbox.org/", "IMachine_getNameResponse").pyclass
+IMachine_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getNameResponse")
 
-IMachine_setNameRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setName").pyclass
+IMachine_setNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setName")
 
-IMachine_setNameResultMsg = GED("http://www.virtualbox.org/", "IMachine_setNameResponse").pyclass
+IMachine_setNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setNameResponse")
 
-IMachine_getDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getDescription").pyclass
+IMachine_getDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getDescription")
 
-IMachine_getDescriptionResultMsg = GED("http://www.virtualbox.org/", "IMachine_getDescriptionResponse").pyclass
+IMachine_getDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getDescriptionResponse")
 
-IMachine_setDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setDescription").pyclass
+IMachine_setDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setDescription")
 
-IMachine_setDescriptionResultMsg = GED("http://www.virtualbox.org/", "IMachine_setDescriptionResponse").pyclass
+IMachine_setDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setDescriptionResponse")
 
-IMachine_getIdRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getId").pyclass
+IMachine_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getId")
 
-IMachine_getIdResultMsg = GED("http://www.virtualbox.org/", "IMachine_getIdResponse").pyclass
+IMachine_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getIdResponse")
 
-IMachine_getGroupsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getGroups").pyclass
+IMachine_getGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGroups")
 
-IMachine_getGroupsResultMsg = GED("http://www.virtualbox.org/", "IMachine_getGroupsResponse").pyclass
+IMachine_getGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGroupsResponse")
 
-IMachine_setGroupsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setGroups").pyclass
+IMachine_setGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGroups")
 
-IMachine_setGroupsResultMsg = GED("http://www.virtualbox.org/", "IMachine_setGroupsResponse").pyclass
+IMachine_setGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGroupsResponse")
 
-IMachine_getOSTypeIdRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getOSTypeId").pyclass
+IMachine_getOSTypeIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getOSTypeId")
 
-IMachine_getOSTypeIdResultMsg = GED("http://www.virtualbox.org/", "IMachine_getOSTypeIdResponse").pyclass
+IMachine_getOSTypeIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getOSTypeIdResponse")
 
-IMachine_setOSTypeIdRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setOSTypeId").pyclass
+IMachine_setOSTypeIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setOSTypeId")
 
-IMachine_setOSTypeIdResultMsg = GED("http://www.virtualbox.org/", "IMachine_setOSTypeIdResponse").pyclass
+IMachine_setOSTypeIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setOSTypeIdResponse")
 
-IMachine_getHardwareVersionRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getHardwareVersion").pyclass
+IMachine_getHardwareVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHardwareVersion")
 
-IMachine_getHardwareVersionResultMsg = GED("http://www.virtualbox.org/", "IMachine_getHardwareVersionResponse").pyclass
+IMachine_getHardwareVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHardwareVersionResponse")
 
-IMachine_setHardwareVersionRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setHardwareVersion").pyclass
+IMachine_setHardwareVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHardwareVersion")
 
-IMachine_setHardwareVersionResultMsg = GED("http://www.virtualbox.org/", "IMachine_setHardwareVersionResponse").pyclass
+IMachine_setHardwareVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHardwareVersionResponse")
 
-IMachine_getHardwareUUIDRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getHardwareUUID").pyclass
+IMachine_getHardwareUUIDRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHardwareUUID")
 
-IMachine_getHardwareUUIDResultMsg = GED("http://www.virtualbox.org/", "IMachine_getHardwareUUIDResponse").pyclass
+IMachine_getHardwareUUIDResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHardwareUUIDResponse")
 
-IMachine_setHardwareUUIDRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setHardwareUUID").pyclass
+IMachine_setHardwareUUIDRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHardwareUUID")
 
-IMachine_setHardwareUUIDResultMsg = GED("http://www.virtualbox.org/", "IMachine_setHardwareUUIDResponse").pyclass
+IMachine_setHardwareUUIDResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHardwareUUIDResponse")
 
-IMachine_getCPUCountRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUCount").pyclass
+IMachine_getCPUCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUCount")
 
-IMachine_getCPUCountResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUCountResponse").pyclass
+IMachine_getCPUCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUCountResponse")
 
-IMachine_setCPUCountRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUCount").pyclass
+IMachine_setCPUCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUCount")
 
-IMachine_setCPUCountResultMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUCountResponse").pyclass
+IMachine_setCPUCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUCountResponse")
 
-IMachine_getCPUHotPlugEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUHotPlugEnabled").pyclass
+IMachine_getCPUHotPlugEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUHotPlugEnabled")
 
-IMachine_getCPUHotPlugEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUHotPlugEnabledResponse").pyclass
+IMachine_getCPUHotPlugEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUHotPlugEnabledResponse")
 
-IMachine_setCPUHotPlugEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUHotPlugEnabled").pyclass
+IMachine_setCPUHotPlugEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUHotPlugEnabled")
 
-IMachine_setCPUHotPlugEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUHotPlugEnabledResponse").pyclass
+IMachine_setCPUHotPlugEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUHotPlugEnabledResponse")
 
-IMachine_getCPUExecutionCapRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUExecutionCap").pyclass
+IMachine_getCPUExecutionCapRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUExecutionCap")
 
-IMachine_getCPUExecutionCapResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUExecutionCapResponse").pyclass
+IMachine_getCPUExecutionCapResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUExecutionCapResponse")
 
-IMachine_setCPUExecutionCapRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUExecutionCap").pyclass
+IMachine_setCPUExecutionCapRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUExecutionCap")
 
-IMachine_setCPUExecutionCapResultMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUExecutionCapResponse").pyclass
+IMachine_setCPUExecutionCapResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUExecutionCapResponse")
 
-IMachine_getMemorySizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getMemorySize").pyclass
+IMachine_getMemorySizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMemorySize")
 
-IMachine_getMemorySizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getMemorySizeResponse").pyclass
+IMachine_getMemorySizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMemorySizeResponse")
 
-IMachine_setMemorySizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setMemorySize").pyclass
+IMachine_setMemorySizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setMemorySize")
 
-IMachine_setMemorySizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setMemorySizeResponse").pyclass
+IMachine_setMemorySizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setMemorySizeResponse")
 
-IMachine_getMemoryBalloonSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getMemoryBalloonSize").pyclass
+IMachine_getMemoryBalloonSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMemoryBalloonSize")
 
-IMachine_getMemoryBalloonSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getMemoryBalloonSizeResponse").pyclass
+IMachine_getMemoryBalloonSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMemoryBalloonSizeResponse")
 
-IMachine_setMemoryBalloonSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setMemoryBalloonSize").pyclass
+IMachine_setMemoryBalloonSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setMemoryBalloonSize")
 
-IMachine_setMemoryBalloonSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setMemoryBalloonSizeResponse").pyclass
+IMachine_setMemoryBalloonSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setMemoryBalloonSizeResponse")
 
-IMachine_getPageFusionEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getPageFusionEnabled").pyclass
+IMachine_getPageFusionEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getPageFusionEnabled")
 
-IMachine_getPageFusionEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getPageFusionEnabledResponse").pyclass
+IMachine_getPageFusionEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getPageFusionEnabledResponse")
 
-IMachine_setPageFusionEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setPageFusionEnabled").pyclass
+IMachine_setPageFusionEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setPageFusionEnabled")
 
-IMachine_setPageFusionEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setPageFusionEnabledResponse").pyclass
+IMachine_setPageFusionEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setPageFusionEnabledResponse")
 
-IMachine_getGraphicsControllerTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getGraphicsControllerType").pyclass
+IMachine_getGraphicsControllerTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGraphicsControllerType")
 
-IMachine_getGraphicsControllerTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getGraphicsControllerTypeResponse").pyclass
+IMachine_getGraphicsControllerTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGraphicsControllerTypeResponse")
 
-IMachine_setGraphicsControllerTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setGraphicsControllerType").pyclass
+IMachine_setGraphicsControllerTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGraphicsControllerType")
 
-IMachine_setGraphicsControllerTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setGraphicsControllerTypeResponse").pyclass
+IMachine_setGraphicsControllerTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGraphicsControllerTypeResponse")
 
-IMachine_getVRAMSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVRAMSize").pyclass
+IMachine_getVRAMSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVRAMSize")
 
-IMachine_getVRAMSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVRAMSizeResponse").pyclass
+IMachine_getVRAMSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVRAMSizeResponse")
 
-IMachine_setVRAMSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVRAMSize").pyclass
+IMachine_setVRAMSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVRAMSize")
 
-IMachine_setVRAMSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVRAMSizeResponse").pyclass
+IMachine_setVRAMSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVRAMSizeResponse")
 
-IMachine_getAccelerate3DEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAccelerate3DEnabled").pyclass
+IMachine_getAccelerate3DEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccelerate3DEnabled")
 
-IMachine_getAccelerate3DEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAccelerate3DEnabledResponse").pyclass
+IMachine_getAccelerate3DEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccelerate3DEnabledResponse")
 
-IMachine_setAccelerate3DEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setAccelerate3DEnabled").pyclass
+IMachine_setAccelerate3DEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAccelerate3DEnabled")
 
-IMachine_setAccelerate3DEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setAccelerate3DEnabledResponse").pyclass
+IMachine_setAccelerate3DEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAccelerate3DEnabledResponse")
 
-IMachine_getAccelerate2DVideoEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAccelerate2DVideoEnabled").pyclass
+IMachine_getAccelerate2DVideoEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccelerate2DVideoEnabled")
 
-IMachine_getAccelerate2DVideoEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAccelerate2DVideoEnabledResponse").pyclass
+IMachine_getAccelerate2DVideoEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAccelerate2DVideoEnabledResponse")
 
-IMachine_setAccelerate2DVideoEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setAccelerate2DVideoEnabled").pyclass
+IMachine_setAccelerate2DVideoEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAccelerate2DVideoEnabled")
 
-IMachine_setAccelerate2DVideoEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setAccelerate2DVideoEnabledResponse").pyclass
+IMachine_setAccelerate2DVideoEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAccelerate2DVideoEnabledResponse")
 
-IMachine_getMonitorCountRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getMonitorCount").pyclass
+IMachine_getMonitorCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMonitorCount")
 
-IMachine_getMonitorCountResultMsg = GED("http://www.virtualbox.org/", "IMachine_getMonitorCountResponse").pyclass
+IMachine_getMonitorCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMonitorCountResponse")
 
-IMachine_setMonitorCountRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setMonitorCount").pyclass
+IMachine_setMonitorCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setMonitorCount")
 
-IMachine_setMonitorCountResultMsg = GED("http://www.virtualbox.org/", "IMachine_setMonitorCountResponse").pyclass
+IMachine_setMonitorCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setMonitorCountResponse")
 
-IMachine_getVideoCaptureEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureEnabled").pyclass
+IMachine_getVideoCaptureEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureEnabled")
 
-IMachine_getVideoCaptureEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureEnabledResponse").pyclass
+IMachine_getVideoCaptureEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureEnabledResponse")
 
-IMachine_setVideoCaptureEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureEnabled").pyclass
+IMachine_setVideoCaptureEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureEnabled")
 
-IMachine_setVideoCaptureEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureEnabledResponse").pyclass
+IMachine_setVideoCaptureEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureEnabledResponse")
 
-IMachine_getVideoCaptureScreensRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureScreens").pyclass
+IMachine_getVideoCaptureScreensRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureScreens")
 
-IMachine_getVideoCaptureScreensResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureScreensResponse").pyclass
+IMachine_getVideoCaptureScreensResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureScreensResponse")
 
-IMachine_setVideoCaptureScreensRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureScreens").pyclass
+IMachine_setVideoCaptureScreensRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureScreens")
 
-IMachine_setVideoCaptureScreensResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureScreensResponse").pyclass
+IMachine_setVideoCaptureScreensResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureScreensResponse")
 
-IMachine_getVideoCaptureFileRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureFile").pyclass
+IMachine_getVideoCaptureFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureFile")
 
-IMachine_getVideoCaptureFileResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureFileResponse").pyclass
+IMachine_getVideoCaptureFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureFileResponse")
 
-IMachine_setVideoCaptureFileRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureFile").pyclass
+IMachine_setVideoCaptureFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureFile")
 
-IMachine_setVideoCaptureFileResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureFileResponse").pyclass
+IMachine_setVideoCaptureFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureFileResponse")
 
-IMachine_getVideoCaptureWidthRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureWidth").pyclass
+IMachine_getVideoCaptureWidthRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureWidth")
 
-IMachine_getVideoCaptureWidthResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureWidthResponse").pyclass
+IMachine_getVideoCaptureWidthResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureWidthResponse")
 
-IMachine_setVideoCaptureWidthRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureWidth").pyclass
+IMachine_setVideoCaptureWidthRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureWidth")
 
-IMachine_setVideoCaptureWidthResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureWidthResponse").pyclass
+IMachine_setVideoCaptureWidthResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureWidthResponse")
 
-IMachine_getVideoCaptureHeightRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureHeight").pyclass
+IMachine_getVideoCaptureHeightRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureHeight")
 
-IMachine_getVideoCaptureHeightResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureHeightResponse").pyclass
+IMachine_getVideoCaptureHeightResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureHeightResponse")
 
-IMachine_setVideoCaptureHeightRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureHeight").pyclass
+IMachine_setVideoCaptureHeightRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureHeight")
 
-IMachine_setVideoCaptureHeightResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureHeightResponse").pyclass
+IMachine_setVideoCaptureHeightResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureHeightResponse")
 
-IMachine_getVideoCaptureRateRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureRate").pyclass
+IMachine_getVideoCaptureRateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureRate")
 
-IMachine_getVideoCaptureRateResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureRateResponse").pyclass
+IMachine_getVideoCaptureRateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureRateResponse")
 
-IMachine_setVideoCaptureRateRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureRate").pyclass
+IMachine_setVideoCaptureRateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureRate")
 
-IMachine_setVideoCaptureRateResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureRateResponse").pyclass
+IMachine_setVideoCaptureRateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureRateResponse")
 
-IMachine_getVideoCaptureFPSRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureFPS").pyclass
+IMachine_getVideoCaptureFPSRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureFPS")
 
-IMachine_getVideoCaptureFPSResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVideoCaptureFPSResponse").pyclass
+IMachine_getVideoCaptureFPSResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVideoCaptureFPSResponse")
 
-IMachine_setVideoCaptureFPSRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureFPS").pyclass
+IMachine_setVideoCaptureFPSRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureFPS")
 
-IMachine_setVideoCaptureFPSResultMsg = GED("http://www.virtualbox.org/", "IMachine_setVideoCaptureFPSResponse").pyclass
+IMachine_setVideoCaptureFPSResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setVideoCaptureFPSResponse")
 
-IMachine_getBIOSSettingsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getBIOSSettings").pyclass
+IMachine_getBIOSSettingsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getBIOSSettings")
 
-IMachine_getBIOSSettingsResultMsg = GED("http://www.virtualbox.org/", "IMachine_getBIOSSettingsResponse").pyclass
+IMachine_getBIOSSettingsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getBIOSSettingsResponse")
 
-IMachine_getFirmwareTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getFirmwareType").pyclass
+IMachine_getFirmwareTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFirmwareType")
 
-IMachine_getFirmwareTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getFirmwareTypeResponse").pyclass
+IMachine_getFirmwareTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFirmwareTypeResponse")
 
-IMachine_setFirmwareTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setFirmwareType").pyclass
+IMachine_setFirmwareTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFirmwareType")
 
-IMachine_setFirmwareTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setFirmwareTypeResponse").pyclass
+IMachine_setFirmwareTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFirmwareTypeResponse")
 
-IMachine_getPointingHIDTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getPointingHIDType").pyclass
+IMachine_getPointingHIDTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getPointingHIDType")
 
-IMachine_getPointingHIDTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getPointingHIDTypeResponse").pyclass
+IMachine_getPointingHIDTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getPointingHIDTypeResponse")
 
-IMachine_setPointingHIDTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setPointingHIDType").pyclass
+IMachine_setPointingHIDTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setPointingHIDType")
 
-IMachine_setPointingHIDTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setPointingHIDTypeResponse").pyclass
+IMachine_setPointingHIDTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setPointingHIDTypeResponse")
 
-IMachine_getKeyboardHIDTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getKeyboardHIDType").pyclass
+IMachine_getKeyboardHIDTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getKeyboardHIDType")
 
-IMachine_getKeyboardHIDTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getKeyboardHIDTypeResponse").pyclass
+IMachine_getKeyboardHIDTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getKeyboardHIDTypeResponse")
 
-IMachine_setKeyboardHIDTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setKeyboardHIDType").pyclass
+IMachine_setKeyboardHIDTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setKeyboardHIDType")
 
-IMachine_setKeyboardHIDTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setKeyboardHIDTypeResponse").pyclass
+IMachine_setKeyboardHIDTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setKeyboardHIDTypeResponse")
 
-IMachine_getHPETEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getHPETEnabled").pyclass
+IMachine_getHPETEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHPETEnabled")
 
-IMachine_getHPETEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getHPETEnabledResponse").pyclass
+IMachine_getHPETEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHPETEnabledResponse")
 
-IMachine_setHPETEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setHPETEnabled").pyclass
+IMachine_setHPETEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHPETEnabled")
 
-IMachine_setHPETEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setHPETEnabledResponse").pyclass
+IMachine_setHPETEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHPETEnabledResponse")
 
-IMachine_getChipsetTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getChipsetType").pyclass
+IMachine_getChipsetTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getChipsetType")
 
-IMachine_getChipsetTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getChipsetTypeResponse").pyclass
+IMachine_getChipsetTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getChipsetTypeResponse")
 
-IMachine_setChipsetTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setChipsetType").pyclass
+IMachine_setChipsetTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setChipsetType")
 
-IMachine_setChipsetTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setChipsetTypeResponse").pyclass
+IMachine_setChipsetTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setChipsetTypeResponse")
 
-IMachine_getSnapshotFolderRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSnapshotFolder").pyclass
+IMachine_getSnapshotFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSnapshotFolder")
 
-IMachine_getSnapshotFolderResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSnapshotFolderResponse").pyclass
+IMachine_getSnapshotFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSnapshotFolderResponse")
 
-IMachine_setSnapshotFolderRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setSnapshotFolder").pyclass
+IMachine_setSnapshotFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setSnapshotFolder")
 
-IMachine_setSnapshotFolderResultMsg = GED("http://www.virtualbox.org/", "IMachine_setSnapshotFolderResponse").pyclass
+IMachine_setSnapshotFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setSnapshotFolderResponse")
 
-IMachine_getVRDEServerRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getVRDEServer").pyclass
+IMachine_getVRDEServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVRDEServer")
 
-IMachine_getVRDEServerResultMsg = GED("http://www.virtualbox.org/", "IMachine_getVRDEServerResponse").pyclass
+IMachine_getVRDEServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getVRDEServerResponse")
 
-IMachine_getEmulatedUSBCardReaderEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getEmulatedUSBCardReaderEnabled").pyclass
+IMachine_getEmulatedUSBCardReaderEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getEmulatedUSBCardReaderEnabled")
 
-IMachine_getEmulatedUSBCardReaderEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getEmulatedUSBCardReaderEnabledResponse").pyclass
+IMachine_getEmulatedUSBCardReaderEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getEmulatedUSBCardReaderEnabledResponse")
 
-IMachine_setEmulatedUSBCardReaderEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setEmulatedUSBCardReaderEnabled").pyclass
+IMachine_setEmulatedUSBCardReaderEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setEmulatedUSBCardReaderEnabled")
 
-IMachine_setEmulatedUSBCardReaderEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setEmulatedUSBCardReaderEnabledResponse").pyclass
+IMachine_setEmulatedUSBCardReaderEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setEmulatedUSBCardReaderEnabledResponse")
 
-IMachine_getMediumAttachmentsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getMediumAttachments").pyclass
+IMachine_getMediumAttachmentsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMediumAttachments")
 
-IMachine_getMediumAttachmentsResultMsg = GED("http://www.virtualbox.org/", "IMachine_getMediumAttachmentsResponse").pyclass
+IMachine_getMediumAttachmentsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMediumAttachmentsResponse")
 
-IMachine_getUSBControllersRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBControllers").pyclass
+IMachine_getUSBControllersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBControllers")
 
-IMachine_getUSBControllersResultMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBControllersResponse").pyclass
+IMachine_getUSBControllersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBControllersResponse")
 
-IMachine_getUSBDeviceFiltersRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBDeviceFilters").pyclass
+IMachine_getUSBDeviceFiltersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBDeviceFilters")
 
-IMachine_getUSBDeviceFiltersResultMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBDeviceFiltersResponse").pyclass
+IMachine_getUSBDeviceFiltersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBDeviceFiltersResponse")
 
-IMachine_getAudioAdapterRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAudioAdapter").pyclass
+IMachine_getAudioAdapterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAudioAdapter")
 
-IMachine_getAudioAdapterResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAudioAdapterResponse").pyclass
+IMachine_getAudioAdapterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAudioAdapterResponse")
 
-IMachine_getStorageControllersRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getStorageControllers").pyclass
+IMachine_getStorageControllersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStorageControllers")
 
-IMachine_getStorageControllersResultMsg = GED("http://www.virtualbox.org/", "IMachine_getStorageControllersResponse").pyclass
+IMachine_getStorageControllersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStorageControllersResponse")
 
-IMachine_getSettingsFilePathRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSettingsFilePath").pyclass
+IMachine_getSettingsFilePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSettingsFilePath")
 
-IMachine_getSettingsFilePathResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSettingsFilePathResponse").pyclass
+IMachine_getSettingsFilePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSettingsFilePathResponse")
 
-IMachine_getSettingsModifiedRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSettingsModified").pyclass
+IMachine_getSettingsModifiedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSettingsModified")
 
-IMachine_getSettingsModifiedResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSettingsModifiedResponse").pyclass
+IMachine_getSettingsModifiedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSettingsModifiedResponse")
 
-IMachine_getSessionStateRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSessionState").pyclass
+IMachine_getSessionStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSessionState")
 
-IMachine_getSessionStateResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSessionStateResponse").pyclass
+IMachine_getSessionStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSessionStateResponse")
 
-IMachine_getSessionTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSessionType").pyclass
+IMachine_getSessionTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSessionType")
 
-IMachine_getSessionTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSessionTypeResponse").pyclass
+IMachine_getSessionTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSessionTypeResponse")
 
-IMachine_getSessionPIDRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSessionPID").pyclass
+IMachine_getSessionPIDRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSessionPID")
 
-IMachine_getSessionPIDResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSessionPIDResponse").pyclass
+IMachine_getSessionPIDResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSessionPIDResponse")
 
-IMachine_getStateRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getState").pyclass
+IMachine_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getState")
 
-IMachine_getStateResultMsg = GED("http://www.virtualbox.org/", "IMachine_getStateResponse").pyclass
+IMachine_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStateResponse")
 
-IMachine_getLastStateChangeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getLastStateChange").pyclass
+IMachine_getLastStateChangeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getLastStateChange")
 
-IMachine_getLastStateChangeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getLastStateChangeResponse").pyclass
+IMachine_getLastStateChangeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getLastStateChangeResponse")
 
-IMachine_getStateFilePathRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getStateFilePath").pyclass
+IMachine_getStateFilePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStateFilePath")
 
-IMachine_getStateFilePathResultMsg = GED("http://www.virtualbox.org/", "IMachine_getStateFilePathResponse").pyclass
+IMachine_getStateFilePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStateFilePathResponse")
 
-IMachine_getLogFolderRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getLogFolder").pyclass
+IMachine_getLogFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getLogFolder")
 
-IMachine_getLogFolderResultMsg = GED("http://www.virtualbox.org/", "IMachine_getLogFolderResponse").pyclass
+IMachine_getLogFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getLogFolderResponse")
 
-IMachine_getCurrentSnapshotRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCurrentSnapshot").pyclass
+IMachine_getCurrentSnapshotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCurrentSnapshot")
 
-IMachine_getCurrentSnapshotResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCurrentSnapshotResponse").pyclass
+IMachine_getCurrentSnapshotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCurrentSnapshotResponse")
 
-IMachine_getSnapshotCountRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSnapshotCount").pyclass
+IMachine_getSnapshotCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSnapshotCount")
 
-IMachine_getSnapshotCountResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSnapshotCountResponse").pyclass
+IMachine_getSnapshotCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSnapshotCountResponse")
 
-IMachine_getCurrentStateModifiedRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCurrentStateModified").pyclass
+IMachine_getCurrentStateModifiedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCurrentStateModified")
 
-IMachine_getCurrentStateModifiedResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCurrentStateModifiedResponse").pyclass
+IMachine_getCurrentStateModifiedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCurrentStateModifiedResponse")
 
-IMachine_getSharedFoldersRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSharedFolders").pyclass
+IMachine_getSharedFoldersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSharedFolders")
 
-IMachine_getSharedFoldersResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSharedFoldersResponse").pyclass
+IMachine_getSharedFoldersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSharedFoldersResponse")
 
-IMachine_getClipboardModeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getClipboardMode").pyclass
+IMachine_getClipboardModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getClipboardMode")
 
-IMachine_getClipboardModeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getClipboardModeResponse").pyclass
+IMachine_getClipboardModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getClipboardModeResponse")
 
-IMachine_setClipboardModeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setClipboardMode").pyclass
+IMachine_setClipboardModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setClipboardMode")
 
-IMachine_setClipboardModeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setClipboardModeResponse").pyclass
+IMachine_setClipboardModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setClipboardModeResponse")
 
-IMachine_getDragAndDropModeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getDragAndDropMode").pyclass
+IMachine_getDragAndDropModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getDragAndDropMode")
 
-IMachine_getDragAndDropModeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getDragAndDropModeResponse").pyclass
+IMachine_getDragAndDropModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getDragAndDropModeResponse")
 
-IMachine_setDragAndDropModeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setDragAndDropMode").pyclass
+IMachine_setDragAndDropModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setDragAndDropMode")
 
-IMachine_setDragAndDropModeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setDragAndDropModeResponse").pyclass
+IMachine_setDragAndDropModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setDragAndDropModeResponse")
 
-IMachine_getGuestPropertyNotificationPatternsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestPropertyNotificationPatterns").pyclass
+IMachine_getGuestPropertyNotificationPatternsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestPropertyNotificationPatterns")
 
-IMachine_getGuestPropertyNotificationPatternsResultMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestPropertyNotificationPatternsResponse").pyclass
+IMachine_getGuestPropertyNotificationPatternsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestPropertyNotificationPatternsResponse")
 
-IMachine_setGuestPropertyNotificationPatternsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setGuestPropertyNotificationPatterns").pyclass
+IMachine_setGuestPropertyNotificationPatternsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGuestPropertyNotificationPatterns")
 
-IMachine_setGuestPropertyNotificationPatternsResultMsg = GED("http://www.virtualbox.org/", "IMachine_setGuestPropertyNotificationPatternsResponse").pyclass
+IMachine_setGuestPropertyNotificationPatternsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGuestPropertyNotificationPatternsResponse")
 
-IMachine_getTeleporterEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterEnabled").pyclass
+IMachine_getTeleporterEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterEnabled")
 
-IMachine_getTeleporterEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterEnabledResponse").pyclass
+IMachine_getTeleporterEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterEnabledResponse")
 
-IMachine_setTeleporterEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterEnabled").pyclass
+IMachine_setTeleporterEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterEnabled")
 
-IMachine_setTeleporterEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterEnabledResponse").pyclass
+IMachine_setTeleporterEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterEnabledResponse")
 
-IMachine_getTeleporterPortRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterPort").pyclass
+IMachine_getTeleporterPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterPort")
 
-IMachine_getTeleporterPortResultMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterPortResponse").pyclass
+IMachine_getTeleporterPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterPortResponse")
 
-IMachine_setTeleporterPortRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterPort").pyclass
+IMachine_setTeleporterPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterPort")
 
-IMachine_setTeleporterPortResultMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterPortResponse").pyclass
+IMachine_setTeleporterPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterPortResponse")
 
-IMachine_getTeleporterAddressRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterAddress").pyclass
+IMachine_getTeleporterAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterAddress")
 
-IMachine_getTeleporterAddressResultMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterAddressResponse").pyclass
+IMachine_getTeleporterAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterAddressResponse")
 
-IMachine_setTeleporterAddressRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterAddress").pyclass
+IMachine_setTeleporterAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterAddress")
 
-IMachine_setTeleporterAddressResultMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterAddressResponse").pyclass
+IMachine_setTeleporterAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterAddressResponse")
 
-IMachine_getTeleporterPasswordRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterPassword").pyclass
+IMachine_getTeleporterPasswordRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterPassword")
 
-IMachine_getTeleporterPasswordResultMsg = GED("http://www.virtualbox.org/", "IMachine_getTeleporterPasswordResponse").pyclass
+IMachine_getTeleporterPasswordResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTeleporterPasswordResponse")
 
-IMachine_setTeleporterPasswordRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterPassword").pyclass
+IMachine_setTeleporterPasswordRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterPassword")
 
-IMachine_setTeleporterPasswordResultMsg = GED("http://www.virtualbox.org/", "IMachine_setTeleporterPasswordResponse").pyclass
+IMachine_setTeleporterPasswordResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTeleporterPasswordResponse")
 
-IMachine_getFaultToleranceStateRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultToleranceState").pyclass
+IMachine_getFaultToleranceStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultToleranceState")
 
-IMachine_getFaultToleranceStateResultMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultToleranceStateResponse").pyclass
+IMachine_getFaultToleranceStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultToleranceStateResponse")
 
-IMachine_setFaultToleranceStateRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultToleranceState").pyclass
+IMachine_setFaultToleranceStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultToleranceState")
 
-IMachine_setFaultToleranceStateResultMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultToleranceStateResponse").pyclass
+IMachine_setFaultToleranceStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultToleranceStateResponse")
 
-IMachine_getFaultTolerancePortRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultTolerancePort").pyclass
+IMachine_getFaultTolerancePortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultTolerancePort")
 
-IMachine_getFaultTolerancePortResultMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultTolerancePortResponse").pyclass
+IMachine_getFaultTolerancePortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultTolerancePortResponse")
 
-IMachine_setFaultTolerancePortRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultTolerancePort").pyclass
+IMachine_setFaultTolerancePortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultTolerancePort")
 
-IMachine_setFaultTolerancePortResultMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultTolerancePortResponse").pyclass
+IMachine_setFaultTolerancePortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultTolerancePortResponse")
 
-IMachine_getFaultToleranceAddressRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultToleranceAddress").pyclass
+IMachine_getFaultToleranceAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultToleranceAddress")
 
-IMachine_getFaultToleranceAddressResultMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultToleranceAddressResponse").pyclass
+IMachine_getFaultToleranceAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultToleranceAddressResponse")
 
-IMachine_setFaultToleranceAddressRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultToleranceAddress").pyclass
+IMachine_setFaultToleranceAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultToleranceAddress")
 
-IMachine_setFaultToleranceAddressResultMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultToleranceAddressResponse").pyclass
+IMachine_setFaultToleranceAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultToleranceAddressResponse")
 
-IMachine_getFaultTolerancePasswordRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultTolerancePassword").pyclass
+IMachine_getFaultTolerancePasswordRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultTolerancePassword")
 
-IMachine_getFaultTolerancePasswordResultMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultTolerancePasswordResponse").pyclass
+IMachine_getFaultTolerancePasswordResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultTolerancePasswordResponse")
 
-IMachine_setFaultTolerancePasswordRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultTolerancePassword").pyclass
+IMachine_setFaultTolerancePasswordRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultTolerancePassword")
 
-IMachine_setFaultTolerancePasswordResultMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultTolerancePasswordResponse").pyclass
+IMachine_setFaultTolerancePasswordResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultTolerancePasswordResponse")
 
-IMachine_getFaultToleranceSyncIntervalRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultToleranceSyncInterval").pyclass
+IMachine_getFaultToleranceSyncIntervalRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultToleranceSyncInterval")
 
-IMachine_getFaultToleranceSyncIntervalResultMsg = GED("http://www.virtualbox.org/", "IMachine_getFaultToleranceSyncIntervalResponse").pyclass
+IMachine_getFaultToleranceSyncIntervalResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getFaultToleranceSyncIntervalResponse")
 
-IMachine_setFaultToleranceSyncIntervalRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultToleranceSyncInterval").pyclass
+IMachine_setFaultToleranceSyncIntervalRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultToleranceSyncInterval")
 
-IMachine_setFaultToleranceSyncIntervalResultMsg = GED("http://www.virtualbox.org/", "IMachine_setFaultToleranceSyncIntervalResponse").pyclass
+IMachine_setFaultToleranceSyncIntervalResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setFaultToleranceSyncIntervalResponse")
 
-IMachine_getRTCUseUTCRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getRTCUseUTC").pyclass
+IMachine_getRTCUseUTCRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getRTCUseUTC")
 
-IMachine_getRTCUseUTCResultMsg = GED("http://www.virtualbox.org/", "IMachine_getRTCUseUTCResponse").pyclass
+IMachine_getRTCUseUTCResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getRTCUseUTCResponse")
 
-IMachine_setRTCUseUTCRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setRTCUseUTC").pyclass
+IMachine_setRTCUseUTCRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setRTCUseUTC")
 
-IMachine_setRTCUseUTCResultMsg = GED("http://www.virtualbox.org/", "IMachine_setRTCUseUTCResponse").pyclass
+IMachine_setRTCUseUTCResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setRTCUseUTCResponse")
 
-IMachine_getIOCacheEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getIOCacheEnabled").pyclass
+IMachine_getIOCacheEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getIOCacheEnabled")
 
-IMachine_getIOCacheEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getIOCacheEnabledResponse").pyclass
+IMachine_getIOCacheEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getIOCacheEnabledResponse")
 
-IMachine_setIOCacheEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setIOCacheEnabled").pyclass
+IMachine_setIOCacheEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setIOCacheEnabled")
 
-IMachine_setIOCacheEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setIOCacheEnabledResponse").pyclass
+IMachine_setIOCacheEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setIOCacheEnabledResponse")
 
-IMachine_getIOCacheSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getIOCacheSize").pyclass
+IMachine_getIOCacheSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getIOCacheSize")
 
-IMachine_getIOCacheSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getIOCacheSizeResponse").pyclass
+IMachine_getIOCacheSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getIOCacheSizeResponse")
 
-IMachine_setIOCacheSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setIOCacheSize").pyclass
+IMachine_setIOCacheSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setIOCacheSize")
 
-IMachine_setIOCacheSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setIOCacheSizeResponse").pyclass
+IMachine_setIOCacheSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setIOCacheSizeResponse")
 
-IMachine_getPCIDeviceAssignmentsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getPCIDeviceAssignments").pyclass
+IMachine_getPCIDeviceAssignmentsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getPCIDeviceAssignments")
 
-IMachine_getPCIDeviceAssignmentsResultMsg = GED("http://www.virtualbox.org/", "IMachine_getPCIDeviceAssignmentsResponse").pyclass
+IMachine_getPCIDeviceAssignmentsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getPCIDeviceAssignmentsResponse")
 
-IMachine_getBandwidthControlRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getBandwidthControl").pyclass
+IMachine_getBandwidthControlRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getBandwidthControl")
 
-IMachine_getBandwidthControlResultMsg = GED("http://www.virtualbox.org/", "IMachine_getBandwidthControlResponse").pyclass
+IMachine_getBandwidthControlResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getBandwidthControlResponse")
 
-IMachine_getTracingEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getTracingEnabled").pyclass
+IMachine_getTracingEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTracingEnabled")
 
-IMachine_getTracingEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getTracingEnabledResponse").pyclass
+IMachine_getTracingEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTracingEnabledResponse")
 
-IMachine_setTracingEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setTracingEnabled").pyclass
+IMachine_setTracingEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTracingEnabled")
 
-IMachine_setTracingEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setTracingEnabledResponse").pyclass
+IMachine_setTracingEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTracingEnabledResponse")
 
-IMachine_getTracingConfigRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getTracingConfig").pyclass
+IMachine_getTracingConfigRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTracingConfig")
 
-IMachine_getTracingConfigResultMsg = GED("http://www.virtualbox.org/", "IMachine_getTracingConfigResponse").pyclass
+IMachine_getTracingConfigResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getTracingConfigResponse")
 
-IMachine_setTracingConfigRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setTracingConfig").pyclass
+IMachine_setTracingConfigRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTracingConfig")
 
-IMachine_setTracingConfigResultMsg = GED("http://www.virtualbox.org/", "IMachine_setTracingConfigResponse").pyclass
+IMachine_setTracingConfigResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setTracingConfigResponse")
 
-IMachine_getAllowTracingToAccessVMRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAllowTracingToAccessVM").pyclass
+IMachine_getAllowTracingToAccessVMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAllowTracingToAccessVM")
 
-IMachine_getAllowTracingToAccessVMResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAllowTracingToAccessVMResponse").pyclass
+IMachine_getAllowTracingToAccessVMResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAllowTracingToAccessVMResponse")
 
-IMachine_setAllowTracingToAccessVMRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setAllowTracingToAccessVM").pyclass
+IMachine_setAllowTracingToAccessVMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAllowTracingToAccessVM")
 
-IMachine_setAllowTracingToAccessVMResultMsg = GED("http://www.virtualbox.org/", "IMachine_setAllowTracingToAccessVMResponse").pyclass
+IMachine_setAllowTracingToAccessVMResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAllowTracingToAccessVMResponse")
 
-IMachine_getAutostartEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAutostartEnabled").pyclass
+IMachine_getAutostartEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAutostartEnabled")
 
-IMachine_getAutostartEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAutostartEnabledResponse").pyclass
+IMachine_getAutostartEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAutostartEnabledResponse")
 
-IMachine_setAutostartEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setAutostartEnabled").pyclass
+IMachine_setAutostartEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutostartEnabled")
 
-IMachine_setAutostartEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachine_setAutostartEnabledResponse").pyclass
+IMachine_setAutostartEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutostartEnabledResponse")
 
-IMachine_getAutostartDelayRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAutostartDelay").pyclass
+IMachine_getAutostartDelayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAutostartDelay")
 
-IMachine_getAutostartDelayResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAutostartDelayResponse").pyclass
+IMachine_getAutostartDelayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAutostartDelayResponse")
 
-IMachine_setAutostartDelayRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setAutostartDelay").pyclass
+IMachine_setAutostartDelayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutostartDelay")
 
-IMachine_setAutostartDelayResultMsg = GED("http://www.virtualbox.org/", "IMachine_setAutostartDelayResponse").pyclass
+IMachine_setAutostartDelayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutostartDelayResponse")
 
-IMachine_getAutostopTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getAutostopType").pyclass
+IMachine_getAutostopTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAutostopType")
 
-IMachine_getAutostopTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getAutostopTypeResponse").pyclass
+IMachine_getAutostopTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getAutostopTypeResponse")
 
-IMachine_setAutostopTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setAutostopType").pyclass
+IMachine_setAutostopTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutostopType")
 
-IMachine_setAutostopTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_setAutostopTypeResponse").pyclass
+IMachine_setAutostopTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutostopTypeResponse")
 
-IMachine_getDefaultFrontendRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getDefaultFrontend").pyclass
+IMachine_getDefaultFrontendRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getDefaultFrontend")
 
-IMachine_getDefaultFrontendResultMsg = GED("http://www.virtualbox.org/", "IMachine_getDefaultFrontendResponse").pyclass
+IMachine_getDefaultFrontendResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getDefaultFrontendResponse")
 
-IMachine_setDefaultFrontendRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setDefaultFrontend").pyclass
+IMachine_setDefaultFrontendRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setDefaultFrontend")
 
-IMachine_setDefaultFrontendResultMsg = GED("http://www.virtualbox.org/", "IMachine_setDefaultFrontendResponse").pyclass
+IMachine_setDefaultFrontendResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setDefaultFrontendResponse")
 
-IMachine_getUSBProxyAvailableRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBProxyAvailable").pyclass
+IMachine_getUSBProxyAvailableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBProxyAvailable")
 
-IMachine_getUSBProxyAvailableResultMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBProxyAvailableResponse").pyclass
+IMachine_getUSBProxyAvailableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBProxyAvailableResponse")
 
-IMachine_lockMachineRequestMsg = GED("http://www.virtualbox.org/", "IMachine_lockMachine").pyclass
+IMachine_lockMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_lockMachine")
 
-IMachine_lockMachineResultMsg = GED("http://www.virtualbox.org/", "IMachine_lockMachineResponse").pyclass
+IMachine_lockMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_lockMachineResponse")
 
-IMachine_launchVMProcessRequestMsg = GED("http://www.virtualbox.org/", "IMachine_launchVMProcess").pyclass
+IMachine_launchVMProcessRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_launchVMProcess")
 
-IMachine_launchVMProcessResultMsg = GED("http://www.virtualbox.org/", "IMachine_launchVMProcessResponse").pyclass
+IMachine_launchVMProcessResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_launchVMProcessResponse")
 
-IMachine_setBootOrderRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setBootOrder").pyclass
+IMachine_setBootOrderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setBootOrder")
 
-IMachine_setBootOrderResultMsg = GED("http://www.virtualbox.org/", "IMachine_setBootOrderResponse").pyclass
+IMachine_setBootOrderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setBootOrderResponse")
 
-IMachine_getBootOrderRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getBootOrder").pyclass
+IMachine_getBootOrderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getBootOrder")
 
-IMachine_getBootOrderResultMsg = GED("http://www.virtualbox.org/", "IMachine_getBootOrderResponse").pyclass
+IMachine_getBootOrderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getBootOrderResponse")
 
-IMachine_attachDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_attachDevice").pyclass
+IMachine_attachDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_attachDevice")
 
-IMachine_attachDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_attachDeviceResponse").pyclass
+IMachine_attachDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_attachDeviceResponse")
 
-IMachine_attachDeviceWithoutMediumRequestMsg = GED("http://www.virtualbox.org/", "IMachine_attachDeviceWithoutMedium").pyclass
+IMachine_attachDeviceWithoutMediumRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_attachDeviceWithoutMedium")
 
-IMachine_attachDeviceWithoutMediumResultMsg = GED("http://www.virtualbox.org/", "IMachine_attachDeviceWithoutMediumResponse").pyclass
+IMachine_attachDeviceWithoutMediumResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_attachDeviceWithoutMediumResponse")
 
-IMachine_detachDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_detachDevice").pyclass
+IMachine_detachDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_detachDevice")
 
-IMachine_detachDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_detachDeviceResponse").pyclass
+IMachine_detachDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_detachDeviceResponse")
 
-IMachine_passthroughDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_passthroughDevice").pyclass
+IMachine_passthroughDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_passthroughDevice")
 
-IMachine_passthroughDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_passthroughDeviceResponse").pyclass
+IMachine_passthroughDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_passthroughDeviceResponse")
 
-IMachine_temporaryEjectDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_temporaryEjectDevice").pyclass
+IMachine_temporaryEjectDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_temporaryEjectDevice")
 
-IMachine_temporaryEjectDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_temporaryEjectDeviceResponse").pyclass
+IMachine_temporaryEjectDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_temporaryEjectDeviceResponse")
 
-IMachine_nonRotationalDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_nonRotationalDevice").pyclass
+IMachine_nonRotationalDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_nonRotationalDevice")
 
-IMachine_nonRotationalDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_nonRotationalDeviceResponse").pyclass
+IMachine_nonRotationalDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_nonRotationalDeviceResponse")
 
-IMachine_setAutoDiscardForDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setAutoDiscardForDevice").pyclass
+IMachine_setAutoDiscardForDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutoDiscardForDevice")
 
-IMachine_setAutoDiscardForDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_setAutoDiscardForDeviceResponse").pyclass
+IMachine_setAutoDiscardForDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setAutoDiscardForDeviceResponse")
 
-IMachine_setHotPluggableForDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setHotPluggableForDevice").pyclass
+IMachine_setHotPluggableForDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHotPluggableForDevice")
 
-IMachine_setHotPluggableForDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_setHotPluggableForDeviceResponse").pyclass
+IMachine_setHotPluggableForDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHotPluggableForDeviceResponse")
 
-IMachine_setBandwidthGroupForDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setBandwidthGroupForDevice").pyclass
+IMachine_setBandwidthGroupForDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setBandwidthGroupForDevice")
 
-IMachine_setBandwidthGroupForDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_setBandwidthGroupForDeviceResponse").pyclass
+IMachine_setBandwidthGroupForDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setBandwidthGroupForDeviceResponse")
 
-IMachine_setNoBandwidthGroupForDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setNoBandwidthGroupForDevice").pyclass
+IMachine_setNoBandwidthGroupForDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setNoBandwidthGroupForDevice")
 
-IMachine_setNoBandwidthGroupForDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_setNoBandwidthGroupForDeviceResponse").pyclass
+IMachine_setNoBandwidthGroupForDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setNoBandwidthGroupForDeviceResponse")
 
-IMachine_unmountMediumRequestMsg = GED("http://www.virtualbox.org/", "IMachine_unmountMedium").pyclass
+IMachine_unmountMediumRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_unmountMedium")
 
-IMachine_unmountMediumResultMsg = GED("http://www.virtualbox.org/", "IMachine_unmountMediumResponse").pyclass
+IMachine_unmountMediumResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_unmountMediumResponse")
 
-IMachine_mountMediumRequestMsg = GED("http://www.virtualbox.org/", "IMachine_mountMedium").pyclass
+IMachine_mountMediumRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_mountMedium")
 
-IMachine_mountMediumResultMsg = GED("http://www.virtualbox.org/", "IMachine_mountMediumResponse").pyclass
+IMachine_mountMediumResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_mountMediumResponse")
 
-IMachine_getMediumRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getMedium").pyclass
+IMachine_getMediumRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMedium")
 
-IMachine_getMediumResultMsg = GED("http://www.virtualbox.org/", "IMachine_getMediumResponse").pyclass
+IMachine_getMediumResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMediumResponse")
 
-IMachine_getMediumAttachmentsOfControllerRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getMediumAttachmentsOfController").pyclass
+IMachine_getMediumAttachmentsOfControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMediumAttachmentsOfController")
 
-IMachine_getMediumAttachmentsOfControllerResultMsg = GED("http://www.virtualbox.org/", "IMachine_getMediumAttachmentsOfControllerResponse").pyclass
+IMachine_getMediumAttachmentsOfControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMediumAttachmentsOfControllerResponse")
 
-IMachine_getMediumAttachmentRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getMediumAttachment").pyclass
+IMachine_getMediumAttachmentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMediumAttachment")
 
-IMachine_getMediumAttachmentResultMsg = GED("http://www.virtualbox.org/", "IMachine_getMediumAttachmentResponse").pyclass
+IMachine_getMediumAttachmentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getMediumAttachmentResponse")
 
-IMachine_attachHostPCIDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_attachHostPCIDevice").pyclass
+IMachine_attachHostPCIDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_attachHostPCIDevice")
 
-IMachine_attachHostPCIDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_attachHostPCIDeviceResponse").pyclass
+IMachine_attachHostPCIDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_attachHostPCIDeviceResponse")
 
-IMachine_detachHostPCIDeviceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_detachHostPCIDevice").pyclass
+IMachine_detachHostPCIDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_detachHostPCIDevice")
 
-IMachine_detachHostPCIDeviceResultMsg = GED("http://www.virtualbox.org/", "IMachine_detachHostPCIDeviceResponse").pyclass
+IMachine_detachHostPCIDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_detachHostPCIDeviceResponse")
 
-IMachine_getNetworkAdapterRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getNetworkAdapter").pyclass
+IMachine_getNetworkAdapterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getNetworkAdapter")
 
-IMachine_getNetworkAdapterResultMsg = GED("http://www.virtualbox.org/", "IMachine_getNetworkAdapterResponse").pyclass
+IMachine_getNetworkAdapterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getNetworkAdapterResponse")
 
-IMachine_addStorageControllerRequestMsg = GED("http://www.virtualbox.org/", "IMachine_addStorageController").pyclass
+IMachine_addStorageControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_addStorageController")
 
-IMachine_addStorageControllerResultMsg = GED("http://www.virtualbox.org/", "IMachine_addStorageControllerResponse").pyclass
+IMachine_addStorageControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_addStorageControllerResponse")
 
-IMachine_getStorageControllerByNameRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getStorageControllerByName").pyclass
+IMachine_getStorageControllerByNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStorageControllerByName")
 
-IMachine_getStorageControllerByNameResultMsg = GED("http://www.virtualbox.org/", "IMachine_getStorageControllerByNameResponse").pyclass
+IMachine_getStorageControllerByNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStorageControllerByNameResponse")
 
-IMachine_getStorageControllerByInstanceRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getStorageControllerByInstance").pyclass
+IMachine_getStorageControllerByInstanceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStorageControllerByInstance")
 
-IMachine_getStorageControllerByInstanceResultMsg = GED("http://www.virtualbox.org/", "IMachine_getStorageControllerByInstanceResponse").pyclass
+IMachine_getStorageControllerByInstanceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getStorageControllerByInstanceResponse")
 
-IMachine_removeStorageControllerRequestMsg = GED("http://www.virtualbox.org/", "IMachine_removeStorageController").pyclass
+IMachine_removeStorageControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeStorageController")
 
-IMachine_removeStorageControllerResultMsg = GED("http://www.virtualbox.org/", "IMachine_removeStorageControllerResponse").pyclass
+IMachine_removeStorageControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeStorageControllerResponse")
 
-IMachine_setStorageControllerBootableRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setStorageControllerBootable").pyclass
+IMachine_setStorageControllerBootableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setStorageControllerBootable")
 
-IMachine_setStorageControllerBootableResultMsg = GED("http://www.virtualbox.org/", "IMachine_setStorageControllerBootableResponse").pyclass
+IMachine_setStorageControllerBootableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setStorageControllerBootableResponse")
 
-IMachine_addUSBControllerRequestMsg = GED("http://www.virtualbox.org/", "IMachine_addUSBController").pyclass
+IMachine_addUSBControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_addUSBController")
 
-IMachine_addUSBControllerResultMsg = GED("http://www.virtualbox.org/", "IMachine_addUSBControllerResponse").pyclass
+IMachine_addUSBControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_addUSBControllerResponse")
 
-IMachine_removeUSBControllerRequestMsg = GED("http://www.virtualbox.org/", "IMachine_removeUSBController").pyclass
+IMachine_removeUSBControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeUSBController")
 
-IMachine_removeUSBControllerResultMsg = GED("http://www.virtualbox.org/", "IMachine_removeUSBControllerResponse").pyclass
+IMachine_removeUSBControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeUSBControllerResponse")
 
-IMachine_getUSBControllerByNameRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBControllerByName").pyclass
+IMachine_getUSBControllerByNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBControllerByName")
 
-IMachine_getUSBControllerByNameResultMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBControllerByNameResponse").pyclass
+IMachine_getUSBControllerByNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBControllerByNameResponse")
 
-IMachine_getUSBControllerCountByTypeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBControllerCountByType").pyclass
+IMachine_getUSBControllerCountByTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBControllerCountByType")
 
-IMachine_getUSBControllerCountByTypeResultMsg = GED("http://www.virtualbox.org/", "IMachine_getUSBControllerCountByTypeResponse").pyclass
+IMachine_getUSBControllerCountByTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getUSBControllerCountByTypeResponse")
 
-IMachine_getSerialPortRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getSerialPort").pyclass
+IMachine_getSerialPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSerialPort")
 
-IMachine_getSerialPortResultMsg = GED("http://www.virtualbox.org/", "IMachine_getSerialPortResponse").pyclass
+IMachine_getSerialPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getSerialPortResponse")
 
-IMachine_getParallelPortRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getParallelPort").pyclass
+IMachine_getParallelPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getParallelPort")
 
-IMachine_getParallelPortResultMsg = GED("http://www.virtualbox.org/", "IMachine_getParallelPortResponse").pyclass
+IMachine_getParallelPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getParallelPortResponse")
 
-IMachine_getExtraDataKeysRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getExtraDataKeys").pyclass
+IMachine_getExtraDataKeysRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getExtraDataKeys")
 
-IMachine_getExtraDataKeysResultMsg = GED("http://www.virtualbox.org/", "IMachine_getExtraDataKeysResponse").pyclass
+IMachine_getExtraDataKeysResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getExtraDataKeysResponse")
 
-IMachine_getExtraDataRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getExtraData").pyclass
+IMachine_getExtraDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getExtraData")
 
-IMachine_getExtraDataResultMsg = GED("http://www.virtualbox.org/", "IMachine_getExtraDataResponse").pyclass
+IMachine_getExtraDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getExtraDataResponse")
 
-IMachine_setExtraDataRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setExtraData").pyclass
+IMachine_setExtraDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setExtraData")
 
-IMachine_setExtraDataResultMsg = GED("http://www.virtualbox.org/", "IMachine_setExtraDataResponse").pyclass
+IMachine_setExtraDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setExtraDataResponse")
 
-IMachine_getCPUPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUProperty").pyclass
+IMachine_getCPUPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUProperty")
 
-IMachine_getCPUPropertyResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUPropertyResponse").pyclass
+IMachine_getCPUPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUPropertyResponse")
 
-IMachine_setCPUPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUProperty").pyclass
+IMachine_setCPUPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUProperty")
 
-IMachine_setCPUPropertyResultMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUPropertyResponse").pyclass
+IMachine_setCPUPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUPropertyResponse")
 
-IMachine_getCPUIDLeafRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUIDLeaf").pyclass
+IMachine_getCPUIDLeafRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUIDLeaf")
 
-IMachine_getCPUIDLeafResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUIDLeafResponse").pyclass
+IMachine_getCPUIDLeafResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUIDLeafResponse")
 
-IMachine_setCPUIDLeafRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUIDLeaf").pyclass
+IMachine_setCPUIDLeafRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUIDLeaf")
 
-IMachine_setCPUIDLeafResultMsg = GED("http://www.virtualbox.org/", "IMachine_setCPUIDLeafResponse").pyclass
+IMachine_setCPUIDLeafResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setCPUIDLeafResponse")
 
-IMachine_removeCPUIDLeafRequestMsg = GED("http://www.virtualbox.org/", "IMachine_removeCPUIDLeaf").pyclass
+IMachine_removeCPUIDLeafRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeCPUIDLeaf")
 
-IMachine_removeCPUIDLeafResultMsg = GED("http://www.virtualbox.org/", "IMachine_removeCPUIDLeafResponse").pyclass
+IMachine_removeCPUIDLeafResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeCPUIDLeafResponse")
 
-IMachine_removeAllCPUIDLeavesRequestMsg = GED("http://www.virtualbox.org/", "IMachine_removeAllCPUIDLeaves").pyclass
+IMachine_removeAllCPUIDLeavesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeAllCPUIDLeaves")
 
-IMachine_removeAllCPUIDLeavesResultMsg = GED("http://www.virtualbox.org/", "IMachine_removeAllCPUIDLeavesResponse").pyclass
+IMachine_removeAllCPUIDLeavesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeAllCPUIDLeavesResponse")
 
-IMachine_getHWVirtExPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getHWVirtExProperty").pyclass
+IMachine_getHWVirtExPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHWVirtExProperty")
 
-IMachine_getHWVirtExPropertyResultMsg = GED("http://www.virtualbox.org/", "IMachine_getHWVirtExPropertyResponse").pyclass
+IMachine_getHWVirtExPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getHWVirtExPropertyResponse")
 
-IMachine_setHWVirtExPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setHWVirtExProperty").pyclass
+IMachine_setHWVirtExPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHWVirtExProperty")
 
-IMachine_setHWVirtExPropertyResultMsg = GED("http://www.virtualbox.org/", "IMachine_setHWVirtExPropertyResponse").pyclass
+IMachine_setHWVirtExPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setHWVirtExPropertyResponse")
 
-IMachine_setSettingsFilePathRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setSettingsFilePath").pyclass
+IMachine_setSettingsFilePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setSettingsFilePath")
 
-IMachine_setSettingsFilePathResultMsg = GED("http://www.virtualbox.org/", "IMachine_setSettingsFilePathResponse").pyclass
+IMachine_setSettingsFilePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setSettingsFilePathResponse")
 
-IMachine_saveSettingsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_saveSettings").pyclass
+IMachine_saveSettingsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_saveSettings")
 
-IMachine_saveSettingsResultMsg = GED("http://www.virtualbox.org/", "IMachine_saveSettingsResponse").pyclass
+IMachine_saveSettingsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_saveSettingsResponse")
 
-IMachine_discardSettingsRequestMsg = GED("http://www.virtualbox.org/", "IMachine_discardSettings").pyclass
+IMachine_discardSettingsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_discardSettings")
 
-IMachine_discardSettingsResultMsg = GED("http://www.virtualbox.org/", "IMachine_discardSettingsResponse").pyclass
+IMachine_discardSettingsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_discardSettingsResponse")
 
-IMachine_unregisterRequestMsg = GED("http://www.virtualbox.org/", "IMachine_unregister").pyclass
+IMachine_unregisterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_unregister")
 
-IMachine_unregisterResultMsg = GED("http://www.virtualbox.org/", "IMachine_unregisterResponse").pyclass
+IMachine_unregisterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_unregisterResponse")
 
-IMachine_deleteConfigRequestMsg = GED("http://www.virtualbox.org/", "IMachine_deleteConfig").pyclass
+IMachine_deleteConfigRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_deleteConfig")
 
-IMachine_deleteConfigResultMsg = GED("http://www.virtualbox.org/", "IMachine_deleteConfigResponse").pyclass
+IMachine_deleteConfigResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_deleteConfigResponse")
 
-IMachine_exportToRequestMsg = GED("http://www.virtualbox.org/", "IMachine_exportTo").pyclass
+IMachine_exportToRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_exportTo")
 
-IMachine_exportToResultMsg = GED("http://www.virtualbox.org/", "IMachine_exportToResponse").pyclass
+IMachine_exportToResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_exportToResponse")
 
-IMachine_findSnapshotRequestMsg = GED("http://www.virtualbox.org/", "IMachine_findSnapshot").pyclass
+IMachine_findSnapshotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_findSnapshot")
 
-IMachine_findSnapshotResultMsg = GED("http://www.virtualbox.org/", "IMachine_findSnapshotResponse").pyclass
+IMachine_findSnapshotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_findSnapshotResponse")
 
-IMachine_createSharedFolderRequestMsg = GED("http://www.virtualbox.org/", "IMachine_createSharedFolder").pyclass
+IMachine_createSharedFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_createSharedFolder")
 
-IMachine_createSharedFolderResultMsg = GED("http://www.virtualbox.org/", "IMachine_createSharedFolderResponse").pyclass
+IMachine_createSharedFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_createSharedFolderResponse")
 
-IMachine_removeSharedFolderRequestMsg = GED("http://www.virtualbox.org/", "IMachine_removeSharedFolder").pyclass
+IMachine_removeSharedFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeSharedFolder")
 
-IMachine_removeSharedFolderResultMsg = GED("http://www.virtualbox.org/", "IMachine_removeSharedFolderResponse").pyclass
+IMachine_removeSharedFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_removeSharedFolderResponse")
 
-IMachine_canShowConsoleWindowRequestMsg = GED("http://www.virtualbox.org/", "IMachine_canShowConsoleWindow").pyclass
+IMachine_canShowConsoleWindowRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_canShowConsoleWindow")
 
-IMachine_canShowConsoleWindowResultMsg = GED("http://www.virtualbox.org/", "IMachine_canShowConsoleWindowResponse").pyclass
+IMachine_canShowConsoleWindowResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_canShowConsoleWindowResponse")
 
-IMachine_showConsoleWindowRequestMsg = GED("http://www.virtualbox.org/", "IMachine_showConsoleWindow").pyclass
+IMachine_showConsoleWindowRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_showConsoleWindow")
 
-IMachine_showConsoleWindowResultMsg = GED("http://www.virtualbox.org/", "IMachine_showConsoleWindowResponse").pyclass
+IMachine_showConsoleWindowResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_showConsoleWindowResponse")
 
-IMachine_getGuestPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestProperty").pyclass
+IMachine_getGuestPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestProperty")
 
-IMachine_getGuestPropertyResultMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestPropertyResponse").pyclass
+IMachine_getGuestPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestPropertyResponse")
 
-IMachine_getGuestPropertyValueRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestPropertyValue").pyclass
+IMachine_getGuestPropertyValueRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestPropertyValue")
 
-IMachine_getGuestPropertyValueResultMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestPropertyValueResponse").pyclass
+IMachine_getGuestPropertyValueResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestPropertyValueResponse")
 
-IMachine_getGuestPropertyTimestampRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestPropertyTimestamp").pyclass
+IMachine_getGuestPropertyTimestampRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestPropertyTimestamp")
 
-IMachine_getGuestPropertyTimestampResultMsg = GED("http://www.virtualbox.org/", "IMachine_getGuestPropertyTimestampResponse").pyclass
+IMachine_getGuestPropertyTimestampResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getGuestPropertyTimestampResponse")
 
-IMachine_setGuestPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setGuestProperty").pyclass
+IMachine_setGuestPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGuestProperty")
 
-IMachine_setGuestPropertyResultMsg = GED("http://www.virtualbox.org/", "IMachine_setGuestPropertyResponse").pyclass
+IMachine_setGuestPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGuestPropertyResponse")
 
-IMachine_setGuestPropertyValueRequestMsg = GED("http://www.virtualbox.org/", "IMachine_setGuestPropertyValue").pyclass
+IMachine_setGuestPropertyValueRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGuestPropertyValue")
 
-IMachine_setGuestPropertyValueResultMsg = GED("http://www.virtualbox.org/", "IMachine_setGuestPropertyValueResponse").pyclass
+IMachine_setGuestPropertyValueResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_setGuestPropertyValueResponse")
 
-IMachine_deleteGuestPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMachine_deleteGuestProperty").pyclass
+IMachine_deleteGuestPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_deleteGuestProperty")
 
-IMachine_deleteGuestPropertyResultMsg = GED("http://www.virtualbox.org/", "IMachine_deleteGuestPropertyResponse").pyclass
+IMachine_deleteGuestPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_deleteGuestPropertyResponse")
 
-IMachine_enumerateGuestPropertiesRequestMsg = GED("http://www.virtualbox.org/", "IMachine_enumerateGuestProperties").pyclass
+IMachine_enumerateGuestPropertiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_enumerateGuestProperties")
 
-IMachine_enumerateGuestPropertiesResultMsg = GED("http://www.virtualbox.org/", "IMachine_enumerateGuestPropertiesResponse").pyclass
+IMachine_enumerateGuestPropertiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_enumerateGuestPropertiesResponse")
 
-IMachine_querySavedGuestScreenInfoRequestMsg = GED("http://www.virtualbox.org/", "IMachine_querySavedGuestScreenInfo").pyclass
+IMachine_querySavedGuestScreenInfoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_querySavedGuestScreenInfo")
 
-IMachine_querySavedGuestScreenInfoResultMsg = GED("http://www.virtualbox.org/", "IMachine_querySavedGuestScreenInfoResponse").pyclass
+IMachine_querySavedGuestScreenInfoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_querySavedGuestScreenInfoResponse")
 
-IMachine_querySavedThumbnailSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_querySavedThumbnailSize").pyclass
+IMachine_querySavedThumbnailSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_querySavedThumbnailSize")
 
-IMachine_querySavedThumbnailSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_querySavedThumbnailSizeResponse").pyclass
+IMachine_querySavedThumbnailSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_querySavedThumbnailSizeResponse")
 
-IMachine_readSavedThumbnailToArrayRequestMsg = GED("http://www.virtualbox.org/", "IMachine_readSavedThumbnailToArray").pyclass
+IMachine_readSavedThumbnailToArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readSavedThumbnailToArray")
 
-IMachine_readSavedThumbnailToArrayResultMsg = GED("http://www.virtualbox.org/", "IMachine_readSavedThumbnailToArrayResponse").pyclass
+IMachine_readSavedThumbnailToArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readSavedThumbnailToArrayResponse")
 
-IMachine_readSavedThumbnailPNGToArrayRequestMsg = GED("http://www.virtualbox.org/", "IMachine_readSavedThumbnailPNGToArray").pyclass
+IMachine_readSavedThumbnailPNGToArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readSavedThumbnailPNGToArray")
 
-IMachine_readSavedThumbnailPNGToArrayResultMsg = GED("http://www.virtualbox.org/", "IMachine_readSavedThumbnailPNGToArrayResponse").pyclass
+IMachine_readSavedThumbnailPNGToArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readSavedThumbnailPNGToArrayResponse")
 
-IMachine_querySavedScreenshotPNGSizeRequestMsg = GED("http://www.virtualbox.org/", "IMachine_querySavedScreenshotPNGSize").pyclass
+IMachine_querySavedScreenshotPNGSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_querySavedScreenshotPNGSize")
 
-IMachine_querySavedScreenshotPNGSizeResultMsg = GED("http://www.virtualbox.org/", "IMachine_querySavedScreenshotPNGSizeResponse").pyclass
+IMachine_querySavedScreenshotPNGSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_querySavedScreenshotPNGSizeResponse")
 
-IMachine_readSavedScreenshotPNGToArrayRequestMsg = GED("http://www.virtualbox.org/", "IMachine_readSavedScreenshotPNGToArray").pyclass
+IMachine_readSavedScreenshotPNGToArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readSavedScreenshotPNGToArray")
 
-IMachine_readSavedScreenshotPNGToArrayResultMsg = GED("http://www.virtualbox.org/", "IMachine_readSavedScreenshotPNGToArrayResponse").pyclass
+IMachine_readSavedScreenshotPNGToArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readSavedScreenshotPNGToArrayResponse")
 
-IMachine_hotPlugCPURequestMsg = GED("http://www.virtualbox.org/", "IMachine_hotPlugCPU").pyclass
+IMachine_hotPlugCPURequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_hotPlugCPU")
 
-IMachine_hotPlugCPUResultMsg = GED("http://www.virtualbox.org/", "IMachine_hotPlugCPUResponse").pyclass
+IMachine_hotPlugCPUResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_hotPlugCPUResponse")
 
-IMachine_hotUnplugCPURequestMsg = GED("http://www.virtualbox.org/", "IMachine_hotUnplugCPU").pyclass
+IMachine_hotUnplugCPURequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_hotUnplugCPU")
 
-IMachine_hotUnplugCPUResultMsg = GED("http://www.virtualbox.org/", "IMachine_hotUnplugCPUResponse").pyclass
+IMachine_hotUnplugCPUResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_hotUnplugCPUResponse")
 
-IMachine_getCPUStatusRequestMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUStatus").pyclass
+IMachine_getCPUStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUStatus")
 
-IMachine_getCPUStatusResultMsg = GED("http://www.virtualbox.org/", "IMachine_getCPUStatusResponse").pyclass
+IMachine_getCPUStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_getCPUStatusResponse")
 
-IMachine_queryLogFilenameRequestMsg = GED("http://www.virtualbox.org/", "IMachine_queryLogFilename").pyclass
+IMachine_queryLogFilenameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_queryLogFilename")
 
-IMachine_queryLogFilenameResultMsg = GED("http://www.virtualbox.org/", "IMachine_queryLogFilenameResponse").pyclass
+IMachine_queryLogFilenameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_queryLogFilenameResponse")
 
-IMachine_readLogRequestMsg = GED("http://www.virtualbox.org/", "IMachine_readLog").pyclass
+IMachine_readLogRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readLog")
 
-IMachine_readLogResultMsg = GED("http://www.virtualbox.org/", "IMachine_readLogResponse").pyclass
+IMachine_readLogResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_readLogResponse")
 
-IMachine_cloneToRequestMsg = GED("http://www.virtualbox.org/", "IMachine_cloneTo").pyclass
+IMachine_cloneToRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_cloneTo")
 
-IMachine_cloneToResultMsg = GED("http://www.virtualbox.org/", "IMachine_cloneToResponse").pyclass
+IMachine_cloneToResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachine_cloneToResponse")
 
-IEmulatedUSB_getWebcamsRequestMsg = GED("http://www.virtualbox.org/", "IEmulatedUSB_getWebcams").pyclass
+IEmulatedUSB_getWebcamsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEmulatedUSB_getWebcams")
 
-IEmulatedUSB_getWebcamsResultMsg = GED("http://www.virtualbox.org/", "IEmulatedUSB_getWebcamsResponse").pyclass
+IEmulatedUSB_getWebcamsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEmulatedUSB_getWebcamsResponse")
 
-IEmulatedUSB_webcamAttachRequestMsg = GED("http://www.virtualbox.org/", "IEmulatedUSB_webcamAttach").pyclass
+IEmulatedUSB_webcamAttachRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEmulatedUSB_webcamAttach")
 
-IEmulatedUSB_webcamAttachResultMsg = GED("http://www.virtualbox.org/", "IEmulatedUSB_webcamAttachResponse").pyclass
+IEmulatedUSB_webcamAttachResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEmulatedUSB_webcamAttachResponse")
 
-IEmulatedUSB_webcamDetachRequestMsg = GED("http://www.virtualbox.org/", "IEmulatedUSB_webcamDetach").pyclass
+IEmulatedUSB_webcamDetachRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEmulatedUSB_webcamDetach")
 
-IEmulatedUSB_webcamDetachResultMsg = GED("http://www.virtualbox.org/", "IEmulatedUSB_webcamDetachResponse").pyclass
+IEmulatedUSB_webcamDetachResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEmulatedUSB_webcamDetachResponse")
 
-IConsole_getMachineRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getMachine").pyclass
+IConsole_getMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getMachine")
 
-IConsole_getMachineResultMsg = GED("http://www.virtualbox.org/", "IConsole_getMachineResponse").pyclass
+IConsole_getMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getMachineResponse")
 
-IConsole_getStateRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getState").pyclass
+IConsole_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getState")
 
-IConsole_getStateResultMsg = GED("http://www.virtualbox.org/", "IConsole_getStateResponse").pyclass
+IConsole_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getStateResponse")
 
-IConsole_getGuestRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getGuest").pyclass
+IConsole_getGuestRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getGuest")
 
-IConsole_getGuestResultMsg = GED("http://www.virtualbox.org/", "IConsole_getGuestResponse").pyclass
+IConsole_getGuestResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getGuestResponse")
 
-IConsole_getKeyboardRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getKeyboard").pyclass
+IConsole_getKeyboardRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getKeyboard")
 
-IConsole_getKeyboardResultMsg = GED("http://www.virtualbox.org/", "IConsole_getKeyboardResponse").pyclass
+IConsole_getKeyboardResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getKeyboardResponse")
 
-IConsole_getMouseRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getMouse").pyclass
+IConsole_getMouseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getMouse")
 
-IConsole_getMouseResultMsg = GED("http://www.virtualbox.org/", "IConsole_getMouseResponse").pyclass
+IConsole_getMouseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getMouseResponse")
 
-IConsole_getDisplayRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getDisplay").pyclass
+IConsole_getDisplayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getDisplay")
 
-IConsole_getDisplayResultMsg = GED("http://www.virtualbox.org/", "IConsole_getDisplayResponse").pyclass
+IConsole_getDisplayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getDisplayResponse")
 
-IConsole_getDebuggerRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getDebugger").pyclass
+IConsole_getDebuggerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getDebugger")
 
-IConsole_getDebuggerResultMsg = GED("http://www.virtualbox.org/", "IConsole_getDebuggerResponse").pyclass
+IConsole_getDebuggerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getDebuggerResponse")
 
-IConsole_getUSBDevicesRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getUSBDevices").pyclass
+IConsole_getUSBDevicesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getUSBDevices")
 
-IConsole_getUSBDevicesResultMsg = GED("http://www.virtualbox.org/", "IConsole_getUSBDevicesResponse").pyclass
+IConsole_getUSBDevicesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getUSBDevicesResponse")
 
-IConsole_getRemoteUSBDevicesRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getRemoteUSBDevices").pyclass
+IConsole_getRemoteUSBDevicesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getRemoteUSBDevices")
 
-IConsole_getRemoteUSBDevicesResultMsg = GED("http://www.virtualbox.org/", "IConsole_getRemoteUSBDevicesResponse").pyclass
+IConsole_getRemoteUSBDevicesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getRemoteUSBDevicesResponse")
 
-IConsole_getSharedFoldersRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getSharedFolders").pyclass
+IConsole_getSharedFoldersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getSharedFolders")
 
-IConsole_getSharedFoldersResultMsg = GED("http://www.virtualbox.org/", "IConsole_getSharedFoldersResponse").pyclass
+IConsole_getSharedFoldersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getSharedFoldersResponse")
 
-IConsole_getVRDEServerInfoRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getVRDEServerInfo").pyclass
+IConsole_getVRDEServerInfoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getVRDEServerInfo")
 
-IConsole_getVRDEServerInfoResultMsg = GED("http://www.virtualbox.org/", "IConsole_getVRDEServerInfoResponse").pyclass
+IConsole_getVRDEServerInfoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getVRDEServerInfoResponse")
 
-IConsole_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getEventSource").pyclass
+IConsole_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getEventSource")
 
-IConsole_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IConsole_getEventSourceResponse").pyclass
+IConsole_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getEventSourceResponse")
 
-IConsole_getAttachedPCIDevicesRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getAttachedPCIDevices").pyclass
+IConsole_getAttachedPCIDevicesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getAttachedPCIDevices")
 
-IConsole_getAttachedPCIDevicesResultMsg = GED("http://www.virtualbox.org/", "IConsole_getAttachedPCIDevicesResponse").pyclass
+IConsole_getAttachedPCIDevicesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getAttachedPCIDevicesResponse")
 
-IConsole_getUseHostClipboardRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getUseHostClipboard").pyclass
+IConsole_getUseHostClipboardRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getUseHostClipboard")
 
-IConsole_getUseHostClipboardResultMsg = GED("http://www.virtualbox.org/", "IConsole_getUseHostClipboardResponse").pyclass
+IConsole_getUseHostClipboardResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getUseHostClipboardResponse")
 
-IConsole_setUseHostClipboardRequestMsg = GED("http://www.virtualbox.org/", "IConsole_setUseHostClipboard").pyclass
+IConsole_setUseHostClipboardRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_setUseHostClipboard")
 
-IConsole_setUseHostClipboardResultMsg = GED("http://www.virtualbox.org/", "IConsole_setUseHostClipboardResponse").pyclass
+IConsole_setUseHostClipboardResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_setUseHostClipboardResponse")
 
-IConsole_getEmulatedUSBRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getEmulatedUSB").pyclass
+IConsole_getEmulatedUSBRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getEmulatedUSB")
 
-IConsole_getEmulatedUSBResultMsg = GED("http://www.virtualbox.org/", "IConsole_getEmulatedUSBResponse").pyclass
+IConsole_getEmulatedUSBResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getEmulatedUSBResponse")
 
-IConsole_powerUpRequestMsg = GED("http://www.virtualbox.org/", "IConsole_powerUp").pyclass
+IConsole_powerUpRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerUp")
 
-IConsole_powerUpResultMsg = GED("http://www.virtualbox.org/", "IConsole_powerUpResponse").pyclass
+IConsole_powerUpResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerUpResponse")
 
-IConsole_powerUpPausedRequestMsg = GED("http://www.virtualbox.org/", "IConsole_powerUpPaused").pyclass
+IConsole_powerUpPausedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerUpPaused")
 
-IConsole_powerUpPausedResultMsg = GED("http://www.virtualbox.org/", "IConsole_powerUpPausedResponse").pyclass
+IConsole_powerUpPausedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerUpPausedResponse")
 
-IConsole_powerDownRequestMsg = GED("http://www.virtualbox.org/", "IConsole_powerDown").pyclass
+IConsole_powerDownRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerDown")
 
-IConsole_powerDownResultMsg = GED("http://www.virtualbox.org/", "IConsole_powerDownResponse").pyclass
+IConsole_powerDownResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerDownResponse")
 
-IConsole_resetRequestMsg = GED("http://www.virtualbox.org/", "IConsole_reset").pyclass
+IConsole_resetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_reset")
 
-IConsole_resetResultMsg = GED("http://www.virtualbox.org/", "IConsole_resetResponse").pyclass
+IConsole_resetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_resetResponse")
 
-IConsole_pauseRequestMsg = GED("http://www.virtualbox.org/", "IConsole_pause").pyclass
+IConsole_pauseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_pause")
 
-IConsole_pauseResultMsg = GED("http://www.virtualbox.org/", "IConsole_pauseResponse").pyclass
+IConsole_pauseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_pauseResponse")
 
-IConsole_resumeRequestMsg = GED("http://www.virtualbox.org/", "IConsole_resume").pyclass
+IConsole_resumeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_resume")
 
-IConsole_resumeResultMsg = GED("http://www.virtualbox.org/", "IConsole_resumeResponse").pyclass
+IConsole_resumeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_resumeResponse")
 
-IConsole_powerButtonRequestMsg = GED("http://www.virtualbox.org/", "IConsole_powerButton").pyclass
+IConsole_powerButtonRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerButton")
 
-IConsole_powerButtonResultMsg = GED("http://www.virtualbox.org/", "IConsole_powerButtonResponse").pyclass
+IConsole_powerButtonResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_powerButtonResponse")
 
-IConsole_sleepButtonRequestMsg = GED("http://www.virtualbox.org/", "IConsole_sleepButton").pyclass
+IConsole_sleepButtonRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_sleepButton")
 
-IConsole_sleepButtonResultMsg = GED("http://www.virtualbox.org/", "IConsole_sleepButtonResponse").pyclass
+IConsole_sleepButtonResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_sleepButtonResponse")
 
-IConsole_getPowerButtonHandledRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getPowerButtonHandled").pyclass
+IConsole_getPowerButtonHandledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getPowerButtonHandled")
 
-IConsole_getPowerButtonHandledResultMsg = GED("http://www.virtualbox.org/", "IConsole_getPowerButtonHandledResponse").pyclass
+IConsole_getPowerButtonHandledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getPowerButtonHandledResponse")
 
-IConsole_getGuestEnteredACPIModeRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getGuestEnteredACPIMode").pyclass
+IConsole_getGuestEnteredACPIModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getGuestEnteredACPIMode")
 
-IConsole_getGuestEnteredACPIModeResultMsg = GED("http://www.virtualbox.org/", "IConsole_getGuestEnteredACPIModeResponse").pyclass
+IConsole_getGuestEnteredACPIModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getGuestEnteredACPIModeResponse")
 
-IConsole_saveStateRequestMsg = GED("http://www.virtualbox.org/", "IConsole_saveState").pyclass
+IConsole_saveStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_saveState")
 
-IConsole_saveStateResultMsg = GED("http://www.virtualbox.org/", "IConsole_saveStateResponse").pyclass
+IConsole_saveStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_saveStateResponse")
 
-IConsole_adoptSavedStateRequestMsg = GED("http://www.virtualbox.org/", "IConsole_adoptSavedState").pyclass
+IConsole_adoptSavedStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_adoptSavedState")
 
-IConsole_adoptSavedStateResultMsg = GED("http://www.virtualbox.org/", "IConsole_adoptSavedStateResponse").pyclass
+IConsole_adoptSavedStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_adoptSavedStateResponse")
 
-IConsole_discardSavedStateRequestMsg = GED("http://www.virtualbox.org/", "IConsole_discardSavedState").pyclass
+IConsole_discardSavedStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_discardSavedState")
 
-IConsole_discardSavedStateResultMsg = GED("http://www.virtualbox.org/", "IConsole_discardSavedStateResponse").pyclass
+IConsole_discardSavedStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_discardSavedStateResponse")
 
-IConsole_getDeviceActivityRequestMsg = GED("http://www.virtualbox.org/", "IConsole_getDeviceActivity").pyclass
+IConsole_getDeviceActivityRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getDeviceActivity")
 
-IConsole_getDeviceActivityResultMsg = GED("http://www.virtualbox.org/", "IConsole_getDeviceActivityResponse").pyclass
+IConsole_getDeviceActivityResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_getDeviceActivityResponse")
 
-IConsole_attachUSBDeviceRequestMsg = GED("http://www.virtualbox.org/", "IConsole_attachUSBDevice").pyclass
+IConsole_attachUSBDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_attachUSBDevice")
 
-IConsole_attachUSBDeviceResultMsg = GED("http://www.virtualbox.org/", "IConsole_attachUSBDeviceResponse").pyclass
+IConsole_attachUSBDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_attachUSBDeviceResponse")
 
-IConsole_detachUSBDeviceRequestMsg = GED("http://www.virtualbox.org/", "IConsole_detachUSBDevice").pyclass
+IConsole_detachUSBDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_detachUSBDevice")
 
-IConsole_detachUSBDeviceResultMsg = GED("http://www.virtualbox.org/", "IConsole_detachUSBDeviceResponse").pyclass
+IConsole_detachUSBDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_detachUSBDeviceResponse")
 
-IConsole_findUSBDeviceByAddressRequestMsg = GED("http://www.virtualbox.org/", "IConsole_findUSBDeviceByAddress").pyclass
+IConsole_findUSBDeviceByAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_findUSBDeviceByAddress")
 
-IConsole_findUSBDeviceByAddressResultMsg = GED("http://www.virtualbox.org/", "IConsole_findUSBDeviceByAddressResponse").pyclass
+IConsole_findUSBDeviceByAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_findUSBDeviceByAddressResponse")
 
-IConsole_findUSBDeviceByIdRequestMsg = GED("http://www.virtualbox.org/", "IConsole_findUSBDeviceById").pyclass
+IConsole_findUSBDeviceByIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_findUSBDeviceById")
 
-IConsole_findUSBDeviceByIdResultMsg = GED("http://www.virtualbox.org/", "IConsole_findUSBDeviceByIdResponse").pyclass
+IConsole_findUSBDeviceByIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_findUSBDeviceByIdResponse")
 
-IConsole_createSharedFolderRequestMsg = GED("http://www.virtualbox.org/", "IConsole_createSharedFolder").pyclass
+IConsole_createSharedFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_createSharedFolder")
 
-IConsole_createSharedFolderResultMsg = GED("http://www.virtualbox.org/", "IConsole_createSharedFolderResponse").pyclass
+IConsole_createSharedFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_createSharedFolderResponse")
 
-IConsole_removeSharedFolderRequestMsg = GED("http://www.virtualbox.org/", "IConsole_removeSharedFolder").pyclass
+IConsole_removeSharedFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_removeSharedFolder")
 
-IConsole_removeSharedFolderResultMsg = GED("http://www.virtualbox.org/", "IConsole_removeSharedFolderResponse").pyclass
+IConsole_removeSharedFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_removeSharedFolderResponse")
 
-IConsole_takeSnapshotRequestMsg = GED("http://www.virtualbox.org/", "IConsole_takeSnapshot").pyclass
+IConsole_takeSnapshotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_takeSnapshot")
 
-IConsole_takeSnapshotResultMsg = GED("http://www.virtualbox.org/", "IConsole_takeSnapshotResponse").pyclass
+IConsole_takeSnapshotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_takeSnapshotResponse")
 
-IConsole_deleteSnapshotRequestMsg = GED("http://www.virtualbox.org/", "IConsole_deleteSnapshot").pyclass
+IConsole_deleteSnapshotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_deleteSnapshot")
 
-IConsole_deleteSnapshotResultMsg = GED("http://www.virtualbox.org/", "IConsole_deleteSnapshotResponse").pyclass
+IConsole_deleteSnapshotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_deleteSnapshotResponse")
 
-IConsole_deleteSnapshotAndAllChildrenRequestMsg = GED("http://www.virtualbox.org/", "IConsole_deleteSnapshotAndAllChildren").pyclass
+IConsole_deleteSnapshotAndAllChildrenRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_deleteSnapshotAndAllChildren")
 
-IConsole_deleteSnapshotAndAllChildrenResultMsg = GED("http://www.virtualbox.org/", "IConsole_deleteSnapshotAndAllChildrenResponse").pyclass
+IConsole_deleteSnapshotAndAllChildrenResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_deleteSnapshotAndAllChildrenResponse")
 
-IConsole_deleteSnapshotRangeRequestMsg = GED("http://www.virtualbox.org/", "IConsole_deleteSnapshotRange").pyclass
+IConsole_deleteSnapshotRangeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_deleteSnapshotRange")
 
-IConsole_deleteSnapshotRangeResultMsg = GED("http://www.virtualbox.org/", "IConsole_deleteSnapshotRangeResponse").pyclass
+IConsole_deleteSnapshotRangeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_deleteSnapshotRangeResponse")
 
-IConsole_restoreSnapshotRequestMsg = GED("http://www.virtualbox.org/", "IConsole_restoreSnapshot").pyclass
+IConsole_restoreSnapshotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_restoreSnapshot")
 
-IConsole_restoreSnapshotResultMsg = GED("http://www.virtualbox.org/", "IConsole_restoreSnapshotResponse").pyclass
+IConsole_restoreSnapshotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_restoreSnapshotResponse")
 
-IConsole_teleportRequestMsg = GED("http://www.virtualbox.org/", "IConsole_teleport").pyclass
+IConsole_teleportRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_teleport")
 
-IConsole_teleportResultMsg = GED("http://www.virtualbox.org/", "IConsole_teleportResponse").pyclass
+IConsole_teleportResultMsg = LazyPyclass("http://www.virtualbox.org/", "IConsole_teleportResponse")
 
-IHostNetworkInterface_getNameRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getName").pyclass
+IHostNetworkInterface_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getName")
 
-IHostNetworkInterface_getNameResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getNameResponse").pyclass
+IHostNetworkInterface_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getNameResponse")
 
-IHostNetworkInterface_getShortNameRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getShortName").pyclass
+IHostNetworkInterface_getShortNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getShortName")
 
-IHostNetworkInterface_getShortNameResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getShortNameResponse").pyclass
+IHostNetworkInterface_getShortNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getShortNameResponse")
 
-IHostNetworkInterface_getIdRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getId").pyclass
+IHostNetworkInterface_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getId")
 
-IHostNetworkInterface_getIdResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIdResponse").pyclass
+IHostNetworkInterface_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIdResponse")
 
-IHostNetworkInterface_getNetworkNameRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkName").pyclass
+IHostNetworkInterface_getNetworkNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkName")
 
-IHostNetworkInterface_getNetworkNameResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkNameResponse").pyclass
+IHostNetworkInterface_getNetworkNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkNameResponse")
 
-IHostNetworkInterface_getDHCPEnabledRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getDHCPEnabled").pyclass
+IHostNetworkInterface_getDHCPEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getDHCPEnabled")
 
-IHostNetworkInterface_getDHCPEnabledResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getDHCPEnabledResponse").pyclass
+IHostNetworkInterface_getDHCPEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getDHCPEnabledResponse")
 
-IHostNetworkInterface_getIPAddressRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPAddress").pyclass
+IHostNetworkInterface_getIPAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPAddress")
 
-IHostNetworkInterface_getIPAddressResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPAddressResponse").pyclass
+IHostNetworkInterface_getIPAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPAddressResponse")
 
-IHostNetworkInterface_getNetworkMaskRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkMask").pyclass
+IHostNetworkInterface_getNetworkMaskRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkMask")
 
-IHostNetworkInterface_getNetworkMaskResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkMaskResponse").pyclass
+IHostNetworkInterface_getNetworkMaskResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getNetworkMaskResponse")
 
-IHostNetworkInterface_getIPV6SupportedRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6Supported").pyclass
+IHostNetworkInterface_getIPV6SupportedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6Supported")
 
-IHostNetworkInterface_getIPV6SupportedResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6SupportedResponse").pyclass
+IHostNetworkInterface_getIPV6SupportedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6SupportedResponse")
 
-IHostNetworkInterface_getIPV6AddressRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6Address").pyclass
+IHostNetworkInterface_getIPV6AddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6Address")
 
-IHostNetworkInterface_getIPV6AddressResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6AddressResponse").pyclass
+IHostNetworkInterface_getIPV6AddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6AddressResponse")
 
-IHostNetworkInterface_getIPV6NetworkMaskPrefixLengthRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6NetworkMaskPrefixLength").pyclass
+IHostNetworkInterface_getIPV6NetworkMaskPrefixLengthRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6NetworkMaskPrefixLength")
 
-IHostNetworkInterface_getIPV6NetworkMaskPrefixLengthResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6NetworkMaskPrefixLengthResponse").pyclass
+IHostNetworkInterface_getIPV6NetworkMaskPrefixLengthResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getIPV6NetworkMaskPrefixLengthResponse")
 
-IHostNetworkInterface_getHardwareAddressRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getHardwareAddress").pyclass
+IHostNetworkInterface_getHardwareAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getHardwareAddress")
 
-IHostNetworkInterface_getHardwareAddressResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getHardwareAddressResponse").pyclass
+IHostNetworkInterface_getHardwareAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getHardwareAddressResponse")
 
-IHostNetworkInterface_getMediumTypeRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getMediumType").pyclass
+IHostNetworkInterface_getMediumTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getMediumType")
 
-IHostNetworkInterface_getMediumTypeResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getMediumTypeResponse").pyclass
+IHostNetworkInterface_getMediumTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getMediumTypeResponse")
 
-IHostNetworkInterface_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getStatus").pyclass
+IHostNetworkInterface_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getStatus")
 
-IHostNetworkInterface_getStatusResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getStatusResponse").pyclass
+IHostNetworkInterface_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getStatusResponse")
 
-IHostNetworkInterface_getInterfaceTypeRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getInterfaceType").pyclass
+IHostNetworkInterface_getInterfaceTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getInterfaceType")
 
-IHostNetworkInterface_getInterfaceTypeResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_getInterfaceTypeResponse").pyclass
+IHostNetworkInterface_getInterfaceTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_getInterfaceTypeResponse")
 
-IHostNetworkInterface_enableStaticIPConfigRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfig").pyclass
+IHostNetworkInterface_enableStaticIPConfigRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfig")
 
-IHostNetworkInterface_enableStaticIPConfigResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfigResponse").pyclass
+IHostNetworkInterface_enableStaticIPConfigResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfigResponse")
 
-IHostNetworkInterface_enableStaticIPConfigV6RequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfigV6").pyclass
+IHostNetworkInterface_enableStaticIPConfigV6RequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfigV6")
 
-IHostNetworkInterface_enableStaticIPConfigV6ResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfigV6Response").pyclass
+IHostNetworkInterface_enableStaticIPConfigV6ResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_enableStaticIPConfigV6Response")
 
-IHostNetworkInterface_enableDynamicIPConfigRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_enableDynamicIPConfig").pyclass
+IHostNetworkInterface_enableDynamicIPConfigRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_enableDynamicIPConfig")
 
-IHostNetworkInterface_enableDynamicIPConfigResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_enableDynamicIPConfigResponse").pyclass
+IHostNetworkInterface_enableDynamicIPConfigResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_enableDynamicIPConfigResponse")
 
-IHostNetworkInterface_DHCPRediscoverRequestMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_DHCPRediscover").pyclass
+IHostNetworkInterface_DHCPRediscoverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_DHCPRediscover")
 
-IHostNetworkInterface_DHCPRediscoverResultMsg = GED("http://www.virtualbox.org/", "IHostNetworkInterface_DHCPRediscoverResponse").pyclass
+IHostNetworkInterface_DHCPRediscoverResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostNetworkInterface_DHCPRediscoverResponse")
 
-IHostVideoInputDevice_getNameRequestMsg = GED("http://www.virtualbox.org/", "IHostVideoInputDevice_getName").pyclass
+IHostVideoInputDevice_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostVideoInputDevice_getName")
 
-IHostVideoInputDevice_getNameResultMsg = GED("http://www.virtualbox.org/", "IHostVideoInputDevice_getNameResponse").pyclass
+IHostVideoInputDevice_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostVideoInputDevice_getNameResponse")
 
-IHostVideoInputDevice_getPathRequestMsg = GED("http://www.virtualbox.org/", "IHostVideoInputDevice_getPath").pyclass
+IHostVideoInputDevice_getPathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostVideoInputDevice_getPath")
 
-IHostVideoInputDevice_getPathResultMsg = GED("http://www.virtualbox.org/", "IHostVideoInputDevice_getPathResponse").pyclass
+IHostVideoInputDevice_getPathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostVideoInputDevice_getPathResponse")
 
-IHostVideoInputDevice_getAliasRequestMsg = GED("http://www.virtualbox.org/", "IHostVideoInputDevice_getAlias").pyclass
+IHostVideoInputDevice_getAliasRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostVideoInputDevice_getAlias")
 
-IHostVideoInputDevice_getAliasResultMsg = GED("http://www.virtualbox.org/", "IHostVideoInputDevice_getAliasResponse").pyclass
+IHostVideoInputDevice_getAliasResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostVideoInputDevice_getAliasResponse")
 
-IHost_getDVDDrivesRequestMsg = GED("http://www.virtualbox.org/", "IHost_getDVDDrives").pyclass
+IHost_getDVDDrivesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getDVDDrives")
 
-IHost_getDVDDrivesResultMsg = GED("http://www.virtualbox.org/", "IHost_getDVDDrivesResponse").pyclass
+IHost_getDVDDrivesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getDVDDrivesResponse")
 
-IHost_getFloppyDrivesRequestMsg = GED("http://www.virtualbox.org/", "IHost_getFloppyDrives").pyclass
+IHost_getFloppyDrivesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getFloppyDrives")
 
-IHost_getFloppyDrivesResultMsg = GED("http://www.virtualbox.org/", "IHost_getFloppyDrivesResponse").pyclass
+IHost_getFloppyDrivesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getFloppyDrivesResponse")
 
-IHost_getUSBDevicesRequestMsg = GED("http://www.virtualbox.org/", "IHost_getUSBDevices").pyclass
+IHost_getUSBDevicesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getUSBDevices")
 
-IHost_getUSBDevicesResultMsg = GED("http://www.virtualbox.org/", "IHost_getUSBDevicesResponse").pyclass
+IHost_getUSBDevicesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getUSBDevicesResponse")
 
-IHost_getUSBDeviceFiltersRequestMsg = GED("http://www.virtualbox.org/", "IHost_getUSBDeviceFilters").pyclass
+IHost_getUSBDeviceFiltersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getUSBDeviceFilters")
 
-IHost_getUSBDeviceFiltersResultMsg = GED("http://www.virtualbox.org/", "IHost_getUSBDeviceFiltersResponse").pyclass
+IHost_getUSBDeviceFiltersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getUSBDeviceFiltersResponse")
 
-IHost_getNetworkInterfacesRequestMsg = GED("http://www.virtualbox.org/", "IHost_getNetworkInterfaces").pyclass
+IHost_getNetworkInterfacesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getNetworkInterfaces")
 
-IHost_getNetworkInterfacesResultMsg = GED("http://www.virtualbox.org/", "IHost_getNetworkInterfacesResponse").pyclass
+IHost_getNetworkInterfacesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getNetworkInterfacesResponse")
 
-IHost_getNameServersRequestMsg = GED("http://www.virtualbox.org/", "IHost_getNameServers").pyclass
+IHost_getNameServersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getNameServers")
 
-IHost_getNameServersResultMsg = GED("http://www.virtualbox.org/", "IHost_getNameServersResponse").pyclass
+IHost_getNameServersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getNameServersResponse")
 
-IHost_getDomainNameRequestMsg = GED("http://www.virtualbox.org/", "IHost_getDomainName").pyclass
+IHost_getDomainNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getDomainName")
 
-IHost_getDomainNameResultMsg = GED("http://www.virtualbox.org/", "IHost_getDomainNameResponse").pyclass
+IHost_getDomainNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getDomainNameResponse")
 
-IHost_getSearchStringsRequestMsg = GED("http://www.virtualbox.org/", "IHost_getSearchStrings").pyclass
+IHost_getSearchStringsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getSearchStrings")
 
-IHost_getSearchStringsResultMsg = GED("http://www.virtualbox.org/", "IHost_getSearchStringsResponse").pyclass
+IHost_getSearchStringsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getSearchStringsResponse")
 
-IHost_getProcessorCountRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorCount").pyclass
+IHost_getProcessorCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorCount")
 
-IHost_getProcessorCountResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorCountResponse").pyclass
+IHost_getProcessorCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorCountResponse")
 
-IHost_getProcessorOnlineCountRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorOnlineCount").pyclass
+IHost_getProcessorOnlineCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorOnlineCount")
 
-IHost_getProcessorOnlineCountResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorOnlineCountResponse").pyclass
+IHost_getProcessorOnlineCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorOnlineCountResponse")
 
-IHost_getProcessorCoreCountRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorCoreCount").pyclass
+IHost_getProcessorCoreCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorCoreCount")
 
-IHost_getProcessorCoreCountResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorCoreCountResponse").pyclass
+IHost_getProcessorCoreCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorCoreCountResponse")
 
-IHost_getProcessorOnlineCoreCountRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorOnlineCoreCount").pyclass
+IHost_getProcessorOnlineCoreCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorOnlineCoreCount")
 
-IHost_getProcessorOnlineCoreCountResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorOnlineCoreCountResponse").pyclass
+IHost_getProcessorOnlineCoreCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorOnlineCoreCountResponse")
 
-IHost_getMemorySizeRequestMsg = GED("http://www.virtualbox.org/", "IHost_getMemorySize").pyclass
+IHost_getMemorySizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getMemorySize")
 
-IHost_getMemorySizeResultMsg = GED("http://www.virtualbox.org/", "IHost_getMemorySizeResponse").pyclass
+IHost_getMemorySizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getMemorySizeResponse")
 
-IHost_getMemoryAvailableRequestMsg = GED("http://www.virtualbox.org/", "IHost_getMemoryAvailable").pyclass
+IHost_getMemoryAvailableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getMemoryAvailable")
 
-IHost_getMemoryAvailableResultMsg = GED("http://www.virtualbox.org/", "IHost_getMemoryAvailableResponse").pyclass
+IHost_getMemoryAvailableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getMemoryAvailableResponse")
 
-IHost_getOperatingSystemRequestMsg = GED("http://www.virtualbox.org/", "IHost_getOperatingSystem").pyclass
+IHost_getOperatingSystemRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getOperatingSystem")
 
-IHost_getOperatingSystemResultMsg = GED("http://www.virtualbox.org/", "IHost_getOperatingSystemResponse").pyclass
+IHost_getOperatingSystemResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getOperatingSystemResponse")
 
-IHost_getOSVersionRequestMsg = GED("http://www.virtualbox.org/", "IHost_getOSVersion").pyclass
+IHost_getOSVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getOSVersion")
 
-IHost_getOSVersionResultMsg = GED("http://www.virtualbox.org/", "IHost_getOSVersionResponse").pyclass
+IHost_getOSVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getOSVersionResponse")
 
-IHost_getUTCTimeRequestMsg = GED("http://www.virtualbox.org/", "IHost_getUTCTime").pyclass
+IHost_getUTCTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getUTCTime")
 
-IHost_getUTCTimeResultMsg = GED("http://www.virtualbox.org/", "IHost_getUTCTimeResponse").pyclass
+IHost_getUTCTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getUTCTimeResponse")
 
-IHost_getAcceleration3DAvailableRequestMsg = GED("http://www.virtualbox.org/", "IHost_getAcceleration3DAvailable").pyclass
+IHost_getAcceleration3DAvailableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getAcceleration3DAvailable")
 
-IHost_getAcceleration3DAvailableResultMsg = GED("http://www.virtualbox.org/", "IHost_getAcceleration3DAvailableResponse").pyclass
+IHost_getAcceleration3DAvailableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getAcceleration3DAvailableResponse")
 
-IHost_getVideoInputDevicesRequestMsg = GED("http://www.virtualbox.org/", "IHost_getVideoInputDevices").pyclass
+IHost_getVideoInputDevicesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getVideoInputDevices")
 
-IHost_getVideoInputDevicesResultMsg = GED("http://www.virtualbox.org/", "IHost_getVideoInputDevicesResponse").pyclass
+IHost_getVideoInputDevicesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getVideoInputDevicesResponse")
 
-IHost_getProcessorSpeedRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorSpeed").pyclass
+IHost_getProcessorSpeedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorSpeed")
 
-IHost_getProcessorSpeedResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorSpeedResponse").pyclass
+IHost_getProcessorSpeedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorSpeedResponse")
 
-IHost_getProcessorFeatureRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorFeature").pyclass
+IHost_getProcessorFeatureRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorFeature")
 
-IHost_getProcessorFeatureResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorFeatureResponse").pyclass
+IHost_getProcessorFeatureResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorFeatureResponse")
 
-IHost_getProcessorDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorDescription").pyclass
+IHost_getProcessorDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorDescription")
 
-IHost_getProcessorDescriptionResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorDescriptionResponse").pyclass
+IHost_getProcessorDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorDescriptionResponse")
 
-IHost_getProcessorCPUIDLeafRequestMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorCPUIDLeaf").pyclass
+IHost_getProcessorCPUIDLeafRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorCPUIDLeaf")
 
-IHost_getProcessorCPUIDLeafResultMsg = GED("http://www.virtualbox.org/", "IHost_getProcessorCPUIDLeafResponse").pyclass
+IHost_getProcessorCPUIDLeafResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_getProcessorCPUIDLeafResponse")
 
-IHost_createHostOnlyNetworkInterfaceRequestMsg = GED("http://www.virtualbox.org/", "IHost_createHostOnlyNetworkInterface").pyclass
+IHost_createHostOnlyNetworkInterfaceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_createHostOnlyNetworkInterface")
 
-IHost_createHostOnlyNetworkInterfaceResultMsg = GED("http://www.virtualbox.org/", "IHost_createHostOnlyNetworkInterfaceResponse").pyclass
+IHost_createHostOnlyNetworkInterfaceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_createHostOnlyNetworkInterfaceResponse")
 
-IHost_removeHostOnlyNetworkInterfaceRequestMsg = GED("http://www.virtualbox.org/", "IHost_removeHostOnlyNetworkInterface").pyclass
+IHost_removeHostOnlyNetworkInterfaceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_removeHostOnlyNetworkInterface")
 
-IHost_removeHostOnlyNetworkInterfaceResultMsg = GED("http://www.virtualbox.org/", "IHost_removeHostOnlyNetworkInterfaceResponse").pyclass
+IHost_removeHostOnlyNetworkInterfaceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_removeHostOnlyNetworkInterfaceResponse")
 
-IHost_createUSBDeviceFilterRequestMsg = GED("http://www.virtualbox.org/", "IHost_createUSBDeviceFilter").pyclass
+IHost_createUSBDeviceFilterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_createUSBDeviceFilter")
 
-IHost_createUSBDeviceFilterResultMsg = GED("http://www.virtualbox.org/", "IHost_createUSBDeviceFilterResponse").pyclass
+IHost_createUSBDeviceFilterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_createUSBDeviceFilterResponse")
 
-IHost_insertUSBDeviceFilterRequestMsg = GED("http://www.virtualbox.org/", "IHost_insertUSBDeviceFilter").pyclass
+IHost_insertUSBDeviceFilterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_insertUSBDeviceFilter")
 
-IHost_insertUSBDeviceFilterResultMsg = GED("http://www.virtualbox.org/", "IHost_insertUSBDeviceFilterResponse").pyclass
+IHost_insertUSBDeviceFilterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_insertUSBDeviceFilterResponse")
 
-IHost_removeUSBDeviceFilterRequestMsg = GED("http://www.virtualbox.org/", "IHost_removeUSBDeviceFilter").pyclass
+IHost_removeUSBDeviceFilterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_removeUSBDeviceFilter")
 
-IHost_removeUSBDeviceFilterResultMsg = GED("http://www.virtualbox.org/", "IHost_removeUSBDeviceFilterResponse").pyclass
+IHost_removeUSBDeviceFilterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_removeUSBDeviceFilterResponse")
 
-IHost_findHostDVDDriveRequestMsg = GED("http://www.virtualbox.org/", "IHost_findHostDVDDrive").pyclass
+IHost_findHostDVDDriveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostDVDDrive")
 
-IHost_findHostDVDDriveResultMsg = GED("http://www.virtualbox.org/", "IHost_findHostDVDDriveResponse").pyclass
+IHost_findHostDVDDriveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostDVDDriveResponse")
 
-IHost_findHostFloppyDriveRequestMsg = GED("http://www.virtualbox.org/", "IHost_findHostFloppyDrive").pyclass
+IHost_findHostFloppyDriveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostFloppyDrive")
 
-IHost_findHostFloppyDriveResultMsg = GED("http://www.virtualbox.org/", "IHost_findHostFloppyDriveResponse").pyclass
+IHost_findHostFloppyDriveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostFloppyDriveResponse")
 
-IHost_findHostNetworkInterfaceByNameRequestMsg = GED("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceByName").pyclass
+IHost_findHostNetworkInterfaceByNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceByName")
 
-IHost_findHostNetworkInterfaceByNameResultMsg = GED("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceByNameResponse").pyclass
+IHost_findHostNetworkInterfaceByNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceByNameResponse")
 
-IHost_findHostNetworkInterfaceByIdRequestMsg = GED("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceById").pyclass
+IHost_findHostNetworkInterfaceByIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceById")
 
-IHost_findHostNetworkInterfaceByIdResultMsg = GED("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceByIdResponse").pyclass
+IHost_findHostNetworkInterfaceByIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostNetworkInterfaceByIdResponse")
 
-IHost_findHostNetworkInterfacesOfTypeRequestMsg = GED("http://www.virtualbox.org/", "IHost_findHostNetworkInterfacesOfType").pyclass
+IHost_findHostNetworkInterfacesOfTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostNetworkInterfacesOfType")
 
-IHost_findHostNetworkInterfacesOfTypeResultMsg = GED("http://www.virtualbox.org/", "IHost_findHostNetworkInterfacesOfTypeResponse").pyclass
+IHost_findHostNetworkInterfacesOfTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findHostNetworkInterfacesOfTypeResponse")
 
-IHost_findUSBDeviceByIdRequestMsg = GED("http://www.virtualbox.org/", "IHost_findUSBDeviceById").pyclass
+IHost_findUSBDeviceByIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findUSBDeviceById")
 
-IHost_findUSBDeviceByIdResultMsg = GED("http://www.virtualbox.org/", "IHost_findUSBDeviceByIdResponse").pyclass
+IHost_findUSBDeviceByIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findUSBDeviceByIdResponse")
 
-IHost_findUSBDeviceByAddressRequestMsg = GED("http://www.virtualbox.org/", "IHost_findUSBDeviceByAddress").pyclass
+IHost_findUSBDeviceByAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findUSBDeviceByAddress")
 
-IHost_findUSBDeviceByAddressResultMsg = GED("http://www.virtualbox.org/", "IHost_findUSBDeviceByAddressResponse").pyclass
+IHost_findUSBDeviceByAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_findUSBDeviceByAddressResponse")
 
-IHost_generateMACAddressRequestMsg = GED("http://www.virtualbox.org/", "IHost_generateMACAddress").pyclass
+IHost_generateMACAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_generateMACAddress")
 
-IHost_generateMACAddressResultMsg = GED("http://www.virtualbox.org/", "IHost_generateMACAddressResponse").pyclass
+IHost_generateMACAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHost_generateMACAddressResponse")
 
-ISystemProperties_getMinGuestRAMRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinGuestRAM").pyclass
+ISystemProperties_getMinGuestRAMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinGuestRAM")
 
-ISystemProperties_getMinGuestRAMResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinGuestRAMResponse").pyclass
+ISystemProperties_getMinGuestRAMResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinGuestRAMResponse")
 
-ISystemProperties_getMaxGuestRAMRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestRAM").pyclass
+ISystemProperties_getMaxGuestRAMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestRAM")
 
-ISystemProperties_getMaxGuestRAMResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestRAMResponse").pyclass
+ISystemProperties_getMaxGuestRAMResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestRAMResponse")
 
-ISystemProperties_getMinGuestVRAMRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinGuestVRAM").pyclass
+ISystemProperties_getMinGuestVRAMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinGuestVRAM")
 
-ISystemProperties_getMinGuestVRAMResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinGuestVRAMResponse").pyclass
+ISystemProperties_getMinGuestVRAMResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinGuestVRAMResponse")
 
-ISystemProperties_getMaxGuestVRAMRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestVRAM").pyclass
+ISystemProperties_getMaxGuestVRAMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestVRAM")
 
-ISystemProperties_getMaxGuestVRAMResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestVRAMResponse").pyclass
+ISystemProperties_getMaxGuestVRAMResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestVRAMResponse")
 
-ISystemProperties_getMinGuestCPUCountRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinGuestCPUCount").pyclass
+ISystemProperties_getMinGuestCPUCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinGuestCPUCount")
 
-ISystemProperties_getMinGuestCPUCountResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinGuestCPUCountResponse").pyclass
+ISystemProperties_getMinGuestCPUCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinGuestCPUCountResponse")
 
-ISystemProperties_getMaxGuestCPUCountRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestCPUCount").pyclass
+ISystemProperties_getMaxGuestCPUCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestCPUCount")
 
-ISystemProperties_getMaxGuestCPUCountResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestCPUCountResponse").pyclass
+ISystemProperties_getMaxGuestCPUCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestCPUCountResponse")
 
-ISystemProperties_getMaxGuestMonitorsRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestMonitors").pyclass
+ISystemProperties_getMaxGuestMonitorsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestMonitors")
 
-ISystemProperties_getMaxGuestMonitorsResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestMonitorsResponse").pyclass
+ISystemProperties_getMaxGuestMonitorsResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxGuestMonitorsResponse")
 
-ISystemProperties_getInfoVDSizeRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getInfoVDSize").pyclass
+ISystemProperties_getInfoVDSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getInfoVDSize")
 
-ISystemProperties_getInfoVDSizeResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getInfoVDSizeResponse").pyclass
+ISystemProperties_getInfoVDSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getInfoVDSizeResponse")
 
-ISystemProperties_getSerialPortCountRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getSerialPortCount").pyclass
+ISystemProperties_getSerialPortCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getSerialPortCount")
 
-ISystemProperties_getSerialPortCountResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getSerialPortCountResponse").pyclass
+ISystemProperties_getSerialPortCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getSerialPortCountResponse")
 
-ISystemProperties_getParallelPortCountRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getParallelPortCount").pyclass
+ISystemProperties_getParallelPortCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getParallelPortCount")
 
-ISystemProperties_getParallelPortCountResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getParallelPortCountResponse").pyclass
+ISystemProperties_getParallelPortCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getParallelPortCountResponse")
 
-ISystemProperties_getMaxBootPositionRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxBootPosition").pyclass
+ISystemProperties_getMaxBootPositionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxBootPosition")
 
-ISystemProperties_getMaxBootPositionResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxBootPositionResponse").pyclass
+ISystemProperties_getMaxBootPositionResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxBootPositionResponse")
 
-ISystemProperties_getExclusiveHwVirtRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getExclusiveHwVirt").pyclass
+ISystemProperties_getExclusiveHwVirtRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getExclusiveHwVirt")
 
-ISystemProperties_getExclusiveHwVirtResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getExclusiveHwVirtResponse").pyclass
+ISystemProperties_getExclusiveHwVirtResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getExclusiveHwVirtResponse")
 
-ISystemProperties_setExclusiveHwVirtRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setExclusiveHwVirt").pyclass
+ISystemProperties_setExclusiveHwVirtRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setExclusiveHwVirt")
 
-ISystemProperties_setExclusiveHwVirtResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setExclusiveHwVirtResponse").pyclass
+ISystemProperties_setExclusiveHwVirtResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setExclusiveHwVirtResponse")
 
-ISystemProperties_getDefaultMachineFolderRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultMachineFolder").pyclass
+ISystemProperties_getDefaultMachineFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultMachineFolder")
 
-ISystemProperties_getDefaultMachineFolderResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultMachineFolderResponse").pyclass
+ISystemProperties_getDefaultMachineFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultMachineFolderResponse")
 
-ISystemProperties_setDefaultMachineFolderRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultMachineFolder").pyclass
+ISystemProperties_setDefaultMachineFolderRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultMachineFolder")
 
-ISystemProperties_setDefaultMachineFolderResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultMachineFolderResponse").pyclass
+ISystemProperties_setDefaultMachineFolderResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultMachineFolderResponse")
 
-ISystemProperties_getLoggingLevelRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getLoggingLevel").pyclass
+ISystemProperties_getLoggingLevelRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getLoggingLevel")
 
-ISystemProperties_getLoggingLevelResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getLoggingLevelResponse").pyclass
+ISystemProperties_getLoggingLevelResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getLoggingLevelResponse")
 
-ISystemProperties_setLoggingLevelRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setLoggingLevel").pyclass
+ISystemProperties_setLoggingLevelRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setLoggingLevel")
 
-ISystemProperties_setLoggingLevelResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setLoggingLevelResponse").pyclass
+ISystemProperties_setLoggingLevelResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setLoggingLevelResponse")
 
-ISystemProperties_getMediumFormatsRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMediumFormats").pyclass
+ISystemProperties_getMediumFormatsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMediumFormats")
 
-ISystemProperties_getMediumFormatsResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMediumFormatsResponse").pyclass
+ISystemProperties_getMediumFormatsResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMediumFormatsResponse")
 
-ISystemProperties_getDefaultHardDiskFormatRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultHardDiskFormat").pyclass
+ISystemProperties_getDefaultHardDiskFormatRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultHardDiskFormat")
 
-ISystemProperties_getDefaultHardDiskFormatResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultHardDiskFormatResponse").pyclass
+ISystemProperties_getDefaultHardDiskFormatResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultHardDiskFormatResponse")
 
-ISystemProperties_setDefaultHardDiskFormatRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultHardDiskFormat").pyclass
+ISystemProperties_setDefaultHardDiskFormatRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultHardDiskFormat")
 
-ISystemProperties_setDefaultHardDiskFormatResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultHardDiskFormatResponse").pyclass
+ISystemProperties_setDefaultHardDiskFormatResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultHardDiskFormatResponse")
 
-ISystemProperties_getFreeDiskSpaceWarningRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceWarning").pyclass
+ISystemProperties_getFreeDiskSpaceWarningRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceWarning")
 
-ISystemProperties_getFreeDiskSpaceWarningResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceWarningResponse").pyclass
+ISystemProperties_getFreeDiskSpaceWarningResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceWarningResponse")
 
-ISystemProperties_setFreeDiskSpaceWarningRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceWarning").pyclass
+ISystemProperties_setFreeDiskSpaceWarningRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceWarning")
 
-ISystemProperties_setFreeDiskSpaceWarningResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceWarningResponse").pyclass
+ISystemProperties_setFreeDiskSpaceWarningResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceWarningResponse")
 
-ISystemProperties_getFreeDiskSpacePercentWarningRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentWarning").pyclass
+ISystemProperties_getFreeDiskSpacePercentWarningRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentWarning")
 
-ISystemProperties_getFreeDiskSpacePercentWarningResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentWarningResponse").pyclass
+ISystemProperties_getFreeDiskSpacePercentWarningResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentWarningResponse")
 
-ISystemProperties_setFreeDiskSpacePercentWarningRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentWarning").pyclass
+ISystemProperties_setFreeDiskSpacePercentWarningRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentWarning")
 
-ISystemProperties_setFreeDiskSpacePercentWarningResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentWarningResponse").pyclass
+ISystemProperties_setFreeDiskSpacePercentWarningResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentWarningResponse")
 
-ISystemProperties_getFreeDiskSpaceErrorRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceError").pyclass
+ISystemProperties_getFreeDiskSpaceErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceError")
 
-ISystemProperties_getFreeDiskSpaceErrorResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceErrorResponse").pyclass
+ISystemProperties_getFreeDiskSpaceErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpaceErrorResponse")
 
-ISystemProperties_setFreeDiskSpaceErrorRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceError").pyclass
+ISystemProperties_setFreeDiskSpaceErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceError")
 
-ISystemProperties_setFreeDiskSpaceErrorResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceErrorResponse").pyclass
+ISystemProperties_setFreeDiskSpaceErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpaceErrorResponse")
 
-ISystemProperties_getFreeDiskSpacePercentErrorRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentError").pyclass
+ISystemProperties_getFreeDiskSpacePercentErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentError")
 
-ISystemProperties_getFreeDiskSpacePercentErrorResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentErrorResponse").pyclass
+ISystemProperties_getFreeDiskSpacePercentErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getFreeDiskSpacePercentErrorResponse")
 
-ISystemProperties_setFreeDiskSpacePercentErrorRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentError").pyclass
+ISystemProperties_setFreeDiskSpacePercentErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentError")
 
-ISystemProperties_setFreeDiskSpacePercentErrorResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentErrorResponse").pyclass
+ISystemProperties_setFreeDiskSpacePercentErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setFreeDiskSpacePercentErrorResponse")
 
-ISystemProperties_getVRDEAuthLibraryRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getVRDEAuthLibrary").pyclass
+ISystemProperties_getVRDEAuthLibraryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getVRDEAuthLibrary")
 
-ISystemProperties_getVRDEAuthLibraryResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getVRDEAuthLibraryResponse").pyclass
+ISystemProperties_getVRDEAuthLibraryResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getVRDEAuthLibraryResponse")
 
-ISystemProperties_setVRDEAuthLibraryRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setVRDEAuthLibrary").pyclass
+ISystemProperties_setVRDEAuthLibraryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setVRDEAuthLibrary")
 
-ISystemProperties_setVRDEAuthLibraryResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setVRDEAuthLibraryResponse").pyclass
+ISystemProperties_setVRDEAuthLibraryResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setVRDEAuthLibraryResponse")
 
-ISystemProperties_getWebServiceAuthLibraryRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getWebServiceAuthLibrary").pyclass
+ISystemProperties_getWebServiceAuthLibraryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getWebServiceAuthLibrary")
 
-ISystemProperties_getWebServiceAuthLibraryResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getWebServiceAuthLibraryResponse").pyclass
+ISystemProperties_getWebServiceAuthLibraryResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getWebServiceAuthLibraryResponse")
 
-ISystemProperties_setWebServiceAuthLibraryRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setWebServiceAuthLibrary").pyclass
+ISystemProperties_setWebServiceAuthLibraryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setWebServiceAuthLibrary")
 
-ISystemProperties_setWebServiceAuthLibraryResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setWebServiceAuthLibraryResponse").pyclass
+ISystemProperties_setWebServiceAuthLibraryResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setWebServiceAuthLibraryResponse")
 
-ISystemProperties_getDefaultVRDEExtPackRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultVRDEExtPack").pyclass
+ISystemProperties_getDefaultVRDEExtPackRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultVRDEExtPack")
 
-ISystemProperties_getDefaultVRDEExtPackResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultVRDEExtPackResponse").pyclass
+ISystemProperties_getDefaultVRDEExtPackResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultVRDEExtPackResponse")
 
-ISystemProperties_setDefaultVRDEExtPackRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultVRDEExtPack").pyclass
+ISystemProperties_setDefaultVRDEExtPackRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultVRDEExtPack")
 
-ISystemProperties_setDefaultVRDEExtPackResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultVRDEExtPackResponse").pyclass
+ISystemProperties_setDefaultVRDEExtPackResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultVRDEExtPackResponse")
 
-ISystemProperties_getLogHistoryCountRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getLogHistoryCount").pyclass
+ISystemProperties_getLogHistoryCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getLogHistoryCount")
 
-ISystemProperties_getLogHistoryCountResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getLogHistoryCountResponse").pyclass
+ISystemProperties_getLogHistoryCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getLogHistoryCountResponse")
 
-ISystemProperties_setLogHistoryCountRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setLogHistoryCount").pyclass
+ISystemProperties_setLogHistoryCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setLogHistoryCount")
 
-ISystemProperties_setLogHistoryCountResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setLogHistoryCountResponse").pyclass
+ISystemProperties_setLogHistoryCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setLogHistoryCountResponse")
 
-ISystemProperties_getDefaultAudioDriverRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultAudioDriver").pyclass
+ISystemProperties_getDefaultAudioDriverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultAudioDriver")
 
-ISystemProperties_getDefaultAudioDriverResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultAudioDriverResponse").pyclass
+ISystemProperties_getDefaultAudioDriverResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultAudioDriverResponse")
 
-ISystemProperties_getAutostartDatabasePathRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getAutostartDatabasePath").pyclass
+ISystemProperties_getAutostartDatabasePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getAutostartDatabasePath")
 
-ISystemProperties_getAutostartDatabasePathResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getAutostartDatabasePathResponse").pyclass
+ISystemProperties_getAutostartDatabasePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getAutostartDatabasePathResponse")
 
-ISystemProperties_setAutostartDatabasePathRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setAutostartDatabasePath").pyclass
+ISystemProperties_setAutostartDatabasePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setAutostartDatabasePath")
 
-ISystemProperties_setAutostartDatabasePathResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setAutostartDatabasePathResponse").pyclass
+ISystemProperties_setAutostartDatabasePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setAutostartDatabasePathResponse")
 
-ISystemProperties_getDefaultAdditionsISORequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultAdditionsISO").pyclass
+ISystemProperties_getDefaultAdditionsISORequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultAdditionsISO")
 
-ISystemProperties_getDefaultAdditionsISOResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultAdditionsISOResponse").pyclass
+ISystemProperties_getDefaultAdditionsISOResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultAdditionsISOResponse")
 
-ISystemProperties_setDefaultAdditionsISORequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultAdditionsISO").pyclass
+ISystemProperties_setDefaultAdditionsISORequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultAdditionsISO")
 
-ISystemProperties_setDefaultAdditionsISOResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultAdditionsISOResponse").pyclass
+ISystemProperties_setDefaultAdditionsISOResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultAdditionsISOResponse")
 
-ISystemProperties_getDefaultFrontendRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultFrontend").pyclass
+ISystemProperties_getDefaultFrontendRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultFrontend")
 
-ISystemProperties_getDefaultFrontendResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultFrontendResponse").pyclass
+ISystemProperties_getDefaultFrontendResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultFrontendResponse")
 
-ISystemProperties_setDefaultFrontendRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultFrontend").pyclass
+ISystemProperties_setDefaultFrontendRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultFrontend")
 
-ISystemProperties_setDefaultFrontendResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_setDefaultFrontendResponse").pyclass
+ISystemProperties_setDefaultFrontendResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_setDefaultFrontendResponse")
 
-ISystemProperties_getMaxNetworkAdaptersRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdapters").pyclass
+ISystemProperties_getMaxNetworkAdaptersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdapters")
 
-ISystemProperties_getMaxNetworkAdaptersResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdaptersResponse").pyclass
+ISystemProperties_getMaxNetworkAdaptersResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdaptersResponse")
 
-ISystemProperties_getMaxNetworkAdaptersOfTypeRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdaptersOfType").pyclass
+ISystemProperties_getMaxNetworkAdaptersOfTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdaptersOfType")
 
-ISystemProperties_getMaxNetworkAdaptersOfTypeResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdaptersOfTypeResponse").pyclass
+ISystemProperties_getMaxNetworkAdaptersOfTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxNetworkAdaptersOfTypeResponse")
 
-ISystemProperties_getMaxDevicesPerPortForStorageBusRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxDevicesPerPortForStorageBus").pyclass
+ISystemProperties_getMaxDevicesPerPortForStorageBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxDevicesPerPortForStorageBus")
 
-ISystemProperties_getMaxDevicesPerPortForStorageBusResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxDevicesPerPortForStorageBusResponse").pyclass
+ISystemProperties_getMaxDevicesPerPortForStorageBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxDevicesPerPortForStorageBusResponse")
 
-ISystemProperties_getMinPortCountForStorageBusRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinPortCountForStorageBus").pyclass
+ISystemProperties_getMinPortCountForStorageBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinPortCountForStorageBus")
 
-ISystemProperties_getMinPortCountForStorageBusResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMinPortCountForStorageBusResponse").pyclass
+ISystemProperties_getMinPortCountForStorageBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMinPortCountForStorageBusResponse")
 
-ISystemProperties_getMaxPortCountForStorageBusRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxPortCountForStorageBus").pyclass
+ISystemProperties_getMaxPortCountForStorageBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxPortCountForStorageBus")
 
-ISystemProperties_getMaxPortCountForStorageBusResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxPortCountForStorageBusResponse").pyclass
+ISystemProperties_getMaxPortCountForStorageBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxPortCountForStorageBusResponse")
 
-ISystemProperties_getMaxInstancesOfStorageBusRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfStorageBus").pyclass
+ISystemProperties_getMaxInstancesOfStorageBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfStorageBus")
 
-ISystemProperties_getMaxInstancesOfStorageBusResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfStorageBusResponse").pyclass
+ISystemProperties_getMaxInstancesOfStorageBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfStorageBusResponse")
 
-ISystemProperties_getDeviceTypesForStorageBusRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDeviceTypesForStorageBus").pyclass
+ISystemProperties_getDeviceTypesForStorageBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDeviceTypesForStorageBus")
 
-ISystemProperties_getDeviceTypesForStorageBusResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDeviceTypesForStorageBusResponse").pyclass
+ISystemProperties_getDeviceTypesForStorageBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDeviceTypesForStorageBusResponse")
 
-ISystemProperties_getDefaultIoCacheSettingForStorageControllerRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultIoCacheSettingForStorageController").pyclass
+ISystemProperties_getDefaultIoCacheSettingForStorageControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultIoCacheSettingForStorageController")
 
-ISystemProperties_getDefaultIoCacheSettingForStorageControllerResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getDefaultIoCacheSettingForStorageControllerResponse").pyclass
+ISystemProperties_getDefaultIoCacheSettingForStorageControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getDefaultIoCacheSettingForStorageControllerResponse")
 
-ISystemProperties_getMaxInstancesOfUSBControllerTypeRequestMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfUSBControllerType").pyclass
+ISystemProperties_getMaxInstancesOfUSBControllerTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfUSBControllerType")
 
-ISystemProperties_getMaxInstancesOfUSBControllerTypeResultMsg = GED("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfUSBControllerTypeResponse").pyclass
+ISystemProperties_getMaxInstancesOfUSBControllerTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISystemProperties_getMaxInstancesOfUSBControllerTypeResponse")
 
-IGuestSession_getUserRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getUser").pyclass
+IGuestSession_getUserRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getUser")
 
-IGuestSession_getUserResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getUserResponse").pyclass
+IGuestSession_getUserResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getUserResponse")
 
-IGuestSession_getDomainRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getDomain").pyclass
+IGuestSession_getDomainRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getDomain")
 
-IGuestSession_getDomainResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getDomainResponse").pyclass
+IGuestSession_getDomainResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getDomainResponse")
 
-IGuestSession_getNameRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getName").pyclass
+IGuestSession_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getName")
 
-IGuestSession_getNameResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getNameResponse").pyclass
+IGuestSession_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getNameResponse")
 
-IGuestSession_getIdRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getId").pyclass
+IGuestSession_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getId")
 
-IGuestSession_getIdResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getIdResponse").pyclass
+IGuestSession_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getIdResponse")
 
-IGuestSession_getTimeoutRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getTimeout").pyclass
+IGuestSession_getTimeoutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getTimeout")
 
-IGuestSession_getTimeoutResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getTimeoutResponse").pyclass
+IGuestSession_getTimeoutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getTimeoutResponse")
 
-IGuestSession_setTimeoutRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_setTimeout").pyclass
+IGuestSession_setTimeoutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_setTimeout")
 
-IGuestSession_setTimeoutResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_setTimeoutResponse").pyclass
+IGuestSession_setTimeoutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_setTimeoutResponse")
 
-IGuestSession_getProtocolVersionRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getProtocolVersion").pyclass
+IGuestSession_getProtocolVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getProtocolVersion")
 
-IGuestSession_getProtocolVersionResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getProtocolVersionResponse").pyclass
+IGuestSession_getProtocolVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getProtocolVersionResponse")
 
-IGuestSession_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getStatus").pyclass
+IGuestSession_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getStatus")
 
-IGuestSession_getStatusResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getStatusResponse").pyclass
+IGuestSession_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getStatusResponse")
 
-IGuestSession_getEnvironmentRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getEnvironment").pyclass
+IGuestSession_getEnvironmentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getEnvironment")
 
-IGuestSession_getEnvironmentResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getEnvironmentResponse").pyclass
+IGuestSession_getEnvironmentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getEnvironmentResponse")
 
-IGuestSession_setEnvironmentRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_setEnvironment").pyclass
+IGuestSession_setEnvironmentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_setEnvironment")
 
-IGuestSession_setEnvironmentResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_setEnvironmentResponse").pyclass
+IGuestSession_setEnvironmentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_setEnvironmentResponse")
 
-IGuestSession_getProcessesRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getProcesses").pyclass
+IGuestSession_getProcessesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getProcesses")
 
-IGuestSession_getProcessesResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getProcessesResponse").pyclass
+IGuestSession_getProcessesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getProcessesResponse")
 
-IGuestSession_getDirectoriesRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getDirectories").pyclass
+IGuestSession_getDirectoriesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getDirectories")
 
-IGuestSession_getDirectoriesResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getDirectoriesResponse").pyclass
+IGuestSession_getDirectoriesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getDirectoriesResponse")
 
-IGuestSession_getFilesRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getFiles").pyclass
+IGuestSession_getFilesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getFiles")
 
-IGuestSession_getFilesResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getFilesResponse").pyclass
+IGuestSession_getFilesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getFilesResponse")
 
-IGuestSession_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_getEventSource").pyclass
+IGuestSession_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getEventSource")
 
-IGuestSession_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_getEventSourceResponse").pyclass
+IGuestSession_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_getEventSourceResponse")
 
-IGuestSession_closeRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_close").pyclass
+IGuestSession_closeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_close")
 
-IGuestSession_closeResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_closeResponse").pyclass
+IGuestSession_closeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_closeResponse")
 
-IGuestSession_copyFromRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_copyFrom").pyclass
+IGuestSession_copyFromRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_copyFrom")
 
-IGuestSession_copyFromResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_copyFromResponse").pyclass
+IGuestSession_copyFromResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_copyFromResponse")
 
-IGuestSession_copyToRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_copyTo").pyclass
+IGuestSession_copyToRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_copyTo")
 
-IGuestSession_copyToResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_copyToResponse").pyclass
+IGuestSession_copyToResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_copyToResponse")
 
-IGuestSession_directoryCreateRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryCreate").pyclass
+IGuestSession_directoryCreateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryCreate")
 
-IGuestSession_directoryCreateResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryCreateResponse").pyclass
+IGuestSession_directoryCreateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryCreateResponse")
 
-IGuestSession_directoryCreateTempRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryCreateTemp").pyclass
+IGuestSession_directoryCreateTempRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryCreateTemp")
 
-IGuestSession_directoryCreateTempResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryCreateTempResponse").pyclass
+IGuestSession_directoryCreateTempResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryCreateTempResponse")
 
-IGuestSession_directoryExistsRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryExists").pyclass
+IGuestSession_directoryExistsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryExists")
 
-IGuestSession_directoryExistsResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryExistsResponse").pyclass
+IGuestSession_directoryExistsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryExistsResponse")
 
-IGuestSession_directoryOpenRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryOpen").pyclass
+IGuestSession_directoryOpenRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryOpen")
 
-IGuestSession_directoryOpenResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryOpenResponse").pyclass
+IGuestSession_directoryOpenResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryOpenResponse")
 
-IGuestSession_directoryQueryInfoRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryQueryInfo").pyclass
+IGuestSession_directoryQueryInfoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryQueryInfo")
 
-IGuestSession_directoryQueryInfoResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryQueryInfoResponse").pyclass
+IGuestSession_directoryQueryInfoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryQueryInfoResponse")
 
-IGuestSession_directoryRemoveRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryRemove").pyclass
+IGuestSession_directoryRemoveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryRemove")
 
-IGuestSession_directoryRemoveResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryRemoveResponse").pyclass
+IGuestSession_directoryRemoveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryRemoveResponse")
 
-IGuestSession_directoryRemoveRecursiveRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryRemoveRecursive").pyclass
+IGuestSession_directoryRemoveRecursiveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryRemoveRecursive")
 
-IGuestSession_directoryRemoveRecursiveResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryRemoveRecursiveResponse").pyclass
+IGuestSession_directoryRemoveRecursiveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryRemoveRecursiveResponse")
 
-IGuestSession_directoryRenameRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryRename").pyclass
+IGuestSession_directoryRenameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryRename")
 
-IGuestSession_directoryRenameResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directoryRenameResponse").pyclass
+IGuestSession_directoryRenameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directoryRenameResponse")
 
-IGuestSession_directorySetACLRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_directorySetACL").pyclass
+IGuestSession_directorySetACLRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directorySetACL")
 
-IGuestSession_directorySetACLResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_directorySetACLResponse").pyclass
+IGuestSession_directorySetACLResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_directorySetACLResponse")
 
-IGuestSession_environmentClearRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentClear").pyclass
+IGuestSession_environmentClearRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentClear")
 
-IGuestSession_environmentClearResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentClearResponse").pyclass
+IGuestSession_environmentClearResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentClearResponse")
 
-IGuestSession_environmentGetRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentGet").pyclass
+IGuestSession_environmentGetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentGet")
 
-IGuestSession_environmentGetResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentGetResponse").pyclass
+IGuestSession_environmentGetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentGetResponse")
 
-IGuestSession_environmentSetRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentSet").pyclass
+IGuestSession_environmentSetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentSet")
 
-IGuestSession_environmentSetResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentSetResponse").pyclass
+IGuestSession_environmentSetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentSetResponse")
 
-IGuestSession_environmentUnsetRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentUnset").pyclass
+IGuestSession_environmentUnsetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentUnset")
 
-IGuestSession_environmentUnsetResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_environmentUnsetResponse").pyclass
+IGuestSession_environmentUnsetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_environmentUnsetResponse")
 
-IGuestSession_fileCreateTempRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileCreateTemp").pyclass
+IGuestSession_fileCreateTempRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileCreateTemp")
 
-IGuestSession_fileCreateTempResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileCreateTempResponse").pyclass
+IGuestSession_fileCreateTempResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileCreateTempResponse")
 
-IGuestSession_fileExistsRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileExists").pyclass
+IGuestSession_fileExistsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileExists")
 
-IGuestSession_fileExistsResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileExistsResponse").pyclass
+IGuestSession_fileExistsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileExistsResponse")
 
-IGuestSession_fileRemoveRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileRemove").pyclass
+IGuestSession_fileRemoveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileRemove")
 
-IGuestSession_fileRemoveResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileRemoveResponse").pyclass
+IGuestSession_fileRemoveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileRemoveResponse")
 
-IGuestSession_fileOpenRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileOpen").pyclass
+IGuestSession_fileOpenRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileOpen")
 
-IGuestSession_fileOpenResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileOpenResponse").pyclass
+IGuestSession_fileOpenResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileOpenResponse")
 
-IGuestSession_fileOpenExRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileOpenEx").pyclass
+IGuestSession_fileOpenExRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileOpenEx")
 
-IGuestSession_fileOpenExResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileOpenExResponse").pyclass
+IGuestSession_fileOpenExResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileOpenExResponse")
 
-IGuestSession_fileQueryInfoRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileQueryInfo").pyclass
+IGuestSession_fileQueryInfoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileQueryInfo")
 
-IGuestSession_fileQueryInfoResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileQueryInfoResponse").pyclass
+IGuestSession_fileQueryInfoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileQueryInfoResponse")
 
-IGuestSession_fileQuerySizeRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileQuerySize").pyclass
+IGuestSession_fileQuerySizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileQuerySize")
 
-IGuestSession_fileQuerySizeResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileQuerySizeResponse").pyclass
+IGuestSession_fileQuerySizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileQuerySizeResponse")
 
-IGuestSession_fileRenameRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileRename").pyclass
+IGuestSession_fileRenameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileRename")
 
-IGuestSession_fileRenameResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileRenameResponse").pyclass
+IGuestSession_fileRenameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileRenameResponse")
 
-IGuestSession_fileSetACLRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileSetACL").pyclass
+IGuestSession_fileSetACLRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileSetACL")
 
-IGuestSession_fileSetACLResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_fileSetACLResponse").pyclass
+IGuestSession_fileSetACLResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_fileSetACLResponse")
 
-IGuestSession_processCreateRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_processCreate").pyclass
+IGuestSession_processCreateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_processCreate")
 
-IGuestSession_processCreateResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_processCreateResponse").pyclass
+IGuestSession_processCreateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_processCreateResponse")
 
-IGuestSession_processCreateExRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_processCreateEx").pyclass
+IGuestSession_processCreateExRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_processCreateEx")
 
-IGuestSession_processCreateExResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_processCreateExResponse").pyclass
+IGuestSession_processCreateExResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_processCreateExResponse")
 
-IGuestSession_processGetRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_processGet").pyclass
+IGuestSession_processGetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_processGet")
 
-IGuestSession_processGetResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_processGetResponse").pyclass
+IGuestSession_processGetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_processGetResponse")
 
-IGuestSession_symlinkCreateRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkCreate").pyclass
+IGuestSession_symlinkCreateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkCreate")
 
-IGuestSession_symlinkCreateResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkCreateResponse").pyclass
+IGuestSession_symlinkCreateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkCreateResponse")
 
-IGuestSession_symlinkExistsRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkExists").pyclass
+IGuestSession_symlinkExistsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkExists")
 
-IGuestSession_symlinkExistsResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkExistsResponse").pyclass
+IGuestSession_symlinkExistsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkExistsResponse")
 
-IGuestSession_symlinkReadRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkRead").pyclass
+IGuestSession_symlinkReadRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkRead")
 
-IGuestSession_symlinkReadResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkReadResponse").pyclass
+IGuestSession_symlinkReadResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkReadResponse")
 
-IGuestSession_symlinkRemoveDirectoryRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveDirectory").pyclass
+IGuestSession_symlinkRemoveDirectoryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveDirectory")
 
-IGuestSession_symlinkRemoveDirectoryResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveDirectoryResponse").pyclass
+IGuestSession_symlinkRemoveDirectoryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveDirectoryResponse")
 
-IGuestSession_symlinkRemoveFileRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveFile").pyclass
+IGuestSession_symlinkRemoveFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveFile")
 
-IGuestSession_symlinkRemoveFileResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveFileResponse").pyclass
+IGuestSession_symlinkRemoveFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_symlinkRemoveFileResponse")
 
-IGuestSession_waitForRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_waitFor").pyclass
+IGuestSession_waitForRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_waitFor")
 
-IGuestSession_waitForResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_waitForResponse").pyclass
+IGuestSession_waitForResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_waitForResponse")
 
-IGuestSession_waitForArrayRequestMsg = GED("http://www.virtualbox.org/", "IGuestSession_waitForArray").pyclass
+IGuestSession_waitForArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_waitForArray")
 
-IGuestSession_waitForArrayResultMsg = GED("http://www.virtualbox.org/", "IGuestSession_waitForArrayResponse").pyclass
+IGuestSession_waitForArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSession_waitForArrayResponse")
 
-IProcess_getArgumentsRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getArguments").pyclass
+IProcess_getArgumentsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getArguments")
 
-IProcess_getArgumentsResultMsg = GED("http://www.virtualbox.org/", "IProcess_getArgumentsResponse").pyclass
+IProcess_getArgumentsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getArgumentsResponse")
 
-IProcess_getEnvironmentRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getEnvironment").pyclass
+IProcess_getEnvironmentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getEnvironment")
 
-IProcess_getEnvironmentResultMsg = GED("http://www.virtualbox.org/", "IProcess_getEnvironmentResponse").pyclass
+IProcess_getEnvironmentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getEnvironmentResponse")
 
-IProcess_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getEventSource").pyclass
+IProcess_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getEventSource")
 
-IProcess_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IProcess_getEventSourceResponse").pyclass
+IProcess_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getEventSourceResponse")
 
-IProcess_getExecutablePathRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getExecutablePath").pyclass
+IProcess_getExecutablePathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getExecutablePath")
 
-IProcess_getExecutablePathResultMsg = GED("http://www.virtualbox.org/", "IProcess_getExecutablePathResponse").pyclass
+IProcess_getExecutablePathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getExecutablePathResponse")
 
-IProcess_getExitCodeRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getExitCode").pyclass
+IProcess_getExitCodeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getExitCode")
 
-IProcess_getExitCodeResultMsg = GED("http://www.virtualbox.org/", "IProcess_getExitCodeResponse").pyclass
+IProcess_getExitCodeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getExitCodeResponse")
 
-IProcess_getNameRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getName").pyclass
+IProcess_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getName")
 
-IProcess_getNameResultMsg = GED("http://www.virtualbox.org/", "IProcess_getNameResponse").pyclass
+IProcess_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getNameResponse")
 
-IProcess_getPIDRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getPID").pyclass
+IProcess_getPIDRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getPID")
 
-IProcess_getPIDResultMsg = GED("http://www.virtualbox.org/", "IProcess_getPIDResponse").pyclass
+IProcess_getPIDResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getPIDResponse")
 
-IProcess_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IProcess_getStatus").pyclass
+IProcess_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getStatus")
 
-IProcess_getStatusResultMsg = GED("http://www.virtualbox.org/", "IProcess_getStatusResponse").pyclass
+IProcess_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_getStatusResponse")
 
-IProcess_waitForRequestMsg = GED("http://www.virtualbox.org/", "IProcess_waitFor").pyclass
+IProcess_waitForRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_waitFor")
 
-IProcess_waitForResultMsg = GED("http://www.virtualbox.org/", "IProcess_waitForResponse").pyclass
+IProcess_waitForResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_waitForResponse")
 
-IProcess_waitForArrayRequestMsg = GED("http://www.virtualbox.org/", "IProcess_waitForArray").pyclass
+IProcess_waitForArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_waitForArray")
 
-IProcess_waitForArrayResultMsg = GED("http://www.virtualbox.org/", "IProcess_waitForArrayResponse").pyclass
+IProcess_waitForArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_waitForArrayResponse")
 
-IProcess_readRequestMsg = GED("http://www.virtualbox.org/", "IProcess_read").pyclass
+IProcess_readRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_read")
 
-IProcess_readResultMsg = GED("http://www.virtualbox.org/", "IProcess_readResponse").pyclass
+IProcess_readResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_readResponse")
 
-IProcess_writeRequestMsg = GED("http://www.virtualbox.org/", "IProcess_write").pyclass
+IProcess_writeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_write")
 
-IProcess_writeResultMsg = GED("http://www.virtualbox.org/", "IProcess_writeResponse").pyclass
+IProcess_writeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_writeResponse")
 
-IProcess_writeArrayRequestMsg = GED("http://www.virtualbox.org/", "IProcess_writeArray").pyclass
+IProcess_writeArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_writeArray")
 
-IProcess_writeArrayResultMsg = GED("http://www.virtualbox.org/", "IProcess_writeArrayResponse").pyclass
+IProcess_writeArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_writeArrayResponse")
 
-IProcess_terminateRequestMsg = GED("http://www.virtualbox.org/", "IProcess_terminate").pyclass
+IProcess_terminateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_terminate")
 
-IProcess_terminateResultMsg = GED("http://www.virtualbox.org/", "IProcess_terminateResponse").pyclass
+IProcess_terminateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProcess_terminateResponse")
 
-IDirectory_getDirectoryNameRequestMsg = GED("http://www.virtualbox.org/", "IDirectory_getDirectoryName").pyclass
+IDirectory_getDirectoryNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_getDirectoryName")
 
-IDirectory_getDirectoryNameResultMsg = GED("http://www.virtualbox.org/", "IDirectory_getDirectoryNameResponse").pyclass
+IDirectory_getDirectoryNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_getDirectoryNameResponse")
 
-IDirectory_getFilterRequestMsg = GED("http://www.virtualbox.org/", "IDirectory_getFilter").pyclass
+IDirectory_getFilterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_getFilter")
 
-IDirectory_getFilterResultMsg = GED("http://www.virtualbox.org/", "IDirectory_getFilterResponse").pyclass
+IDirectory_getFilterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_getFilterResponse")
 
-IDirectory_closeRequestMsg = GED("http://www.virtualbox.org/", "IDirectory_close").pyclass
+IDirectory_closeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_close")
 
-IDirectory_closeResultMsg = GED("http://www.virtualbox.org/", "IDirectory_closeResponse").pyclass
+IDirectory_closeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_closeResponse")
 
-IDirectory_readRequestMsg = GED("http://www.virtualbox.org/", "IDirectory_read").pyclass
+IDirectory_readRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_read")
 
-IDirectory_readResultMsg = GED("http://www.virtualbox.org/", "IDirectory_readResponse").pyclass
+IDirectory_readResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDirectory_readResponse")
 
-IFile_getCreationModeRequestMsg = GED("http://www.virtualbox.org/", "IFile_getCreationMode").pyclass
+IFile_getCreationModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getCreationMode")
 
-IFile_getCreationModeResultMsg = GED("http://www.virtualbox.org/", "IFile_getCreationModeResponse").pyclass
+IFile_getCreationModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getCreationModeResponse")
 
-IFile_getDispositionRequestMsg = GED("http://www.virtualbox.org/", "IFile_getDisposition").pyclass
+IFile_getDispositionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getDisposition")
 
-IFile_getDispositionResultMsg = GED("http://www.virtualbox.org/", "IFile_getDispositionResponse").pyclass
+IFile_getDispositionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getDispositionResponse")
 
-IFile_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IFile_getEventSource").pyclass
+IFile_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getEventSource")
 
-IFile_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IFile_getEventSourceResponse").pyclass
+IFile_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getEventSourceResponse")
 
-IFile_getFileNameRequestMsg = GED("http://www.virtualbox.org/", "IFile_getFileName").pyclass
+IFile_getFileNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getFileName")
 
-IFile_getFileNameResultMsg = GED("http://www.virtualbox.org/", "IFile_getFileNameResponse").pyclass
+IFile_getFileNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getFileNameResponse")
 
-IFile_getIdRequestMsg = GED("http://www.virtualbox.org/", "IFile_getId").pyclass
+IFile_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getId")
 
-IFile_getIdResultMsg = GED("http://www.virtualbox.org/", "IFile_getIdResponse").pyclass
+IFile_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getIdResponse")
 
-IFile_getInitialSizeRequestMsg = GED("http://www.virtualbox.org/", "IFile_getInitialSize").pyclass
+IFile_getInitialSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getInitialSize")
 
-IFile_getInitialSizeResultMsg = GED("http://www.virtualbox.org/", "IFile_getInitialSizeResponse").pyclass
+IFile_getInitialSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getInitialSizeResponse")
 
-IFile_getOpenModeRequestMsg = GED("http://www.virtualbox.org/", "IFile_getOpenMode").pyclass
+IFile_getOpenModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getOpenMode")
 
-IFile_getOpenModeResultMsg = GED("http://www.virtualbox.org/", "IFile_getOpenModeResponse").pyclass
+IFile_getOpenModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getOpenModeResponse")
 
-IFile_getOffsetRequestMsg = GED("http://www.virtualbox.org/", "IFile_getOffset").pyclass
+IFile_getOffsetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getOffset")
 
-IFile_getOffsetResultMsg = GED("http://www.virtualbox.org/", "IFile_getOffsetResponse").pyclass
+IFile_getOffsetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getOffsetResponse")
 
-IFile_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IFile_getStatus").pyclass
+IFile_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getStatus")
 
-IFile_getStatusResultMsg = GED("http://www.virtualbox.org/", "IFile_getStatusResponse").pyclass
+IFile_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_getStatusResponse")
 
-IFile_closeRequestMsg = GED("http://www.virtualbox.org/", "IFile_close").pyclass
+IFile_closeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_close")
 
-IFile_closeResultMsg = GED("http://www.virtualbox.org/", "IFile_closeResponse").pyclass
+IFile_closeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_closeResponse")
 
-IFile_queryInfoRequestMsg = GED("http://www.virtualbox.org/", "IFile_queryInfo").pyclass
+IFile_queryInfoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_queryInfo")
 
-IFile_queryInfoResultMsg = GED("http://www.virtualbox.org/", "IFile_queryInfoResponse").pyclass
+IFile_queryInfoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_queryInfoResponse")
 
-IFile_readRequestMsg = GED("http://www.virtualbox.org/", "IFile_read").pyclass
+IFile_readRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_read")
 
-IFile_readResultMsg = GED("http://www.virtualbox.org/", "IFile_readResponse").pyclass
+IFile_readResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_readResponse")
 
-IFile_readAtRequestMsg = GED("http://www.virtualbox.org/", "IFile_readAt").pyclass
+IFile_readAtRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_readAt")
 
-IFile_readAtResultMsg = GED("http://www.virtualbox.org/", "IFile_readAtResponse").pyclass
+IFile_readAtResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_readAtResponse")
 
-IFile_seekRequestMsg = GED("http://www.virtualbox.org/", "IFile_seek").pyclass
+IFile_seekRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_seek")
 
-IFile_seekResultMsg = GED("http://www.virtualbox.org/", "IFile_seekResponse").pyclass
+IFile_seekResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_seekResponse")
 
-IFile_setACLRequestMsg = GED("http://www.virtualbox.org/", "IFile_setACL").pyclass
+IFile_setACLRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_setACL")
 
-IFile_setACLResultMsg = GED("http://www.virtualbox.org/", "IFile_setACLResponse").pyclass
+IFile_setACLResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_setACLResponse")
 
-IFile_writeRequestMsg = GED("http://www.virtualbox.org/", "IFile_write").pyclass
+IFile_writeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_write")
 
-IFile_writeResultMsg = GED("http://www.virtualbox.org/", "IFile_writeResponse").pyclass
+IFile_writeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_writeResponse")
 
-IFile_writeAtRequestMsg = GED("http://www.virtualbox.org/", "IFile_writeAt").pyclass
+IFile_writeAtRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_writeAt")
 
-IFile_writeAtResultMsg = GED("http://www.virtualbox.org/", "IFile_writeAtResponse").pyclass
+IFile_writeAtResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFile_writeAtResponse")
 
-IFsObjInfo_getAccessTimeRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getAccessTime").pyclass
+IFsObjInfo_getAccessTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getAccessTime")
 
-IFsObjInfo_getAccessTimeResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getAccessTimeResponse").pyclass
+IFsObjInfo_getAccessTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getAccessTimeResponse")
 
-IFsObjInfo_getAllocatedSizeRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getAllocatedSize").pyclass
+IFsObjInfo_getAllocatedSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getAllocatedSize")
 
-IFsObjInfo_getAllocatedSizeResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getAllocatedSizeResponse").pyclass
+IFsObjInfo_getAllocatedSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getAllocatedSizeResponse")
 
-IFsObjInfo_getBirthTimeRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getBirthTime").pyclass
+IFsObjInfo_getBirthTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getBirthTime")
 
-IFsObjInfo_getBirthTimeResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getBirthTimeResponse").pyclass
+IFsObjInfo_getBirthTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getBirthTimeResponse")
 
-IFsObjInfo_getChangeTimeRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getChangeTime").pyclass
+IFsObjInfo_getChangeTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getChangeTime")
 
-IFsObjInfo_getChangeTimeResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getChangeTimeResponse").pyclass
+IFsObjInfo_getChangeTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getChangeTimeResponse")
 
-IFsObjInfo_getDeviceNumberRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getDeviceNumber").pyclass
+IFsObjInfo_getDeviceNumberRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getDeviceNumber")
 
-IFsObjInfo_getDeviceNumberResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getDeviceNumberResponse").pyclass
+IFsObjInfo_getDeviceNumberResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getDeviceNumberResponse")
 
-IFsObjInfo_getFileAttributesRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getFileAttributes").pyclass
+IFsObjInfo_getFileAttributesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getFileAttributes")
 
-IFsObjInfo_getFileAttributesResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getFileAttributesResponse").pyclass
+IFsObjInfo_getFileAttributesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getFileAttributesResponse")
 
-IFsObjInfo_getGenerationIdRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getGenerationId").pyclass
+IFsObjInfo_getGenerationIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getGenerationId")
 
-IFsObjInfo_getGenerationIdResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getGenerationIdResponse").pyclass
+IFsObjInfo_getGenerationIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getGenerationIdResponse")
 
-IFsObjInfo_getGIDRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getGID").pyclass
+IFsObjInfo_getGIDRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getGID")
 
-IFsObjInfo_getGIDResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getGIDResponse").pyclass
+IFsObjInfo_getGIDResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getGIDResponse")
 
-IFsObjInfo_getGroupNameRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getGroupName").pyclass
+IFsObjInfo_getGroupNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getGroupName")
 
-IFsObjInfo_getGroupNameResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getGroupNameResponse").pyclass
+IFsObjInfo_getGroupNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getGroupNameResponse")
 
-IFsObjInfo_getHardLinksRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getHardLinks").pyclass
+IFsObjInfo_getHardLinksRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getHardLinks")
 
-IFsObjInfo_getHardLinksResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getHardLinksResponse").pyclass
+IFsObjInfo_getHardLinksResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getHardLinksResponse")
 
-IFsObjInfo_getModificationTimeRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getModificationTime").pyclass
+IFsObjInfo_getModificationTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getModificationTime")
 
-IFsObjInfo_getModificationTimeResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getModificationTimeResponse").pyclass
+IFsObjInfo_getModificationTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getModificationTimeResponse")
 
-IFsObjInfo_getNameRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getName").pyclass
+IFsObjInfo_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getName")
 
-IFsObjInfo_getNameResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getNameResponse").pyclass
+IFsObjInfo_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getNameResponse")
 
-IFsObjInfo_getNodeIdRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getNodeId").pyclass
+IFsObjInfo_getNodeIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getNodeId")
 
-IFsObjInfo_getNodeIdResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getNodeIdResponse").pyclass
+IFsObjInfo_getNodeIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getNodeIdResponse")
 
-IFsObjInfo_getNodeIdDeviceRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getNodeIdDevice").pyclass
+IFsObjInfo_getNodeIdDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getNodeIdDevice")
 
-IFsObjInfo_getNodeIdDeviceResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getNodeIdDeviceResponse").pyclass
+IFsObjInfo_getNodeIdDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getNodeIdDeviceResponse")
 
-IFsObjInfo_getObjectSizeRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getObjectSize").pyclass
+IFsObjInfo_getObjectSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getObjectSize")
 
-IFsObjInfo_getObjectSizeResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getObjectSizeResponse").pyclass
+IFsObjInfo_getObjectSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getObjectSizeResponse")
 
-IFsObjInfo_getTypeRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getType").pyclass
+IFsObjInfo_getTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getType")
 
-IFsObjInfo_getTypeResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getTypeResponse").pyclass
+IFsObjInfo_getTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getTypeResponse")
 
-IFsObjInfo_getUIDRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getUID").pyclass
+IFsObjInfo_getUIDRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getUID")
 
-IFsObjInfo_getUIDResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getUIDResponse").pyclass
+IFsObjInfo_getUIDResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getUIDResponse")
 
-IFsObjInfo_getUserFlagsRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getUserFlags").pyclass
+IFsObjInfo_getUserFlagsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getUserFlags")
 
-IFsObjInfo_getUserFlagsResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getUserFlagsResponse").pyclass
+IFsObjInfo_getUserFlagsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getUserFlagsResponse")
 
-IFsObjInfo_getUserNameRequestMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getUserName").pyclass
+IFsObjInfo_getUserNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getUserName")
 
-IFsObjInfo_getUserNameResultMsg = GED("http://www.virtualbox.org/", "IFsObjInfo_getUserNameResponse").pyclass
+IFsObjInfo_getUserNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFsObjInfo_getUserNameResponse")
 
-IGuest_getOSTypeIdRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getOSTypeId").pyclass
+IGuest_getOSTypeIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getOSTypeId")
 
-IGuest_getOSTypeIdResultMsg = GED("http://www.virtualbox.org/", "IGuest_getOSTypeIdResponse").pyclass
+IGuest_getOSTypeIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getOSTypeIdResponse")
 
-IGuest_getAdditionsRunLevelRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsRunLevel").pyclass
+IGuest_getAdditionsRunLevelRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsRunLevel")
 
-IGuest_getAdditionsRunLevelResultMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsRunLevelResponse").pyclass
+IGuest_getAdditionsRunLevelResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsRunLevelResponse")
 
-IGuest_getAdditionsVersionRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsVersion").pyclass
+IGuest_getAdditionsVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsVersion")
 
-IGuest_getAdditionsVersionResultMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsVersionResponse").pyclass
+IGuest_getAdditionsVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsVersionResponse")
 
-IGuest_getAdditionsRevisionRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsRevision").pyclass
+IGuest_getAdditionsRevisionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsRevision")
 
-IGuest_getAdditionsRevisionResultMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsRevisionResponse").pyclass
+IGuest_getAdditionsRevisionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsRevisionResponse")
 
-IGuest_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getEventSource").pyclass
+IGuest_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getEventSource")
 
-IGuest_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IGuest_getEventSourceResponse").pyclass
+IGuest_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getEventSourceResponse")
 
-IGuest_getFacilitiesRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getFacilities").pyclass
+IGuest_getFacilitiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getFacilities")
 
-IGuest_getFacilitiesResultMsg = GED("http://www.virtualbox.org/", "IGuest_getFacilitiesResponse").pyclass
+IGuest_getFacilitiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getFacilitiesResponse")
 
-IGuest_getSessionsRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getSessions").pyclass
+IGuest_getSessionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getSessions")
 
-IGuest_getSessionsResultMsg = GED("http://www.virtualbox.org/", "IGuest_getSessionsResponse").pyclass
+IGuest_getSessionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getSessionsResponse")
 
-IGuest_getMemoryBalloonSizeRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getMemoryBalloonSize").pyclass
+IGuest_getMemoryBalloonSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getMemoryBalloonSize")
 
-IGuest_getMemoryBalloonSizeResultMsg = GED("http://www.virtualbox.org/", "IGuest_getMemoryBalloonSizeResponse").pyclass
+IGuest_getMemoryBalloonSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getMemoryBalloonSizeResponse")
 
-IGuest_setMemoryBalloonSizeRequestMsg = GED("http://www.virtualbox.org/", "IGuest_setMemoryBalloonSize").pyclass
+IGuest_setMemoryBalloonSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_setMemoryBalloonSize")
 
-IGuest_setMemoryBalloonSizeResultMsg = GED("http://www.virtualbox.org/", "IGuest_setMemoryBalloonSizeResponse").pyclass
+IGuest_setMemoryBalloonSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_setMemoryBalloonSizeResponse")
 
-IGuest_getStatisticsUpdateIntervalRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getStatisticsUpdateInterval").pyclass
+IGuest_getStatisticsUpdateIntervalRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getStatisticsUpdateInterval")
 
-IGuest_getStatisticsUpdateIntervalResultMsg = GED("http://www.virtualbox.org/", "IGuest_getStatisticsUpdateIntervalResponse").pyclass
+IGuest_getStatisticsUpdateIntervalResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getStatisticsUpdateIntervalResponse")
 
-IGuest_setStatisticsUpdateIntervalRequestMsg = GED("http://www.virtualbox.org/", "IGuest_setStatisticsUpdateInterval").pyclass
+IGuest_setStatisticsUpdateIntervalRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_setStatisticsUpdateInterval")
 
-IGuest_setStatisticsUpdateIntervalResultMsg = GED("http://www.virtualbox.org/", "IGuest_setStatisticsUpdateIntervalResponse").pyclass
+IGuest_setStatisticsUpdateIntervalResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_setStatisticsUpdateIntervalResponse")
 
-IGuest_internalGetStatisticsRequestMsg = GED("http://www.virtualbox.org/", "IGuest_internalGetStatistics").pyclass
+IGuest_internalGetStatisticsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_internalGetStatistics")
 
-IGuest_internalGetStatisticsResultMsg = GED("http://www.virtualbox.org/", "IGuest_internalGetStatisticsResponse").pyclass
+IGuest_internalGetStatisticsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_internalGetStatisticsResponse")
 
-IGuest_getFacilityStatusRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getFacilityStatus").pyclass
+IGuest_getFacilityStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getFacilityStatus")
 
-IGuest_getFacilityStatusResultMsg = GED("http://www.virtualbox.org/", "IGuest_getFacilityStatusResponse").pyclass
+IGuest_getFacilityStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getFacilityStatusResponse")
 
-IGuest_getAdditionsStatusRequestMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsStatus").pyclass
+IGuest_getAdditionsStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsStatus")
 
-IGuest_getAdditionsStatusResultMsg = GED("http://www.virtualbox.org/", "IGuest_getAdditionsStatusResponse").pyclass
+IGuest_getAdditionsStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_getAdditionsStatusResponse")
 
-IGuest_setCredentialsRequestMsg = GED("http://www.virtualbox.org/", "IGuest_setCredentials").pyclass
+IGuest_setCredentialsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_setCredentials")
 
-IGuest_setCredentialsResultMsg = GED("http://www.virtualbox.org/", "IGuest_setCredentialsResponse").pyclass
+IGuest_setCredentialsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_setCredentialsResponse")
 
-IGuest_dragHGEnterRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGEnter").pyclass
+IGuest_dragHGEnterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGEnter")
 
-IGuest_dragHGEnterResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGEnterResponse").pyclass
+IGuest_dragHGEnterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGEnterResponse")
 
-IGuest_dragHGMoveRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGMove").pyclass
+IGuest_dragHGMoveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGMove")
 
-IGuest_dragHGMoveResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGMoveResponse").pyclass
+IGuest_dragHGMoveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGMoveResponse")
 
-IGuest_dragHGLeaveRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGLeave").pyclass
+IGuest_dragHGLeaveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGLeave")
 
-IGuest_dragHGLeaveResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGLeaveResponse").pyclass
+IGuest_dragHGLeaveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGLeaveResponse")
 
-IGuest_dragHGDropRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGDrop").pyclass
+IGuest_dragHGDropRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGDrop")
 
-IGuest_dragHGDropResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGDropResponse").pyclass
+IGuest_dragHGDropResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGDropResponse")
 
-IGuest_dragHGPutDataRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGPutData").pyclass
+IGuest_dragHGPutDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGPutData")
 
-IGuest_dragHGPutDataResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragHGPutDataResponse").pyclass
+IGuest_dragHGPutDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragHGPutDataResponse")
 
-IGuest_dragGHPendingRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragGHPending").pyclass
+IGuest_dragGHPendingRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragGHPending")
 
-IGuest_dragGHPendingResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragGHPendingResponse").pyclass
+IGuest_dragGHPendingResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragGHPendingResponse")
 
-IGuest_dragGHDroppedRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragGHDropped").pyclass
+IGuest_dragGHDroppedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragGHDropped")
 
-IGuest_dragGHDroppedResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragGHDroppedResponse").pyclass
+IGuest_dragGHDroppedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragGHDroppedResponse")
 
-IGuest_dragGHGetDataRequestMsg = GED("http://www.virtualbox.org/", "IGuest_dragGHGetData").pyclass
+IGuest_dragGHGetDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragGHGetData")
 
-IGuest_dragGHGetDataResultMsg = GED("http://www.virtualbox.org/", "IGuest_dragGHGetDataResponse").pyclass
+IGuest_dragGHGetDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_dragGHGetDataResponse")
 
-IGuest_createSessionRequestMsg = GED("http://www.virtualbox.org/", "IGuest_createSession").pyclass
+IGuest_createSessionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_createSession")
 
-IGuest_createSessionResultMsg = GED("http://www.virtualbox.org/", "IGuest_createSessionResponse").pyclass
+IGuest_createSessionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_createSessionResponse")
 
-IGuest_findSessionRequestMsg = GED("http://www.virtualbox.org/", "IGuest_findSession").pyclass
+IGuest_findSessionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_findSession")
 
-IGuest_findSessionResultMsg = GED("http://www.virtualbox.org/", "IGuest_findSessionResponse").pyclass
+IGuest_findSessionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_findSessionResponse")
 
-IGuest_updateGuestAdditionsRequestMsg = GED("http://www.virtualbox.org/", "IGuest_updateGuestAdditions").pyclass
+IGuest_updateGuestAdditionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_updateGuestAdditions")
 
-IGuest_updateGuestAdditionsResultMsg = GED("http://www.virtualbox.org/", "IGuest_updateGuestAdditionsResponse").pyclass
+IGuest_updateGuestAdditionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuest_updateGuestAdditionsResponse")
 
-IProgress_getIdRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getId").pyclass
+IProgress_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getId")
 
-IProgress_getIdResultMsg = GED("http://www.virtualbox.org/", "IProgress_getIdResponse").pyclass
+IProgress_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getIdResponse")
 
-IProgress_getDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getDescription").pyclass
+IProgress_getDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getDescription")
 
-IProgress_getDescriptionResultMsg = GED("http://www.virtualbox.org/", "IProgress_getDescriptionResponse").pyclass
+IProgress_getDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getDescriptionResponse")
 
-IProgress_getInitiatorRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getInitiator").pyclass
+IProgress_getInitiatorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getInitiator")
 
-IProgress_getInitiatorResultMsg = GED("http://www.virtualbox.org/", "IProgress_getInitiatorResponse").pyclass
+IProgress_getInitiatorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getInitiatorResponse")
 
-IProgress_getCancelableRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getCancelable").pyclass
+IProgress_getCancelableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getCancelable")
 
-IProgress_getCancelableResultMsg = GED("http://www.virtualbox.org/", "IProgress_getCancelableResponse").pyclass
+IProgress_getCancelableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getCancelableResponse")
 
-IProgress_getPercentRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getPercent").pyclass
+IProgress_getPercentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getPercent")
 
-IProgress_getPercentResultMsg = GED("http://www.virtualbox.org/", "IProgress_getPercentResponse").pyclass
+IProgress_getPercentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getPercentResponse")
 
-IProgress_getTimeRemainingRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getTimeRemaining").pyclass
+IProgress_getTimeRemainingRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getTimeRemaining")
 
-IProgress_getTimeRemainingResultMsg = GED("http://www.virtualbox.org/", "IProgress_getTimeRemainingResponse").pyclass
+IProgress_getTimeRemainingResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getTimeRemainingResponse")
 
-IProgress_getCompletedRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getCompleted").pyclass
+IProgress_getCompletedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getCompleted")
 
-IProgress_getCompletedResultMsg = GED("http://www.virtualbox.org/", "IProgress_getCompletedResponse").pyclass
+IProgress_getCompletedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getCompletedResponse")
 
-IProgress_getCanceledRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getCanceled").pyclass
+IProgress_getCanceledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getCanceled")
 
-IProgress_getCanceledResultMsg = GED("http://www.virtualbox.org/", "IProgress_getCanceledResponse").pyclass
+IProgress_getCanceledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getCanceledResponse")
 
-IProgress_getResultCodeRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getResultCode").pyclass
+IProgress_getResultCodeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getResultCode")
 
-IProgress_getResultCodeResultMsg = GED("http://www.virtualbox.org/", "IProgress_getResultCodeResponse").pyclass
+IProgress_getResultCodeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getResultCodeResponse")
 
-IProgress_getErrorInfoRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getErrorInfo").pyclass
+IProgress_getErrorInfoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getErrorInfo")
 
-IProgress_getErrorInfoResultMsg = GED("http://www.virtualbox.org/", "IProgress_getErrorInfoResponse").pyclass
+IProgress_getErrorInfoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getErrorInfoResponse")
 
-IProgress_getOperationCountRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationCount").pyclass
+IProgress_getOperationCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationCount")
 
-IProgress_getOperationCountResultMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationCountResponse").pyclass
+IProgress_getOperationCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationCountResponse")
 
-IProgress_getOperationRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getOperation").pyclass
+IProgress_getOperationRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperation")
 
-IProgress_getOperationResultMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationResponse").pyclass
+IProgress_getOperationResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationResponse")
 
-IProgress_getOperationDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationDescription").pyclass
+IProgress_getOperationDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationDescription")
 
-IProgress_getOperationDescriptionResultMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationDescriptionResponse").pyclass
+IProgress_getOperationDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationDescriptionResponse")
 
-IProgress_getOperationPercentRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationPercent").pyclass
+IProgress_getOperationPercentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationPercent")
 
-IProgress_getOperationPercentResultMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationPercentResponse").pyclass
+IProgress_getOperationPercentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationPercentResponse")
 
-IProgress_getOperationWeightRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationWeight").pyclass
+IProgress_getOperationWeightRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationWeight")
 
-IProgress_getOperationWeightResultMsg = GED("http://www.virtualbox.org/", "IProgress_getOperationWeightResponse").pyclass
+IProgress_getOperationWeightResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getOperationWeightResponse")
 
-IProgress_getTimeoutRequestMsg = GED("http://www.virtualbox.org/", "IProgress_getTimeout").pyclass
+IProgress_getTimeoutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getTimeout")
 
-IProgress_getTimeoutResultMsg = GED("http://www.virtualbox.org/", "IProgress_getTimeoutResponse").pyclass
+IProgress_getTimeoutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_getTimeoutResponse")
 
-IProgress_setTimeoutRequestMsg = GED("http://www.virtualbox.org/", "IProgress_setTimeout").pyclass
+IProgress_setTimeoutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_setTimeout")
 
-IProgress_setTimeoutResultMsg = GED("http://www.virtualbox.org/", "IProgress_setTimeoutResponse").pyclass
+IProgress_setTimeoutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_setTimeoutResponse")
 
-IProgress_setCurrentOperationProgressRequestMsg = GED("http://www.virtualbox.org/", "IProgress_setCurrentOperationProgress").pyclass
+IProgress_setCurrentOperationProgressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_setCurrentOperationProgress")
 
-IProgress_setCurrentOperationProgressResultMsg = GED("http://www.virtualbox.org/", "IProgress_setCurrentOperationProgressResponse").pyclass
+IProgress_setCurrentOperationProgressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_setCurrentOperationProgressResponse")
 
-IProgress_setNextOperationRequestMsg = GED("http://www.virtualbox.org/", "IProgress_setNextOperation").pyclass
+IProgress_setNextOperationRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_setNextOperation")
 
-IProgress_setNextOperationResultMsg = GED("http://www.virtualbox.org/", "IProgress_setNextOperationResponse").pyclass
+IProgress_setNextOperationResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_setNextOperationResponse")
 
-IProgress_waitForCompletionRequestMsg = GED("http://www.virtualbox.org/", "IProgress_waitForCompletion").pyclass
+IProgress_waitForCompletionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_waitForCompletion")
 
-IProgress_waitForCompletionResultMsg = GED("http://www.virtualbox.org/", "IProgress_waitForCompletionResponse").pyclass
+IProgress_waitForCompletionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_waitForCompletionResponse")
 
-IProgress_waitForOperationCompletionRequestMsg = GED("http://www.virtualbox.org/", "IProgress_waitForOperationCompletion").pyclass
+IProgress_waitForOperationCompletionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_waitForOperationCompletion")
 
-IProgress_waitForOperationCompletionResultMsg = GED("http://www.virtualbox.org/", "IProgress_waitForOperationCompletionResponse").pyclass
+IProgress_waitForOperationCompletionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_waitForOperationCompletionResponse")
 
-IProgress_waitForAsyncProgressCompletionRequestMsg = GED("http://www.virtualbox.org/", "IProgress_waitForAsyncProgressCompletion").pyclass
+IProgress_waitForAsyncProgressCompletionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_waitForAsyncProgressCompletion")
 
-IProgress_waitForAsyncProgressCompletionResultMsg = GED("http://www.virtualbox.org/", "IProgress_waitForAsyncProgressCompletionResponse").pyclass
+IProgress_waitForAsyncProgressCompletionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_waitForAsyncProgressCompletionResponse")
 
-IProgress_cancelRequestMsg = GED("http://www.virtualbox.org/", "IProgress_cancel").pyclass
+IProgress_cancelRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_cancel")
 
-IProgress_cancelResultMsg = GED("http://www.virtualbox.org/", "IProgress_cancelResponse").pyclass
+IProgress_cancelResultMsg = LazyPyclass("http://www.virtualbox.org/", "IProgress_cancelResponse")
 
-ISnapshot_getIdRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getId").pyclass
+ISnapshot_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getId")
 
-ISnapshot_getIdResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getIdResponse").pyclass
+ISnapshot_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getIdResponse")
 
-ISnapshot_getNameRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getName").pyclass
+ISnapshot_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getName")
 
-ISnapshot_getNameResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getNameResponse").pyclass
+ISnapshot_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getNameResponse")
 
-ISnapshot_setNameRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_setName").pyclass
+ISnapshot_setNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_setName")
 
-ISnapshot_setNameResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_setNameResponse").pyclass
+ISnapshot_setNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_setNameResponse")
 
-ISnapshot_getDescriptionRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getDescription").pyclass
+ISnapshot_getDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getDescription")
 
-ISnapshot_getDescriptionResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getDescriptionResponse").pyclass
+ISnapshot_getDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getDescriptionResponse")
 
-ISnapshot_setDescriptionRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_setDescription").pyclass
+ISnapshot_setDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_setDescription")
 
-ISnapshot_setDescriptionResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_setDescriptionResponse").pyclass
+ISnapshot_setDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_setDescriptionResponse")
 
-ISnapshot_getTimeStampRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getTimeStamp").pyclass
+ISnapshot_getTimeStampRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getTimeStamp")
 
-ISnapshot_getTimeStampResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getTimeStampResponse").pyclass
+ISnapshot_getTimeStampResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getTimeStampResponse")
 
-ISnapshot_getOnlineRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getOnline").pyclass
+ISnapshot_getOnlineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getOnline")
 
-ISnapshot_getOnlineResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getOnlineResponse").pyclass
+ISnapshot_getOnlineResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getOnlineResponse")
 
-ISnapshot_getMachineRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getMachine").pyclass
+ISnapshot_getMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getMachine")
 
-ISnapshot_getMachineResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getMachineResponse").pyclass
+ISnapshot_getMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getMachineResponse")
 
-ISnapshot_getParentRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getParent").pyclass
+ISnapshot_getParentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getParent")
 
-ISnapshot_getParentResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getParentResponse").pyclass
+ISnapshot_getParentResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getParentResponse")
 
-ISnapshot_getChildrenRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getChildren").pyclass
+ISnapshot_getChildrenRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getChildren")
 
-ISnapshot_getChildrenResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getChildrenResponse").pyclass
+ISnapshot_getChildrenResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getChildrenResponse")
 
-ISnapshot_getChildrenCountRequestMsg = GED("http://www.virtualbox.org/", "ISnapshot_getChildrenCount").pyclass
+ISnapshot_getChildrenCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getChildrenCount")
 
-ISnapshot_getChildrenCountResultMsg = GED("http://www.virtualbox.org/", "ISnapshot_getChildrenCountResponse").pyclass
+ISnapshot_getChildrenCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshot_getChildrenCountResponse")
 
-IMedium_getIdRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getId").pyclass
+IMedium_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getId")
 
-IMedium_getIdResultMsg = GED("http://www.virtualbox.org/", "IMedium_getIdResponse").pyclass
+IMedium_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getIdResponse")
 
-IMedium_getDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getDescription").pyclass
+IMedium_getDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getDescription")
 
-IMedium_getDescriptionResultMsg = GED("http://www.virtualbox.org/", "IMedium_getDescriptionResponse").pyclass
+IMedium_getDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getDescriptionResponse")
 
-IMedium_setDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IMedium_setDescription").pyclass
+IMedium_setDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setDescription")
 
-IMedium_setDescriptionResultMsg = GED("http://www.virtualbox.org/", "IMedium_setDescriptionResponse").pyclass
+IMedium_setDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setDescriptionResponse")
 
-IMedium_getStateRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getState").pyclass
+IMedium_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getState")
 
-IMedium_getStateResultMsg = GED("http://www.virtualbox.org/", "IMedium_getStateResponse").pyclass
+IMedium_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getStateResponse")
 
-IMedium_getVariantRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getVariant").pyclass
+IMedium_getVariantRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getVariant")
 
-IMedium_getVariantResultMsg = GED("http://www.virtualbox.org/", "IMedium_getVariantResponse").pyclass
+IMedium_getVariantResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getVariantResponse")
 
-IMedium_getLocationRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getLocation").pyclass
+IMedium_getLocationRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getLocation")
 
-IMedium_getLocationResultMsg = GED("http://www.virtualbox.org/", "IMedium_getLocationResponse").pyclass
+IMedium_getLocationResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getLocationResponse")
 
-IMedium_getNameRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getName").pyclass
+IMedium_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getName")
 
-IMedium_getNameResultMsg = GED("http://www.virtualbox.org/", "IMedium_getNameResponse").pyclass
+IMedium_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getNameResponse")
 
-IMedium_getDeviceTypeRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getDeviceType").pyclass
+IMedium_getDeviceTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getDeviceType")
 
-IMedium_getDeviceTypeResultMsg = GED("http://www.virtualbox.org/", "IMedium_getDeviceTypeResponse").pyclass
+IMedium_getDeviceTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getDeviceTypeResponse")
 
-IMedium_getHostDriveRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getHostDrive").pyclass
+IMedium_getHostDriveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getHostDrive")
 
-IMedium_getHostDriveResultMsg = GED("http://www.virtualbox.org/", "IMedium_getHostDriveResponse").pyclass
+IMedium_getHostDriveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getHostDriveResponse")
 
-IMedium_getSizeRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getSize").pyclass
+IMedium_getSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getSize")
 
-IMedium_getSizeResultMsg = GED("http://www.virtualbox.org/", "IMedium_getSizeResponse").pyclass
+IMedium_getSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getSizeResponse")
 
-IMedium_getFormatRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getFormat").pyclass
+IMedium_getFormatRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getFormat")
 
-IMedium_getFormatResultMsg = GED("http://www.virtualbox.org/", "IMedium_getFormatResponse").pyclass
+IMedium_getFormatResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getFormatResponse")
 
-IMedium_getMediumFormatRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getMediumFormat").pyclass
+IMedium_getMediumFormatRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getMediumFormat")
 
-IMedium_getMediumFormatResultMsg = GED("http://www.virtualbox.org/", "IMedium_getMediumFormatResponse").pyclass
+IMedium_getMediumFormatResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getMediumFormatResponse")
 
-IMedium_getTypeRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getType").pyclass
+IMedium_getTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getType")
 
-IMedium_getTypeResultMsg = GED("http://www.virtualbox.org/", "IMedium_getTypeResponse").pyclass
+IMedium_getTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getTypeResponse")
 
-IMedium_setTypeRequestMsg = GED("http://www.virtualbox.org/", "IMedium_setType").pyclass
+IMedium_setTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setType")
 
-IMedium_setTypeResultMsg = GED("http://www.virtualbox.org/", "IMedium_setTypeResponse").pyclass
+IMedium_setTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setTypeResponse")
 
-IMedium_getAllowedTypesRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getAllowedTypes").pyclass
+IMedium_getAllowedTypesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getAllowedTypes")
 
-IMedium_getAllowedTypesResultMsg = GED("http://www.virtualbox.org/", "IMedium_getAllowedTypesResponse").pyclass
+IMedium_getAllowedTypesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getAllowedTypesResponse")
 
-IMedium_getParentRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getParent").pyclass
+IMedium_getParentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getParent")
 
-IMedium_getParentResultMsg = GED("http://www.virtualbox.org/", "IMedium_getParentResponse").pyclass
+IMedium_getParentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getParentResponse")
 
-IMedium_getChildrenRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getChildren").pyclass
+IMedium_getChildrenRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getChildren")
 
-IMedium_getChildrenResultMsg = GED("http://www.virtualbox.org/", "IMedium_getChildrenResponse").pyclass
+IMedium_getChildrenResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getChildrenResponse")
 
-IMedium_getBaseRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getBase").pyclass
+IMedium_getBaseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getBase")
 
-IMedium_getBaseResultMsg = GED("http://www.virtualbox.org/", "IMedium_getBaseResponse").pyclass
+IMedium_getBaseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getBaseResponse")
 
-IMedium_getReadOnlyRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getReadOnly").pyclass
+IMedium_getReadOnlyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getReadOnly")
 
-IMedium_getReadOnlyResultMsg = GED("http://www.virtualbox.org/", "IMedium_getReadOnlyResponse").pyclass
+IMedium_getReadOnlyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getReadOnlyResponse")
 
-IMedium_getLogicalSizeRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getLogicalSize").pyclass
+IMedium_getLogicalSizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getLogicalSize")
 
-IMedium_getLogicalSizeResultMsg = GED("http://www.virtualbox.org/", "IMedium_getLogicalSizeResponse").pyclass
+IMedium_getLogicalSizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getLogicalSizeResponse")
 
-IMedium_getAutoResetRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getAutoReset").pyclass
+IMedium_getAutoResetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getAutoReset")
 
-IMedium_getAutoResetResultMsg = GED("http://www.virtualbox.org/", "IMedium_getAutoResetResponse").pyclass
+IMedium_getAutoResetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getAutoResetResponse")
 
-IMedium_setAutoResetRequestMsg = GED("http://www.virtualbox.org/", "IMedium_setAutoReset").pyclass
+IMedium_setAutoResetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setAutoReset")
 
-IMedium_setAutoResetResultMsg = GED("http://www.virtualbox.org/", "IMedium_setAutoResetResponse").pyclass
+IMedium_setAutoResetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setAutoResetResponse")
 
-IMedium_getLastAccessErrorRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getLastAccessError").pyclass
+IMedium_getLastAccessErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getLastAccessError")
 
-IMedium_getLastAccessErrorResultMsg = GED("http://www.virtualbox.org/", "IMedium_getLastAccessErrorResponse").pyclass
+IMedium_getLastAccessErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getLastAccessErrorResponse")
 
-IMedium_getMachineIdsRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getMachineIds").pyclass
+IMedium_getMachineIdsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getMachineIds")
 
-IMedium_getMachineIdsResultMsg = GED("http://www.virtualbox.org/", "IMedium_getMachineIdsResponse").pyclass
+IMedium_getMachineIdsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getMachineIdsResponse")
 
-IMedium_setIdsRequestMsg = GED("http://www.virtualbox.org/", "IMedium_setIds").pyclass
+IMedium_setIdsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setIds")
 
-IMedium_setIdsResultMsg = GED("http://www.virtualbox.org/", "IMedium_setIdsResponse").pyclass
+IMedium_setIdsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setIdsResponse")
 
-IMedium_refreshStateRequestMsg = GED("http://www.virtualbox.org/", "IMedium_refreshState").pyclass
+IMedium_refreshStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_refreshState")
 
-IMedium_refreshStateResultMsg = GED("http://www.virtualbox.org/", "IMedium_refreshStateResponse").pyclass
+IMedium_refreshStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_refreshStateResponse")
 
-IMedium_getSnapshotIdsRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getSnapshotIds").pyclass
+IMedium_getSnapshotIdsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getSnapshotIds")
 
-IMedium_getSnapshotIdsResultMsg = GED("http://www.virtualbox.org/", "IMedium_getSnapshotIdsResponse").pyclass
+IMedium_getSnapshotIdsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getSnapshotIdsResponse")
 
-IMedium_lockReadRequestMsg = GED("http://www.virtualbox.org/", "IMedium_lockRead").pyclass
+IMedium_lockReadRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_lockRead")
 
-IMedium_lockReadResultMsg = GED("http://www.virtualbox.org/", "IMedium_lockReadResponse").pyclass
+IMedium_lockReadResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_lockReadResponse")
 
-IMedium_lockWriteRequestMsg = GED("http://www.virtualbox.org/", "IMedium_lockWrite").pyclass
+IMedium_lockWriteRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_lockWrite")
 
-IMedium_lockWriteResultMsg = GED("http://www.virtualbox.org/", "IMedium_lockWriteResponse").pyclass
+IMedium_lockWriteResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_lockWriteResponse")
 
-IMedium_closeRequestMsg = GED("http://www.virtualbox.org/", "IMedium_close").pyclass
+IMedium_closeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_close")
 
-IMedium_closeResultMsg = GED("http://www.virtualbox.org/", "IMedium_closeResponse").pyclass
+IMedium_closeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_closeResponse")
 
-IMedium_getPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getProperty").pyclass
+IMedium_getPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getProperty")
 
-IMedium_getPropertyResultMsg = GED("http://www.virtualbox.org/", "IMedium_getPropertyResponse").pyclass
+IMedium_getPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getPropertyResponse")
 
-IMedium_setPropertyRequestMsg = GED("http://www.virtualbox.org/", "IMedium_setProperty").pyclass
+IMedium_setPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setProperty")
 
-IMedium_setPropertyResultMsg = GED("http://www.virtualbox.org/", "IMedium_setPropertyResponse").pyclass
+IMedium_setPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setPropertyResponse")
 
-IMedium_getPropertiesRequestMsg = GED("http://www.virtualbox.org/", "IMedium_getProperties").pyclass
+IMedium_getPropertiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getProperties")
 
-IMedium_getPropertiesResultMsg = GED("http://www.virtualbox.org/", "IMedium_getPropertiesResponse").pyclass
+IMedium_getPropertiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_getPropertiesResponse")
 
-IMedium_setPropertiesRequestMsg = GED("http://www.virtualbox.org/", "IMedium_setProperties").pyclass
+IMedium_setPropertiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setProperties")
 
-IMedium_setPropertiesResultMsg = GED("http://www.virtualbox.org/", "IMedium_setPropertiesResponse").pyclass
+IMedium_setPropertiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setPropertiesResponse")
 
-IMedium_createBaseStorageRequestMsg = GED("http://www.virtualbox.org/", "IMedium_createBaseStorage").pyclass
+IMedium_createBaseStorageRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_createBaseStorage")
 
-IMedium_createBaseStorageResultMsg = GED("http://www.virtualbox.org/", "IMedium_createBaseStorageResponse").pyclass
+IMedium_createBaseStorageResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_createBaseStorageResponse")
 
-IMedium_deleteStorageRequestMsg = GED("http://www.virtualbox.org/", "IMedium_deleteStorage").pyclass
+IMedium_deleteStorageRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_deleteStorage")
 
-IMedium_deleteStorageResultMsg = GED("http://www.virtualbox.org/", "IMedium_deleteStorageResponse").pyclass
+IMedium_deleteStorageResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_deleteStorageResponse")
 
-IMedium_createDiffStorageRequestMsg = GED("http://www.virtualbox.org/", "IMedium_createDiffStorage").pyclass
+IMedium_createDiffStorageRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_createDiffStorage")
 
-IMedium_createDiffStorageResultMsg = GED("http://www.virtualbox.org/", "IMedium_createDiffStorageResponse").pyclass
+IMedium_createDiffStorageResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_createDiffStorageResponse")
 
-IMedium_mergeToRequestMsg = GED("http://www.virtualbox.org/", "IMedium_mergeTo").pyclass
+IMedium_mergeToRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_mergeTo")
 
-IMedium_mergeToResultMsg = GED("http://www.virtualbox.org/", "IMedium_mergeToResponse").pyclass
+IMedium_mergeToResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_mergeToResponse")
 
-IMedium_cloneToRequestMsg = GED("http://www.virtualbox.org/", "IMedium_cloneTo").pyclass
+IMedium_cloneToRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_cloneTo")
 
-IMedium_cloneToResultMsg = GED("http://www.virtualbox.org/", "IMedium_cloneToResponse").pyclass
+IMedium_cloneToResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_cloneToResponse")
 
-IMedium_cloneToBaseRequestMsg = GED("http://www.virtualbox.org/", "IMedium_cloneToBase").pyclass
+IMedium_cloneToBaseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_cloneToBase")
 
-IMedium_cloneToBaseResultMsg = GED("http://www.virtualbox.org/", "IMedium_cloneToBaseResponse").pyclass
+IMedium_cloneToBaseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_cloneToBaseResponse")
 
-IMedium_setLocationRequestMsg = GED("http://www.virtualbox.org/", "IMedium_setLocation").pyclass
+IMedium_setLocationRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setLocation")
 
-IMedium_setLocationResultMsg = GED("http://www.virtualbox.org/", "IMedium_setLocationResponse").pyclass
+IMedium_setLocationResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_setLocationResponse")
 
-IMedium_compactRequestMsg = GED("http://www.virtualbox.org/", "IMedium_compact").pyclass
+IMedium_compactRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_compact")
 
-IMedium_compactResultMsg = GED("http://www.virtualbox.org/", "IMedium_compactResponse").pyclass
+IMedium_compactResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_compactResponse")
 
-IMedium_resizeRequestMsg = GED("http://www.virtualbox.org/", "IMedium_resize").pyclass
+IMedium_resizeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_resize")
 
-IMedium_resizeResultMsg = GED("http://www.virtualbox.org/", "IMedium_resizeResponse").pyclass
+IMedium_resizeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_resizeResponse")
 
-IMedium_resetRequestMsg = GED("http://www.virtualbox.org/", "IMedium_reset").pyclass
+IMedium_resetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_reset")
 
-IMedium_resetResultMsg = GED("http://www.virtualbox.org/", "IMedium_resetResponse").pyclass
+IMedium_resetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMedium_resetResponse")
 
-IMediumFormat_getIdRequestMsg = GED("http://www.virtualbox.org/", "IMediumFormat_getId").pyclass
+IMediumFormat_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_getId")
 
-IMediumFormat_getIdResultMsg = GED("http://www.virtualbox.org/", "IMediumFormat_getIdResponse").pyclass
+IMediumFormat_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_getIdResponse")
 
-IMediumFormat_getNameRequestMsg = GED("http://www.virtualbox.org/", "IMediumFormat_getName").pyclass
+IMediumFormat_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_getName")
 
-IMediumFormat_getNameResultMsg = GED("http://www.virtualbox.org/", "IMediumFormat_getNameResponse").pyclass
+IMediumFormat_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_getNameResponse")
 
-IMediumFormat_getCapabilitiesRequestMsg = GED("http://www.virtualbox.org/", "IMediumFormat_getCapabilities").pyclass
+IMediumFormat_getCapabilitiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_getCapabilities")
 
-IMediumFormat_getCapabilitiesResultMsg = GED("http://www.virtualbox.org/", "IMediumFormat_getCapabilitiesResponse").pyclass
+IMediumFormat_getCapabilitiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_getCapabilitiesResponse")
 
-IMediumFormat_describeFileExtensionsRequestMsg = GED("http://www.virtualbox.org/", "IMediumFormat_describeFileExtensions").pyclass
+IMediumFormat_describeFileExtensionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_describeFileExtensions")
 
-IMediumFormat_describeFileExtensionsResultMsg = GED("http://www.virtualbox.org/", "IMediumFormat_describeFileExtensionsResponse").pyclass
+IMediumFormat_describeFileExtensionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_describeFileExtensionsResponse")
 
-IMediumFormat_describePropertiesRequestMsg = GED("http://www.virtualbox.org/", "IMediumFormat_describeProperties").pyclass
+IMediumFormat_describePropertiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_describeProperties")
 
-IMediumFormat_describePropertiesResultMsg = GED("http://www.virtualbox.org/", "IMediumFormat_describePropertiesResponse").pyclass
+IMediumFormat_describePropertiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumFormat_describePropertiesResponse")
 
-IToken_abandonRequestMsg = GED("http://www.virtualbox.org/", "IToken_abandon").pyclass
+IToken_abandonRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IToken_abandon")
 
-IToken_abandonResultMsg = GED("http://www.virtualbox.org/", "IToken_abandonResponse").pyclass
+IToken_abandonResultMsg = LazyPyclass("http://www.virtualbox.org/", "IToken_abandonResponse")
 
-IToken_dummyRequestMsg = GED("http://www.virtualbox.org/", "IToken_dummy").pyclass
+IToken_dummyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IToken_dummy")
 
-IToken_dummyResultMsg = GED("http://www.virtualbox.org/", "IToken_dummyResponse").pyclass
+IToken_dummyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IToken_dummyResponse")
 
-IKeyboard_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IKeyboard_getEventSource").pyclass
+IKeyboard_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_getEventSource")
 
-IKeyboard_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IKeyboard_getEventSourceResponse").pyclass
+IKeyboard_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_getEventSourceResponse")
 
-IKeyboard_putScancodeRequestMsg = GED("http://www.virtualbox.org/", "IKeyboard_putScancode").pyclass
+IKeyboard_putScancodeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_putScancode")
 
-IKeyboard_putScancodeResultMsg = GED("http://www.virtualbox.org/", "IKeyboard_putScancodeResponse").pyclass
+IKeyboard_putScancodeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_putScancodeResponse")
 
-IKeyboard_putScancodesRequestMsg = GED("http://www.virtualbox.org/", "IKeyboard_putScancodes").pyclass
+IKeyboard_putScancodesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_putScancodes")
 
-IKeyboard_putScancodesResultMsg = GED("http://www.virtualbox.org/", "IKeyboard_putScancodesResponse").pyclass
+IKeyboard_putScancodesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_putScancodesResponse")
 
-IKeyboard_putCADRequestMsg = GED("http://www.virtualbox.org/", "IKeyboard_putCAD").pyclass
+IKeyboard_putCADRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_putCAD")
 
-IKeyboard_putCADResultMsg = GED("http://www.virtualbox.org/", "IKeyboard_putCADResponse").pyclass
+IKeyboard_putCADResultMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboard_putCADResponse")
 
-IMouse_getAbsoluteSupportedRequestMsg = GED("http://www.virtualbox.org/", "IMouse_getAbsoluteSupported").pyclass
+IMouse_getAbsoluteSupportedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getAbsoluteSupported")
 
-IMouse_getAbsoluteSupportedResultMsg = GED("http://www.virtualbox.org/", "IMouse_getAbsoluteSupportedResponse").pyclass
+IMouse_getAbsoluteSupportedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getAbsoluteSupportedResponse")
 
-IMouse_getRelativeSupportedRequestMsg = GED("http://www.virtualbox.org/", "IMouse_getRelativeSupported").pyclass
+IMouse_getRelativeSupportedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getRelativeSupported")
 
-IMouse_getRelativeSupportedResultMsg = GED("http://www.virtualbox.org/", "IMouse_getRelativeSupportedResponse").pyclass
+IMouse_getRelativeSupportedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getRelativeSupportedResponse")
 
-IMouse_getMultiTouchSupportedRequestMsg = GED("http://www.virtualbox.org/", "IMouse_getMultiTouchSupported").pyclass
+IMouse_getMultiTouchSupportedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getMultiTouchSupported")
 
-IMouse_getMultiTouchSupportedResultMsg = GED("http://www.virtualbox.org/", "IMouse_getMultiTouchSupportedResponse").pyclass
+IMouse_getMultiTouchSupportedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getMultiTouchSupportedResponse")
 
-IMouse_getNeedsHostCursorRequestMsg = GED("http://www.virtualbox.org/", "IMouse_getNeedsHostCursor").pyclass
+IMouse_getNeedsHostCursorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getNeedsHostCursor")
 
-IMouse_getNeedsHostCursorResultMsg = GED("http://www.virtualbox.org/", "IMouse_getNeedsHostCursorResponse").pyclass
+IMouse_getNeedsHostCursorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getNeedsHostCursorResponse")
 
-IMouse_getEventSourceRequestMsg = GED("http://www.virtualbox.org/", "IMouse_getEventSource").pyclass
+IMouse_getEventSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getEventSource")
 
-IMouse_getEventSourceResultMsg = GED("http://www.virtualbox.org/", "IMouse_getEventSourceResponse").pyclass
+IMouse_getEventSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_getEventSourceResponse")
 
-IMouse_putMouseEventRequestMsg = GED("http://www.virtualbox.org/", "IMouse_putMouseEvent").pyclass
+IMouse_putMouseEventRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putMouseEvent")
 
-IMouse_putMouseEventResultMsg = GED("http://www.virtualbox.org/", "IMouse_putMouseEventResponse").pyclass
+IMouse_putMouseEventResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putMouseEventResponse")
 
-IMouse_putMouseEventAbsoluteRequestMsg = GED("http://www.virtualbox.org/", "IMouse_putMouseEventAbsolute").pyclass
+IMouse_putMouseEventAbsoluteRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putMouseEventAbsolute")
 
-IMouse_putMouseEventAbsoluteResultMsg = GED("http://www.virtualbox.org/", "IMouse_putMouseEventAbsoluteResponse").pyclass
+IMouse_putMouseEventAbsoluteResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putMouseEventAbsoluteResponse")
 
-IMouse_putEventMultiTouchRequestMsg = GED("http://www.virtualbox.org/", "IMouse_putEventMultiTouch").pyclass
+IMouse_putEventMultiTouchRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putEventMultiTouch")
 
-IMouse_putEventMultiTouchResultMsg = GED("http://www.virtualbox.org/", "IMouse_putEventMultiTouchResponse").pyclass
+IMouse_putEventMultiTouchResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putEventMultiTouchResponse")
 
-IMouse_putEventMultiTouchStringRequestMsg = GED("http://www.virtualbox.org/", "IMouse_putEventMultiTouchString").pyclass
+IMouse_putEventMultiTouchStringRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putEventMultiTouchString")
 
-IMouse_putEventMultiTouchStringResultMsg = GED("http://www.virtualbox.org/", "IMouse_putEventMultiTouchStringResponse").pyclass
+IMouse_putEventMultiTouchStringResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouse_putEventMultiTouchStringResponse")
 
-IFramebuffer_getWidthRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getWidth").pyclass
+IFramebuffer_getWidthRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getWidth")
 
-IFramebuffer_getWidthResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getWidthResponse").pyclass
+IFramebuffer_getWidthResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getWidthResponse")
 
-IFramebuffer_getHeightRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getHeight").pyclass
+IFramebuffer_getHeightRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getHeight")
 
-IFramebuffer_getHeightResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getHeightResponse").pyclass
+IFramebuffer_getHeightResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getHeightResponse")
 
-IFramebuffer_getBitsPerPixelRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getBitsPerPixel").pyclass
+IFramebuffer_getBitsPerPixelRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getBitsPerPixel")
 
-IFramebuffer_getBitsPerPixelResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getBitsPerPixelResponse").pyclass
+IFramebuffer_getBitsPerPixelResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getBitsPerPixelResponse")
 
-IFramebuffer_getBytesPerLineRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getBytesPerLine").pyclass
+IFramebuffer_getBytesPerLineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getBytesPerLine")
 
-IFramebuffer_getBytesPerLineResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getBytesPerLineResponse").pyclass
+IFramebuffer_getBytesPerLineResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getBytesPerLineResponse")
 
-IFramebuffer_getPixelFormatRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getPixelFormat").pyclass
+IFramebuffer_getPixelFormatRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getPixelFormat")
 
-IFramebuffer_getPixelFormatResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getPixelFormatResponse").pyclass
+IFramebuffer_getPixelFormatResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getPixelFormatResponse")
 
-IFramebuffer_getUsesGuestVRAMRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getUsesGuestVRAM").pyclass
+IFramebuffer_getUsesGuestVRAMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getUsesGuestVRAM")
 
-IFramebuffer_getUsesGuestVRAMResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getUsesGuestVRAMResponse").pyclass
+IFramebuffer_getUsesGuestVRAMResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getUsesGuestVRAMResponse")
 
-IFramebuffer_getHeightReductionRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getHeightReduction").pyclass
+IFramebuffer_getHeightReductionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getHeightReduction")
 
-IFramebuffer_getHeightReductionResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getHeightReductionResponse").pyclass
+IFramebuffer_getHeightReductionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getHeightReductionResponse")
 
-IFramebuffer_getOverlayRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getOverlay").pyclass
+IFramebuffer_getOverlayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getOverlay")
 
-IFramebuffer_getOverlayResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_getOverlayResponse").pyclass
+IFramebuffer_getOverlayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_getOverlayResponse")
 
-IFramebuffer_videoModeSupportedRequestMsg = GED("http://www.virtualbox.org/", "IFramebuffer_videoModeSupported").pyclass
+IFramebuffer_videoModeSupportedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_videoModeSupported")
 
-IFramebuffer_videoModeSupportedResultMsg = GED("http://www.virtualbox.org/", "IFramebuffer_videoModeSupportedResponse").pyclass
+IFramebuffer_videoModeSupportedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebuffer_videoModeSupportedResponse")
 
-IFramebufferOverlay_getXRequestMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getX").pyclass
+IFramebufferOverlay_getXRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getX")
 
-IFramebufferOverlay_getXResultMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getXResponse").pyclass
+IFramebufferOverlay_getXResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getXResponse")
 
-IFramebufferOverlay_getYRequestMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getY").pyclass
+IFramebufferOverlay_getYRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getY")
 
-IFramebufferOverlay_getYResultMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getYResponse").pyclass
+IFramebufferOverlay_getYResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getYResponse")
 
-IFramebufferOverlay_getVisibleRequestMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getVisible").pyclass
+IFramebufferOverlay_getVisibleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getVisible")
 
-IFramebufferOverlay_getVisibleResultMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getVisibleResponse").pyclass
+IFramebufferOverlay_getVisibleResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getVisibleResponse")
 
-IFramebufferOverlay_setVisibleRequestMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_setVisible").pyclass
+IFramebufferOverlay_setVisibleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_setVisible")
 
-IFramebufferOverlay_setVisibleResultMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_setVisibleResponse").pyclass
+IFramebufferOverlay_setVisibleResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_setVisibleResponse")
 
-IFramebufferOverlay_getAlphaRequestMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getAlpha").pyclass
+IFramebufferOverlay_getAlphaRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getAlpha")
 
-IFramebufferOverlay_getAlphaResultMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_getAlphaResponse").pyclass
+IFramebufferOverlay_getAlphaResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_getAlphaResponse")
 
-IFramebufferOverlay_setAlphaRequestMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_setAlpha").pyclass
+IFramebufferOverlay_setAlphaRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_setAlpha")
 
-IFramebufferOverlay_setAlphaResultMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_setAlphaResponse").pyclass
+IFramebufferOverlay_setAlphaResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_setAlphaResponse")
 
-IFramebufferOverlay_moveRequestMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_move").pyclass
+IFramebufferOverlay_moveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_move")
 
-IFramebufferOverlay_moveResultMsg = GED("http://www.virtualbox.org/", "IFramebufferOverlay_moveResponse").pyclass
+IFramebufferOverlay_moveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IFramebufferOverlay_moveResponse")
 
-IDisplay_getScreenResolutionRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_getScreenResolution").pyclass
+IDisplay_getScreenResolutionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_getScreenResolution")
 
-IDisplay_getScreenResolutionResultMsg = GED("http://www.virtualbox.org/", "IDisplay_getScreenResolutionResponse").pyclass
+IDisplay_getScreenResolutionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_getScreenResolutionResponse")
 
-IDisplay_setFramebufferRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_setFramebuffer").pyclass
+IDisplay_setFramebufferRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_setFramebuffer")
 
-IDisplay_setFramebufferResultMsg = GED("http://www.virtualbox.org/", "IDisplay_setFramebufferResponse").pyclass
+IDisplay_setFramebufferResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_setFramebufferResponse")
 
-IDisplay_getFramebufferRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_getFramebuffer").pyclass
+IDisplay_getFramebufferRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_getFramebuffer")
 
-IDisplay_getFramebufferResultMsg = GED("http://www.virtualbox.org/", "IDisplay_getFramebufferResponse").pyclass
+IDisplay_getFramebufferResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_getFramebufferResponse")
 
-IDisplay_setVideoModeHintRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_setVideoModeHint").pyclass
+IDisplay_setVideoModeHintRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_setVideoModeHint")
 
-IDisplay_setVideoModeHintResultMsg = GED("http://www.virtualbox.org/", "IDisplay_setVideoModeHintResponse").pyclass
+IDisplay_setVideoModeHintResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_setVideoModeHintResponse")
 
-IDisplay_setSeamlessModeRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_setSeamlessMode").pyclass
+IDisplay_setSeamlessModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_setSeamlessMode")
 
-IDisplay_setSeamlessModeResultMsg = GED("http://www.virtualbox.org/", "IDisplay_setSeamlessModeResponse").pyclass
+IDisplay_setSeamlessModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_setSeamlessModeResponse")
 
-IDisplay_takeScreenShotToArrayRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_takeScreenShotToArray").pyclass
+IDisplay_takeScreenShotToArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_takeScreenShotToArray")
 
-IDisplay_takeScreenShotToArrayResultMsg = GED("http://www.virtualbox.org/", "IDisplay_takeScreenShotToArrayResponse").pyclass
+IDisplay_takeScreenShotToArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_takeScreenShotToArrayResponse")
 
-IDisplay_takeScreenShotPNGToArrayRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_takeScreenShotPNGToArray").pyclass
+IDisplay_takeScreenShotPNGToArrayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_takeScreenShotPNGToArray")
 
-IDisplay_takeScreenShotPNGToArrayResultMsg = GED("http://www.virtualbox.org/", "IDisplay_takeScreenShotPNGToArrayResponse").pyclass
+IDisplay_takeScreenShotPNGToArrayResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_takeScreenShotPNGToArrayResponse")
 
-IDisplay_invalidateAndUpdateRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_invalidateAndUpdate").pyclass
+IDisplay_invalidateAndUpdateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_invalidateAndUpdate")
 
-IDisplay_invalidateAndUpdateResultMsg = GED("http://www.virtualbox.org/", "IDisplay_invalidateAndUpdateResponse").pyclass
+IDisplay_invalidateAndUpdateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_invalidateAndUpdateResponse")
 
-IDisplay_resizeCompletedRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_resizeCompleted").pyclass
+IDisplay_resizeCompletedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_resizeCompleted")
 
-IDisplay_resizeCompletedResultMsg = GED("http://www.virtualbox.org/", "IDisplay_resizeCompletedResponse").pyclass
+IDisplay_resizeCompletedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_resizeCompletedResponse")
 
-IDisplay_viewportChangedRequestMsg = GED("http://www.virtualbox.org/", "IDisplay_viewportChanged").pyclass
+IDisplay_viewportChangedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_viewportChanged")
 
-IDisplay_viewportChangedResultMsg = GED("http://www.virtualbox.org/", "IDisplay_viewportChangedResponse").pyclass
+IDisplay_viewportChangedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDisplay_viewportChangedResponse")
 
-INetworkAdapter_getAdapterTypeRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getAdapterType").pyclass
+INetworkAdapter_getAdapterTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getAdapterType")
 
-INetworkAdapter_getAdapterTypeResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getAdapterTypeResponse").pyclass
+INetworkAdapter_getAdapterTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getAdapterTypeResponse")
 
-INetworkAdapter_setAdapterTypeRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setAdapterType").pyclass
+INetworkAdapter_setAdapterTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setAdapterType")
 
-INetworkAdapter_setAdapterTypeResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setAdapterTypeResponse").pyclass
+INetworkAdapter_setAdapterTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setAdapterTypeResponse")
 
-INetworkAdapter_getSlotRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getSlot").pyclass
+INetworkAdapter_getSlotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getSlot")
 
-INetworkAdapter_getSlotResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getSlotResponse").pyclass
+INetworkAdapter_getSlotResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getSlotResponse")
 
-INetworkAdapter_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getEnabled").pyclass
+INetworkAdapter_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getEnabled")
 
-INetworkAdapter_getEnabledResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getEnabledResponse").pyclass
+INetworkAdapter_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getEnabledResponse")
 
-INetworkAdapter_setEnabledRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setEnabled").pyclass
+INetworkAdapter_setEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setEnabled")
 
-INetworkAdapter_setEnabledResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setEnabledResponse").pyclass
+INetworkAdapter_setEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setEnabledResponse")
 
-INetworkAdapter_getMACAddressRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getMACAddress").pyclass
+INetworkAdapter_getMACAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getMACAddress")
 
-INetworkAdapter_getMACAddressResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getMACAddressResponse").pyclass
+INetworkAdapter_getMACAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getMACAddressResponse")
 
-INetworkAdapter_setMACAddressRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setMACAddress").pyclass
+INetworkAdapter_setMACAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setMACAddress")
 
-INetworkAdapter_setMACAddressResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setMACAddressResponse").pyclass
+INetworkAdapter_setMACAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setMACAddressResponse")
 
-INetworkAdapter_getAttachmentTypeRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getAttachmentType").pyclass
+INetworkAdapter_getAttachmentTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getAttachmentType")
 
-INetworkAdapter_getAttachmentTypeResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getAttachmentTypeResponse").pyclass
+INetworkAdapter_getAttachmentTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getAttachmentTypeResponse")
 
-INetworkAdapter_setAttachmentTypeRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setAttachmentType").pyclass
+INetworkAdapter_setAttachmentTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setAttachmentType")
 
-INetworkAdapter_setAttachmentTypeResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setAttachmentTypeResponse").pyclass
+INetworkAdapter_setAttachmentTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setAttachmentTypeResponse")
 
-INetworkAdapter_getBridgedInterfaceRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getBridgedInterface").pyclass
+INetworkAdapter_getBridgedInterfaceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getBridgedInterface")
 
-INetworkAdapter_getBridgedInterfaceResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getBridgedInterfaceResponse").pyclass
+INetworkAdapter_getBridgedInterfaceResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getBridgedInterfaceResponse")
 
-INetworkAdapter_setBridgedInterfaceRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setBridgedInterface").pyclass
+INetworkAdapter_setBridgedInterfaceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setBridgedInterface")
 
-INetworkAdapter_setBridgedInterfaceResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setBridgedInterfaceResponse").pyclass
+INetworkAdapter_setBridgedInterfaceResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setBridgedInterfaceResponse")
 
-INetworkAdapter_getHostOnlyInterfaceRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getHostOnlyInterface").pyclass
+INetworkAdapter_getHostOnlyInterfaceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getHostOnlyInterface")
 
-INetworkAdapter_getHostOnlyInterfaceResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getHostOnlyInterfaceResponse").pyclass
+INetworkAdapter_getHostOnlyInterfaceResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getHostOnlyInterfaceResponse")
 
-INetworkAdapter_setHostOnlyInterfaceRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setHostOnlyInterface").pyclass
+INetworkAdapter_setHostOnlyInterfaceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setHostOnlyInterface")
 
-INetworkAdapter_setHostOnlyInterfaceResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setHostOnlyInterfaceResponse").pyclass
+INetworkAdapter_setHostOnlyInterfaceResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setHostOnlyInterfaceResponse")
 
-INetworkAdapter_getInternalNetworkRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getInternalNetwork").pyclass
+INetworkAdapter_getInternalNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getInternalNetwork")
 
-INetworkAdapter_getInternalNetworkResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getInternalNetworkResponse").pyclass
+INetworkAdapter_getInternalNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getInternalNetworkResponse")
 
-INetworkAdapter_setInternalNetworkRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setInternalNetwork").pyclass
+INetworkAdapter_setInternalNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setInternalNetwork")
 
-INetworkAdapter_setInternalNetworkResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setInternalNetworkResponse").pyclass
+INetworkAdapter_setInternalNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setInternalNetworkResponse")
 
-INetworkAdapter_getNATNetworkRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getNATNetwork").pyclass
+INetworkAdapter_getNATNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getNATNetwork")
 
-INetworkAdapter_getNATNetworkResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getNATNetworkResponse").pyclass
+INetworkAdapter_getNATNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getNATNetworkResponse")
 
-INetworkAdapter_setNATNetworkRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setNATNetwork").pyclass
+INetworkAdapter_setNATNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setNATNetwork")
 
-INetworkAdapter_setNATNetworkResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setNATNetworkResponse").pyclass
+INetworkAdapter_setNATNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setNATNetworkResponse")
 
-INetworkAdapter_getGenericDriverRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getGenericDriver").pyclass
+INetworkAdapter_getGenericDriverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getGenericDriver")
 
-INetworkAdapter_getGenericDriverResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getGenericDriverResponse").pyclass
+INetworkAdapter_getGenericDriverResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getGenericDriverResponse")
 
-INetworkAdapter_setGenericDriverRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setGenericDriver").pyclass
+INetworkAdapter_setGenericDriverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setGenericDriver")
 
-INetworkAdapter_setGenericDriverResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setGenericDriverResponse").pyclass
+INetworkAdapter_setGenericDriverResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setGenericDriverResponse")
 
-INetworkAdapter_getCableConnectedRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getCableConnected").pyclass
+INetworkAdapter_getCableConnectedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getCableConnected")
 
-INetworkAdapter_getCableConnectedResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getCableConnectedResponse").pyclass
+INetworkAdapter_getCableConnectedResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getCableConnectedResponse")
 
-INetworkAdapter_setCableConnectedRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setCableConnected").pyclass
+INetworkAdapter_setCableConnectedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setCableConnected")
 
-INetworkAdapter_setCableConnectedResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setCableConnectedResponse").pyclass
+INetworkAdapter_setCableConnectedResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setCableConnectedResponse")
 
-INetworkAdapter_getLineSpeedRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getLineSpeed").pyclass
+INetworkAdapter_getLineSpeedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getLineSpeed")
 
-INetworkAdapter_getLineSpeedResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getLineSpeedResponse").pyclass
+INetworkAdapter_getLineSpeedResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getLineSpeedResponse")
 
-INetworkAdapter_setLineSpeedRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setLineSpeed").pyclass
+INetworkAdapter_setLineSpeedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setLineSpeed")
 
-INetworkAdapter_setLineSpeedResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setLineSpeedResponse").pyclass
+INetworkAdapter_setLineSpeedResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setLineSpeedResponse")
 
-INetworkAdapter_getPromiscModePolicyRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getPromiscModePolicy").pyclass
+INetworkAdapter_getPromiscModePolicyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getPromiscModePolicy")
 
-INetworkAdapter_getPromiscModePolicyResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getPromiscModePolicyResponse").pyclass
+INetworkAdapter_getPromiscModePolicyResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getPromiscModePolicyResponse")
 
-INetworkAdapter_setPromiscModePolicyRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setPromiscModePolicy").pyclass
+INetworkAdapter_setPromiscModePolicyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setPromiscModePolicy")
 
-INetworkAdapter_setPromiscModePolicyResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setPromiscModePolicyResponse").pyclass
+INetworkAdapter_setPromiscModePolicyResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setPromiscModePolicyResponse")
 
-INetworkAdapter_getTraceEnabledRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getTraceEnabled").pyclass
+INetworkAdapter_getTraceEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getTraceEnabled")
 
-INetworkAdapter_getTraceEnabledResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getTraceEnabledResponse").pyclass
+INetworkAdapter_getTraceEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getTraceEnabledResponse")
 
-INetworkAdapter_setTraceEnabledRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setTraceEnabled").pyclass
+INetworkAdapter_setTraceEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setTraceEnabled")
 
-INetworkAdapter_setTraceEnabledResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setTraceEnabledResponse").pyclass
+INetworkAdapter_setTraceEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setTraceEnabledResponse")
 
-INetworkAdapter_getTraceFileRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getTraceFile").pyclass
+INetworkAdapter_getTraceFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getTraceFile")
 
-INetworkAdapter_getTraceFileResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getTraceFileResponse").pyclass
+INetworkAdapter_getTraceFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getTraceFileResponse")
 
-INetworkAdapter_setTraceFileRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setTraceFile").pyclass
+INetworkAdapter_setTraceFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setTraceFile")
 
-INetworkAdapter_setTraceFileResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setTraceFileResponse").pyclass
+INetworkAdapter_setTraceFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setTraceFileResponse")
 
-INetworkAdapter_getNATEngineRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getNATEngine").pyclass
+INetworkAdapter_getNATEngineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getNATEngine")
 
-INetworkAdapter_getNATEngineResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getNATEngineResponse").pyclass
+INetworkAdapter_getNATEngineResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getNATEngineResponse")
 
-INetworkAdapter_getBootPriorityRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getBootPriority").pyclass
+INetworkAdapter_getBootPriorityRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getBootPriority")
 
-INetworkAdapter_getBootPriorityResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getBootPriorityResponse").pyclass
+INetworkAdapter_getBootPriorityResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getBootPriorityResponse")
 
-INetworkAdapter_setBootPriorityRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setBootPriority").pyclass
+INetworkAdapter_setBootPriorityRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setBootPriority")
 
-INetworkAdapter_setBootPriorityResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setBootPriorityResponse").pyclass
+INetworkAdapter_setBootPriorityResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setBootPriorityResponse")
 
-INetworkAdapter_getBandwidthGroupRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getBandwidthGroup").pyclass
+INetworkAdapter_getBandwidthGroupRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getBandwidthGroup")
 
-INetworkAdapter_getBandwidthGroupResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getBandwidthGroupResponse").pyclass
+INetworkAdapter_getBandwidthGroupResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getBandwidthGroupResponse")
 
-INetworkAdapter_setBandwidthGroupRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setBandwidthGroup").pyclass
+INetworkAdapter_setBandwidthGroupRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setBandwidthGroup")
 
-INetworkAdapter_setBandwidthGroupResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setBandwidthGroupResponse").pyclass
+INetworkAdapter_setBandwidthGroupResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setBandwidthGroupResponse")
 
-INetworkAdapter_getPropertyRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getProperty").pyclass
+INetworkAdapter_getPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getProperty")
 
-INetworkAdapter_getPropertyResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getPropertyResponse").pyclass
+INetworkAdapter_getPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getPropertyResponse")
 
-INetworkAdapter_setPropertyRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setProperty").pyclass
+INetworkAdapter_setPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setProperty")
 
-INetworkAdapter_setPropertyResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_setPropertyResponse").pyclass
+INetworkAdapter_setPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_setPropertyResponse")
 
-INetworkAdapter_getPropertiesRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getProperties").pyclass
+INetworkAdapter_getPropertiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getProperties")
 
-INetworkAdapter_getPropertiesResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapter_getPropertiesResponse").pyclass
+INetworkAdapter_getPropertiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapter_getPropertiesResponse")
 
-ISerialPort_getSlotRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_getSlot").pyclass
+ISerialPort_getSlotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getSlot")
 
-ISerialPort_getSlotResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_getSlotResponse").pyclass
+ISerialPort_getSlotResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getSlotResponse")
 
-ISerialPort_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_getEnabled").pyclass
+ISerialPort_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getEnabled")
 
-ISerialPort_getEnabledResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_getEnabledResponse").pyclass
+ISerialPort_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getEnabledResponse")
 
-ISerialPort_setEnabledRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_setEnabled").pyclass
+ISerialPort_setEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setEnabled")
 
-ISerialPort_setEnabledResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_setEnabledResponse").pyclass
+ISerialPort_setEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setEnabledResponse")
 
-ISerialPort_getIOBaseRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_getIOBase").pyclass
+ISerialPort_getIOBaseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getIOBase")
 
-ISerialPort_getIOBaseResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_getIOBaseResponse").pyclass
+ISerialPort_getIOBaseResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getIOBaseResponse")
 
-ISerialPort_setIOBaseRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_setIOBase").pyclass
+ISerialPort_setIOBaseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setIOBase")
 
-ISerialPort_setIOBaseResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_setIOBaseResponse").pyclass
+ISerialPort_setIOBaseResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setIOBaseResponse")
 
-ISerialPort_getIRQRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_getIRQ").pyclass
+ISerialPort_getIRQRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getIRQ")
 
-ISerialPort_getIRQResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_getIRQResponse").pyclass
+ISerialPort_getIRQResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getIRQResponse")
 
-ISerialPort_setIRQRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_setIRQ").pyclass
+ISerialPort_setIRQRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setIRQ")
 
-ISerialPort_setIRQResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_setIRQResponse").pyclass
+ISerialPort_setIRQResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setIRQResponse")
 
-ISerialPort_getHostModeRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_getHostMode").pyclass
+ISerialPort_getHostModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getHostMode")
 
-ISerialPort_getHostModeResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_getHostModeResponse").pyclass
+ISerialPort_getHostModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getHostModeResponse")
 
-ISerialPort_setHostModeRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_setHostMode").pyclass
+ISerialPort_setHostModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setHostMode")
 
-ISerialPort_setHostModeResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_setHostModeResponse").pyclass
+ISerialPort_setHostModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setHostModeResponse")
 
-ISerialPort_getServerRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_getServer").pyclass
+ISerialPort_getServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getServer")
 
-ISerialPort_getServerResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_getServerResponse").pyclass
+ISerialPort_getServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getServerResponse")
 
-ISerialPort_setServerRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_setServer").pyclass
+ISerialPort_setServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setServer")
 
-ISerialPort_setServerResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_setServerResponse").pyclass
+ISerialPort_setServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setServerResponse")
 
-ISerialPort_getPathRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_getPath").pyclass
+ISerialPort_getPathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getPath")
 
-ISerialPort_getPathResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_getPathResponse").pyclass
+ISerialPort_getPathResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_getPathResponse")
 
-ISerialPort_setPathRequestMsg = GED("http://www.virtualbox.org/", "ISerialPort_setPath").pyclass
+ISerialPort_setPathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setPath")
 
-ISerialPort_setPathResultMsg = GED("http://www.virtualbox.org/", "ISerialPort_setPathResponse").pyclass
+ISerialPort_setPathResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPort_setPathResponse")
 
-IParallelPort_getSlotRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_getSlot").pyclass
+IParallelPort_getSlotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getSlot")
 
-IParallelPort_getSlotResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_getSlotResponse").pyclass
+IParallelPort_getSlotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getSlotResponse")
 
-IParallelPort_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_getEnabled").pyclass
+IParallelPort_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getEnabled")
 
-IParallelPort_getEnabledResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_getEnabledResponse").pyclass
+IParallelPort_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getEnabledResponse")
 
-IParallelPort_setEnabledRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_setEnabled").pyclass
+IParallelPort_setEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setEnabled")
 
-IParallelPort_setEnabledResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_setEnabledResponse").pyclass
+IParallelPort_setEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setEnabledResponse")
 
-IParallelPort_getIOBaseRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_getIOBase").pyclass
+IParallelPort_getIOBaseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getIOBase")
 
-IParallelPort_getIOBaseResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_getIOBaseResponse").pyclass
+IParallelPort_getIOBaseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getIOBaseResponse")
 
-IParallelPort_setIOBaseRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_setIOBase").pyclass
+IParallelPort_setIOBaseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setIOBase")
 
-IParallelPort_setIOBaseResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_setIOBaseResponse").pyclass
+IParallelPort_setIOBaseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setIOBaseResponse")
 
-IParallelPort_getIRQRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_getIRQ").pyclass
+IParallelPort_getIRQRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getIRQ")
 
-IParallelPort_getIRQResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_getIRQResponse").pyclass
+IParallelPort_getIRQResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getIRQResponse")
 
-IParallelPort_setIRQRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_setIRQ").pyclass
+IParallelPort_setIRQRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setIRQ")
 
-IParallelPort_setIRQResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_setIRQResponse").pyclass
+IParallelPort_setIRQResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setIRQResponse")
 
-IParallelPort_getPathRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_getPath").pyclass
+IParallelPort_getPathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getPath")
 
-IParallelPort_getPathResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_getPathResponse").pyclass
+IParallelPort_getPathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_getPathResponse")
 
-IParallelPort_setPathRequestMsg = GED("http://www.virtualbox.org/", "IParallelPort_setPath").pyclass
+IParallelPort_setPathRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setPath")
 
-IParallelPort_setPathResultMsg = GED("http://www.virtualbox.org/", "IParallelPort_setPathResponse").pyclass
+IParallelPort_setPathResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPort_setPathResponse")
 
-IMachineDebugger_getSingleStepRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getSingleStep").pyclass
+IMachineDebugger_getSingleStepRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getSingleStep")
 
-IMachineDebugger_getSingleStepResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getSingleStepResponse").pyclass
+IMachineDebugger_getSingleStepResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getSingleStepResponse")
 
-IMachineDebugger_setSingleStepRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setSingleStep").pyclass
+IMachineDebugger_setSingleStepRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setSingleStep")
 
-IMachineDebugger_setSingleStepResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setSingleStepResponse").pyclass
+IMachineDebugger_setSingleStepResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setSingleStepResponse")
 
-IMachineDebugger_getRecompileUserRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRecompileUser").pyclass
+IMachineDebugger_getRecompileUserRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRecompileUser")
 
-IMachineDebugger_getRecompileUserResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRecompileUserResponse").pyclass
+IMachineDebugger_getRecompileUserResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRecompileUserResponse")
 
-IMachineDebugger_setRecompileUserRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRecompileUser").pyclass
+IMachineDebugger_setRecompileUserRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRecompileUser")
 
-IMachineDebugger_setRecompileUserResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRecompileUserResponse").pyclass
+IMachineDebugger_setRecompileUserResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRecompileUserResponse")
 
-IMachineDebugger_getRecompileSupervisorRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRecompileSupervisor").pyclass
+IMachineDebugger_getRecompileSupervisorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRecompileSupervisor")
 
-IMachineDebugger_getRecompileSupervisorResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRecompileSupervisorResponse").pyclass
+IMachineDebugger_getRecompileSupervisorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRecompileSupervisorResponse")
 
-IMachineDebugger_setRecompileSupervisorRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRecompileSupervisor").pyclass
+IMachineDebugger_setRecompileSupervisorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRecompileSupervisor")
 
-IMachineDebugger_setRecompileSupervisorResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRecompileSupervisorResponse").pyclass
+IMachineDebugger_setRecompileSupervisorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRecompileSupervisorResponse")
 
-IMachineDebugger_getExecuteAllInIEMRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getExecuteAllInIEM").pyclass
+IMachineDebugger_getExecuteAllInIEMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getExecuteAllInIEM")
 
-IMachineDebugger_getExecuteAllInIEMResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getExecuteAllInIEMResponse").pyclass
+IMachineDebugger_getExecuteAllInIEMResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getExecuteAllInIEMResponse")
 
-IMachineDebugger_setExecuteAllInIEMRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setExecuteAllInIEM").pyclass
+IMachineDebugger_setExecuteAllInIEMRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setExecuteAllInIEM")
 
-IMachineDebugger_setExecuteAllInIEMResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setExecuteAllInIEMResponse").pyclass
+IMachineDebugger_setExecuteAllInIEMResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setExecuteAllInIEMResponse")
 
-IMachineDebugger_getPATMEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getPATMEnabled").pyclass
+IMachineDebugger_getPATMEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getPATMEnabled")
 
-IMachineDebugger_getPATMEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getPATMEnabledResponse").pyclass
+IMachineDebugger_getPATMEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getPATMEnabledResponse")
 
-IMachineDebugger_setPATMEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setPATMEnabled").pyclass
+IMachineDebugger_setPATMEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setPATMEnabled")
 
-IMachineDebugger_setPATMEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setPATMEnabledResponse").pyclass
+IMachineDebugger_setPATMEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setPATMEnabledResponse")
 
-IMachineDebugger_getCSAMEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getCSAMEnabled").pyclass
+IMachineDebugger_getCSAMEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getCSAMEnabled")
 
-IMachineDebugger_getCSAMEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getCSAMEnabledResponse").pyclass
+IMachineDebugger_getCSAMEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getCSAMEnabledResponse")
 
-IMachineDebugger_setCSAMEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setCSAMEnabled").pyclass
+IMachineDebugger_setCSAMEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setCSAMEnabled")
 
-IMachineDebugger_setCSAMEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setCSAMEnabledResponse").pyclass
+IMachineDebugger_setCSAMEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setCSAMEnabledResponse")
 
-IMachineDebugger_getLogEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogEnabled").pyclass
+IMachineDebugger_getLogEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogEnabled")
 
-IMachineDebugger_getLogEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogEnabledResponse").pyclass
+IMachineDebugger_getLogEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogEnabledResponse")
 
-IMachineDebugger_setLogEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setLogEnabled").pyclass
+IMachineDebugger_setLogEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setLogEnabled")
 
-IMachineDebugger_setLogEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setLogEnabledResponse").pyclass
+IMachineDebugger_setLogEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setLogEnabledResponse")
 
-IMachineDebugger_getLogDbgFlagsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgFlags").pyclass
+IMachineDebugger_getLogDbgFlagsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgFlags")
 
-IMachineDebugger_getLogDbgFlagsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgFlagsResponse").pyclass
+IMachineDebugger_getLogDbgFlagsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgFlagsResponse")
 
-IMachineDebugger_getLogDbgGroupsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgGroups").pyclass
+IMachineDebugger_getLogDbgGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgGroups")
 
-IMachineDebugger_getLogDbgGroupsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgGroupsResponse").pyclass
+IMachineDebugger_getLogDbgGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgGroupsResponse")
 
-IMachineDebugger_getLogDbgDestinationsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgDestinations").pyclass
+IMachineDebugger_getLogDbgDestinationsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgDestinations")
 
-IMachineDebugger_getLogDbgDestinationsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgDestinationsResponse").pyclass
+IMachineDebugger_getLogDbgDestinationsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogDbgDestinationsResponse")
 
-IMachineDebugger_getLogRelFlagsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogRelFlags").pyclass
+IMachineDebugger_getLogRelFlagsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogRelFlags")
 
-IMachineDebugger_getLogRelFlagsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogRelFlagsResponse").pyclass
+IMachineDebugger_getLogRelFlagsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogRelFlagsResponse")
 
-IMachineDebugger_getLogRelGroupsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogRelGroups").pyclass
+IMachineDebugger_getLogRelGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogRelGroups")
 
-IMachineDebugger_getLogRelGroupsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogRelGroupsResponse").pyclass
+IMachineDebugger_getLogRelGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogRelGroupsResponse")
 
-IMachineDebugger_getLogRelDestinationsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogRelDestinations").pyclass
+IMachineDebugger_getLogRelDestinationsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogRelDestinations")
 
-IMachineDebugger_getLogRelDestinationsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getLogRelDestinationsResponse").pyclass
+IMachineDebugger_getLogRelDestinationsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getLogRelDestinationsResponse")
 
-IMachineDebugger_getHWVirtExEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExEnabled").pyclass
+IMachineDebugger_getHWVirtExEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExEnabled")
 
-IMachineDebugger_getHWVirtExEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExEnabledResponse").pyclass
+IMachineDebugger_getHWVirtExEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExEnabledResponse")
 
-IMachineDebugger_getHWVirtExNestedPagingEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExNestedPagingEnabled").pyclass
+IMachineDebugger_getHWVirtExNestedPagingEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExNestedPagingEnabled")
 
-IMachineDebugger_getHWVirtExNestedPagingEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExNestedPagingEnabledResponse").pyclass
+IMachineDebugger_getHWVirtExNestedPagingEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExNestedPagingEnabledResponse")
 
-IMachineDebugger_getHWVirtExVPIDEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExVPIDEnabled").pyclass
+IMachineDebugger_getHWVirtExVPIDEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExVPIDEnabled")
 
-IMachineDebugger_getHWVirtExVPIDEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExVPIDEnabledResponse").pyclass
+IMachineDebugger_getHWVirtExVPIDEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExVPIDEnabledResponse")
 
-IMachineDebugger_getHWVirtExUXEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExUXEnabled").pyclass
+IMachineDebugger_getHWVirtExUXEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExUXEnabled")
 
-IMachineDebugger_getHWVirtExUXEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExUXEnabledResponse").pyclass
+IMachineDebugger_getHWVirtExUXEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getHWVirtExUXEnabledResponse")
 
-IMachineDebugger_getOSNameRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getOSName").pyclass
+IMachineDebugger_getOSNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getOSName")
 
-IMachineDebugger_getOSNameResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getOSNameResponse").pyclass
+IMachineDebugger_getOSNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getOSNameResponse")
 
-IMachineDebugger_getOSVersionRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getOSVersion").pyclass
+IMachineDebugger_getOSVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getOSVersion")
 
-IMachineDebugger_getOSVersionResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getOSVersionResponse").pyclass
+IMachineDebugger_getOSVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getOSVersionResponse")
 
-IMachineDebugger_getPAEEnabledRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getPAEEnabled").pyclass
+IMachineDebugger_getPAEEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getPAEEnabled")
 
-IMachineDebugger_getPAEEnabledResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getPAEEnabledResponse").pyclass
+IMachineDebugger_getPAEEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getPAEEnabledResponse")
 
-IMachineDebugger_getVirtualTimeRateRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getVirtualTimeRate").pyclass
+IMachineDebugger_getVirtualTimeRateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getVirtualTimeRate")
 
-IMachineDebugger_getVirtualTimeRateResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getVirtualTimeRateResponse").pyclass
+IMachineDebugger_getVirtualTimeRateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getVirtualTimeRateResponse")
 
-IMachineDebugger_setVirtualTimeRateRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setVirtualTimeRate").pyclass
+IMachineDebugger_setVirtualTimeRateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setVirtualTimeRate")
 
-IMachineDebugger_setVirtualTimeRateResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setVirtualTimeRateResponse").pyclass
+IMachineDebugger_setVirtualTimeRateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setVirtualTimeRateResponse")
 
-IMachineDebugger_dumpGuestCoreRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestCore").pyclass
+IMachineDebugger_dumpGuestCoreRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestCore")
 
-IMachineDebugger_dumpGuestCoreResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestCoreResponse").pyclass
+IMachineDebugger_dumpGuestCoreResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestCoreResponse")
 
-IMachineDebugger_dumpHostProcessCoreRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpHostProcessCore").pyclass
+IMachineDebugger_dumpHostProcessCoreRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpHostProcessCore")
 
-IMachineDebugger_dumpHostProcessCoreResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpHostProcessCoreResponse").pyclass
+IMachineDebugger_dumpHostProcessCoreResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpHostProcessCoreResponse")
 
-IMachineDebugger_infoRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_info").pyclass
+IMachineDebugger_infoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_info")
 
-IMachineDebugger_infoResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_infoResponse").pyclass
+IMachineDebugger_infoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_infoResponse")
 
-IMachineDebugger_injectNMIRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_injectNMI").pyclass
+IMachineDebugger_injectNMIRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_injectNMI")
 
-IMachineDebugger_injectNMIResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_injectNMIResponse").pyclass
+IMachineDebugger_injectNMIResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_injectNMIResponse")
 
-IMachineDebugger_modifyLogGroupsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_modifyLogGroups").pyclass
+IMachineDebugger_modifyLogGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_modifyLogGroups")
 
-IMachineDebugger_modifyLogGroupsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_modifyLogGroupsResponse").pyclass
+IMachineDebugger_modifyLogGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_modifyLogGroupsResponse")
 
-IMachineDebugger_modifyLogFlagsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_modifyLogFlags").pyclass
+IMachineDebugger_modifyLogFlagsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_modifyLogFlags")
 
-IMachineDebugger_modifyLogFlagsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_modifyLogFlagsResponse").pyclass
+IMachineDebugger_modifyLogFlagsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_modifyLogFlagsResponse")
 
-IMachineDebugger_modifyLogDestinationsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_modifyLogDestinations").pyclass
+IMachineDebugger_modifyLogDestinationsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_modifyLogDestinations")
 
-IMachineDebugger_modifyLogDestinationsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_modifyLogDestinationsResponse").pyclass
+IMachineDebugger_modifyLogDestinationsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_modifyLogDestinationsResponse")
 
-IMachineDebugger_readPhysicalMemoryRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_readPhysicalMemory").pyclass
+IMachineDebugger_readPhysicalMemoryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_readPhysicalMemory")
 
-IMachineDebugger_readPhysicalMemoryResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_readPhysicalMemoryResponse").pyclass
+IMachineDebugger_readPhysicalMemoryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_readPhysicalMemoryResponse")
 
-IMachineDebugger_writePhysicalMemoryRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_writePhysicalMemory").pyclass
+IMachineDebugger_writePhysicalMemoryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_writePhysicalMemory")
 
-IMachineDebugger_writePhysicalMemoryResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_writePhysicalMemoryResponse").pyclass
+IMachineDebugger_writePhysicalMemoryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_writePhysicalMemoryResponse")
 
-IMachineDebugger_readVirtualMemoryRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_readVirtualMemory").pyclass
+IMachineDebugger_readVirtualMemoryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_readVirtualMemory")
 
-IMachineDebugger_readVirtualMemoryResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_readVirtualMemoryResponse").pyclass
+IMachineDebugger_readVirtualMemoryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_readVirtualMemoryResponse")
 
-IMachineDebugger_writeVirtualMemoryRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_writeVirtualMemory").pyclass
+IMachineDebugger_writeVirtualMemoryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_writeVirtualMemory")
 
-IMachineDebugger_writeVirtualMemoryResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_writeVirtualMemoryResponse").pyclass
+IMachineDebugger_writeVirtualMemoryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_writeVirtualMemoryResponse")
 
-IMachineDebugger_detectOSRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_detectOS").pyclass
+IMachineDebugger_detectOSRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_detectOS")
 
-IMachineDebugger_detectOSResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_detectOSResponse").pyclass
+IMachineDebugger_detectOSResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_detectOSResponse")
 
-IMachineDebugger_getRegisterRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRegister").pyclass
+IMachineDebugger_getRegisterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRegister")
 
-IMachineDebugger_getRegisterResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRegisterResponse").pyclass
+IMachineDebugger_getRegisterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRegisterResponse")
 
-IMachineDebugger_getRegistersRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRegisters").pyclass
+IMachineDebugger_getRegistersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRegisters")
 
-IMachineDebugger_getRegistersResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getRegistersResponse").pyclass
+IMachineDebugger_getRegistersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getRegistersResponse")
 
-IMachineDebugger_setRegisterRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRegister").pyclass
+IMachineDebugger_setRegisterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRegister")
 
-IMachineDebugger_setRegisterResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRegisterResponse").pyclass
+IMachineDebugger_setRegisterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRegisterResponse")
 
-IMachineDebugger_setRegistersRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRegisters").pyclass
+IMachineDebugger_setRegistersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRegisters")
 
-IMachineDebugger_setRegistersResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_setRegistersResponse").pyclass
+IMachineDebugger_setRegistersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_setRegistersResponse")
 
-IMachineDebugger_dumpGuestStackRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestStack").pyclass
+IMachineDebugger_dumpGuestStackRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestStack")
 
-IMachineDebugger_dumpGuestStackResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestStackResponse").pyclass
+IMachineDebugger_dumpGuestStackResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpGuestStackResponse")
 
-IMachineDebugger_resetStatsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_resetStats").pyclass
+IMachineDebugger_resetStatsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_resetStats")
 
-IMachineDebugger_resetStatsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_resetStatsResponse").pyclass
+IMachineDebugger_resetStatsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_resetStatsResponse")
 
-IMachineDebugger_dumpStatsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpStats").pyclass
+IMachineDebugger_dumpStatsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpStats")
 
-IMachineDebugger_dumpStatsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_dumpStatsResponse").pyclass
+IMachineDebugger_dumpStatsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_dumpStatsResponse")
 
-IMachineDebugger_getStatsRequestMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getStats").pyclass
+IMachineDebugger_getStatsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getStats")
 
-IMachineDebugger_getStatsResultMsg = GED("http://www.virtualbox.org/", "IMachineDebugger_getStatsResponse").pyclass
+IMachineDebugger_getStatsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDebugger_getStatsResponse")
 
-IUSBDeviceFilters_getDeviceFiltersRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_getDeviceFilters").pyclass
+IUSBDeviceFilters_getDeviceFiltersRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_getDeviceFilters")
 
-IUSBDeviceFilters_getDeviceFiltersResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_getDeviceFiltersResponse").pyclass
+IUSBDeviceFilters_getDeviceFiltersResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_getDeviceFiltersResponse")
 
-IUSBDeviceFilters_createDeviceFilterRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_createDeviceFilter").pyclass
+IUSBDeviceFilters_createDeviceFilterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_createDeviceFilter")
 
-IUSBDeviceFilters_createDeviceFilterResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_createDeviceFilterResponse").pyclass
+IUSBDeviceFilters_createDeviceFilterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_createDeviceFilterResponse")
 
-IUSBDeviceFilters_insertDeviceFilterRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_insertDeviceFilter").pyclass
+IUSBDeviceFilters_insertDeviceFilterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_insertDeviceFilter")
 
-IUSBDeviceFilters_insertDeviceFilterResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_insertDeviceFilterResponse").pyclass
+IUSBDeviceFilters_insertDeviceFilterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_insertDeviceFilterResponse")
 
-IUSBDeviceFilters_removeDeviceFilterRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_removeDeviceFilter").pyclass
+IUSBDeviceFilters_removeDeviceFilterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_removeDeviceFilter")
 
-IUSBDeviceFilters_removeDeviceFilterResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilters_removeDeviceFilterResponse").pyclass
+IUSBDeviceFilters_removeDeviceFilterResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilters_removeDeviceFilterResponse")
 
-IUSBController_getNameRequestMsg = GED("http://www.virtualbox.org/", "IUSBController_getName").pyclass
+IUSBController_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBController_getName")
 
-IUSBController_getNameResultMsg = GED("http://www.virtualbox.org/", "IUSBController_getNameResponse").pyclass
+IUSBController_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBController_getNameResponse")
 
-IUSBController_getTypeRequestMsg = GED("http://www.virtualbox.org/", "IUSBController_getType").pyclass
+IUSBController_getTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBController_getType")
 
-IUSBController_getTypeResultMsg = GED("http://www.virtualbox.org/", "IUSBController_getTypeResponse").pyclass
+IUSBController_getTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBController_getTypeResponse")
 
-IUSBController_getUSBStandardRequestMsg = GED("http://www.virtualbox.org/", "IUSBController_getUSBStandard").pyclass
+IUSBController_getUSBStandardRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBController_getUSBStandard")
 
-IUSBController_getUSBStandardResultMsg = GED("http://www.virtualbox.org/", "IUSBController_getUSBStandardResponse").pyclass
+IUSBController_getUSBStandardResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBController_getUSBStandardResponse")
 
-IUSBDevice_getIdRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getId").pyclass
+IUSBDevice_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getId")
 
-IUSBDevice_getIdResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getIdResponse").pyclass
+IUSBDevice_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getIdResponse")
 
-IUSBDevice_getVendorIdRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getVendorId").pyclass
+IUSBDevice_getVendorIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getVendorId")
 
-IUSBDevice_getVendorIdResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getVendorIdResponse").pyclass
+IUSBDevice_getVendorIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getVendorIdResponse")
 
-IUSBDevice_getProductIdRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getProductId").pyclass
+IUSBDevice_getProductIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getProductId")
 
-IUSBDevice_getProductIdResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getProductIdResponse").pyclass
+IUSBDevice_getProductIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getProductIdResponse")
 
-IUSBDevice_getRevisionRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getRevision").pyclass
+IUSBDevice_getRevisionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getRevision")
 
-IUSBDevice_getRevisionResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getRevisionResponse").pyclass
+IUSBDevice_getRevisionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getRevisionResponse")
 
-IUSBDevice_getManufacturerRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getManufacturer").pyclass
+IUSBDevice_getManufacturerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getManufacturer")
 
-IUSBDevice_getManufacturerResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getManufacturerResponse").pyclass
+IUSBDevice_getManufacturerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getManufacturerResponse")
 
-IUSBDevice_getProductRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getProduct").pyclass
+IUSBDevice_getProductRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getProduct")
 
-IUSBDevice_getProductResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getProductResponse").pyclass
+IUSBDevice_getProductResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getProductResponse")
 
-IUSBDevice_getSerialNumberRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getSerialNumber").pyclass
+IUSBDevice_getSerialNumberRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getSerialNumber")
 
-IUSBDevice_getSerialNumberResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getSerialNumberResponse").pyclass
+IUSBDevice_getSerialNumberResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getSerialNumberResponse")
 
-IUSBDevice_getAddressRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getAddress").pyclass
+IUSBDevice_getAddressRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getAddress")
 
-IUSBDevice_getAddressResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getAddressResponse").pyclass
+IUSBDevice_getAddressResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getAddressResponse")
 
-IUSBDevice_getPortRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getPort").pyclass
+IUSBDevice_getPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getPort")
 
-IUSBDevice_getPortResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getPortResponse").pyclass
+IUSBDevice_getPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getPortResponse")
 
-IUSBDevice_getVersionRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getVersion").pyclass
+IUSBDevice_getVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getVersion")
 
-IUSBDevice_getVersionResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getVersionResponse").pyclass
+IUSBDevice_getVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getVersionResponse")
 
-IUSBDevice_getPortVersionRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getPortVersion").pyclass
+IUSBDevice_getPortVersionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getPortVersion")
 
-IUSBDevice_getPortVersionResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getPortVersionResponse").pyclass
+IUSBDevice_getPortVersionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getPortVersionResponse")
 
-IUSBDevice_getRemoteRequestMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getRemote").pyclass
+IUSBDevice_getRemoteRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getRemote")
 
-IUSBDevice_getRemoteResultMsg = GED("http://www.virtualbox.org/", "IUSBDevice_getRemoteResponse").pyclass
+IUSBDevice_getRemoteResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDevice_getRemoteResponse")
 
-IUSBDeviceFilter_getNameRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getName").pyclass
+IUSBDeviceFilter_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getName")
 
-IUSBDeviceFilter_getNameResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getNameResponse").pyclass
+IUSBDeviceFilter_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getNameResponse")
 
-IUSBDeviceFilter_setNameRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setName").pyclass
+IUSBDeviceFilter_setNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setName")
 
-IUSBDeviceFilter_setNameResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setNameResponse").pyclass
+IUSBDeviceFilter_setNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setNameResponse")
 
-IUSBDeviceFilter_getActiveRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getActive").pyclass
+IUSBDeviceFilter_getActiveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getActive")
 
-IUSBDeviceFilter_getActiveResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getActiveResponse").pyclass
+IUSBDeviceFilter_getActiveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getActiveResponse")
 
-IUSBDeviceFilter_setActiveRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setActive").pyclass
+IUSBDeviceFilter_setActiveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setActive")
 
-IUSBDeviceFilter_setActiveResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setActiveResponse").pyclass
+IUSBDeviceFilter_setActiveResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setActiveResponse")
 
-IUSBDeviceFilter_getVendorIdRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getVendorId").pyclass
+IUSBDeviceFilter_getVendorIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getVendorId")
 
-IUSBDeviceFilter_getVendorIdResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getVendorIdResponse").pyclass
+IUSBDeviceFilter_getVendorIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getVendorIdResponse")
 
-IUSBDeviceFilter_setVendorIdRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setVendorId").pyclass
+IUSBDeviceFilter_setVendorIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setVendorId")
 
-IUSBDeviceFilter_setVendorIdResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setVendorIdResponse").pyclass
+IUSBDeviceFilter_setVendorIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setVendorIdResponse")
 
-IUSBDeviceFilter_getProductIdRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getProductId").pyclass
+IUSBDeviceFilter_getProductIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getProductId")
 
-IUSBDeviceFilter_getProductIdResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getProductIdResponse").pyclass
+IUSBDeviceFilter_getProductIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getProductIdResponse")
 
-IUSBDeviceFilter_setProductIdRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setProductId").pyclass
+IUSBDeviceFilter_setProductIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setProductId")
 
-IUSBDeviceFilter_setProductIdResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setProductIdResponse").pyclass
+IUSBDeviceFilter_setProductIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setProductIdResponse")
 
-IUSBDeviceFilter_getRevisionRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getRevision").pyclass
+IUSBDeviceFilter_getRevisionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getRevision")
 
-IUSBDeviceFilter_getRevisionResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getRevisionResponse").pyclass
+IUSBDeviceFilter_getRevisionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getRevisionResponse")
 
-IUSBDeviceFilter_setRevisionRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setRevision").pyclass
+IUSBDeviceFilter_setRevisionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setRevision")
 
-IUSBDeviceFilter_setRevisionResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setRevisionResponse").pyclass
+IUSBDeviceFilter_setRevisionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setRevisionResponse")
 
-IUSBDeviceFilter_getManufacturerRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getManufacturer").pyclass
+IUSBDeviceFilter_getManufacturerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getManufacturer")
 
-IUSBDeviceFilter_getManufacturerResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getManufacturerResponse").pyclass
+IUSBDeviceFilter_getManufacturerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getManufacturerResponse")
 
-IUSBDeviceFilter_setManufacturerRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setManufacturer").pyclass
+IUSBDeviceFilter_setManufacturerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setManufacturer")
 
-IUSBDeviceFilter_setManufacturerResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setManufacturerResponse").pyclass
+IUSBDeviceFilter_setManufacturerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setManufacturerResponse")
 
-IUSBDeviceFilter_getProductRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getProduct").pyclass
+IUSBDeviceFilter_getProductRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getProduct")
 
-IUSBDeviceFilter_getProductResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getProductResponse").pyclass
+IUSBDeviceFilter_getProductResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getProductResponse")
 
-IUSBDeviceFilter_setProductRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setProduct").pyclass
+IUSBDeviceFilter_setProductRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setProduct")
 
-IUSBDeviceFilter_setProductResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setProductResponse").pyclass
+IUSBDeviceFilter_setProductResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setProductResponse")
 
-IUSBDeviceFilter_getSerialNumberRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getSerialNumber").pyclass
+IUSBDeviceFilter_getSerialNumberRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getSerialNumber")
 
-IUSBDeviceFilter_getSerialNumberResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getSerialNumberResponse").pyclass
+IUSBDeviceFilter_getSerialNumberResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getSerialNumberResponse")
 
-IUSBDeviceFilter_setSerialNumberRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setSerialNumber").pyclass
+IUSBDeviceFilter_setSerialNumberRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setSerialNumber")
 
-IUSBDeviceFilter_setSerialNumberResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setSerialNumberResponse").pyclass
+IUSBDeviceFilter_setSerialNumberResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setSerialNumberResponse")
 
-IUSBDeviceFilter_getPortRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getPort").pyclass
+IUSBDeviceFilter_getPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getPort")
 
-IUSBDeviceFilter_getPortResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getPortResponse").pyclass
+IUSBDeviceFilter_getPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getPortResponse")
 
-IUSBDeviceFilter_setPortRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setPort").pyclass
+IUSBDeviceFilter_setPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setPort")
 
-IUSBDeviceFilter_setPortResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setPortResponse").pyclass
+IUSBDeviceFilter_setPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setPortResponse")
 
-IUSBDeviceFilter_getRemoteRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getRemote").pyclass
+IUSBDeviceFilter_getRemoteRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getRemote")
 
-IUSBDeviceFilter_getRemoteResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getRemoteResponse").pyclass
+IUSBDeviceFilter_getRemoteResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getRemoteResponse")
 
-IUSBDeviceFilter_setRemoteRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setRemote").pyclass
+IUSBDeviceFilter_setRemoteRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setRemote")
 
-IUSBDeviceFilter_setRemoteResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setRemoteResponse").pyclass
+IUSBDeviceFilter_setRemoteResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setRemoteResponse")
 
-IUSBDeviceFilter_getMaskedInterfacesRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getMaskedInterfaces").pyclass
+IUSBDeviceFilter_getMaskedInterfacesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getMaskedInterfaces")
 
-IUSBDeviceFilter_getMaskedInterfacesResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_getMaskedInterfacesResponse").pyclass
+IUSBDeviceFilter_getMaskedInterfacesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_getMaskedInterfacesResponse")
 
-IUSBDeviceFilter_setMaskedInterfacesRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setMaskedInterfaces").pyclass
+IUSBDeviceFilter_setMaskedInterfacesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setMaskedInterfaces")
 
-IUSBDeviceFilter_setMaskedInterfacesResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceFilter_setMaskedInterfacesResponse").pyclass
+IUSBDeviceFilter_setMaskedInterfacesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceFilter_setMaskedInterfacesResponse")
 
-IHostUSBDevice_getStateRequestMsg = GED("http://www.virtualbox.org/", "IHostUSBDevice_getState").pyclass
+IHostUSBDevice_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostUSBDevice_getState")
 
-IHostUSBDevice_getStateResultMsg = GED("http://www.virtualbox.org/", "IHostUSBDevice_getStateResponse").pyclass
+IHostUSBDevice_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostUSBDevice_getStateResponse")
 
-IHostUSBDeviceFilter_getActionRequestMsg = GED("http://www.virtualbox.org/", "IHostUSBDeviceFilter_getAction").pyclass
+IHostUSBDeviceFilter_getActionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostUSBDeviceFilter_getAction")
 
-IHostUSBDeviceFilter_getActionResultMsg = GED("http://www.virtualbox.org/", "IHostUSBDeviceFilter_getActionResponse").pyclass
+IHostUSBDeviceFilter_getActionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostUSBDeviceFilter_getActionResponse")
 
-IHostUSBDeviceFilter_setActionRequestMsg = GED("http://www.virtualbox.org/", "IHostUSBDeviceFilter_setAction").pyclass
+IHostUSBDeviceFilter_setActionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostUSBDeviceFilter_setAction")
 
-IHostUSBDeviceFilter_setActionResultMsg = GED("http://www.virtualbox.org/", "IHostUSBDeviceFilter_setActionResponse").pyclass
+IHostUSBDeviceFilter_setActionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostUSBDeviceFilter_setActionResponse")
 
-IAudioAdapter_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_getEnabled").pyclass
+IAudioAdapter_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_getEnabled")
 
-IAudioAdapter_getEnabledResultMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_getEnabledResponse").pyclass
+IAudioAdapter_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_getEnabledResponse")
 
-IAudioAdapter_setEnabledRequestMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_setEnabled").pyclass
+IAudioAdapter_setEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_setEnabled")
 
-IAudioAdapter_setEnabledResultMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_setEnabledResponse").pyclass
+IAudioAdapter_setEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_setEnabledResponse")
 
-IAudioAdapter_getAudioControllerRequestMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_getAudioController").pyclass
+IAudioAdapter_getAudioControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_getAudioController")
 
-IAudioAdapter_getAudioControllerResultMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_getAudioControllerResponse").pyclass
+IAudioAdapter_getAudioControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_getAudioControllerResponse")
 
-IAudioAdapter_setAudioControllerRequestMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_setAudioController").pyclass
+IAudioAdapter_setAudioControllerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_setAudioController")
 
-IAudioAdapter_setAudioControllerResultMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_setAudioControllerResponse").pyclass
+IAudioAdapter_setAudioControllerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_setAudioControllerResponse")
 
-IAudioAdapter_getAudioDriverRequestMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_getAudioDriver").pyclass
+IAudioAdapter_getAudioDriverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_getAudioDriver")
 
-IAudioAdapter_getAudioDriverResultMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_getAudioDriverResponse").pyclass
+IAudioAdapter_getAudioDriverResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_getAudioDriverResponse")
 
-IAudioAdapter_setAudioDriverRequestMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_setAudioDriver").pyclass
+IAudioAdapter_setAudioDriverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_setAudioDriver")
 
-IAudioAdapter_setAudioDriverResultMsg = GED("http://www.virtualbox.org/", "IAudioAdapter_setAudioDriverResponse").pyclass
+IAudioAdapter_setAudioDriverResultMsg = LazyPyclass("http://www.virtualbox.org/", "IAudioAdapter_setAudioDriverResponse")
 
-IVRDEServer_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getEnabled").pyclass
+IVRDEServer_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getEnabled")
 
-IVRDEServer_getEnabledResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getEnabledResponse").pyclass
+IVRDEServer_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getEnabledResponse")
 
-IVRDEServer_setEnabledRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setEnabled").pyclass
+IVRDEServer_setEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setEnabled")
 
-IVRDEServer_setEnabledResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setEnabledResponse").pyclass
+IVRDEServer_setEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setEnabledResponse")
 
-IVRDEServer_getAuthTypeRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAuthType").pyclass
+IVRDEServer_getAuthTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAuthType")
 
-IVRDEServer_getAuthTypeResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAuthTypeResponse").pyclass
+IVRDEServer_getAuthTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAuthTypeResponse")
 
-IVRDEServer_setAuthTypeRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAuthType").pyclass
+IVRDEServer_setAuthTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAuthType")
 
-IVRDEServer_setAuthTypeResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAuthTypeResponse").pyclass
+IVRDEServer_setAuthTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAuthTypeResponse")
 
-IVRDEServer_getAuthTimeoutRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAuthTimeout").pyclass
+IVRDEServer_getAuthTimeoutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAuthTimeout")
 
-IVRDEServer_getAuthTimeoutResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAuthTimeoutResponse").pyclass
+IVRDEServer_getAuthTimeoutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAuthTimeoutResponse")
 
-IVRDEServer_setAuthTimeoutRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAuthTimeout").pyclass
+IVRDEServer_setAuthTimeoutRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAuthTimeout")
 
-IVRDEServer_setAuthTimeoutResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAuthTimeoutResponse").pyclass
+IVRDEServer_setAuthTimeoutResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAuthTimeoutResponse")
 
-IVRDEServer_getAllowMultiConnectionRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAllowMultiConnection").pyclass
+IVRDEServer_getAllowMultiConnectionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAllowMultiConnection")
 
-IVRDEServer_getAllowMultiConnectionResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAllowMultiConnectionResponse").pyclass
+IVRDEServer_getAllowMultiConnectionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAllowMultiConnectionResponse")
 
-IVRDEServer_setAllowMultiConnectionRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAllowMultiConnection").pyclass
+IVRDEServer_setAllowMultiConnectionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAllowMultiConnection")
 
-IVRDEServer_setAllowMultiConnectionResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAllowMultiConnectionResponse").pyclass
+IVRDEServer_setAllowMultiConnectionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAllowMultiConnectionResponse")
 
-IVRDEServer_getReuseSingleConnectionRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getReuseSingleConnection").pyclass
+IVRDEServer_getReuseSingleConnectionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getReuseSingleConnection")
 
-IVRDEServer_getReuseSingleConnectionResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getReuseSingleConnectionResponse").pyclass
+IVRDEServer_getReuseSingleConnectionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getReuseSingleConnectionResponse")
 
-IVRDEServer_setReuseSingleConnectionRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setReuseSingleConnection").pyclass
+IVRDEServer_setReuseSingleConnectionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setReuseSingleConnection")
 
-IVRDEServer_setReuseSingleConnectionResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setReuseSingleConnectionResponse").pyclass
+IVRDEServer_setReuseSingleConnectionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setReuseSingleConnectionResponse")
 
-IVRDEServer_getVRDEExtPackRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getVRDEExtPack").pyclass
+IVRDEServer_getVRDEExtPackRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getVRDEExtPack")
 
-IVRDEServer_getVRDEExtPackResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getVRDEExtPackResponse").pyclass
+IVRDEServer_getVRDEExtPackResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getVRDEExtPackResponse")
 
-IVRDEServer_setVRDEExtPackRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setVRDEExtPack").pyclass
+IVRDEServer_setVRDEExtPackRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setVRDEExtPack")
 
-IVRDEServer_setVRDEExtPackResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setVRDEExtPackResponse").pyclass
+IVRDEServer_setVRDEExtPackResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setVRDEExtPackResponse")
 
-IVRDEServer_getAuthLibraryRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAuthLibrary").pyclass
+IVRDEServer_getAuthLibraryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAuthLibrary")
 
-IVRDEServer_getAuthLibraryResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getAuthLibraryResponse").pyclass
+IVRDEServer_getAuthLibraryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getAuthLibraryResponse")
 
-IVRDEServer_setAuthLibraryRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAuthLibrary").pyclass
+IVRDEServer_setAuthLibraryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAuthLibrary")
 
-IVRDEServer_setAuthLibraryResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setAuthLibraryResponse").pyclass
+IVRDEServer_setAuthLibraryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setAuthLibraryResponse")
 
-IVRDEServer_getVRDEPropertiesRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getVRDEProperties").pyclass
+IVRDEServer_getVRDEPropertiesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getVRDEProperties")
 
-IVRDEServer_getVRDEPropertiesResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getVRDEPropertiesResponse").pyclass
+IVRDEServer_getVRDEPropertiesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getVRDEPropertiesResponse")
 
-IVRDEServer_setVRDEPropertyRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setVRDEProperty").pyclass
+IVRDEServer_setVRDEPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setVRDEProperty")
 
-IVRDEServer_setVRDEPropertyResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_setVRDEPropertyResponse").pyclass
+IVRDEServer_setVRDEPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_setVRDEPropertyResponse")
 
-IVRDEServer_getVRDEPropertyRequestMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getVRDEProperty").pyclass
+IVRDEServer_getVRDEPropertyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getVRDEProperty")
 
-IVRDEServer_getVRDEPropertyResultMsg = GED("http://www.virtualbox.org/", "IVRDEServer_getVRDEPropertyResponse").pyclass
+IVRDEServer_getVRDEPropertyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVRDEServer_getVRDEPropertyResponse")
 
-ISession_getStateRequestMsg = GED("http://www.virtualbox.org/", "ISession_getState").pyclass
+ISession_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getState")
 
-ISession_getStateResultMsg = GED("http://www.virtualbox.org/", "ISession_getStateResponse").pyclass
+ISession_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getStateResponse")
 
-ISession_getTypeRequestMsg = GED("http://www.virtualbox.org/", "ISession_getType").pyclass
+ISession_getTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getType")
 
-ISession_getTypeResultMsg = GED("http://www.virtualbox.org/", "ISession_getTypeResponse").pyclass
+ISession_getTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getTypeResponse")
 
-ISession_getMachineRequestMsg = GED("http://www.virtualbox.org/", "ISession_getMachine").pyclass
+ISession_getMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getMachine")
 
-ISession_getMachineResultMsg = GED("http://www.virtualbox.org/", "ISession_getMachineResponse").pyclass
+ISession_getMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getMachineResponse")
 
-ISession_getConsoleRequestMsg = GED("http://www.virtualbox.org/", "ISession_getConsole").pyclass
+ISession_getConsoleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getConsole")
 
-ISession_getConsoleResultMsg = GED("http://www.virtualbox.org/", "ISession_getConsoleResponse").pyclass
+ISession_getConsoleResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_getConsoleResponse")
 
-ISession_unlockMachineRequestMsg = GED("http://www.virtualbox.org/", "ISession_unlockMachine").pyclass
+ISession_unlockMachineRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_unlockMachine")
 
-ISession_unlockMachineResultMsg = GED("http://www.virtualbox.org/", "ISession_unlockMachineResponse").pyclass
+ISession_unlockMachineResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISession_unlockMachineResponse")
 
-IStorageController_getNameRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getName").pyclass
+IStorageController_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getName")
 
-IStorageController_getNameResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getNameResponse").pyclass
+IStorageController_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getNameResponse")
 
-IStorageController_getMaxDevicesPerPortCountRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getMaxDevicesPerPortCount").pyclass
+IStorageController_getMaxDevicesPerPortCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getMaxDevicesPerPortCount")
 
-IStorageController_getMaxDevicesPerPortCountResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getMaxDevicesPerPortCountResponse").pyclass
+IStorageController_getMaxDevicesPerPortCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getMaxDevicesPerPortCountResponse")
 
-IStorageController_getMinPortCountRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getMinPortCount").pyclass
+IStorageController_getMinPortCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getMinPortCount")
 
-IStorageController_getMinPortCountResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getMinPortCountResponse").pyclass
+IStorageController_getMinPortCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getMinPortCountResponse")
 
-IStorageController_getMaxPortCountRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getMaxPortCount").pyclass
+IStorageController_getMaxPortCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getMaxPortCount")
 
-IStorageController_getMaxPortCountResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getMaxPortCountResponse").pyclass
+IStorageController_getMaxPortCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getMaxPortCountResponse")
 
-IStorageController_getInstanceRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getInstance").pyclass
+IStorageController_getInstanceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getInstance")
 
-IStorageController_getInstanceResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getInstanceResponse").pyclass
+IStorageController_getInstanceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getInstanceResponse")
 
-IStorageController_setInstanceRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_setInstance").pyclass
+IStorageController_setInstanceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setInstance")
 
-IStorageController_setInstanceResultMsg = GED("http://www.virtualbox.org/", "IStorageController_setInstanceResponse").pyclass
+IStorageController_setInstanceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setInstanceResponse")
 
-IStorageController_getPortCountRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getPortCount").pyclass
+IStorageController_getPortCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getPortCount")
 
-IStorageController_getPortCountResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getPortCountResponse").pyclass
+IStorageController_getPortCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getPortCountResponse")
 
-IStorageController_setPortCountRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_setPortCount").pyclass
+IStorageController_setPortCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setPortCount")
 
-IStorageController_setPortCountResultMsg = GED("http://www.virtualbox.org/", "IStorageController_setPortCountResponse").pyclass
+IStorageController_setPortCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setPortCountResponse")
 
-IStorageController_getBusRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getBus").pyclass
+IStorageController_getBusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getBus")
 
-IStorageController_getBusResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getBusResponse").pyclass
+IStorageController_getBusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getBusResponse")
 
-IStorageController_getControllerTypeRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getControllerType").pyclass
+IStorageController_getControllerTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getControllerType")
 
-IStorageController_getControllerTypeResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getControllerTypeResponse").pyclass
+IStorageController_getControllerTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getControllerTypeResponse")
 
-IStorageController_setControllerTypeRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_setControllerType").pyclass
+IStorageController_setControllerTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setControllerType")
 
-IStorageController_setControllerTypeResultMsg = GED("http://www.virtualbox.org/", "IStorageController_setControllerTypeResponse").pyclass
+IStorageController_setControllerTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setControllerTypeResponse")
 
-IStorageController_getUseHostIOCacheRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getUseHostIOCache").pyclass
+IStorageController_getUseHostIOCacheRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getUseHostIOCache")
 
-IStorageController_getUseHostIOCacheResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getUseHostIOCacheResponse").pyclass
+IStorageController_getUseHostIOCacheResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getUseHostIOCacheResponse")
 
-IStorageController_setUseHostIOCacheRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_setUseHostIOCache").pyclass
+IStorageController_setUseHostIOCacheRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setUseHostIOCache")
 
-IStorageController_setUseHostIOCacheResultMsg = GED("http://www.virtualbox.org/", "IStorageController_setUseHostIOCacheResponse").pyclass
+IStorageController_setUseHostIOCacheResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_setUseHostIOCacheResponse")
 
-IStorageController_getBootableRequestMsg = GED("http://www.virtualbox.org/", "IStorageController_getBootable").pyclass
+IStorageController_getBootableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getBootable")
 
-IStorageController_getBootableResultMsg = GED("http://www.virtualbox.org/", "IStorageController_getBootableResponse").pyclass
+IStorageController_getBootableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageController_getBootableResponse")
 
-IManagedObjectRef_getInterfaceNameRequestMsg = GED("http://www.virtualbox.org/", "IManagedObjectRef_getInterfaceName").pyclass
+IManagedObjectRef_getInterfaceNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IManagedObjectRef_getInterfaceName")
 
-IManagedObjectRef_getInterfaceNameResultMsg = GED("http://www.virtualbox.org/", "IManagedObjectRef_getInterfaceNameResponse").pyclass
+IManagedObjectRef_getInterfaceNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IManagedObjectRef_getInterfaceNameResponse")
 
-IManagedObjectRef_releaseRequestMsg = GED("http://www.virtualbox.org/", "IManagedObjectRef_release").pyclass
+IManagedObjectRef_releaseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IManagedObjectRef_release")
 
-IManagedObjectRef_releaseResultMsg = GED("http://www.virtualbox.org/", "IManagedObjectRef_releaseResponse").pyclass
+IManagedObjectRef_releaseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IManagedObjectRef_releaseResponse")
 
-IWebsessionManager_logonRequestMsg = GED("http://www.virtualbox.org/", "IWebsessionManager_logon").pyclass
+IWebsessionManager_logonRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IWebsessionManager_logon")
 
-IWebsessionManager_logonResultMsg = GED("http://www.virtualbox.org/", "IWebsessionManager_logonResponse").pyclass
+IWebsessionManager_logonResultMsg = LazyPyclass("http://www.virtualbox.org/", "IWebsessionManager_logonResponse")
 
-IWebsessionManager_getSessionObjectRequestMsg = GED("http://www.virtualbox.org/", "IWebsessionManager_getSessionObject").pyclass
+IWebsessionManager_getSessionObjectRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IWebsessionManager_getSessionObject")
 
-IWebsessionManager_getSessionObjectResultMsg = GED("http://www.virtualbox.org/", "IWebsessionManager_getSessionObjectResponse").pyclass
+IWebsessionManager_getSessionObjectResultMsg = LazyPyclass("http://www.virtualbox.org/", "IWebsessionManager_getSessionObjectResponse")
 
-IWebsessionManager_logoffRequestMsg = GED("http://www.virtualbox.org/", "IWebsessionManager_logoff").pyclass
+IWebsessionManager_logoffRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IWebsessionManager_logoff")
 
-IWebsessionManager_logoffResultMsg = GED("http://www.virtualbox.org/", "IWebsessionManager_logoffResponse").pyclass
+IWebsessionManager_logoffResultMsg = LazyPyclass("http://www.virtualbox.org/", "IWebsessionManager_logoffResponse")
 
-IPerformanceMetric_getMetricNameRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getMetricName").pyclass
+IPerformanceMetric_getMetricNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getMetricName")
 
-IPerformanceMetric_getMetricNameResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getMetricNameResponse").pyclass
+IPerformanceMetric_getMetricNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getMetricNameResponse")
 
-IPerformanceMetric_getObjectRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getObject").pyclass
+IPerformanceMetric_getObjectRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getObject")
 
-IPerformanceMetric_getObjectResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getObjectResponse").pyclass
+IPerformanceMetric_getObjectResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getObjectResponse")
 
-IPerformanceMetric_getDescriptionRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getDescription").pyclass
+IPerformanceMetric_getDescriptionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getDescription")
 
-IPerformanceMetric_getDescriptionResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getDescriptionResponse").pyclass
+IPerformanceMetric_getDescriptionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getDescriptionResponse")
 
-IPerformanceMetric_getPeriodRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getPeriod").pyclass
+IPerformanceMetric_getPeriodRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getPeriod")
 
-IPerformanceMetric_getPeriodResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getPeriodResponse").pyclass
+IPerformanceMetric_getPeriodResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getPeriodResponse")
 
-IPerformanceMetric_getCountRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getCount").pyclass
+IPerformanceMetric_getCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getCount")
 
-IPerformanceMetric_getCountResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getCountResponse").pyclass
+IPerformanceMetric_getCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getCountResponse")
 
-IPerformanceMetric_getUnitRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getUnit").pyclass
+IPerformanceMetric_getUnitRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getUnit")
 
-IPerformanceMetric_getUnitResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getUnitResponse").pyclass
+IPerformanceMetric_getUnitResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getUnitResponse")
 
-IPerformanceMetric_getMinimumValueRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getMinimumValue").pyclass
+IPerformanceMetric_getMinimumValueRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getMinimumValue")
 
-IPerformanceMetric_getMinimumValueResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getMinimumValueResponse").pyclass
+IPerformanceMetric_getMinimumValueResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getMinimumValueResponse")
 
-IPerformanceMetric_getMaximumValueRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getMaximumValue").pyclass
+IPerformanceMetric_getMaximumValueRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getMaximumValue")
 
-IPerformanceMetric_getMaximumValueResultMsg = GED("http://www.virtualbox.org/", "IPerformanceMetric_getMaximumValueResponse").pyclass
+IPerformanceMetric_getMaximumValueResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceMetric_getMaximumValueResponse")
 
-IPerformanceCollector_getMetricNamesRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_getMetricNames").pyclass
+IPerformanceCollector_getMetricNamesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_getMetricNames")
 
-IPerformanceCollector_getMetricNamesResultMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_getMetricNamesResponse").pyclass
+IPerformanceCollector_getMetricNamesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_getMetricNamesResponse")
 
-IPerformanceCollector_getMetricsRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_getMetrics").pyclass
+IPerformanceCollector_getMetricsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_getMetrics")
 
-IPerformanceCollector_getMetricsResultMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_getMetricsResponse").pyclass
+IPerformanceCollector_getMetricsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_getMetricsResponse")
 
-IPerformanceCollector_setupMetricsRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_setupMetrics").pyclass
+IPerformanceCollector_setupMetricsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_setupMetrics")
 
-IPerformanceCollector_setupMetricsResultMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_setupMetricsResponse").pyclass
+IPerformanceCollector_setupMetricsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_setupMetricsResponse")
 
-IPerformanceCollector_enableMetricsRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_enableMetrics").pyclass
+IPerformanceCollector_enableMetricsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_enableMetrics")
 
-IPerformanceCollector_enableMetricsResultMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_enableMetricsResponse").pyclass
+IPerformanceCollector_enableMetricsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_enableMetricsResponse")
 
-IPerformanceCollector_disableMetricsRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_disableMetrics").pyclass
+IPerformanceCollector_disableMetricsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_disableMetrics")
 
-IPerformanceCollector_disableMetricsResultMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_disableMetricsResponse").pyclass
+IPerformanceCollector_disableMetricsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_disableMetricsResponse")
 
-IPerformanceCollector_queryMetricsDataRequestMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_queryMetricsData").pyclass
+IPerformanceCollector_queryMetricsDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_queryMetricsData")
 
-IPerformanceCollector_queryMetricsDataResultMsg = GED("http://www.virtualbox.org/", "IPerformanceCollector_queryMetricsDataResponse").pyclass
+IPerformanceCollector_queryMetricsDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IPerformanceCollector_queryMetricsDataResponse")
 
-INATEngine_getNetworkRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getNetwork").pyclass
+INATEngine_getNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getNetwork")
 
-INATEngine_getNetworkResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getNetworkResponse").pyclass
+INATEngine_getNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getNetworkResponse")
 
-INATEngine_setNetworkRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setNetwork").pyclass
+INATEngine_setNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setNetwork")
 
-INATEngine_setNetworkResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setNetworkResponse").pyclass
+INATEngine_setNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setNetworkResponse")
 
-INATEngine_getHostIPRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getHostIP").pyclass
+INATEngine_getHostIPRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getHostIP")
 
-INATEngine_getHostIPResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getHostIPResponse").pyclass
+INATEngine_getHostIPResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getHostIPResponse")
 
-INATEngine_setHostIPRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setHostIP").pyclass
+INATEngine_setHostIPRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setHostIP")
 
-INATEngine_setHostIPResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setHostIPResponse").pyclass
+INATEngine_setHostIPResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setHostIPResponse")
 
-INATEngine_getTFTPPrefixRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getTFTPPrefix").pyclass
+INATEngine_getTFTPPrefixRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getTFTPPrefix")
 
-INATEngine_getTFTPPrefixResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getTFTPPrefixResponse").pyclass
+INATEngine_getTFTPPrefixResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getTFTPPrefixResponse")
 
-INATEngine_setTFTPPrefixRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setTFTPPrefix").pyclass
+INATEngine_setTFTPPrefixRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setTFTPPrefix")
 
-INATEngine_setTFTPPrefixResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setTFTPPrefixResponse").pyclass
+INATEngine_setTFTPPrefixResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setTFTPPrefixResponse")
 
-INATEngine_getTFTPBootFileRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getTFTPBootFile").pyclass
+INATEngine_getTFTPBootFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getTFTPBootFile")
 
-INATEngine_getTFTPBootFileResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getTFTPBootFileResponse").pyclass
+INATEngine_getTFTPBootFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getTFTPBootFileResponse")
 
-INATEngine_setTFTPBootFileRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setTFTPBootFile").pyclass
+INATEngine_setTFTPBootFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setTFTPBootFile")
 
-INATEngine_setTFTPBootFileResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setTFTPBootFileResponse").pyclass
+INATEngine_setTFTPBootFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setTFTPBootFileResponse")
 
-INATEngine_getTFTPNextServerRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getTFTPNextServer").pyclass
+INATEngine_getTFTPNextServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getTFTPNextServer")
 
-INATEngine_getTFTPNextServerResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getTFTPNextServerResponse").pyclass
+INATEngine_getTFTPNextServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getTFTPNextServerResponse")
 
-INATEngine_setTFTPNextServerRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setTFTPNextServer").pyclass
+INATEngine_setTFTPNextServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setTFTPNextServer")
 
-INATEngine_setTFTPNextServerResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setTFTPNextServerResponse").pyclass
+INATEngine_setTFTPNextServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setTFTPNextServerResponse")
 
-INATEngine_getAliasModeRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getAliasMode").pyclass
+INATEngine_getAliasModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getAliasMode")
 
-INATEngine_getAliasModeResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getAliasModeResponse").pyclass
+INATEngine_getAliasModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getAliasModeResponse")
 
-INATEngine_setAliasModeRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setAliasMode").pyclass
+INATEngine_setAliasModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setAliasMode")
 
-INATEngine_setAliasModeResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setAliasModeResponse").pyclass
+INATEngine_setAliasModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setAliasModeResponse")
 
-INATEngine_getDNSPassDomainRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getDNSPassDomain").pyclass
+INATEngine_getDNSPassDomainRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getDNSPassDomain")
 
-INATEngine_getDNSPassDomainResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getDNSPassDomainResponse").pyclass
+INATEngine_getDNSPassDomainResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getDNSPassDomainResponse")
 
-INATEngine_setDNSPassDomainRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setDNSPassDomain").pyclass
+INATEngine_setDNSPassDomainRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setDNSPassDomain")
 
-INATEngine_setDNSPassDomainResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setDNSPassDomainResponse").pyclass
+INATEngine_setDNSPassDomainResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setDNSPassDomainResponse")
 
-INATEngine_getDNSProxyRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getDNSProxy").pyclass
+INATEngine_getDNSProxyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getDNSProxy")
 
-INATEngine_getDNSProxyResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getDNSProxyResponse").pyclass
+INATEngine_getDNSProxyResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getDNSProxyResponse")
 
-INATEngine_setDNSProxyRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setDNSProxy").pyclass
+INATEngine_setDNSProxyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setDNSProxy")
 
-INATEngine_setDNSProxyResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setDNSProxyResponse").pyclass
+INATEngine_setDNSProxyResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setDNSProxyResponse")
 
-INATEngine_getDNSUseHostResolverRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getDNSUseHostResolver").pyclass
+INATEngine_getDNSUseHostResolverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getDNSUseHostResolver")
 
-INATEngine_getDNSUseHostResolverResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getDNSUseHostResolverResponse").pyclass
+INATEngine_getDNSUseHostResolverResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getDNSUseHostResolverResponse")
 
-INATEngine_setDNSUseHostResolverRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setDNSUseHostResolver").pyclass
+INATEngine_setDNSUseHostResolverRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setDNSUseHostResolver")
 
-INATEngine_setDNSUseHostResolverResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setDNSUseHostResolverResponse").pyclass
+INATEngine_setDNSUseHostResolverResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setDNSUseHostResolverResponse")
 
-INATEngine_getRedirectsRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getRedirects").pyclass
+INATEngine_getRedirectsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getRedirects")
 
-INATEngine_getRedirectsResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getRedirectsResponse").pyclass
+INATEngine_getRedirectsResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getRedirectsResponse")
 
-INATEngine_setNetworkSettingsRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_setNetworkSettings").pyclass
+INATEngine_setNetworkSettingsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setNetworkSettings")
 
-INATEngine_setNetworkSettingsResultMsg = GED("http://www.virtualbox.org/", "INATEngine_setNetworkSettingsResponse").pyclass
+INATEngine_setNetworkSettingsResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_setNetworkSettingsResponse")
 
-INATEngine_getNetworkSettingsRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_getNetworkSettings").pyclass
+INATEngine_getNetworkSettingsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getNetworkSettings")
 
-INATEngine_getNetworkSettingsResultMsg = GED("http://www.virtualbox.org/", "INATEngine_getNetworkSettingsResponse").pyclass
+INATEngine_getNetworkSettingsResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_getNetworkSettingsResponse")
 
-INATEngine_addRedirectRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_addRedirect").pyclass
+INATEngine_addRedirectRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_addRedirect")
 
-INATEngine_addRedirectResultMsg = GED("http://www.virtualbox.org/", "INATEngine_addRedirectResponse").pyclass
+INATEngine_addRedirectResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_addRedirectResponse")
 
-INATEngine_removeRedirectRequestMsg = GED("http://www.virtualbox.org/", "INATEngine_removeRedirect").pyclass
+INATEngine_removeRedirectRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_removeRedirect")
 
-INATEngine_removeRedirectResultMsg = GED("http://www.virtualbox.org/", "INATEngine_removeRedirectResponse").pyclass
+INATEngine_removeRedirectResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATEngine_removeRedirectResponse")
 
-IBandwidthGroup_getNameRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getName").pyclass
+IBandwidthGroup_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getName")
 
-IBandwidthGroup_getNameResultMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getNameResponse").pyclass
+IBandwidthGroup_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getNameResponse")
 
-IBandwidthGroup_getTypeRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getType").pyclass
+IBandwidthGroup_getTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getType")
 
-IBandwidthGroup_getTypeResultMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getTypeResponse").pyclass
+IBandwidthGroup_getTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getTypeResponse")
 
-IBandwidthGroup_getReferenceRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getReference").pyclass
+IBandwidthGroup_getReferenceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getReference")
 
-IBandwidthGroup_getReferenceResultMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getReferenceResponse").pyclass
+IBandwidthGroup_getReferenceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getReferenceResponse")
 
-IBandwidthGroup_getMaxBytesPerSecRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getMaxBytesPerSec").pyclass
+IBandwidthGroup_getMaxBytesPerSecRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getMaxBytesPerSec")
 
-IBandwidthGroup_getMaxBytesPerSecResultMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_getMaxBytesPerSecResponse").pyclass
+IBandwidthGroup_getMaxBytesPerSecResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_getMaxBytesPerSecResponse")
 
-IBandwidthGroup_setMaxBytesPerSecRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_setMaxBytesPerSec").pyclass
+IBandwidthGroup_setMaxBytesPerSecRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_setMaxBytesPerSec")
 
-IBandwidthGroup_setMaxBytesPerSecResultMsg = GED("http://www.virtualbox.org/", "IBandwidthGroup_setMaxBytesPerSecResponse").pyclass
+IBandwidthGroup_setMaxBytesPerSecResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroup_setMaxBytesPerSecResponse")
 
-IBandwidthControl_getNumGroupsRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_getNumGroups").pyclass
+IBandwidthControl_getNumGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_getNumGroups")
 
-IBandwidthControl_getNumGroupsResultMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_getNumGroupsResponse").pyclass
+IBandwidthControl_getNumGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_getNumGroupsResponse")
 
-IBandwidthControl_createBandwidthGroupRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_createBandwidthGroup").pyclass
+IBandwidthControl_createBandwidthGroupRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_createBandwidthGroup")
 
-IBandwidthControl_createBandwidthGroupResultMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_createBandwidthGroupResponse").pyclass
+IBandwidthControl_createBandwidthGroupResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_createBandwidthGroupResponse")
 
-IBandwidthControl_deleteBandwidthGroupRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_deleteBandwidthGroup").pyclass
+IBandwidthControl_deleteBandwidthGroupRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_deleteBandwidthGroup")
 
-IBandwidthControl_deleteBandwidthGroupResultMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_deleteBandwidthGroupResponse").pyclass
+IBandwidthControl_deleteBandwidthGroupResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_deleteBandwidthGroupResponse")
 
-IBandwidthControl_getBandwidthGroupRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_getBandwidthGroup").pyclass
+IBandwidthControl_getBandwidthGroupRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_getBandwidthGroup")
 
-IBandwidthControl_getBandwidthGroupResultMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_getBandwidthGroupResponse").pyclass
+IBandwidthControl_getBandwidthGroupResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_getBandwidthGroupResponse")
 
-IBandwidthControl_getAllBandwidthGroupsRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_getAllBandwidthGroups").pyclass
+IBandwidthControl_getAllBandwidthGroupsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_getAllBandwidthGroups")
 
-IBandwidthControl_getAllBandwidthGroupsResultMsg = GED("http://www.virtualbox.org/", "IBandwidthControl_getAllBandwidthGroupsResponse").pyclass
+IBandwidthControl_getAllBandwidthGroupsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthControl_getAllBandwidthGroupsResponse")
 
-IEventSource_createListenerRequestMsg = GED("http://www.virtualbox.org/", "IEventSource_createListener").pyclass
+IEventSource_createListenerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_createListener")
 
-IEventSource_createListenerResultMsg = GED("http://www.virtualbox.org/", "IEventSource_createListenerResponse").pyclass
+IEventSource_createListenerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_createListenerResponse")
 
-IEventSource_createAggregatorRequestMsg = GED("http://www.virtualbox.org/", "IEventSource_createAggregator").pyclass
+IEventSource_createAggregatorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_createAggregator")
 
-IEventSource_createAggregatorResultMsg = GED("http://www.virtualbox.org/", "IEventSource_createAggregatorResponse").pyclass
+IEventSource_createAggregatorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_createAggregatorResponse")
 
-IEventSource_registerListenerRequestMsg = GED("http://www.virtualbox.org/", "IEventSource_registerListener").pyclass
+IEventSource_registerListenerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_registerListener")
 
-IEventSource_registerListenerResultMsg = GED("http://www.virtualbox.org/", "IEventSource_registerListenerResponse").pyclass
+IEventSource_registerListenerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_registerListenerResponse")
 
-IEventSource_unregisterListenerRequestMsg = GED("http://www.virtualbox.org/", "IEventSource_unregisterListener").pyclass
+IEventSource_unregisterListenerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_unregisterListener")
 
-IEventSource_unregisterListenerResultMsg = GED("http://www.virtualbox.org/", "IEventSource_unregisterListenerResponse").pyclass
+IEventSource_unregisterListenerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_unregisterListenerResponse")
 
-IEventSource_fireEventRequestMsg = GED("http://www.virtualbox.org/", "IEventSource_fireEvent").pyclass
+IEventSource_fireEventRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_fireEvent")
 
-IEventSource_fireEventResultMsg = GED("http://www.virtualbox.org/", "IEventSource_fireEventResponse").pyclass
+IEventSource_fireEventResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_fireEventResponse")
 
-IEventSource_getEventRequestMsg = GED("http://www.virtualbox.org/", "IEventSource_getEvent").pyclass
+IEventSource_getEventRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_getEvent")
 
-IEventSource_getEventResultMsg = GED("http://www.virtualbox.org/", "IEventSource_getEventResponse").pyclass
+IEventSource_getEventResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_getEventResponse")
 
-IEventSource_eventProcessedRequestMsg = GED("http://www.virtualbox.org/", "IEventSource_eventProcessed").pyclass
+IEventSource_eventProcessedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_eventProcessed")
 
-IEventSource_eventProcessedResultMsg = GED("http://www.virtualbox.org/", "IEventSource_eventProcessedResponse").pyclass
+IEventSource_eventProcessedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSource_eventProcessedResponse")
 
-IEventListener_handleEventRequestMsg = GED("http://www.virtualbox.org/", "IEventListener_handleEvent").pyclass
+IEventListener_handleEventRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventListener_handleEvent")
 
-IEventListener_handleEventResultMsg = GED("http://www.virtualbox.org/", "IEventListener_handleEventResponse").pyclass
+IEventListener_handleEventResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventListener_handleEventResponse")
 
-IEvent_getTypeRequestMsg = GED("http://www.virtualbox.org/", "IEvent_getType").pyclass
+IEvent_getTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_getType")
 
-IEvent_getTypeResultMsg = GED("http://www.virtualbox.org/", "IEvent_getTypeResponse").pyclass
+IEvent_getTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_getTypeResponse")
 
-IEvent_getSourceRequestMsg = GED("http://www.virtualbox.org/", "IEvent_getSource").pyclass
+IEvent_getSourceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_getSource")
 
-IEvent_getSourceResultMsg = GED("http://www.virtualbox.org/", "IEvent_getSourceResponse").pyclass
+IEvent_getSourceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_getSourceResponse")
 
-IEvent_getWaitableRequestMsg = GED("http://www.virtualbox.org/", "IEvent_getWaitable").pyclass
+IEvent_getWaitableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_getWaitable")
 
-IEvent_getWaitableResultMsg = GED("http://www.virtualbox.org/", "IEvent_getWaitableResponse").pyclass
+IEvent_getWaitableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_getWaitableResponse")
 
-IEvent_setProcessedRequestMsg = GED("http://www.virtualbox.org/", "IEvent_setProcessed").pyclass
+IEvent_setProcessedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_setProcessed")
 
-IEvent_setProcessedResultMsg = GED("http://www.virtualbox.org/", "IEvent_setProcessedResponse").pyclass
+IEvent_setProcessedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_setProcessedResponse")
 
-IEvent_waitProcessedRequestMsg = GED("http://www.virtualbox.org/", "IEvent_waitProcessed").pyclass
+IEvent_waitProcessedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_waitProcessed")
 
-IEvent_waitProcessedResultMsg = GED("http://www.virtualbox.org/", "IEvent_waitProcessedResponse").pyclass
+IEvent_waitProcessedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEvent_waitProcessedResponse")
 
-IReusableEvent_getGenerationRequestMsg = GED("http://www.virtualbox.org/", "IReusableEvent_getGeneration").pyclass
+IReusableEvent_getGenerationRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IReusableEvent_getGeneration")
 
-IReusableEvent_getGenerationResultMsg = GED("http://www.virtualbox.org/", "IReusableEvent_getGenerationResponse").pyclass
+IReusableEvent_getGenerationResultMsg = LazyPyclass("http://www.virtualbox.org/", "IReusableEvent_getGenerationResponse")
 
-IReusableEvent_reuseRequestMsg = GED("http://www.virtualbox.org/", "IReusableEvent_reuse").pyclass
+IReusableEvent_reuseRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IReusableEvent_reuse")
 
-IReusableEvent_reuseResultMsg = GED("http://www.virtualbox.org/", "IReusableEvent_reuseResponse").pyclass
+IReusableEvent_reuseResultMsg = LazyPyclass("http://www.virtualbox.org/", "IReusableEvent_reuseResponse")
 
-IMachineEvent_getMachineIdRequestMsg = GED("http://www.virtualbox.org/", "IMachineEvent_getMachineId").pyclass
+IMachineEvent_getMachineIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineEvent_getMachineId")
 
-IMachineEvent_getMachineIdResultMsg = GED("http://www.virtualbox.org/", "IMachineEvent_getMachineIdResponse").pyclass
+IMachineEvent_getMachineIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineEvent_getMachineIdResponse")
 
-IMachineStateChangedEvent_getStateRequestMsg = GED("http://www.virtualbox.org/", "IMachineStateChangedEvent_getState").pyclass
+IMachineStateChangedEvent_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineStateChangedEvent_getState")
 
-IMachineStateChangedEvent_getStateResultMsg = GED("http://www.virtualbox.org/", "IMachineStateChangedEvent_getStateResponse").pyclass
+IMachineStateChangedEvent_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineStateChangedEvent_getStateResponse")
 
-IMachineDataChangedEvent_getTemporaryRequestMsg = GED("http://www.virtualbox.org/", "IMachineDataChangedEvent_getTemporary").pyclass
+IMachineDataChangedEvent_getTemporaryRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDataChangedEvent_getTemporary")
 
-IMachineDataChangedEvent_getTemporaryResultMsg = GED("http://www.virtualbox.org/", "IMachineDataChangedEvent_getTemporaryResponse").pyclass
+IMachineDataChangedEvent_getTemporaryResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineDataChangedEvent_getTemporaryResponse")
 
-IMediumRegisteredEvent_getMediumIdRequestMsg = GED("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumId").pyclass
+IMediumRegisteredEvent_getMediumIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumId")
 
-IMediumRegisteredEvent_getMediumIdResultMsg = GED("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumIdResponse").pyclass
+IMediumRegisteredEvent_getMediumIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumIdResponse")
 
-IMediumRegisteredEvent_getMediumTypeRequestMsg = GED("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumType").pyclass
+IMediumRegisteredEvent_getMediumTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumType")
 
-IMediumRegisteredEvent_getMediumTypeResultMsg = GED("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumTypeResponse").pyclass
+IMediumRegisteredEvent_getMediumTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumRegisteredEvent_getMediumTypeResponse")
 
-IMediumRegisteredEvent_getRegisteredRequestMsg = GED("http://www.virtualbox.org/", "IMediumRegisteredEvent_getRegistered").pyclass
+IMediumRegisteredEvent_getRegisteredRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumRegisteredEvent_getRegistered")
 
-IMediumRegisteredEvent_getRegisteredResultMsg = GED("http://www.virtualbox.org/", "IMediumRegisteredEvent_getRegisteredResponse").pyclass
+IMediumRegisteredEvent_getRegisteredResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumRegisteredEvent_getRegisteredResponse")
 
-IMachineRegisteredEvent_getRegisteredRequestMsg = GED("http://www.virtualbox.org/", "IMachineRegisteredEvent_getRegistered").pyclass
+IMachineRegisteredEvent_getRegisteredRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineRegisteredEvent_getRegistered")
 
-IMachineRegisteredEvent_getRegisteredResultMsg = GED("http://www.virtualbox.org/", "IMachineRegisteredEvent_getRegisteredResponse").pyclass
+IMachineRegisteredEvent_getRegisteredResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMachineRegisteredEvent_getRegisteredResponse")
 
-ISessionStateChangedEvent_getStateRequestMsg = GED("http://www.virtualbox.org/", "ISessionStateChangedEvent_getState").pyclass
+ISessionStateChangedEvent_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISessionStateChangedEvent_getState")
 
-ISessionStateChangedEvent_getStateResultMsg = GED("http://www.virtualbox.org/", "ISessionStateChangedEvent_getStateResponse").pyclass
+ISessionStateChangedEvent_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISessionStateChangedEvent_getStateResponse")
 
-IGuestPropertyChangedEvent_getNameRequestMsg = GED("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getName").pyclass
+IGuestPropertyChangedEvent_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getName")
 
-IGuestPropertyChangedEvent_getNameResultMsg = GED("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getNameResponse").pyclass
+IGuestPropertyChangedEvent_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getNameResponse")
 
-IGuestPropertyChangedEvent_getValueRequestMsg = GED("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getValue").pyclass
+IGuestPropertyChangedEvent_getValueRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getValue")
 
-IGuestPropertyChangedEvent_getValueResultMsg = GED("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getValueResponse").pyclass
+IGuestPropertyChangedEvent_getValueResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getValueResponse")
 
-IGuestPropertyChangedEvent_getFlagsRequestMsg = GED("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getFlags").pyclass
+IGuestPropertyChangedEvent_getFlagsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getFlags")
 
-IGuestPropertyChangedEvent_getFlagsResultMsg = GED("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getFlagsResponse").pyclass
+IGuestPropertyChangedEvent_getFlagsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestPropertyChangedEvent_getFlagsResponse")
 
-ISnapshotEvent_getSnapshotIdRequestMsg = GED("http://www.virtualbox.org/", "ISnapshotEvent_getSnapshotId").pyclass
+ISnapshotEvent_getSnapshotIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshotEvent_getSnapshotId")
 
-ISnapshotEvent_getSnapshotIdResultMsg = GED("http://www.virtualbox.org/", "ISnapshotEvent_getSnapshotIdResponse").pyclass
+ISnapshotEvent_getSnapshotIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISnapshotEvent_getSnapshotIdResponse")
 
-IMousePointerShapeChangedEvent_getVisibleRequestMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getVisible").pyclass
+IMousePointerShapeChangedEvent_getVisibleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getVisible")
 
-IMousePointerShapeChangedEvent_getVisibleResultMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getVisibleResponse").pyclass
+IMousePointerShapeChangedEvent_getVisibleResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getVisibleResponse")
 
-IMousePointerShapeChangedEvent_getAlphaRequestMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getAlpha").pyclass
+IMousePointerShapeChangedEvent_getAlphaRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getAlpha")
 
-IMousePointerShapeChangedEvent_getAlphaResultMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getAlphaResponse").pyclass
+IMousePointerShapeChangedEvent_getAlphaResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getAlphaResponse")
 
-IMousePointerShapeChangedEvent_getXhotRequestMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getXhot").pyclass
+IMousePointerShapeChangedEvent_getXhotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getXhot")
 
-IMousePointerShapeChangedEvent_getXhotResultMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getXhotResponse").pyclass
+IMousePointerShapeChangedEvent_getXhotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getXhotResponse")
 
-IMousePointerShapeChangedEvent_getYhotRequestMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getYhot").pyclass
+IMousePointerShapeChangedEvent_getYhotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getYhot")
 
-IMousePointerShapeChangedEvent_getYhotResultMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getYhotResponse").pyclass
+IMousePointerShapeChangedEvent_getYhotResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getYhotResponse")
 
-IMousePointerShapeChangedEvent_getWidthRequestMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getWidth").pyclass
+IMousePointerShapeChangedEvent_getWidthRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getWidth")
 
-IMousePointerShapeChangedEvent_getWidthResultMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getWidthResponse").pyclass
+IMousePointerShapeChangedEvent_getWidthResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getWidthResponse")
 
-IMousePointerShapeChangedEvent_getHeightRequestMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getHeight").pyclass
+IMousePointerShapeChangedEvent_getHeightRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getHeight")
 
-IMousePointerShapeChangedEvent_getHeightResultMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getHeightResponse").pyclass
+IMousePointerShapeChangedEvent_getHeightResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getHeightResponse")
 
-IMousePointerShapeChangedEvent_getShapeRequestMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getShape").pyclass
+IMousePointerShapeChangedEvent_getShapeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getShape")
 
-IMousePointerShapeChangedEvent_getShapeResultMsg = GED("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getShapeResponse").pyclass
+IMousePointerShapeChangedEvent_getShapeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMousePointerShapeChangedEvent_getShapeResponse")
 
-IMouseCapabilityChangedEvent_getSupportsAbsoluteRequestMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsAbsolute").pyclass
+IMouseCapabilityChangedEvent_getSupportsAbsoluteRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsAbsolute")
 
-IMouseCapabilityChangedEvent_getSupportsAbsoluteResultMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsAbsoluteResponse").pyclass
+IMouseCapabilityChangedEvent_getSupportsAbsoluteResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsAbsoluteResponse")
 
-IMouseCapabilityChangedEvent_getSupportsRelativeRequestMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsRelative").pyclass
+IMouseCapabilityChangedEvent_getSupportsRelativeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsRelative")
 
-IMouseCapabilityChangedEvent_getSupportsRelativeResultMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsRelativeResponse").pyclass
+IMouseCapabilityChangedEvent_getSupportsRelativeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsRelativeResponse")
 
-IMouseCapabilityChangedEvent_getSupportsMultiTouchRequestMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsMultiTouch").pyclass
+IMouseCapabilityChangedEvent_getSupportsMultiTouchRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsMultiTouch")
 
-IMouseCapabilityChangedEvent_getSupportsMultiTouchResultMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsMultiTouchResponse").pyclass
+IMouseCapabilityChangedEvent_getSupportsMultiTouchResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getSupportsMultiTouchResponse")
 
-IMouseCapabilityChangedEvent_getNeedsHostCursorRequestMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getNeedsHostCursor").pyclass
+IMouseCapabilityChangedEvent_getNeedsHostCursorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getNeedsHostCursor")
 
-IMouseCapabilityChangedEvent_getNeedsHostCursorResultMsg = GED("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getNeedsHostCursorResponse").pyclass
+IMouseCapabilityChangedEvent_getNeedsHostCursorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMouseCapabilityChangedEvent_getNeedsHostCursorResponse")
 
-IKeyboardLedsChangedEvent_getNumLockRequestMsg = GED("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getNumLock").pyclass
+IKeyboardLedsChangedEvent_getNumLockRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getNumLock")
 
-IKeyboardLedsChangedEvent_getNumLockResultMsg = GED("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getNumLockResponse").pyclass
+IKeyboardLedsChangedEvent_getNumLockResultMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getNumLockResponse")
 
-IKeyboardLedsChangedEvent_getCapsLockRequestMsg = GED("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getCapsLock").pyclass
+IKeyboardLedsChangedEvent_getCapsLockRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getCapsLock")
 
-IKeyboardLedsChangedEvent_getCapsLockResultMsg = GED("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getCapsLockResponse").pyclass
+IKeyboardLedsChangedEvent_getCapsLockResultMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getCapsLockResponse")
 
-IKeyboardLedsChangedEvent_getScrollLockRequestMsg = GED("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getScrollLock").pyclass
+IKeyboardLedsChangedEvent_getScrollLockRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getScrollLock")
 
-IKeyboardLedsChangedEvent_getScrollLockResultMsg = GED("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getScrollLockResponse").pyclass
+IKeyboardLedsChangedEvent_getScrollLockResultMsg = LazyPyclass("http://www.virtualbox.org/", "IKeyboardLedsChangedEvent_getScrollLockResponse")
 
-IStateChangedEvent_getStateRequestMsg = GED("http://www.virtualbox.org/", "IStateChangedEvent_getState").pyclass
+IStateChangedEvent_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStateChangedEvent_getState")
 
-IStateChangedEvent_getStateResultMsg = GED("http://www.virtualbox.org/", "IStateChangedEvent_getStateResponse").pyclass
+IStateChangedEvent_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStateChangedEvent_getStateResponse")
 
-INetworkAdapterChangedEvent_getNetworkAdapterRequestMsg = GED("http://www.virtualbox.org/", "INetworkAdapterChangedEvent_getNetworkAdapter").pyclass
+INetworkAdapterChangedEvent_getNetworkAdapterRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapterChangedEvent_getNetworkAdapter")
 
-INetworkAdapterChangedEvent_getNetworkAdapterResultMsg = GED("http://www.virtualbox.org/", "INetworkAdapterChangedEvent_getNetworkAdapterResponse").pyclass
+INetworkAdapterChangedEvent_getNetworkAdapterResultMsg = LazyPyclass("http://www.virtualbox.org/", "INetworkAdapterChangedEvent_getNetworkAdapterResponse")
 
-ISerialPortChangedEvent_getSerialPortRequestMsg = GED("http://www.virtualbox.org/", "ISerialPortChangedEvent_getSerialPort").pyclass
+ISerialPortChangedEvent_getSerialPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPortChangedEvent_getSerialPort")
 
-ISerialPortChangedEvent_getSerialPortResultMsg = GED("http://www.virtualbox.org/", "ISerialPortChangedEvent_getSerialPortResponse").pyclass
+ISerialPortChangedEvent_getSerialPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISerialPortChangedEvent_getSerialPortResponse")
 
-IParallelPortChangedEvent_getParallelPortRequestMsg = GED("http://www.virtualbox.org/", "IParallelPortChangedEvent_getParallelPort").pyclass
+IParallelPortChangedEvent_getParallelPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPortChangedEvent_getParallelPort")
 
-IParallelPortChangedEvent_getParallelPortResultMsg = GED("http://www.virtualbox.org/", "IParallelPortChangedEvent_getParallelPortResponse").pyclass
+IParallelPortChangedEvent_getParallelPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "IParallelPortChangedEvent_getParallelPortResponse")
 
-IMediumChangedEvent_getMediumAttachmentRequestMsg = GED("http://www.virtualbox.org/", "IMediumChangedEvent_getMediumAttachment").pyclass
+IMediumChangedEvent_getMediumAttachmentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumChangedEvent_getMediumAttachment")
 
-IMediumChangedEvent_getMediumAttachmentResultMsg = GED("http://www.virtualbox.org/", "IMediumChangedEvent_getMediumAttachmentResponse").pyclass
+IMediumChangedEvent_getMediumAttachmentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IMediumChangedEvent_getMediumAttachmentResponse")
 
-IClipboardModeChangedEvent_getClipboardModeRequestMsg = GED("http://www.virtualbox.org/", "IClipboardModeChangedEvent_getClipboardMode").pyclass
+IClipboardModeChangedEvent_getClipboardModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IClipboardModeChangedEvent_getClipboardMode")
 
-IClipboardModeChangedEvent_getClipboardModeResultMsg = GED("http://www.virtualbox.org/", "IClipboardModeChangedEvent_getClipboardModeResponse").pyclass
+IClipboardModeChangedEvent_getClipboardModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IClipboardModeChangedEvent_getClipboardModeResponse")
 
-IDragAndDropModeChangedEvent_getDragAndDropModeRequestMsg = GED("http://www.virtualbox.org/", "IDragAndDropModeChangedEvent_getDragAndDropMode").pyclass
+IDragAndDropModeChangedEvent_getDragAndDropModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IDragAndDropModeChangedEvent_getDragAndDropMode")
 
-IDragAndDropModeChangedEvent_getDragAndDropModeResultMsg = GED("http://www.virtualbox.org/", "IDragAndDropModeChangedEvent_getDragAndDropModeResponse").pyclass
+IDragAndDropModeChangedEvent_getDragAndDropModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IDragAndDropModeChangedEvent_getDragAndDropModeResponse")
 
-ICPUChangedEvent_getCPURequestMsg = GED("http://www.virtualbox.org/", "ICPUChangedEvent_getCPU").pyclass
+ICPUChangedEvent_getCPURequestMsg = LazyPyclass("http://www.virtualbox.org/", "ICPUChangedEvent_getCPU")
 
-ICPUChangedEvent_getCPUResultMsg = GED("http://www.virtualbox.org/", "ICPUChangedEvent_getCPUResponse").pyclass
+ICPUChangedEvent_getCPUResultMsg = LazyPyclass("http://www.virtualbox.org/", "ICPUChangedEvent_getCPUResponse")
 
-ICPUChangedEvent_getAddRequestMsg = GED("http://www.virtualbox.org/", "ICPUChangedEvent_getAdd").pyclass
+ICPUChangedEvent_getAddRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ICPUChangedEvent_getAdd")
 
-ICPUChangedEvent_getAddResultMsg = GED("http://www.virtualbox.org/", "ICPUChangedEvent_getAddResponse").pyclass
+ICPUChangedEvent_getAddResultMsg = LazyPyclass("http://www.virtualbox.org/", "ICPUChangedEvent_getAddResponse")
 
-ICPUExecutionCapChangedEvent_getExecutionCapRequestMsg = GED("http://www.virtualbox.org/", "ICPUExecutionCapChangedEvent_getExecutionCap").pyclass
+ICPUExecutionCapChangedEvent_getExecutionCapRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ICPUExecutionCapChangedEvent_getExecutionCap")
 
-ICPUExecutionCapChangedEvent_getExecutionCapResultMsg = GED("http://www.virtualbox.org/", "ICPUExecutionCapChangedEvent_getExecutionCapResponse").pyclass
+ICPUExecutionCapChangedEvent_getExecutionCapResultMsg = LazyPyclass("http://www.virtualbox.org/", "ICPUExecutionCapChangedEvent_getExecutionCapResponse")
 
-IGuestKeyboardEvent_getScancodesRequestMsg = GED("http://www.virtualbox.org/", "IGuestKeyboardEvent_getScancodes").pyclass
+IGuestKeyboardEvent_getScancodesRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestKeyboardEvent_getScancodes")
 
-IGuestKeyboardEvent_getScancodesResultMsg = GED("http://www.virtualbox.org/", "IGuestKeyboardEvent_getScancodesResponse").pyclass
+IGuestKeyboardEvent_getScancodesResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestKeyboardEvent_getScancodesResponse")
 
-IGuestMouseEvent_getModeRequestMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getMode").pyclass
+IGuestMouseEvent_getModeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getMode")
 
-IGuestMouseEvent_getModeResultMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getModeResponse").pyclass
+IGuestMouseEvent_getModeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getModeResponse")
 
-IGuestMouseEvent_getXRequestMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getX").pyclass
+IGuestMouseEvent_getXRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getX")
 
-IGuestMouseEvent_getXResultMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getXResponse").pyclass
+IGuestMouseEvent_getXResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getXResponse")
 
-IGuestMouseEvent_getYRequestMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getY").pyclass
+IGuestMouseEvent_getYRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getY")
 
-IGuestMouseEvent_getYResultMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getYResponse").pyclass
+IGuestMouseEvent_getYResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getYResponse")
 
-IGuestMouseEvent_getZRequestMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getZ").pyclass
+IGuestMouseEvent_getZRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getZ")
 
-IGuestMouseEvent_getZResultMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getZResponse").pyclass
+IGuestMouseEvent_getZResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getZResponse")
 
-IGuestMouseEvent_getWRequestMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getW").pyclass
+IGuestMouseEvent_getWRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getW")
 
-IGuestMouseEvent_getWResultMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getWResponse").pyclass
+IGuestMouseEvent_getWResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getWResponse")
 
-IGuestMouseEvent_getButtonsRequestMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getButtons").pyclass
+IGuestMouseEvent_getButtonsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getButtons")
 
-IGuestMouseEvent_getButtonsResultMsg = GED("http://www.virtualbox.org/", "IGuestMouseEvent_getButtonsResponse").pyclass
+IGuestMouseEvent_getButtonsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMouseEvent_getButtonsResponse")
 
-IGuestMultiTouchEvent_getContactCountRequestMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactCount").pyclass
+IGuestMultiTouchEvent_getContactCountRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactCount")
 
-IGuestMultiTouchEvent_getContactCountResultMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactCountResponse").pyclass
+IGuestMultiTouchEvent_getContactCountResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactCountResponse")
 
-IGuestMultiTouchEvent_getXPositionsRequestMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getXPositions").pyclass
+IGuestMultiTouchEvent_getXPositionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getXPositions")
 
-IGuestMultiTouchEvent_getXPositionsResultMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getXPositionsResponse").pyclass
+IGuestMultiTouchEvent_getXPositionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getXPositionsResponse")
 
-IGuestMultiTouchEvent_getYPositionsRequestMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getYPositions").pyclass
+IGuestMultiTouchEvent_getYPositionsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getYPositions")
 
-IGuestMultiTouchEvent_getYPositionsResultMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getYPositionsResponse").pyclass
+IGuestMultiTouchEvent_getYPositionsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getYPositionsResponse")
 
-IGuestMultiTouchEvent_getContactIdsRequestMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactIds").pyclass
+IGuestMultiTouchEvent_getContactIdsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactIds")
 
-IGuestMultiTouchEvent_getContactIdsResultMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactIdsResponse").pyclass
+IGuestMultiTouchEvent_getContactIdsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactIdsResponse")
 
-IGuestMultiTouchEvent_getContactFlagsRequestMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactFlags").pyclass
+IGuestMultiTouchEvent_getContactFlagsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactFlags")
 
-IGuestMultiTouchEvent_getContactFlagsResultMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactFlagsResponse").pyclass
+IGuestMultiTouchEvent_getContactFlagsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getContactFlagsResponse")
 
-IGuestMultiTouchEvent_getScanTimeRequestMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getScanTime").pyclass
+IGuestMultiTouchEvent_getScanTimeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getScanTime")
 
-IGuestMultiTouchEvent_getScanTimeResultMsg = GED("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getScanTimeResponse").pyclass
+IGuestMultiTouchEvent_getScanTimeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMultiTouchEvent_getScanTimeResponse")
 
-IGuestSessionEvent_getSessionRequestMsg = GED("http://www.virtualbox.org/", "IGuestSessionEvent_getSession").pyclass
+IGuestSessionEvent_getSessionRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionEvent_getSession")
 
-IGuestSessionEvent_getSessionResultMsg = GED("http://www.virtualbox.org/", "IGuestSessionEvent_getSessionResponse").pyclass
+IGuestSessionEvent_getSessionResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionEvent_getSessionResponse")
 
-IGuestSessionStateChangedEvent_getIdRequestMsg = GED("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getId").pyclass
+IGuestSessionStateChangedEvent_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getId")
 
-IGuestSessionStateChangedEvent_getIdResultMsg = GED("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getIdResponse").pyclass
+IGuestSessionStateChangedEvent_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getIdResponse")
 
-IGuestSessionStateChangedEvent_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getStatus").pyclass
+IGuestSessionStateChangedEvent_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getStatus")
 
-IGuestSessionStateChangedEvent_getStatusResultMsg = GED("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getStatusResponse").pyclass
+IGuestSessionStateChangedEvent_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getStatusResponse")
 
-IGuestSessionStateChangedEvent_getErrorRequestMsg = GED("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getError").pyclass
+IGuestSessionStateChangedEvent_getErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getError")
 
-IGuestSessionStateChangedEvent_getErrorResultMsg = GED("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getErrorResponse").pyclass
+IGuestSessionStateChangedEvent_getErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionStateChangedEvent_getErrorResponse")
 
-IGuestSessionRegisteredEvent_getRegisteredRequestMsg = GED("http://www.virtualbox.org/", "IGuestSessionRegisteredEvent_getRegistered").pyclass
+IGuestSessionRegisteredEvent_getRegisteredRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionRegisteredEvent_getRegistered")
 
-IGuestSessionRegisteredEvent_getRegisteredResultMsg = GED("http://www.virtualbox.org/", "IGuestSessionRegisteredEvent_getRegisteredResponse").pyclass
+IGuestSessionRegisteredEvent_getRegisteredResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestSessionRegisteredEvent_getRegisteredResponse")
 
-IGuestProcessEvent_getProcessRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessEvent_getProcess").pyclass
+IGuestProcessEvent_getProcessRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessEvent_getProcess")
 
-IGuestProcessEvent_getProcessResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessEvent_getProcessResponse").pyclass
+IGuestProcessEvent_getProcessResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessEvent_getProcessResponse")
 
-IGuestProcessEvent_getPidRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessEvent_getPid").pyclass
+IGuestProcessEvent_getPidRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessEvent_getPid")
 
-IGuestProcessEvent_getPidResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessEvent_getPidResponse").pyclass
+IGuestProcessEvent_getPidResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessEvent_getPidResponse")
 
-IGuestProcessRegisteredEvent_getRegisteredRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessRegisteredEvent_getRegistered").pyclass
+IGuestProcessRegisteredEvent_getRegisteredRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessRegisteredEvent_getRegistered")
 
-IGuestProcessRegisteredEvent_getRegisteredResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessRegisteredEvent_getRegisteredResponse").pyclass
+IGuestProcessRegisteredEvent_getRegisteredResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessRegisteredEvent_getRegisteredResponse")
 
-IGuestProcessStateChangedEvent_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getStatus").pyclass
+IGuestProcessStateChangedEvent_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getStatus")
 
-IGuestProcessStateChangedEvent_getStatusResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getStatusResponse").pyclass
+IGuestProcessStateChangedEvent_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getStatusResponse")
 
-IGuestProcessStateChangedEvent_getErrorRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getError").pyclass
+IGuestProcessStateChangedEvent_getErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getError")
 
-IGuestProcessStateChangedEvent_getErrorResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getErrorResponse").pyclass
+IGuestProcessStateChangedEvent_getErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessStateChangedEvent_getErrorResponse")
 
-IGuestProcessIOEvent_getHandleRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessIOEvent_getHandle").pyclass
+IGuestProcessIOEvent_getHandleRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessIOEvent_getHandle")
 
-IGuestProcessIOEvent_getHandleResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessIOEvent_getHandleResponse").pyclass
+IGuestProcessIOEvent_getHandleResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessIOEvent_getHandleResponse")
 
-IGuestProcessIOEvent_getProcessedRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessIOEvent_getProcessed").pyclass
+IGuestProcessIOEvent_getProcessedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessIOEvent_getProcessed")
 
-IGuestProcessIOEvent_getProcessedResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessIOEvent_getProcessedResponse").pyclass
+IGuestProcessIOEvent_getProcessedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessIOEvent_getProcessedResponse")
 
-IGuestProcessInputNotifyEvent_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessInputNotifyEvent_getStatus").pyclass
+IGuestProcessInputNotifyEvent_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessInputNotifyEvent_getStatus")
 
-IGuestProcessInputNotifyEvent_getStatusResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessInputNotifyEvent_getStatusResponse").pyclass
+IGuestProcessInputNotifyEvent_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessInputNotifyEvent_getStatusResponse")
 
-IGuestProcessOutputEvent_getDataRequestMsg = GED("http://www.virtualbox.org/", "IGuestProcessOutputEvent_getData").pyclass
+IGuestProcessOutputEvent_getDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessOutputEvent_getData")
 
-IGuestProcessOutputEvent_getDataResultMsg = GED("http://www.virtualbox.org/", "IGuestProcessOutputEvent_getDataResponse").pyclass
+IGuestProcessOutputEvent_getDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestProcessOutputEvent_getDataResponse")
 
-IGuestFileEvent_getFileRequestMsg = GED("http://www.virtualbox.org/", "IGuestFileEvent_getFile").pyclass
+IGuestFileEvent_getFileRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileEvent_getFile")
 
-IGuestFileEvent_getFileResultMsg = GED("http://www.virtualbox.org/", "IGuestFileEvent_getFileResponse").pyclass
+IGuestFileEvent_getFileResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileEvent_getFileResponse")
 
-IGuestFileRegisteredEvent_getRegisteredRequestMsg = GED("http://www.virtualbox.org/", "IGuestFileRegisteredEvent_getRegistered").pyclass
+IGuestFileRegisteredEvent_getRegisteredRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileRegisteredEvent_getRegistered")
 
-IGuestFileRegisteredEvent_getRegisteredResultMsg = GED("http://www.virtualbox.org/", "IGuestFileRegisteredEvent_getRegisteredResponse").pyclass
+IGuestFileRegisteredEvent_getRegisteredResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileRegisteredEvent_getRegisteredResponse")
 
-IGuestFileStateChangedEvent_getStatusRequestMsg = GED("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getStatus").pyclass
+IGuestFileStateChangedEvent_getStatusRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getStatus")
 
-IGuestFileStateChangedEvent_getStatusResultMsg = GED("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getStatusResponse").pyclass
+IGuestFileStateChangedEvent_getStatusResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getStatusResponse")
 
-IGuestFileStateChangedEvent_getErrorRequestMsg = GED("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getError").pyclass
+IGuestFileStateChangedEvent_getErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getError")
 
-IGuestFileStateChangedEvent_getErrorResultMsg = GED("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getErrorResponse").pyclass
+IGuestFileStateChangedEvent_getErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileStateChangedEvent_getErrorResponse")
 
-IGuestFileIOEvent_getOffsetRequestMsg = GED("http://www.virtualbox.org/", "IGuestFileIOEvent_getOffset").pyclass
+IGuestFileIOEvent_getOffsetRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileIOEvent_getOffset")
 
-IGuestFileIOEvent_getOffsetResultMsg = GED("http://www.virtualbox.org/", "IGuestFileIOEvent_getOffsetResponse").pyclass
+IGuestFileIOEvent_getOffsetResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileIOEvent_getOffsetResponse")
 
-IGuestFileIOEvent_getProcessedRequestMsg = GED("http://www.virtualbox.org/", "IGuestFileIOEvent_getProcessed").pyclass
+IGuestFileIOEvent_getProcessedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileIOEvent_getProcessed")
 
-IGuestFileIOEvent_getProcessedResultMsg = GED("http://www.virtualbox.org/", "IGuestFileIOEvent_getProcessedResponse").pyclass
+IGuestFileIOEvent_getProcessedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileIOEvent_getProcessedResponse")
 
-IGuestFileReadEvent_getDataRequestMsg = GED("http://www.virtualbox.org/", "IGuestFileReadEvent_getData").pyclass
+IGuestFileReadEvent_getDataRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileReadEvent_getData")
 
-IGuestFileReadEvent_getDataResultMsg = GED("http://www.virtualbox.org/", "IGuestFileReadEvent_getDataResponse").pyclass
+IGuestFileReadEvent_getDataResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestFileReadEvent_getDataResponse")
 
-IUSBDeviceStateChangedEvent_getDeviceRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getDevice").pyclass
+IUSBDeviceStateChangedEvent_getDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getDevice")
 
-IUSBDeviceStateChangedEvent_getDeviceResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getDeviceResponse").pyclass
+IUSBDeviceStateChangedEvent_getDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getDeviceResponse")
 
-IUSBDeviceStateChangedEvent_getAttachedRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getAttached").pyclass
+IUSBDeviceStateChangedEvent_getAttachedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getAttached")
 
-IUSBDeviceStateChangedEvent_getAttachedResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getAttachedResponse").pyclass
+IUSBDeviceStateChangedEvent_getAttachedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getAttachedResponse")
 
-IUSBDeviceStateChangedEvent_getErrorRequestMsg = GED("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getError").pyclass
+IUSBDeviceStateChangedEvent_getErrorRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getError")
 
-IUSBDeviceStateChangedEvent_getErrorResultMsg = GED("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getErrorResponse").pyclass
+IUSBDeviceStateChangedEvent_getErrorResultMsg = LazyPyclass("http://www.virtualbox.org/", "IUSBDeviceStateChangedEvent_getErrorResponse")
 
-ISharedFolderChangedEvent_getScopeRequestMsg = GED("http://www.virtualbox.org/", "ISharedFolderChangedEvent_getScope").pyclass
+ISharedFolderChangedEvent_getScopeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "ISharedFolderChangedEvent_getScope")
 
-ISharedFolderChangedEvent_getScopeResultMsg = GED("http://www.virtualbox.org/", "ISharedFolderChangedEvent_getScopeResponse").pyclass
+ISharedFolderChangedEvent_getScopeResultMsg = LazyPyclass("http://www.virtualbox.org/", "ISharedFolderChangedEvent_getScopeResponse")
 
-IRuntimeErrorEvent_getFatalRequestMsg = GED("http://www.virtualbox.org/", "IRuntimeErrorEvent_getFatal").pyclass
+IRuntimeErrorEvent_getFatalRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IRuntimeErrorEvent_getFatal")
 
-IRuntimeErrorEvent_getFatalResultMsg = GED("http://www.virtualbox.org/", "IRuntimeErrorEvent_getFatalResponse").pyclass
+IRuntimeErrorEvent_getFatalResultMsg = LazyPyclass("http://www.virtualbox.org/", "IRuntimeErrorEvent_getFatalResponse")
 
-IRuntimeErrorEvent_getIdRequestMsg = GED("http://www.virtualbox.org/", "IRuntimeErrorEvent_getId").pyclass
+IRuntimeErrorEvent_getIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IRuntimeErrorEvent_getId")
 
-IRuntimeErrorEvent_getIdResultMsg = GED("http://www.virtualbox.org/", "IRuntimeErrorEvent_getIdResponse").pyclass
+IRuntimeErrorEvent_getIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IRuntimeErrorEvent_getIdResponse")
 
-IRuntimeErrorEvent_getMessageRequestMsg = GED("http://www.virtualbox.org/", "IRuntimeErrorEvent_getMessage").pyclass
+IRuntimeErrorEvent_getMessageRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IRuntimeErrorEvent_getMessage")
 
-IRuntimeErrorEvent_getMessageResultMsg = GED("http://www.virtualbox.org/", "IRuntimeErrorEvent_getMessageResponse").pyclass
+IRuntimeErrorEvent_getMessageResultMsg = LazyPyclass("http://www.virtualbox.org/", "IRuntimeErrorEvent_getMessageResponse")
 
-IEventSourceChangedEvent_getListenerRequestMsg = GED("http://www.virtualbox.org/", "IEventSourceChangedEvent_getListener").pyclass
+IEventSourceChangedEvent_getListenerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSourceChangedEvent_getListener")
 
-IEventSourceChangedEvent_getListenerResultMsg = GED("http://www.virtualbox.org/", "IEventSourceChangedEvent_getListenerResponse").pyclass
+IEventSourceChangedEvent_getListenerResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSourceChangedEvent_getListenerResponse")
 
-IEventSourceChangedEvent_getAddRequestMsg = GED("http://www.virtualbox.org/", "IEventSourceChangedEvent_getAdd").pyclass
+IEventSourceChangedEvent_getAddRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSourceChangedEvent_getAdd")
 
-IEventSourceChangedEvent_getAddResultMsg = GED("http://www.virtualbox.org/", "IEventSourceChangedEvent_getAddResponse").pyclass
+IEventSourceChangedEvent_getAddResultMsg = LazyPyclass("http://www.virtualbox.org/", "IEventSourceChangedEvent_getAddResponse")
 
-IExtraDataChangedEvent_getMachineIdRequestMsg = GED("http://www.virtualbox.org/", "IExtraDataChangedEvent_getMachineId").pyclass
+IExtraDataChangedEvent_getMachineIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataChangedEvent_getMachineId")
 
-IExtraDataChangedEvent_getMachineIdResultMsg = GED("http://www.virtualbox.org/", "IExtraDataChangedEvent_getMachineIdResponse").pyclass
+IExtraDataChangedEvent_getMachineIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataChangedEvent_getMachineIdResponse")
 
-IExtraDataChangedEvent_getKeyRequestMsg = GED("http://www.virtualbox.org/", "IExtraDataChangedEvent_getKey").pyclass
+IExtraDataChangedEvent_getKeyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataChangedEvent_getKey")
 
-IExtraDataChangedEvent_getKeyResultMsg = GED("http://www.virtualbox.org/", "IExtraDataChangedEvent_getKeyResponse").pyclass
+IExtraDataChangedEvent_getKeyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataChangedEvent_getKeyResponse")
 
-IExtraDataChangedEvent_getValueRequestMsg = GED("http://www.virtualbox.org/", "IExtraDataChangedEvent_getValue").pyclass
+IExtraDataChangedEvent_getValueRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataChangedEvent_getValue")
 
-IExtraDataChangedEvent_getValueResultMsg = GED("http://www.virtualbox.org/", "IExtraDataChangedEvent_getValueResponse").pyclass
+IExtraDataChangedEvent_getValueResultMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataChangedEvent_getValueResponse")
 
-IVetoEvent_addVetoRequestMsg = GED("http://www.virtualbox.org/", "IVetoEvent_addVeto").pyclass
+IVetoEvent_addVetoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVetoEvent_addVeto")
 
-IVetoEvent_addVetoResultMsg = GED("http://www.virtualbox.org/", "IVetoEvent_addVetoResponse").pyclass
+IVetoEvent_addVetoResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVetoEvent_addVetoResponse")
 
-IVetoEvent_isVetoedRequestMsg = GED("http://www.virtualbox.org/", "IVetoEvent_isVetoed").pyclass
+IVetoEvent_isVetoedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVetoEvent_isVetoed")
 
-IVetoEvent_isVetoedResultMsg = GED("http://www.virtualbox.org/", "IVetoEvent_isVetoedResponse").pyclass
+IVetoEvent_isVetoedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVetoEvent_isVetoedResponse")
 
-IVetoEvent_getVetosRequestMsg = GED("http://www.virtualbox.org/", "IVetoEvent_getVetos").pyclass
+IVetoEvent_getVetosRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVetoEvent_getVetos")
 
-IVetoEvent_getVetosResultMsg = GED("http://www.virtualbox.org/", "IVetoEvent_getVetosResponse").pyclass
+IVetoEvent_getVetosResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVetoEvent_getVetosResponse")
 
-IExtraDataCanChangeEvent_getMachineIdRequestMsg = GED("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getMachineId").pyclass
+IExtraDataCanChangeEvent_getMachineIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getMachineId")
 
-IExtraDataCanChangeEvent_getMachineIdResultMsg = GED("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getMachineIdResponse").pyclass
+IExtraDataCanChangeEvent_getMachineIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getMachineIdResponse")
 
-IExtraDataCanChangeEvent_getKeyRequestMsg = GED("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getKey").pyclass
+IExtraDataCanChangeEvent_getKeyRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getKey")
 
-IExtraDataCanChangeEvent_getKeyResultMsg = GED("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getKeyResponse").pyclass
+IExtraDataCanChangeEvent_getKeyResultMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getKeyResponse")
 
-IExtraDataCanChangeEvent_getValueRequestMsg = GED("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getValue").pyclass
+IExtraDataCanChangeEvent_getValueRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getValue")
 
-IExtraDataCanChangeEvent_getValueResultMsg = GED("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getValueResponse").pyclass
+IExtraDataCanChangeEvent_getValueResultMsg = LazyPyclass("http://www.virtualbox.org/", "IExtraDataCanChangeEvent_getValueResponse")
 
-IShowWindowEvent_getWinIdRequestMsg = GED("http://www.virtualbox.org/", "IShowWindowEvent_getWinId").pyclass
+IShowWindowEvent_getWinIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IShowWindowEvent_getWinId")
 
-IShowWindowEvent_getWinIdResultMsg = GED("http://www.virtualbox.org/", "IShowWindowEvent_getWinIdResponse").pyclass
+IShowWindowEvent_getWinIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IShowWindowEvent_getWinIdResponse")
 
-IShowWindowEvent_setWinIdRequestMsg = GED("http://www.virtualbox.org/", "IShowWindowEvent_setWinId").pyclass
+IShowWindowEvent_setWinIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IShowWindowEvent_setWinId")
 
-IShowWindowEvent_setWinIdResultMsg = GED("http://www.virtualbox.org/", "IShowWindowEvent_setWinIdResponse").pyclass
+IShowWindowEvent_setWinIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IShowWindowEvent_setWinIdResponse")
 
-INATRedirectEvent_getSlotRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getSlot").pyclass
+INATRedirectEvent_getSlotRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getSlot")
 
-INATRedirectEvent_getSlotResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getSlotResponse").pyclass
+INATRedirectEvent_getSlotResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getSlotResponse")
 
-INATRedirectEvent_getRemoveRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getRemove").pyclass
+INATRedirectEvent_getRemoveRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getRemove")
 
-INATRedirectEvent_getRemoveResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getRemoveResponse").pyclass
+INATRedirectEvent_getRemoveResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getRemoveResponse")
 
-INATRedirectEvent_getNameRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getName").pyclass
+INATRedirectEvent_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getName")
 
-INATRedirectEvent_getNameResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getNameResponse").pyclass
+INATRedirectEvent_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getNameResponse")
 
-INATRedirectEvent_getProtoRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getProto").pyclass
+INATRedirectEvent_getProtoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getProto")
 
-INATRedirectEvent_getProtoResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getProtoResponse").pyclass
+INATRedirectEvent_getProtoResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getProtoResponse")
 
-INATRedirectEvent_getHostIPRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getHostIP").pyclass
+INATRedirectEvent_getHostIPRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getHostIP")
 
-INATRedirectEvent_getHostIPResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getHostIPResponse").pyclass
+INATRedirectEvent_getHostIPResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getHostIPResponse")
 
-INATRedirectEvent_getHostPortRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getHostPort").pyclass
+INATRedirectEvent_getHostPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getHostPort")
 
-INATRedirectEvent_getHostPortResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getHostPortResponse").pyclass
+INATRedirectEvent_getHostPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getHostPortResponse")
 
-INATRedirectEvent_getGuestIPRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getGuestIP").pyclass
+INATRedirectEvent_getGuestIPRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getGuestIP")
 
-INATRedirectEvent_getGuestIPResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getGuestIPResponse").pyclass
+INATRedirectEvent_getGuestIPResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getGuestIPResponse")
 
-INATRedirectEvent_getGuestPortRequestMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getGuestPort").pyclass
+INATRedirectEvent_getGuestPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getGuestPort")
 
-INATRedirectEvent_getGuestPortResultMsg = GED("http://www.virtualbox.org/", "INATRedirectEvent_getGuestPortResponse").pyclass
+INATRedirectEvent_getGuestPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATRedirectEvent_getGuestPortResponse")
 
-IHostPCIDevicePlugEvent_getPluggedRequestMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getPlugged").pyclass
+IHostPCIDevicePlugEvent_getPluggedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getPlugged")
 
-IHostPCIDevicePlugEvent_getPluggedResultMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getPluggedResponse").pyclass
+IHostPCIDevicePlugEvent_getPluggedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getPluggedResponse")
 
-IHostPCIDevicePlugEvent_getSuccessRequestMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getSuccess").pyclass
+IHostPCIDevicePlugEvent_getSuccessRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getSuccess")
 
-IHostPCIDevicePlugEvent_getSuccessResultMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getSuccessResponse").pyclass
+IHostPCIDevicePlugEvent_getSuccessResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getSuccessResponse")
 
-IHostPCIDevicePlugEvent_getAttachmentRequestMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getAttachment").pyclass
+IHostPCIDevicePlugEvent_getAttachmentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getAttachment")
 
-IHostPCIDevicePlugEvent_getAttachmentResultMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getAttachmentResponse").pyclass
+IHostPCIDevicePlugEvent_getAttachmentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getAttachmentResponse")
 
-IHostPCIDevicePlugEvent_getMessageRequestMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getMessage").pyclass
+IHostPCIDevicePlugEvent_getMessageRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getMessage")
 
-IHostPCIDevicePlugEvent_getMessageResultMsg = GED("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getMessageResponse").pyclass
+IHostPCIDevicePlugEvent_getMessageResultMsg = LazyPyclass("http://www.virtualbox.org/", "IHostPCIDevicePlugEvent_getMessageResponse")
 
-IVBoxSVCAvailabilityChangedEvent_getAvailableRequestMsg = GED("http://www.virtualbox.org/", "IVBoxSVCAvailabilityChangedEvent_getAvailable").pyclass
+IVBoxSVCAvailabilityChangedEvent_getAvailableRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IVBoxSVCAvailabilityChangedEvent_getAvailable")
 
-IVBoxSVCAvailabilityChangedEvent_getAvailableResultMsg = GED("http://www.virtualbox.org/", "IVBoxSVCAvailabilityChangedEvent_getAvailableResponse").pyclass
+IVBoxSVCAvailabilityChangedEvent_getAvailableResultMsg = LazyPyclass("http://www.virtualbox.org/", "IVBoxSVCAvailabilityChangedEvent_getAvailableResponse")
 
-IBandwidthGroupChangedEvent_getBandwidthGroupRequestMsg = GED("http://www.virtualbox.org/", "IBandwidthGroupChangedEvent_getBandwidthGroup").pyclass
+IBandwidthGroupChangedEvent_getBandwidthGroupRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroupChangedEvent_getBandwidthGroup")
 
-IBandwidthGroupChangedEvent_getBandwidthGroupResultMsg = GED("http://www.virtualbox.org/", "IBandwidthGroupChangedEvent_getBandwidthGroupResponse").pyclass
+IBandwidthGroupChangedEvent_getBandwidthGroupResultMsg = LazyPyclass("http://www.virtualbox.org/", "IBandwidthGroupChangedEvent_getBandwidthGroupResponse")
 
-IGuestMonitorChangedEvent_getChangeTypeRequestMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getChangeType").pyclass
+IGuestMonitorChangedEvent_getChangeTypeRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getChangeType")
 
-IGuestMonitorChangedEvent_getChangeTypeResultMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getChangeTypeResponse").pyclass
+IGuestMonitorChangedEvent_getChangeTypeResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getChangeTypeResponse")
 
-IGuestMonitorChangedEvent_getScreenIdRequestMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getScreenId").pyclass
+IGuestMonitorChangedEvent_getScreenIdRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getScreenId")
 
-IGuestMonitorChangedEvent_getScreenIdResultMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getScreenIdResponse").pyclass
+IGuestMonitorChangedEvent_getScreenIdResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getScreenIdResponse")
 
-IGuestMonitorChangedEvent_getOriginXRequestMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginX").pyclass
+IGuestMonitorChangedEvent_getOriginXRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginX")
 
-IGuestMonitorChangedEvent_getOriginXResultMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginXResponse").pyclass
+IGuestMonitorChangedEvent_getOriginXResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginXResponse")
 
-IGuestMonitorChangedEvent_getOriginYRequestMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginY").pyclass
+IGuestMonitorChangedEvent_getOriginYRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginY")
 
-IGuestMonitorChangedEvent_getOriginYResultMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginYResponse").pyclass
+IGuestMonitorChangedEvent_getOriginYResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getOriginYResponse")
 
-IGuestMonitorChangedEvent_getWidthRequestMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getWidth").pyclass
+IGuestMonitorChangedEvent_getWidthRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getWidth")
 
-IGuestMonitorChangedEvent_getWidthResultMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getWidthResponse").pyclass
+IGuestMonitorChangedEvent_getWidthResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getWidthResponse")
 
-IGuestMonitorChangedEvent_getHeightRequestMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getHeight").pyclass
+IGuestMonitorChangedEvent_getHeightRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getHeight")
 
-IGuestMonitorChangedEvent_getHeightResultMsg = GED("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getHeightResponse").pyclass
+IGuestMonitorChangedEvent_getHeightResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestMonitorChangedEvent_getHeightResponse")
 
-IGuestUserStateChangedEvent_getNameRequestMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getName").pyclass
+IGuestUserStateChangedEvent_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getName")
 
-IGuestUserStateChangedEvent_getNameResultMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getNameResponse").pyclass
+IGuestUserStateChangedEvent_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getNameResponse")
 
-IGuestUserStateChangedEvent_getDomainRequestMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getDomain").pyclass
+IGuestUserStateChangedEvent_getDomainRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getDomain")
 
-IGuestUserStateChangedEvent_getDomainResultMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getDomainResponse").pyclass
+IGuestUserStateChangedEvent_getDomainResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getDomainResponse")
 
-IGuestUserStateChangedEvent_getStateRequestMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getState").pyclass
+IGuestUserStateChangedEvent_getStateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getState")
 
-IGuestUserStateChangedEvent_getStateResultMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getStateResponse").pyclass
+IGuestUserStateChangedEvent_getStateResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getStateResponse")
 
-IGuestUserStateChangedEvent_getStateDetailsRequestMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getStateDetails").pyclass
+IGuestUserStateChangedEvent_getStateDetailsRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getStateDetails")
 
-IGuestUserStateChangedEvent_getStateDetailsResultMsg = GED("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getStateDetailsResponse").pyclass
+IGuestUserStateChangedEvent_getStateDetailsResultMsg = LazyPyclass("http://www.virtualbox.org/", "IGuestUserStateChangedEvent_getStateDetailsResponse")
 
-IStorageDeviceChangedEvent_getStorageDeviceRequestMsg = GED("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getStorageDevice").pyclass
+IStorageDeviceChangedEvent_getStorageDeviceRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getStorageDevice")
 
-IStorageDeviceChangedEvent_getStorageDeviceResultMsg = GED("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getStorageDeviceResponse").pyclass
+IStorageDeviceChangedEvent_getStorageDeviceResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getStorageDeviceResponse")
 
-IStorageDeviceChangedEvent_getRemovedRequestMsg = GED("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getRemoved").pyclass
+IStorageDeviceChangedEvent_getRemovedRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getRemoved")
 
-IStorageDeviceChangedEvent_getRemovedResultMsg = GED("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getRemovedResponse").pyclass
+IStorageDeviceChangedEvent_getRemovedResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getRemovedResponse")
 
-IStorageDeviceChangedEvent_getSilentRequestMsg = GED("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getSilent").pyclass
+IStorageDeviceChangedEvent_getSilentRequestMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getSilent")
 
-IStorageDeviceChangedEvent_getSilentResultMsg = GED("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getSilentResponse").pyclass
+IStorageDeviceChangedEvent_getSilentResultMsg = LazyPyclass("http://www.virtualbox.org/", "IStorageDeviceChangedEvent_getSilentResponse")
 
-INATNetworkChangedEvent_getNetworkNameRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkChangedEvent_getNetworkName").pyclass
+INATNetworkChangedEvent_getNetworkNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkChangedEvent_getNetworkName")
 
-INATNetworkChangedEvent_getNetworkNameResultMsg = GED("http://www.virtualbox.org/", "INATNetworkChangedEvent_getNetworkNameResponse").pyclass
+INATNetworkChangedEvent_getNetworkNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkChangedEvent_getNetworkNameResponse")
 
-INATNetworkStartStopEvent_getStartEventRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkStartStopEvent_getStartEvent").pyclass
+INATNetworkStartStopEvent_getStartEventRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkStartStopEvent_getStartEvent")
 
-INATNetworkStartStopEvent_getStartEventResultMsg = GED("http://www.virtualbox.org/", "INATNetworkStartStopEvent_getStartEventResponse").pyclass
+INATNetworkStartStopEvent_getStartEventResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkStartStopEvent_getStartEventResponse")
 
-INATNetworkCreationDeletionEvent_getCreationEventRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkCreationDeletionEvent_getCreationEvent").pyclass
+INATNetworkCreationDeletionEvent_getCreationEventRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkCreationDeletionEvent_getCreationEvent")
 
-INATNetworkCreationDeletionEvent_getCreationEventResultMsg = GED("http://www.virtualbox.org/", "INATNetworkCreationDeletionEvent_getCreationEventResponse").pyclass
+INATNetworkCreationDeletionEvent_getCreationEventResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkCreationDeletionEvent_getCreationEventResponse")
 
-INATNetworkSettingEvent_getEnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getEnabled").pyclass
+INATNetworkSettingEvent_getEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getEnabled")
 
-INATNetworkSettingEvent_getEnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getEnabledResponse").pyclass
+INATNetworkSettingEvent_getEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getEnabledResponse")
 
-INATNetworkSettingEvent_getNetworkRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNetwork").pyclass
+INATNetworkSettingEvent_getNetworkRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNetwork")
 
-INATNetworkSettingEvent_getNetworkResultMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNetworkResponse").pyclass
+INATNetworkSettingEvent_getNetworkResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNetworkResponse")
 
-INATNetworkSettingEvent_getGatewayRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getGateway").pyclass
+INATNetworkSettingEvent_getGatewayRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getGateway")
 
-INATNetworkSettingEvent_getGatewayResultMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getGatewayResponse").pyclass
+INATNetworkSettingEvent_getGatewayResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getGatewayResponse")
 
-INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabledRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabled").pyclass
+INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabledRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabled")
 
-INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabledResultMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabledResponse").pyclass
+INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabledResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getAdvertiseDefaultIPv6RouteEnabledResponse")
 
-INATNetworkSettingEvent_getNeedDhcpServerRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNeedDhcpServer").pyclass
+INATNetworkSettingEvent_getNeedDhcpServerRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNeedDhcpServer")
 
-INATNetworkSettingEvent_getNeedDhcpServerResultMsg = GED("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNeedDhcpServerResponse").pyclass
+INATNetworkSettingEvent_getNeedDhcpServerResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkSettingEvent_getNeedDhcpServerResponse")
 
-INATNetworkPortForwardEvent_getCreateRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getCreate").pyclass
+INATNetworkPortForwardEvent_getCreateRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getCreate")
 
-INATNetworkPortForwardEvent_getCreateResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getCreateResponse").pyclass
+INATNetworkPortForwardEvent_getCreateResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getCreateResponse")
 
-INATNetworkPortForwardEvent_getIpv6RequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getIpv6").pyclass
+INATNetworkPortForwardEvent_getIpv6RequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getIpv6")
 
-INATNetworkPortForwardEvent_getIpv6ResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getIpv6Response").pyclass
+INATNetworkPortForwardEvent_getIpv6ResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getIpv6Response")
 
-INATNetworkPortForwardEvent_getNameRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getName").pyclass
+INATNetworkPortForwardEvent_getNameRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getName")
 
-INATNetworkPortForwardEvent_getNameResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getNameResponse").pyclass
+INATNetworkPortForwardEvent_getNameResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getNameResponse")
 
-INATNetworkPortForwardEvent_getProtoRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getProto").pyclass
+INATNetworkPortForwardEvent_getProtoRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getProto")
 
-INATNetworkPortForwardEvent_getProtoResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getProtoResponse").pyclass
+INATNetworkPortForwardEvent_getProtoResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getProtoResponse")
 
-INATNetworkPortForwardEvent_getHostIpRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostIp").pyclass
+INATNetworkPortForwardEvent_getHostIpRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostIp")
 
-INATNetworkPortForwardEvent_getHostIpResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostIpResponse").pyclass
+INATNetworkPortForwardEvent_getHostIpResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostIpResponse")
 
-INATNetworkPortForwardEvent_getHostPortRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostPort").pyclass
+INATNetworkPortForwardEvent_getHostPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostPort")
 
-INATNetworkPortForwardEvent_getHostPortResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostPortResponse").pyclass
+INATNetworkPortForwardEvent_getHostPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getHostPortResponse")
 
-INATNetworkPortForwardEvent_getGuestIpRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestIp").pyclass
+INATNetworkPortForwardEvent_getGuestIpRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestIp")
 
-INATNetworkPortForwardEvent_getGuestIpResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestIpResponse").pyclass
+INATNetworkPortForwardEvent_getGuestIpResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestIpResponse")
 
-INATNetworkPortForwardEvent_getGuestPortRequestMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestPort").pyclass
+INATNetworkPortForwardEvent_getGuestPortRequestMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestPort")
 
-INATNetworkPortForwardEvent_getGuestPortResultMsg = GED("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestPortResponse").pyclass
+INATNetworkPortForwardEvent_getGuestPortResultMsg = LazyPyclass("http://www.virtualbox.org/", "INATNetworkPortForwardEvent_getGuestPortResponse")
@@ -0,0 +1,57 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+
+# Typecode overrides for VirtualBox_types.py, applied by the generator:
+#
+#     wsdl2py -b -t VirtualBox_overrides.py vboxwebService.wsdl
+#
+# vboxwebsrv sends octet[] parameters and results as base64 text, but
+# the WSDL declares them as xsd:string.  Results decode to bytearrays,
+# inputs take strings or bytearrays and are encoded on the way out.
+
+OCTET_ARRAY_RESULTS = [
+    'IDisplay_takeScreenShotPNGToArrayResponse',
+    'IDisplay_takeScreenShotToArrayResponse',
+    'IFile_readAtResponse',
+    'IFile_readResponse',
+    'IGuestFileReadEvent_getDataResponse',
+    'IGuestProcessOutputEvent_getDataResponse',
+    'IGuest_dragGHGetDataResponse',
+    'IMachineDebugger_readPhysicalMemoryResponse',
+    'IMachineDebugger_readVirtualMemoryResponse',
+    'IMachine_getIconResponse',
+    'IMachine_readLogResponse',
+    'IMachine_readSavedScreenshotPNGToArrayResponse',
+    'IMachine_readSavedThumbnailPNGToArrayResponse',
+    'IMachine_readSavedThumbnailToArrayResponse',
+    'IMousePointerShapeChangedEvent_getShapeResponse',
+    'IProcess_readResponse',
+]
+
+OCTET_ARRAY_INPUTS = [
+    ('IFile_write', 'data'),
+    ('IFile_writeAt', 'data'),
+    ('IGuest_dragHGPutData', 'data'),
+    ('IMachineDebugger_writePhysicalMemory', 'bytes'),
+    ('IMachineDebugger_writeVirtualMemory', 'bytes'),
+    ('IMachine_setIcon', 'icon'),
+    ('IProcess_write', 'data'),
+    ('IProcess_writeArray', 'data'),
+]
+
+# (element name, local element name, typecode class, extra arguments)
+TYPECODE_OVERRIDES = [
+    (element, 'returnval', 'ZSI.TC.Base64Binary', 'pyclass=bytearray')
+    for element in OCTET_ARRAY_RESULTS] + [
+    (element, local, 'ZSI.TC.Base64Binary', None)
+    for element, local in OCTET_ARRAY_INPUTS]
@@ -7083,7 +7083,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachine_getIconResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachine_getIconResponse")
             kw["aname"] = "_IMachine_getIconResponse"
             self.attribute_typecode_dict = {}
@@ -7103,7 +7103,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachine_setIcon_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="icon", aname="_icon", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="icon", aname="_icon", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachine_setIcon")
             kw["aname"] = "_IMachine_setIcon"
             self.attribute_typecode_dict = {}
@@ -15108,7 +15108,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachine_readSavedThumbnailToArrayResponse_Dec.schema
-            TClist = [ZSI.TCnumbers.IunsignedInt(pname="width", aname="_width", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="height", aname="_height", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TCnumbers.IunsignedInt(pname="width", aname="_width", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="height", aname="_height", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachine_readSavedThumbnailToArrayResponse")
             kw["aname"] = "_IMachine_readSavedThumbnailToArrayResponse"
             self.attribute_typecode_dict = {}
@@ -15151,7 +15151,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachine_readSavedThumbnailPNGToArrayResponse_Dec.schema
-            TClist = [ZSI.TCnumbers.IunsignedInt(pname="width", aname="_width", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="height", aname="_height", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TCnumbers.IunsignedInt(pname="width", aname="_width", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="height", aname="_height", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachine_readSavedThumbnailPNGToArrayResponse")
             kw["aname"] = "_IMachine_readSavedThumbnailPNGToArrayResponse"
             self.attribute_typecode_dict = {}
@@ -15237,7 +15237,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachine_readSavedScreenshotPNGToArrayResponse_Dec.schema
-            TClist = [ZSI.TCnumbers.IunsignedInt(pname="width", aname="_width", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="height", aname="_height", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TCnumbers.IunsignedInt(pname="width", aname="_width", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="height", aname="_height", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachine_readSavedScreenshotPNGToArrayResponse")
             kw["aname"] = "_IMachine_readSavedScreenshotPNGToArrayResponse"
             self.attribute_typecode_dict = {}
@@ -15444,7 +15444,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachine_readLogResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachine_readLogResponse")
             kw["aname"] = "_IMachine_readLogResponse"
             self.attribute_typecode_dict = {}
@@ -24164,7 +24164,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IProcess_readResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IProcess_readResponse")
             kw["aname"] = "_IProcess_readResponse"
             self.attribute_typecode_dict = {}
@@ -24184,7 +24184,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IProcess_write_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="handle", aname="_handle", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="flags", aname="_flags", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="handle", aname="_handle", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="flags", aname="_flags", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IProcess_write")
             kw["aname"] = "_IProcess_write"
             self.attribute_typecode_dict = {}
@@ -24228,7 +24228,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IProcess_writeArray_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="handle", aname="_handle", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), GTD("http://www.virtualbox.org/","ProcessInputFlag",lazy=False)(pname="flags", aname="_flags", minOccurs=0, maxOccurs="unbounded", nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="handle", aname="_handle", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), GTD("http://www.virtualbox.org/","ProcessInputFlag",lazy=False)(pname="flags", aname="_flags", minOccurs=0, maxOccurs="unbounded", nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IProcess_writeArray")
             kw["aname"] = "_IProcess_writeArray"
             self.attribute_typecode_dict = {}
@@ -24931,7 +24931,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IFile_readResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IFile_readResponse")
             kw["aname"] = "_IFile_readResponse"
             self.attribute_typecode_dict = {}
@@ -24974,7 +24974,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IFile_readAtResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IFile_readAtResponse")
             kw["aname"] = "_IFile_readAtResponse"
             self.attribute_typecode_dict = {}
@@ -25075,7 +25075,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IFile_write_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IFile_write")
             kw["aname"] = "_IFile_write"
             self.attribute_typecode_dict = {}
@@ -25117,7 +25117,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IFile_writeAt_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.Ilong(pname="offset", aname="_offset", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.Ilong(pname="offset", aname="_offset", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="timeoutMS", aname="_timeoutMS", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IFile_writeAt")
             kw["aname"] = "_IFile_writeAt"
             self.attribute_typecode_dict = {}
@@ -26717,7 +26717,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IGuest_dragHGPutData_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="screenId", aname="_screenId", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="format", aname="_format", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="screenId", aname="_screenId", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="format", aname="_format", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="data", aname="_data", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IGuest_dragHGPutData")
             kw["aname"] = "_IGuest_dragHGPutData"
             self.attribute_typecode_dict = {}
@@ -26865,7 +26865,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IGuest_dragGHGetDataResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IGuest_dragGHGetDataResponse")
             kw["aname"] = "_IGuest_dragGHGetDataResponse"
             self.attribute_typecode_dict = {}
@@ -31852,7 +31852,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IDisplay_takeScreenShotToArrayResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IDisplay_takeScreenShotToArrayResponse")
             kw["aname"] = "_IDisplay_takeScreenShotToArrayResponse"
             self.attribute_typecode_dict = {}
@@ -31895,7 +31895,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IDisplay_takeScreenShotPNGToArrayResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IDisplay_takeScreenShotPNGToArrayResponse")
             kw["aname"] = "_IDisplay_takeScreenShotPNGToArrayResponse"
             self.attribute_typecode_dict = {}
@@ -35867,7 +35867,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachineDebugger_readPhysicalMemoryResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachineDebugger_readPhysicalMemoryResponse")
             kw["aname"] = "_IMachineDebugger_readPhysicalMemoryResponse"
             self.attribute_typecode_dict = {}
@@ -35887,7 +35887,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachineDebugger_writePhysicalMemory_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.Ilong(pname="address", aname="_address", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="size", aname="_size", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="bytes", aname="_bytes", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.Ilong(pname="address", aname="_address", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="size", aname="_size", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="bytes", aname="_bytes", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachineDebugger_writePhysicalMemory")
             kw["aname"] = "_IMachineDebugger_writePhysicalMemory"
             self.attribute_typecode_dict = {}
@@ -35952,7 +35952,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachineDebugger_readVirtualMemoryResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachineDebugger_readVirtualMemoryResponse")
             kw["aname"] = "_IMachineDebugger_readVirtualMemoryResponse"
             self.attribute_typecode_dict = {}
@@ -35972,7 +35972,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMachineDebugger_writeVirtualMemory_Dec.schema
-            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="cpuId", aname="_cpuId", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.Ilong(pname="address", aname="_address", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="size", aname="_size", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.String(pname="bytes", aname="_bytes", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.String(pname="_this", aname="__this", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="cpuId", aname="_cpuId", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.Ilong(pname="address", aname="_address", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TCnumbers.IunsignedInt(pname="size", aname="_size", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded")), ZSI.TC.Base64Binary(pname="bytes", aname="_bytes", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMachineDebugger_writeVirtualMemory")
             kw["aname"] = "_IMachineDebugger_writeVirtualMemory"
             self.attribute_typecode_dict = {}
@@ -43291,7 +43291,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IMousePointerShapeChangedEvent_getShapeResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IMousePointerShapeChangedEvent_getShapeResponse")
             kw["aname"] = "_IMousePointerShapeChangedEvent_getShapeResponse"
             self.attribute_typecode_dict = {}
@@ -45051,7 +45051,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IGuestProcessOutputEvent_getDataResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IGuestProcessOutputEvent_getDataResponse")
             kw["aname"] = "_IGuestProcessOutputEvent_getDataResponse"
             self.attribute_typecode_dict = {}
@@ -45331,7 +45331,7 @@ class ns0:
         schema = "http://www.virtualbox.org/"
         def __init__(self, **kw):
             ns = ns0.IGuestFileReadEvent_getDataResponse_Dec.schema
-            TClist = [ZSI.TC.String(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, encoded=kw.get("encoded"))]
+            TClist = [ZSI.TC.Base64Binary(pname="returnval", aname="_returnval", minOccurs=1, maxOccurs=1, nillable=False, typed=False, pyclass=bytearray, encoded=kw.get("encoded"))]
             kw["pname"] = ("http://www.virtualbox.org/","IGuestFileReadEvent_getDataResponse")
             kw["aname"] = "_IGuestFileReadEvent_getDataResponse"
             self.attribute_typecode_dict = {}
@@ -17,7 +17,7 @@ from pyremotevbox.ZSI.client import _Binding
 from pyremotevbox.ZSI.generate import commands,containers
 from pyremotevbox.ZSI.schema import GED, GTD
 
-import wstools
+import wstools.WSDLTools
 
 
 #url_to_mod = re.compile(r'<([^ \t\n\r\f\v:]+:)?include\s+location\s*=\s*"(\S+)"')
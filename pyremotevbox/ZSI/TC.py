@@ -497,7 +497,7 @@ class SimpleType(TypeCode):
             self.set_attribute_xsi_type(el, **kw)
 
         # soap id attribute
-        if self.unique is False:
+        if self.unique is False and sw.multiref:
             self.set_attribute_id(el, objid)
 
         #Content, <empty tag/>c
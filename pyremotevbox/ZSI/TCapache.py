@@ -59,7 +59,7 @@ class _Map(TypeCode):
             self.set_attribute_xsi_type(el, **kw)
 
         # soap id attribute
-        if self.unique is False:
+        if self.unique is False and sw.multiref:
             self.set_attribute_id(el, objid)
 
         if self.aslist:
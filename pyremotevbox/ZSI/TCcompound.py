@@ -170,6 +170,13 @@ class ComplexType(TypeCode):
 
         # Clone list of kids (we null it out as we process)
         c, crange = c[:], range(len(c))
+
+        # Index the kids by local name, each bucket in document order, so
+        # a field only visits the kids it can match.
+        index = {}
+        for j in crange:
+            index.setdefault(c[j].localName, []).append(j)
+
         # Loop over all items we're expecting
         
         if debug:
@@ -184,8 +191,16 @@ class ComplexType(TypeCode):
             # Loop over all available kids
             if debug: 
                 self.logger.debug("what: (%s,%s)", what.nspname, what.pname)
-                
-            for j,c_elt in [ (j, c[j]) for j in crange if c[j] ]:
+
+            # substitutionGroup members of a global element declaration go 
+            # by other names, and inorder must see every kid, otherwise
+            # only kids with the field's name can match.
+            if self.inorder is True or isinstance(what, ElementDeclaration):
+                kids = crange
+            else:
+                kids = index.get(what.pname, ())
+
+            for j,c_elt in [ (j, c[j]) for j in kids if c[j] ]:
                 # Parse value, and mark this one done. 
                 if debug:
                     self.logger.debug("child node: (%s,%s)", c_elt.namespaceURI, c_elt.tagName)
@@ -335,7 +350,7 @@ class ComplexType(TypeCode):
         elif not self.inline and self.unique:
             raise EvaluateException('Not inline, but unique makes no sense. No href/id.',
                 sw.Backtrace(elt))
-        elif n is not None:
+        elif n is not None and sw.multiref:
             self.set_attribute_id(elem, objid)
 
         if self.pyclass and type(self.pyclass) is type:
@@ -637,7 +652,7 @@ class Array(TypeCode):
             self.set_attribute_xsi_type(el, **kw)
 
         # soap id attribute
-        if self.unique is False:
+        if self.unique is False and sw.multiref:
             self.set_attribute_id(el, objid)
 
         offset = 0
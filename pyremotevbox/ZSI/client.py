@@ -11,7 +11,8 @@ from pyremotevbox.ZSI.auth import AUTH
 from pyremotevbox.ZSI.TC import AnyElement, AnyType, String, TypeCode, _get_global_element_declaration,\
     _get_type_definition
 from pyremotevbox.ZSI.TCcompound import Struct
-import base64, httplib, Cookie, types, time, urlparse
+from pyremotevbox.ZSI.writer import ElementSerializer
+import base64, errno, httplib, Cookie, socket, threading, types, time, urlparse
 from pyremotevbox.ZSI.address import Address
 from pyremotevbox.ZSI.wstools.logging import getLogger as _GetLogger
 _b64_encode = base64.encodestring
@@ -84,10 +85,142 @@ class _NamedParamCaller:
                    **kw)
 
 
-class _Binding:
+class ConnectionPool:
+    '''Pool of persistent (HTTP/1.1 keep-alive) connections, shared by
+    bindings and keyed by (transport, scheme, netloc).  Idle connections
+    are handed out most-recently-used first, and are closed once they
+    have been idle for longer than idletimeout seconds.
+    '''
+
+    def __init__(self, maxsize=8, idletimeout=30):
+        '''Initialize.
+        Keyword arguments include:
+            maxsize -- maximum number of idle connections kept per key.
+            idletimeout -- seconds an idle connection may be reused.
+        '''
+        self.maxsize = maxsize
+        self.idletimeout = idletimeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def _evict(self, idle, now):
+        '''Remove expired connections from the front of idle list,
+        return them.
+        '''
+        n = 0
+        while n < len(idle) and now - idle[n][1] > self.idletimeout:
+            n += 1
+        stale = [conn for conn,last in idle[:n]]
+        del idle[:n]
+        return stale
+
+    def get(self, key, factory):
+        '''Return a (connection, reused) tuple.  An idle connection for
+        key is reused if one is available, else factory is called to
+        create one and the new connection is connected.
+        '''
+        conn = None
+        self._lock.acquire()
+        try:
+            idle = self._idle.get(key, [])
+            stale = self._evict(idle, time.time())
+            while idle and conn is None:
+                conn = idle.pop()[0]
+                if conn.sock is None:
+                    conn = None
+        finally:
+            self._lock.release()
+
+        for i in stale: i.close()
+        if conn is not None:
+            return conn, True
+
+        conn = factory()
+        conn.connect()
+        return conn, False
+
+    def put(self, key, conn):
+        '''Return a connection to the pool once its response has been
+        read.  The connection is closed instead if the pool is full.
+        '''
+        if conn.sock is None:
+            return
+        self._lock.acquire()
+        try:
+            idle = self._idle.setdefault(key, [])
+            stale = self._evict(idle, time.time())
+            if len(idle) < self.maxsize:
+                idle.append((conn, time.time()))
+                conn = None
+        finally:
+            self._lock.release()
+
+        for i in stale: i.close()
+        if conn is not None: conn.close()
+
+    def clear(self):
+        '''Close all idle connections.
+        '''
+        self._lock.acquire()
+        try:
+            idle, self._idle = self._idle, {}
+        finally:
+            self._lock.release()
+
+        for conns in idle.values():
+            for conn,last in conns: conn.close()
+
+
+class _CallState(object):
+    '''Send and receive state of the call in progress on a binding.
+    '''
+    def __init__(self):
+        self.h = None
+        self.connkey = None
+        self.reused = False
+        self.will_close = True
+        self.request = None
+        self.data = None
+        self.ps = None
+        self.reply_code = None
+        self.reply_msg = None
+        self.reply_headers = None
+        self.address = None
+        self.http_callbacks = {}
+
+
+class _ThreadCallState(_CallState, threading.local):
+    '''Call state kept separately for each thread.
+    '''
+
+
+def _callstate_property(name):
+    '''Return a property delegating name to the binding's call state.
+    '''
+    def fget(self):
+        return getattr(self._callstate, name)
+    def fset(self, value):
+        setattr(self._callstate, name, value)
+    return property(fget, fset)
+
+
+def _no_reply(ex):
+    '''Did the BadStatusLine ex come from a connection closed without
+    a byte of reply?
+    '''
+    line = ex.line
+    return not line or line == "''" or line.startswith('No status line received')
+
+
+class _Binding(object):
     '''Object that represents a binding (connection) to a SOAP server.
     Once the binding is created, various ways of sending and
     receiving SOAP messages are available.
+
+    With threadsafe set, the state of a call (connection, reply, parsed 
+    message) is kept per thread, so that several threads can share one
+    binding, each checking out its own connection from connpool.  The
+    cookies are shared by all threads, and read and updated under a lock.
     '''
     defaultHttpTransport = httplib.HTTPConnection
     defaultHttpsTransport = httplib.HTTPSConnection
@@ -95,11 +228,17 @@ class _Binding:
 
     def __init__(self, nsdict=None, transport=None, url=None, tracefile=None,
                  readerclass=None, writerclass=None, soapaction='', 
-                 wsAddressURI=None, sig_handler=None, transdict=None, **kw):
+                 wsAddressURI=None, sig_handler=None, transdict=None,
+                 connpool=None, threadsafe=False, multiref=True, **kw):
         '''Initialize.
         Keyword arguments include:
             transport -- default use HTTPConnection. 
             transdict -- dict of values to pass to transport.
+            connpool -- ConnectionPool of keep-alive connections, by 
+            default each binding has its own.
+            threadsafe -- keep call state per thread.
+            multiref -- track id/href multi-references when serializing,
+            turn off for document/literal services.
             url -- URL of resource, POST is path 
             soapaction -- value of SOAPAction header
             auth -- (type, name, password) triplet; default is unauth
@@ -113,29 +252,45 @@ class _Binding:
             sig_handler -- XML Signature handler, must sign and verify.
             endPointReference -- optional Endpoint Reference.
         '''
-        self.data = None
-        self.ps = None
+        if threadsafe:
+            self._callstate = _ThreadCallState()
+        else:
+            self._callstate = _CallState()
         self.user_headers = []
         self.nsdict = nsdict or {}
         self.transport = transport
         self.transdict = transdict or {}
+        self.connpool = connpool or ConnectionPool()
         self.url = url
         self.trace = tracefile
         self.readerclass = readerclass
         self.writerclass = writerclass
+        self.multiref = multiref
         self.soapaction = soapaction
         self.wsAddressURI = wsAddressURI
         self.sig_handler = sig_handler
-        self.address = None
         self.endPointReference = kw.get('endPointReference', None)
         self.cookies = Cookie.SimpleCookie()
-        self.http_callbacks = {}
+        self._cookielock = threading.Lock()
 
         if kw.has_key('auth'):
             self.SetAuth(*kw['auth'])
         else:
             self.SetAuth(AUTH.none)
 
+    h = _callstate_property('h')
+    connkey = _callstate_property('connkey')
+    reused = _callstate_property('reused')
+    will_close = _callstate_property('will_close')
+    request = _callstate_property('request')
+    data = _callstate_property('data')
+    ps = _callstate_property('ps')
+    reply_code = _callstate_property('reply_code')
+    reply_msg = _callstate_property('reply_msg')
+    reply_headers = _callstate_property('reply_headers')
+    address = _callstate_property('address')
+    http_callbacks = _callstate_property('http_callbacks')
+
     def SetAuth(self, style, user=None, password=None):
         '''Change auth style, return object to user.
         '''
@@ -158,7 +313,11 @@ class _Binding:
     def ResetCookies(self):
         '''Empty the list of cookies.
         '''
-        self.cookies = Cookie.SimpleCookie()
+        self._cookielock.acquire()
+        try:
+            self.cookies = Cookie.SimpleCookie()
+        finally:
+            self._cookielock.release()
 
     def AddHeader(self, header, value):
         '''Add a header to send.
@@ -169,19 +328,27 @@ class _Binding:
     def __addcookies(self):
         '''Add cookies from self.cookies to request in self.h
         '''
-        for cname, morsel in self.cookies.items():
-            attrs = []
-            value = morsel.get('version', '')
-            if value != '' and value != '0':
-                attrs.append('$Version=%s' % value)
-            attrs.append('%s=%s' % (cname, morsel.coded_value))
-            value = morsel.get('path')
-            if value:
-                attrs.append('$Path=%s' % value)
-            value = morsel.get('domain')
-            if value:
-                attrs.append('$Domain=%s' % value)
-            self.h.putheader('Cookie', "; ".join(attrs))
+        cookies = []
+        self._cookielock.acquire()
+        try:
+            for cname, morsel in self.cookies.items():
+                attrs = []
+                value = morsel.get('version', '')
+                if value != '' and value != '0':
+                    attrs.append('$Version=%s' % value)
+                attrs.append('%s=%s' % (cname, morsel.coded_value))
+                value = morsel.get('path')
+                if value:
+                    attrs.append('$Path=%s' % value)
+                value = morsel.get('domain')
+                if value:
+                    attrs.append('$Domain=%s' % value)
+                cookies.append("; ".join(attrs))
+        finally:
+            self._cookielock.release()
+
+        for cookie in cookies:
+            self.h.putheader('Cookie', cookie)
 
     def RPC(self, url, opname, obj, replytype=None, **kw):
         '''Send a request, return the reply.  See Send() and Recieve()
@@ -225,8 +392,46 @@ class _Binding:
         d.update(self.nsdict)
         d.update(nsdict)
 
-        sw = SoapWriter(nsdict=d, header=True, outputclass=self.writerclass, 
-                 encodingStyle=kw.get('encodingStyle'),)
+        soapdata = None
+        if not (d or soapheaders or self.writerclass or kw.get('encodingStyle') 
+            or kw.has_key('_args') or kw.get('requesttypecode')
+            or self.auth_style & AUTH.zsibasic or self.wsAddressURI is not None
+            or self.sig_handler is not None):
+            # Flat document/literal messages skip building a document.
+            serializer = ElementSerializer.Get(getattr(obj, 'typecode', None))
+            if serializer is not None:
+                soapdata = serializer.serialize(obj)
+
+        if soapdata is None:
+            soapdata = self.__serialize(url, opname, obj, d, wsaction, 
+                endPointReference, soapheaders, **kw)
+
+        scheme,netloc,path,nil,nil,nil = urlparse.urlparse(url)
+        transport = self.transport
+        if transport is None and url is not None:
+            if scheme == 'https':
+                transport = self.defaultHttpsTransport
+            elif scheme == 'http':
+                transport = self.defaultHttpTransport
+            else:
+                raise RuntimeError, 'must specify transport or url startswith https/http'
+
+        # Send the request.
+        if issubclass(transport, httplib.HTTPConnection) is False:
+            raise TypeError, 'transport must be a HTTPConnection'
+
+        self.__release()
+        self.connkey = (transport, scheme, netloc)
+        self.h, self.reused = self.connpool.get(self.connkey, 
+            lambda: transport(netloc, None, **self.transdict))
+        self.SendSOAPData(soapdata, url, soapaction, **kw)
+
+    def __serialize(self, url, opname, obj, nsdict, wsaction, 
+                    endPointReference, soapheaders, **kw):
+        '''Serialize obj with a SoapWriter, return the SOAP message.
+        '''
+        sw = SoapWriter(nsdict=nsdict, header=True, outputclass=self.writerclass, 
+                 encodingStyle=kw.get('encodingStyle'), multiref=self.multiref)
         
         requesttypecode = kw.get('requesttypecode')
         if kw.has_key('_args'): #NamedParamBinding
@@ -272,24 +477,28 @@ class _Binding:
         if self.sig_handler is not None:
             self.sig_handler.sign(sw)
 
-        scheme,netloc,path,nil,nil,nil = urlparse.urlparse(url)
-        transport = self.transport
-        if transport is None and url is not None:
-            if scheme == 'https':
-                transport = self.defaultHttpsTransport
-            elif scheme == 'http':
-                transport = self.defaultHttpTransport
-            else:
-                raise RuntimeError, 'must specify transport or url startswith https/http'
+        return str(sw)
 
-        # Send the request.
-        if issubclass(transport, httplib.HTTPConnection) is False:
-            raise TypeError, 'transport must be a HTTPConnection'
+    def __release(self):
+        '''Return the connection in self.h to the pool if its response
+        has been read, else close it.
+        '''
+        h, self.h = self.h, None
+        if h is None:
+            return
+        if self.data is not None and not self.will_close:
+            self.connpool.put(self.connkey, h)
+        else:
+            h.close()
 
-        soapdata = str(sw)
-        self.h = transport(netloc, None, **self.transdict)
+    def __reconnect(self):
+        '''Replace self.h, a reused connection the server has dropped, 
+        with a new connection.
+        '''
+        self.h.close()
+        self.h = self.connkey[0](self.connkey[2], None, **self.transdict)
         self.h.connect()
-        self.SendSOAPData(soapdata, url, soapaction, **kw)
+        self.reused = False
 
     def SendSOAPData(self, soapdata, url, soapaction, headers={}, **kw):
         # Tracing?
@@ -322,11 +531,21 @@ class _Binding:
 
         for header,value in self.user_headers:
             self.h.putheader(header, value)
-        self.h.endheaders()
-        self.h.send(soapdata)
 
         # Clear prior receive state.
-        self.data, self.ps = None, None
+        self.data, self.ps, self.will_close = None, None, True
+        self.request = (soapdata, url, soapaction, headers, kw)
+        try:
+            # Headers and body in one segment, else Nagle holds the body
+            # back until the server acks the headers.
+            self.h.endheaders(soapdata)
+        except socket.error, ex:
+            # Idle keep-alive connection was closed by the server.
+            if not self.reused or \
+                getattr(ex, 'errno', None) not in (errno.EPIPE, errno.ECONNRESET):
+                raise
+            self.__reconnect()
+            self.SendSOAPData(soapdata, url, soapaction, headers, **kw)
 
     def SendSOAPDataHTTPDigestAuth(self, response, soapdata, url, request_uri, soapaction, **kw):
         '''Resend the initial request w/http digest authorization headers.
@@ -367,10 +586,23 @@ class _Binding:
     def ReceiveRaw(self, **kw):
         '''Read a server reply, unconverted to any format and return it.
         '''
-        if self.data: return self.data
+        if self.data is not None: return self.data
         trace = self.trace
         while 1:
-            response = self.h.getresponse()
+            try:
+                response = self.h.getresponse()
+            except httplib.BadStatusLine, ex:
+                # Idle keep-alive connection was closed by the server
+                # before the request was read, so resend it.  Anything
+                # else, a timeout in particular, may come after the server
+                # acted on the request and is not retried.
+                if not self.reused or not _no_reply(ex): raise
+                self.__reconnect()
+                soapdata, url, soapaction, headers, kw = self.request
+                self.SendSOAPData(soapdata, url, soapaction, headers, **kw)
+                continue
+
+            self.will_close = response.will_close
             self.reply_code, self.reply_msg, self.reply_headers, self.data = \
                 response.status, response.reason, response.msg, response.read()
             if trace:
@@ -380,14 +612,20 @@ class _Binding:
                 print >>trace, "-------"
                 print >>trace, str(self.reply_headers)
                 print >>trace, self.data
-            saved = None
+            saved, cookies = None, []
             for d in response.msg.getallmatchingheaders('set-cookie'):
                 if d[0] in [ ' ', '\t' ]:
                     saved += d.strip()
                 else:
-                    if saved: self.cookies.load(saved)
+                    if saved: cookies.append(saved)
                     saved = d.strip()
-            if saved: self.cookies.load(saved)
+            if saved: cookies.append(saved)
+            if cookies:
+                self._cookielock.acquire()
+                try:
+                    for saved in cookies: self.cookies.load(saved)
+                finally:
+                    self._cookielock.release()
             if response.status == 401:
                 if not callable(self.http_callbacks.get(response.status,None)):
                     raise RuntimeError, 'HTTP Digest Authorization Failed'
@@ -399,6 +637,8 @@ class _Binding:
             # Horrible internals hack to patch things up.
             self.h._HTTPConnection__state = httplib._CS_REQ_SENT
             self.h._HTTPConnection__response = None
+
+        self.__release()
         return self.data
 
     def IsSOAP(self):
@@ -530,9 +770,12 @@ class Binding(_Binding):
         ''' 
         self.ReceiveSOAP(**kw)
         ps = self.ps
+        if self.typesmodule is None:
+            return _Binding.Receive(self, replytype, **kw)
+
         tp = _find_type(ps.body_root)
         isarray = ((type(tp) in (tuple,list) and tp[1] == 'Array') or _find_arraytype(ps.body_root))
-        if self.typesmodule is None or isarray:
+        if isarray:
             return _Binding.Receive(self, replytype, **kw)
 
         if ps.IsAFault():
@@ -40,6 +40,15 @@ def SetPyclassMetaclass(option, opt, value, parser, *args, **kwargs):
 def SetUpLazyEvaluation(option, opt, value, parser, *args, **kwargs):
     from pyremotevbox.ZSI.generate.containers import TypecodeContainerBase
     TypecodeContainerBase.lazy = True
+
+def SetTypecodeOverrides(option, opt, value, parser, *args, **kwargs):
+    """load TYPECODE_OVERRIDES, a list of (element name, local element name,
+    typecode class, extra keyword arguments), from the python file value"""
+    from pyremotevbox.ZSI.generate.containers import TypecodeContainerBase
+    d = {}
+    execfile(value, d)
+    for element, local, klass, extra in d['TYPECODE_OVERRIDES']:
+        TypecodeContainerBase.overrides[(element, local)] = (klass, extra)
     
 
 
@@ -93,6 +102,12 @@ def wsdl2py(args=None):
                   callback_kwargs={},
                   help="EXPERIMENTAL: recursion error solution, lazy evalution of typecodes")
     
+    # Typecodes the schema can not express
+    op.add_option("-t", "--typecode-overrides",
+                  action="callback", callback=SetTypecodeOverrides,
+                  type="string",
+                  help="python file listing TYPECODE_OVERRIDES, typecodes to use for local elements in place of the generated ones")
+
     # Use Twisted
     op.add_option("-w", "--twisted",
                   action="store_true", dest='twisted', default=False,
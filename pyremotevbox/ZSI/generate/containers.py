@@ -307,7 +307,7 @@ class ServiceHeaderContainer(ServiceContainerBase):
     imports = ['\nimport urlparse, types',
               'from pyremotevbox.ZSI.TCcompound import ComplexType, Struct',
               'from pyremotevbox.ZSI import client',
-              'from pyremotevbox.ZSI.schema import GED, GTD',
+              'from pyremotevbox.ZSI.schema import GED, GTD, LazyPyclass',
               'import ZSI'
               ]
     logger = _GetLogger("ServiceHeaderContainer")
@@ -921,7 +921,8 @@ class ServiceDocumentLiteralMessageContainer(ServiceContainerBase,
 #        
         # These messsages are just global element declarations
 #        self.writeArray(['%(message)s = %(prefix)s.%(typecode)s().pyclass' %kw])
-        self.writeArray(['%(message)s = GED("%(nsuri)s", "%(name)s").pyclass' %kw])
+        # Message typecodes are built on first use, see LazyPyclass.
+        self.writeArray(['%(message)s = LazyPyclass("%(nsuri)s", "%(name)s")' %kw])
 
 class ServiceRPCEncodedMessageContainer(ServiceContainerBase, MessageContainerInterface):
     logger = _GetLogger("ServiceRPCEncodedMessageContainer")
@@ -1169,11 +1170,15 @@ class TypecodeContainerBase(TypesContainerBase):
         mixed_content_aname -- text content will be placed in this attribute.
         attributes_aname -- attributes will be placed in this attribute.
         metaclass -- set this attribute to specify a pyclass __metaclass__
+        overrides -- dict of (element name, local element name) to
+            (typecode class, extra keyword arguments), replacing the
+            typecode generated for that local element.
     '''
     mixed_content_aname = 'text'
     attributes_aname = 'attrs'
     metaclass = None
     lazy = False
+    overrides = {}
     logger = _GetLogger("TypecodeContainerBase")
 
     def __init__(self, do_extended=False, extPyClasses=None):
@@ -1665,8 +1670,19 @@ class TypecodeContainerBase(TypesContainerBase):
             else:
                 raise ContainerError, 'unexpected item: %s' % c.getItemTrace()
 
+            self._overrideTypecode(tc)
             self.tcListElements.append(tc)
 
+    def _overrideTypecode(self, tc):
+        '''Replace the typecode class of tc, a local element, if overrides
+        lists it.
+        '''
+        override = TypecodeContainerBase.overrides.get((self.name, tc.name))
+        if override is not None:
+            tc.klass, extra = override
+            tc.global_type = None
+            tc.extra = extra
+
     def getTypecodeList(self):
         if not self.tcListSet:
 #            self._flattenContent()
@@ -1834,6 +1850,7 @@ class TcListComponentContainer(ContainerBase):
         self.name = None
         self.klass = None
         self.global_type = None
+        self.extra = None
         
         self.min = None
         self.max = None
@@ -1896,6 +1913,8 @@ class TcListComponentContainer(ContainerBase):
               'lazy':TypecodeContainerBase.lazy,
               'typed':'typed=False',
               'encoded':'encoded=kw.get("encoded")'}
+        if self.extra:
+            kw['typed'] += ', ' + self.extra
         
         gt = self.global_type
         if gt is not None:
@@ -4,13 +4,17 @@
 '''
 
 from xml.dom import expatbuilder
+from xml.parsers import expat
 from pyremotevbox.ZSI import _copyright, _children, _attrs, _child_elements, _stringtypes, \
         _backtrace, EvaluateException, ParseException, _valid_encoding, \
         _Node, _find_attr, _resolve_prefix
-from pyremotevbox.ZSI.TC import AnyElement
-import types
+from pyremotevbox.ZSI.TC import AnyElement, Base64Binary, Boolean, Integer, Nilled, \
+        SimpleType, String, _ignored
+from pyremotevbox.ZSI.TCcompound import ComplexType
+from pyremotevbox.ZSI.schema import ElementDeclaration
+import binascii, types
 
-from pyremotevbox.ZSI.wstools.Namespaces import SOAP, XMLNS
+from pyremotevbox.ZSI.wstools.Namespaces import SCHEMA, SOAP, XMLNS
 from pyremotevbox.ZSI.wstools.Utility import SplitQName
 
 _find_actor = lambda E: E.getAttributeNS(SOAP.ENV, "actor") or None
@@ -23,6 +27,315 @@ class DefaultReader:
     fromString = staticmethod(expatbuilder.parseString)
     fromStream = staticmethod(expatbuilder.parse)
 
+
+class _StopScan(Exception):
+    '''Raised by a StreamingReader handler to stop expat early.
+    '''
+
+class _Unsupported(Exception):
+    '''Raised when a message can not be parsed without a DOM.
+    '''
+
+
+class _Base64Content:
+    '''Base64 character data of one element, decoded into a bytearray
+    as expat hands it over, so the text is never joined.
+    '''
+    whitespace = ' \t\r\n'
+
+    def __init__(self):
+        self.data = bytearray()
+        self.rest = ''
+
+    def __nonzero__(self):
+        return bool(self.data or self.rest)
+
+    def append(self, text):
+        if type(text) is types.UnicodeType:
+            text = text.encode('ascii')
+        text = self.rest + text.translate(None, self.whitespace)
+        n = len(text) & ~3
+        self.data.extend(binascii.a2b_base64(text[:n]))
+        self.rest = text[n:]
+
+    def value(self):
+        if self.rest:
+            self.data.extend(binascii.a2b_base64(self.rest))
+            self.rest = ''
+        return self.data
+
+
+class _StreamingParser:
+    '''Parse the body root of a document/literal message into the pyclass
+    of a typecode, straight from expat events.  Handles ComplexType 
+    content made of String, Integer, Boolean and Base64Binary elements, 
+    and of nested ComplexTypes, with the same results as their parse 
+    methods.
+
+    class variables:
+        cache -- dict of typecode to (ofwhat, dict of localName to 
+            typecode), or None if the typecode can not be streamed.
+    '''
+    cache = {}
+    nil_attrs = [ '%s nil' %ns for ns in (SCHEMA.XSI3, SCHEMA.XSI1, SCHEMA.XSI2) ] + \
+        [ '%s null' %ns for ns in (SCHEMA.XSI3, SCHEMA.XSI1, SCHEMA.XSI2) ]
+    unsupported_attrs = [ 'href' ] + \
+        [ '%s type' %ns for ns in (SCHEMA.XSI3, SCHEMA.XSI1, SCHEMA.XSI2) ]
+    simple_parsers = [
+        (SimpleType.parse.im_func, String.text_to_data.im_func),
+        (Integer.parse.im_func, Integer.text_to_data.im_func),
+        (Boolean.parse.im_func, Boolean.text_to_data.im_func),
+        (SimpleType.parse.im_func, Base64Binary.text_to_data.im_func),
+    ]
+
+    def supports(cls, tc):
+        '''Return True if tc can be parsed by _StreamingParser.
+        '''
+        if cls.cache.has_key(tc):
+            return cls.cache[tc] is not None
+
+        cls.cache[tc] = None
+        if tc.attribute_typecode_dict:
+            return False
+
+        klass = tc.__class__
+        if isinstance(tc, ComplexType):
+            if klass.parse.im_func is not ComplexType.parse.im_func or \
+                tc.mixed or tc.inorder:
+                return False
+            ofwhat, children = [], {}
+            for what in tc.ofwhat:
+                if callable(what): what = what()
+                if isinstance(what, (AnyElement, ElementDeclaration)) or \
+                    children.has_key(what.pname) or not cls.supports(what):
+                    return False
+                ofwhat.append(what)
+                children[what.pname] = what
+            cls.cache[tc] = (ofwhat, children)
+            return True
+
+        if (klass.parse.im_func, klass.text_to_data.im_func) in cls.simple_parsers:
+            if isinstance(tc, Base64Binary) and \
+                tc.pyclass not in (None, bytearray):
+                return False
+            cls.cache[tc] = ((), {})
+            return True
+        return False
+    supports = classmethod(supports)
+
+    def __init__(self, tc, ps):
+        self.tc, self.ps = tc, ps
+        self.depth = 0
+        self.path = []
+        self.stack = []
+        self.done = False
+        self.result = None
+
+    def parse(self, input):
+        '''Parse input, return the python object.
+        '''
+        p = expat.ParserCreate(namespace_separator=' ')
+        p.buffer_text = True
+        p.StartElementHandler = self.start
+        p.EndElementHandler = self.end
+        p.CharacterDataHandler = self.characters
+        p.Parse(input, 1)
+        return self.result
+
+    def backtrace(self):
+        return '/' + '/'.join(self.path)
+
+    def start(self, name, attrs):
+        self.depth += 1
+        nsuri, localName = self.split(name)
+        self.path.append(localName)
+        if self.depth < 3:
+            return
+
+        # frame: [typecode, content, nil], content is None when skipped.
+        if self.depth == 3:
+            if self.done:
+                raise _Unsupported, 'multiple body elements'
+            what = self.tc
+            if not self.name_match(what, nsuri, localName):
+                raise EvaluateException('Element Name mismatch (got %s wanted %s)' % \
+                    (localName, what.pname), self.backtrace())
+        else:
+            parent = self.stack[-1]
+            if parent[1] is None:
+                self.stack.append([None, None, False])
+                return
+            if not isinstance(parent[0], ComplexType):
+                raise EvaluateException('Sub-elements in value', 
+                    self.backtrace())
+            what = self.cache[parent[0]][1].get(localName)
+            if what is None or not self.name_match(what, nsuri, localName) \
+                or (parent[1].has_key(what.aname) and not what.maxOccurs > 1):
+                self.stack.append([None, None, False])
+                return
+
+        nil = False
+        if attrs:
+            for attr in self.unsupported_attrs:
+                if attrs.has_key(attr):
+                    raise _Unsupported, 'attribute %s' %attr
+            for attr in self.nil_attrs:
+                if attrs.get(attr) in [ 'true', '1' ]:
+                    nil = True
+            if nil and what.nillable is False:
+                raise EvaluateException('Non-nillable element is NIL',
+                    self.backtrace())
+
+        if isinstance(what, ComplexType):
+            self.stack.append([what, {}, nil])
+        elif isinstance(what, Base64Binary):
+            self.stack.append([what, _Base64Content(), nil])
+        else:
+            self.stack.append([what, [], nil])
+
+    def characters(self, data):
+        if self.stack:
+            content = self.stack[-1][1]
+            if type(content) is list or isinstance(content, _Base64Content):
+                content.append(data)
+
+    def end(self, name):
+        self.depth -= 1
+        if self.depth < 2:
+            self.path.pop()
+            return
+
+        what, content, nil = self.stack.pop()
+        if content is None:
+            self.path.pop()
+            return
+        if nil:
+            value = Nilled
+        elif isinstance(what, ComplexType):
+            value = self.complex_value(what, content)
+        else:
+            value = self.simple_value(what, content)
+        self.path.pop()
+
+        if not self.stack:
+            self.result, self.done = value, True
+        elif what.maxOccurs > 1:
+            self.stack[-1][1].setdefault(what.aname, []).append(value)
+        else:
+            self.stack[-1][1][what.aname] = value
+
+    def simple_value(self, what, content):
+        # ParsedSoap.Backtrace(self) gives the backtrace, if needed.
+        elt = self
+        if isinstance(what, Integer):
+            if not content:
+                if what.minOccurs is 0: return None
+                raise EvaluateException('Requiredinteger missing', 
+                    self.backtrace())
+            v = what.text_to_data(''.join(content), elt, self.ps)
+            (rmin, rmax) = Integer.ranges.get(what.type[1], (_ignored, _ignored))
+            if rmin != _ignored and v < rmin:
+                raise EvaluateException('Underflow, less than ' + repr(rmin), 
+                    self.backtrace())
+            if rmax != _ignored and v > rmax:
+                raise EvaluateException('Overflow, greater than ' + repr(rmax),
+                    self.backtrace())
+            return v
+        if isinstance(what, Boolean):
+            if not content:
+                if what.minOccurs is 0: return None
+                raise EvaluateException('Requiredboolean missing', 
+                    self.backtrace())
+            return what.text_to_data(''.join(content).lower(), elt, self.ps)
+        if isinstance(content, _Base64Content):
+            # Bad base64 raises binascii.Error, as text_to_data does.
+            data = content.value()
+            if what.pyclass is None:
+                return str(data)
+            return data
+        if not content:
+            return what.text_to_data(what.empty_content, elt, self.ps)
+        return what.text_to_data(''.join(content), elt, self.ps)
+
+    def complex_value(self, what, v):
+        for c in self.cache[what][0]:
+            if v.has_key(c.aname): 
+                continue
+            if hasattr(c, 'default'):
+                v[c.aname] = c.default
+            elif c.minOccurs > 0:
+                raise EvaluateException('Element "' + c.aname + \
+                    '" missing from complexType', self.backtrace())
+
+        if not what.pyclass:
+            return v
+        try:
+            pyobj = what.pyclass()
+        except Exception, e:
+            raise TypeError("Constructing element (%s,%s) with pyclass(%s), %s" \
+                %(what.nspname, what.pname, what.pyclass.__name__, str(e)))
+        for key in v.keys():
+            setattr(pyobj, key, v[key])
+        return pyobj
+
+    def name_match(what, namespaceURI, localName):
+        '''Same as TypeCode.name_match, without an element.
+        '''
+        return what.pname == localName and \
+            what.nspname in [None, '', namespaceURI]
+    name_match = staticmethod(name_match)
+
+    def split(name):
+        i = name.find(' ')
+        if i == -1: return None, name
+        return name[:i], name[i+1:]
+    split = staticmethod(split)
+
+
+class StreamingReader:
+    '''Reader that does not build a DOM.  A message whose Body holds a 
+    single element, and no Header or Fault, is parsed by ParsedSoap.Parse 
+    straight from expat events into the typecode's pyclass.  Any other 
+    message, or one the typecode can not be streamed for, is parsed with 
+    the DOM reader instead.  Not for use with signatures or WS-Addressing.
+    '''
+    streaming = True
+    chunksize = 2048
+
+    def scan(self, input):
+        '''Return True if the start of input is a SOAP Envelope whose
+        first child is the Body, whose first child is not a Fault.
+        '''
+        names = []
+        def start(name, attrs):
+            names.append(name)
+            if len(names) == 3: raise _StopScan
+        p = expat.ParserCreate(namespace_separator=' ')
+        p.StartElementHandler = start
+        try:
+            for i in range(0, len(input), self.chunksize):
+                p.Parse(input[i:i+self.chunksize], 0)
+            p.Parse('', 1)
+        except _StopScan:
+            pass
+        except expat.ExpatError:
+            return False
+        return len(names) == 3 and \
+            names[0] == '%s Envelope' %SOAP.ENV and \
+            names[1] == '%s Body' %SOAP.ENV and \
+            names[2] != '%s Fault' %SOAP.ENV
+
+    def parse(self, input, tc, ps):
+        '''Parse input into the python object described by tc.
+        '''
+        if not _StreamingParser.supports(tc):
+            raise _Unsupported, 'typecode %s' %tc
+        return _StreamingParser(tc, ps).parse(input)
+
+    def releaseNode(self, node):
+        pass
+
+
 class ParsedSoap:
     '''A Parsed SOAP object.
         Convert the text to a DOM tree and parse SOAP elements.
@@ -56,8 +369,23 @@ class ParsedSoap:
         if not self.readerclass:
             self.readerclass = self.defaultReaderClass
 
-        try:
+        self.reader = self.readerclass()
+        if getattr(self.reader, 'streaming', False):
+            if type(input) not in _stringtypes: 
+                input = input.read()
+            if envelope and self.reader.scan(input):
+                # Body is parsed later, in Parse, without a DOM.
+                self.input, self.dom = input, None
+                self.trailers, self.resolver = trailers, resolver
+                self.ns_cache, self.id_cache = {}, {}
+                self.header, self.header_elements = None, []
+                self.body = self.body_root = None
+                self.data_elements = []
+                return
+            self.readerclass = self.defaultReaderClass
             self.reader = self.readerclass()
+
+        try:
             if type(input) in _stringtypes:
                 self.dom = self.reader.fromString(input)
             else:
@@ -236,6 +564,9 @@ class ParsedSoap:
         '''Return a human-readable "backtrace" from the document root to
         the specified element.
         '''
+        if self.dom is None:
+            # Streaming, elt is the _StreamingParser.
+            return elt.backtrace()
         return _backtrace(elt, self.dom)
 
     def FindLocalHREF(self, href, elt, headers=1):
@@ -323,6 +654,13 @@ class ParsedSoap:
         '''Parse the message.
         '''
         if type(how) == types.ClassType: how = how.typecode
+        if self.dom is None:
+            try:
+                return self.reader.parse(self.input, how, self)
+            except _Unsupported:
+                ParsedSoap.__init__(self, self.input, 
+                    readerclass=self.defaultReaderClass, keepdom=self.keepdom,
+                    trailers=self.trailers, resolver=self.resolver)
         return how.parse(self.body_root, self)
 
     def WhatMustIUnderstand(self):
@@ -63,6 +63,16 @@ GED = _get_global_element_declaration
 GTD = _get_type_definition
 
 
+def _get_global_element_pyclass(namespaceURI, name):
+    '''Return a stand-in for the pyclass of a global element declaration,
+    the typecode and pyclass are built on first use.  See _LazyPyclass.
+    '''
+    return _LazyPyclass(str(name), (object,), 
+        dict(nspname=namespaceURI, pname=name, _pyclass=None))
+
+LazyPyclass = _get_global_element_pyclass
+
+
 def WrapImmutable(pyobj, what):
     '''Wrap immutable instance so a typecode can be
     set, making it self-describing ie. serializable.
@@ -365,6 +375,37 @@ class _Mirage:
     __call__ = _hide_type
 
 
+class _LazyPyclass(type):
+    '''Metaclass of stand-ins for GED(namespaceURI, name).pyclass, so that 
+    generated modules need not instantiate a typecode for every message 
+    at import.  Calling the stand-in, isinstance/issubclass checks and 
+    class attribute access (eg. typecode) are all delegated to the 
+    pyclass, which is looked up the first time it is needed.
+    '''
+    def reveal(cls):
+        pyclass = cls._pyclass
+        if pyclass is None:
+            pyclass = cls._pyclass = GED(cls.nspname, cls.pname).pyclass
+        return pyclass
+
+    def __call__(cls, *args, **kw):
+        return cls.reveal()(*args, **kw)
+
+    def __getattr__(cls, name):
+        if name.startswith('__'):
+            raise AttributeError, name
+        return getattr(cls.reveal(), name)
+
+    def __instancecheck__(cls, instance):
+        return isinstance(instance, cls.reveal())
+
+    def __subclasscheck__(cls, subclass):
+        return subclass is cls or issubclass(subclass, cls.reveal())
+
+    def __repr__(cls):
+        return "<LazyPyclass GED %s>" %str((cls.nspname, cls.pname))
+
+
 class _GetPyobjWrapper:
     '''Get a python object that wraps data and typecode.  Used by
     <any> parse routine, so that typecode information discovered
@@ -10,6 +10,11 @@ from pyremotevbox.ZSI.wstools.Namespaces import XMLNS, SOAP, SCHEMA
 from pyremotevbox.ZSI.wstools.c14n import Canonicalize
 import types
 
+try:
+    from cStringIO import StringIO
+except ImportError:
+    from StringIO import StringIO
+
 _standard_ns = [ ('xml', XMLNS.XML), ('xmlns', XMLNS.BASE) ]
 
 _reserved_ns = {
@@ -24,6 +29,9 @@ class SoapWriter:
     '''SOAP output formatter.
        Instance Data:
            memo -- memory for id/href 
+           multiref -- track id/href multi-references?  Turn off for
+               document/literal, where every element is written out,
+               without id attributes.
            envelope -- add Envelope?
            encodingStyle -- 
            header -- add SOAP Header?
@@ -31,7 +39,7 @@ class SoapWriter:
     '''
 
     def __init__(self, envelope=True, encodingStyle=None, header=True, 
-    nsdict={}, outputclass=None, **kw):
+    nsdict={}, outputclass=None, multiref=True, **kw):
         '''Initialize.
         '''
         outputclass = outputclass or ElementProxy
@@ -39,7 +47,8 @@ class SoapWriter:
             raise TypeError, 'outputclass must subclass MessageInterface'
 
         self.dom, self.memo, self.nsdict= \
-            outputclass(self), [], nsdict
+            outputclass(self), {}, nsdict
+        self.multiref = multiref
         self.envelope = envelope
         self.encodingStyle = encodingStyle
         self.header = header
@@ -153,21 +162,20 @@ class SoapWriter:
 
     def Known(self, obj):
         '''Seen this object (known by its id()?  Return 1 if so,
-        otherwise add it to our memory and return 0.
+        otherwise add it to our memory and return 0.  Without multiref
+        nothing is remembered, always return 0.
         '''
+        if not self.multiref: return 0
         obj = _get_idstr(obj)
-        if obj in self.memo: return 1
-        self.memo.append(obj)
+        if self.memo.has_key(obj): return 1
+        self.memo[obj] = 1
         return 0
 
     def Forget(self, obj):
         '''Forget we've seen this object.
         '''
-        obj = _get_idstr(obj)
-        try:
-            self.memo.remove(obj)
-        except ValueError:
-            pass
+        if not self.multiref: return
+        self.memo.pop(_get_idstr(obj), None)
 
     def Backtrace(self, elt):
         '''Return a human-readable "backtrace" from the document root to
@@ -187,4 +195,140 @@ class SoapWriter:
         if not self.closed: self.close()
         
 
+def _escape_text(text):
+    '''Escape character data the way Canonicalize does.
+    '''
+    return text.replace('&', '&amp;').replace('<', '&lt;')\
+        .replace('>', '&gt;').replace('\r', '&#xD;')
+
+
+class ElementSerializer:
+    '''Serializes a pyobj of a document/literal global element declaration,
+    whose content is only simple elements, straight into a SOAP message
+    string.  The element's template is built once, from the typecode's 
+    ofwhat, and gives the same message SoapWriter would.  Use Get.
+
+    class variables:
+        cache -- dict of typecode to ElementSerializer, or None if the
+            typecode can not be compiled.
+    '''
+    cache = {}
+    envelope_start = '<SOAP-ENV:Envelope%s><SOAP-ENV:Header></SOAP-ENV:Header>'\
+        '<SOAP-ENV:Body xmlns:ns1="%%s"><ns1:%%s>' %''.join(
+            [ ' xmlns:%s="%s"' %i for i in sorted(_reserved_ns.items()) ])
+    envelope_end = '</ns1:%s></SOAP-ENV:Body></SOAP-ENV:Envelope>'
+
+    def Get(cls, typecode):
+        '''Return the ElementSerializer for typecode, or None if it can
+        not be compiled.
+        '''
+        try:
+            return cls.cache[typecode]
+        except KeyError:
+            pass
+        except TypeError:
+            return None
+
+        serializer = None
+        try:
+            serializer = cls(typecode)
+        except TypeError:
+            pass
+        cls.cache[typecode] = serializer
+        return serializer
+    Get = classmethod(Get)
+
+    def __init__(self, typecode):
+        '''Compile typecode, raise TypeError if it can not be compiled.
+        '''
+        from pyremotevbox.ZSI.TC import Base64Binary, Boolean, Integer, String
+        from pyremotevbox.ZSI.TCcompound import ComplexType
+        from pyremotevbox.ZSI.schema import ElementDeclaration
+
+        if not isinstance(typecode, ComplexType) or \
+            not isinstance(typecode, ElementDeclaration) or \
+            typecode.__class__.serialize.im_func is not ComplexType.serialize.im_func or \
+            typecode.__class__.cb.im_func is not ComplexType.cb.im_func or \
+            typecode.mixed or not typecode.inline or typecode.typed or \
+            typecode.attribute_typecode_dict or not typecode.nspname or \
+            not isinstance(typecode.pyclass, type):
+            raise TypeError, 'not a simple element declaration'
+
+        formatters = {
+            String.get_formatted_content.im_func: self._format_string,
+            Integer.get_formatted_content.im_func: self._format_integer,
+            Boolean.get_formatted_content.im_func: self._format_boolean,
+            Base64Binary.get_formatted_content.im_func: self._format_base64,
+        }
+        self.fields = []
+        for what in typecode.ofwhat:
+            if callable(what): what = what()
+            klass = what.__class__
+            format = formatters.get(klass.get_formatted_content.im_func)
+            if format is None or what.nspname or what.typed or \
+                not what.unique or what.nillable or what.attribute_typecode_dict or \
+                klass.serialize.im_func is not String.serialize.im_func:
+                raise TypeError, 'not a simple element: %s' %what
+            self.fields.append((what, format, '<%s>' %what.pname, 
+                '</%s>' %what.pname))
+
+        self.pyclass = typecode.pyclass
+        self.start = self.envelope_start %(typecode.nspname, typecode.pname)
+        self.end = self.envelope_end %typecode.pname
+
+    def _format_string(self, what, value):
+        if type(value) is types.UnicodeType:
+            value = value.encode('utf-8')
+        elif type(value) is not types.StringType:
+            value = str(value)
+        return _escape_text(value)
+
+    def _format_integer(self, what, value):
+        return what.format %value
+
+    def _format_boolean(self, what, value):
+        if value: return 'true'
+        return 'false'
+
+    def _format_base64(self, what, value):
+        return what.get_formatted_content(value)
+
+    def _simple(self, value):
+        '''Is value a plain value, rather than a self-describing one?
+        '''
+        return not hasattr(value, 'typecode') and not hasattr(value, '_attrs')
+
+    def serialize(self, pyobj):
+        '''Return the SOAP message for pyobj, or None if pyobj holds values
+        that must be serialized by SoapWriter.
+        '''
+        if type(pyobj) is not self.pyclass or \
+            pyobj.__dict__.has_key('typecode'):
+            return None
+
+        out = StringIO()
+        write = out.write
+        write(self.start)
+        for what, format, start, end in self.fields:
+            v = getattr(pyobj, what.aname, None)
+            if v is None:
+                if what.minOccurs == 0: continue
+                return None
+
+            if what.maxOccurs > 1:
+                if type(v) not in _seqtypes or len(v) < what.minOccurs or \
+                    (what.maxOccurs != 'unbounded' and len(v) > what.maxOccurs):
+                    return None
+            else:
+                v = (v,)
+            for v2 in v:
+                if v2 is None or not self._simple(v2):
+                    return None
+                write(start)
+                write(format(what, v2))
+                write(end)
+        write(self.end)
+        return out.getvalue()
+
+
 if __name__ == '__main__': print _copyright
@@ -3,7 +3,9 @@
 
 ident = "$Id: __init__.py 840 2004-12-07 15:54:53Z blunck2 $"
 
-import WSDLTools
+# WSDLTools (and with it XMLSchema) is only needed to read WSDL, eg. by 
+# the code generator, and is slow to import.  Import it explicitly with
+# "from pyremotevbox.ZSI.wstools import WSDLTools".
 import XMLname
 import logging
 
@@ -0,0 +1,249 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+
+import math
+import threading
+
+import exception
+
+from VirtualBox_client import IVirtualBox_getPerformanceCollectorRequestMsg
+from VirtualBox_client import IPerformanceCollector_setupMetricsRequestMsg
+from VirtualBox_client import IPerformanceCollector_queryMetricsDataRequestMsg
+
+# NumPy is optional, without it the ring buffers are plain lists.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class RingBuffer:
+
+    # The last size samples of one metric, oldest first.
+
+    def __init__(self, size):
+
+        self.size = size
+        self.count = 0
+        self.pos = 0
+        if numpy is not None:
+            self.data = numpy.zeros(size, dtype=float)
+        else:
+            self.data = [0.0] * size
+
+    def __len__(self):
+
+        return self.count
+
+    def extend(self, values):
+
+        n = len(values)
+        if not n:
+            return
+
+        if n >= self.size:
+            self.data[:] = values[n - self.size:]
+            self.pos = 0
+            self.count = self.size
+            return
+
+        end = self.pos + n
+        if end <= self.size:
+            self.data[self.pos:end] = values
+        else:
+            split = self.size - self.pos
+            self.data[self.pos:] = values[:split]
+            self.data[:end - self.size] = values[split:]
+        self.pos = end % self.size
+        self.count = min(self.count + n, self.size)
+
+    def values(self):
+
+        if self.count < self.size:
+            return self.data[:self.count]
+        if numpy is not None:
+            return numpy.concatenate((self.data[self.pos:],
+                                      self.data[:self.pos]))
+        return self.data[self.pos:] + self.data[:self.pos]
+
+    def _check(self):
+
+        if not self.count:
+            raise exception.PyRemoteVBoxException("No samples collected.")
+
+    def mean(self):
+
+        self._check()
+        samples = self.data[:self.count]
+        if numpy is not None:
+            return float(samples.mean())
+        return sum(samples) / float(self.count)
+
+    def max(self):
+
+        self._check()
+        samples = self.data[:self.count]
+        if numpy is not None:
+            return float(samples.max())
+        return max(samples)
+
+    def percentile(self, q):
+
+        # Linear interpolation between the closest ranks, as numpy does.
+        self._check()
+        samples = self.data[:self.count]
+        if numpy is not None:
+            return float(numpy.percentile(samples, q))
+
+        samples = sorted(samples)
+        k = (len(samples) - 1) * q / 100.0
+        lower = int(math.floor(k))
+        upper = int(math.ceil(k))
+        if lower == upper:
+            return samples[lower]
+        return samples[lower] + (samples[upper] - samples[lower]) * (k - lower)
+
+
+class MetricsCollector:
+
+    # Sets up VirtualBox performance metrics for a set of machines and
+    # keeps their samples, per (machine ref, metric name), in RingBuffers
+    # of size samples.  Each poll() is one queryMetricsData call.
+
+    def __init__(self, host, metric_names, vms, period=1, count=60,
+                 size=3600):
+
+        self.host = host
+        self.metric_names = list(metric_names)
+        self.objects = [getattr(vm, 'handle', vm) for vm in vms]
+        self.period = period
+        self.size = size
+        self.lock = threading.Lock()
+        self.buffers = {}
+        self.sequence = {}
+        self.stopped = threading.Event()
+        self.thread = None
+
+        req = IVirtualBox_getPerformanceCollectorRequestMsg()
+        req._this = host.handle
+        val = host.run_command('IVirtualBox_getPerformanceCollector', req)
+        self.handle = host.refs.track(val._returnval, scoped=False)
+
+        req = IPerformanceCollector_setupMetricsRequestMsg()
+        req._this = self.handle
+        req._metricNames = self.metric_names
+        req._objects = self.objects
+        req._period = period
+        req._count = count
+        val = host.run_command('IPerformanceCollector_setupMetrics', req)
+        host.refs.release([host.refs.track(ref, scoped=False)
+                           for ref in val._returnval or []])
+
+    def poll(self):
+
+        # Fetch the samples taken since the last poll, return how many.
+        req = IPerformanceCollector_queryMetricsDataRequestMsg()
+        req._this = self.handle
+        req._metricNames = self.metric_names
+        req._objects = self.objects
+        val = self.host.run_command('IPerformanceCollector_queryMetricsData',
+                                    req)
+
+        data = val._returnval or []
+        if numpy is not None:
+            data = numpy.asarray(data, dtype=float)
+
+        added = 0
+        self.lock.acquire()
+        try:
+            for name, obj, scale, first, index, length in zip(
+                    val._returnMetricNames or [], val._returnObjects or [],
+                    val._returnScales or [], val._returnSequenceNumbers or [],
+                    val._returnDataIndices or [],
+                    val._returnDataLengths or []):
+                key = (obj, name)
+                last = self.sequence.get(key, first - 1)
+                skip = max(0, min(length, last - first + 1))
+                if skip == length:
+                    continue
+                self.sequence[key] = first + length - 1
+
+                samples = data[index + skip:index + length]
+                if numpy is not None:
+                    samples = samples / (scale or 1)
+                else:
+                    samples = [float(v) / (scale or 1) for v in samples]
+
+                buf = self.buffers.get(key)
+                if buf is None:
+                    buf = self.buffers[key] = RingBuffer(self.size)
+                buf.extend(samples)
+                added += len(samples)
+        finally:
+            self.lock.release()
+        return added
+
+    def start(self, interval=None):
+
+        # Poll every interval seconds, the metrics' period by default, in
+        # a daemon thread.  Failed polls are retried at the next tick.
+        interval = interval or self.period
+
+        def run():
+            while not self.stopped.wait(interval):
+                try:
+                    self.poll()
+                except exception.PyRemoteVBoxException:
+                    pass
+
+        self.stopped.clear()
+        self.thread = threading.Thread(target=run)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def close(self):
+
+        self.stop()
+        self.host.refs.release([self.handle])
+
+    def buffer(self, vm, metric_name):
+
+        key = (getattr(vm, 'handle', vm), metric_name)
+        self.lock.acquire()
+        try:
+            buf = self.buffers.get(key)
+        finally:
+            self.lock.release()
+        if buf is None:
+            raise exception.PyRemoteVBoxException(
+                "No samples of %s for %s." % (metric_name, key[0]))
+        return buf
+
+    def mean(self, vm, metric_name):
+
+        return self.buffer(vm, metric_name).mean()
+
+    def max(self, vm, metric_name):
+
+        return self.buffer(vm, metric_name).max()
+
+    def percentile(self, vm, metric_name, q):
+
+        return self.buffer(vm, metric_name).percentile(q)
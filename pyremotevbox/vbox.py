@@ -11,13 +11,29 @@
 # under the License.
 
 
-import exception
+import Queue
+import collections
+import contextlib
+import functools
+import hashlib
+import itertools
+import sys
+import threading
 import time
 
+import exception
+
+from metrics import MetricsCollector
+from pyremotevbox.ZSI import FaultException
+from pyremotevbox.ZSI.parse import StreamingReader
 from VirtualBox_client import vboxServiceLocator
 from VirtualBox_client import IWebsessionManager_logonRequestMsg
 from VirtualBox_client import IVirtualBox_getVersionRequestMsg
 from VirtualBox_client import IVirtualBox_findMachineRequestMsg
+from VirtualBox_client import IVirtualBox_getMachinesRequestMsg
+from VirtualBox_client import IMachine_getNameRequestMsg
+from VirtualBox_client import IMachine_getIdRequestMsg
+from VirtualBox_client import IMachine_getSessionStateRequestMsg
 from VirtualBox_client import IWebsessionManager_getSessionObjectRequestMsg
 from VirtualBox_client import IMachine_launchVMProcessRequestMsg
 from VirtualBox_client import ISession_getConsoleRequestMsg
@@ -30,13 +46,58 @@ from VirtualBox_client import IMachine_getBootOrderRequestMsg
 from VirtualBox_client import IMachine_setBootOrderRequestMsg
 from VirtualBox_client import ISession_getMachineRequestMsg
 from VirtualBox_client import IMachine_saveSettingsRequestMsg
+from VirtualBox_client import IMachine_discardSettingsRequestMsg
 from VirtualBox_client import IMachine_attachDeviceRequestMsg
 from VirtualBox_client import IMachine_detachDeviceRequestMsg
 from VirtualBox_client import IVirtualBox_openMediumRequestMsg
 from VirtualBox_client import IMachine_getFirmwareTypeRequestMsg
 from VirtualBox_client import IMachine_setFirmwareTypeRequestMsg
 from VirtualBox_client import IMachine_getMediumRequestMsg
+from VirtualBox_client import IMachine_queryLogFilenameRequestMsg
+from VirtualBox_client import IMachine_readLogRequestMsg
 from VirtualBox_client import IMedium_getLocationRequestMsg
+from VirtualBox_client import IProgress_waitForCompletionRequestMsg
+from VirtualBox_client import IProgress_getCompletedRequestMsg
+from VirtualBox_client import IProgress_getResultCodeRequestMsg
+from VirtualBox_client import IProgress_getErrorInfoRequestMsg
+from VirtualBox_client import IVirtualBoxErrorInfo_getTextRequestMsg
+from VirtualBox_client import IVirtualBox_getEventSourceRequestMsg
+from VirtualBox_client import IEventSource_createListenerRequestMsg
+from VirtualBox_client import IEventSource_registerListenerRequestMsg
+from VirtualBox_client import IEventSource_unregisterListenerRequestMsg
+from VirtualBox_client import IEventSource_getEventRequestMsg
+from VirtualBox_client import IEventSource_eventProcessedRequestMsg
+from VirtualBox_client import IEvent_getTypeRequestMsg
+from VirtualBox_client import IMachineEvent_getMachineIdRequestMsg
+from VirtualBox_client import IMachineStateChangedEvent_getStateRequestMsg
+from VirtualBox_client import ISessionStateChangedEvent_getStateRequestMsg
+from VirtualBox_client import IMachineRegisteredEvent_getRegisteredRequestMsg
+from VirtualBox_client import IMachineDataChangedEvent_getTemporaryRequestMsg
+from VirtualBox_client import IConsole_getGuestRequestMsg
+from VirtualBox_client import IGuest_createSessionRequestMsg
+from VirtualBox_client import IGuestSession_waitForArrayRequestMsg
+from VirtualBox_client import IGuestSession_closeRequestMsg
+from VirtualBox_client import IGuestSession_fileOpenRequestMsg
+from VirtualBox_client import IFile_readAtRequestMsg
+from VirtualBox_client import IFile_writeAtRequestMsg
+from VirtualBox_client import IFile_closeRequestMsg
+from VirtualBox_client import IGuestSession_processCreateRequestMsg
+from VirtualBox_client import IProcess_waitForArrayRequestMsg
+from VirtualBox_client import IProcess_readRequestMsg
+from VirtualBox_client import IProcess_writeRequestMsg
+from VirtualBox_client import IProcess_getStatusRequestMsg
+from VirtualBox_client import IProcess_getExitCodeRequestMsg
+from VirtualBox_client import IProcess_terminateRequestMsg
+from VirtualBox_client import IConsole_getDisplayRequestMsg
+from VirtualBox_client import IDisplay_getScreenResolutionRequestMsg
+from VirtualBox_client import IDisplay_takeScreenShotToArrayRequestMsg
+from VirtualBox_client import IDisplay_takeScreenShotPNGToArrayRequestMsg
+
+# NumPy is optional, without it screenshots are plain bytearrays.
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 STATE_POWERED_OFF = 'PoweredOff'
@@ -57,6 +118,25 @@ ACCESS_READWRITE = 2
 FIRMWARE_BIOS = 'BIOS'
 FIRMWARE_EFI = 'EFI'
 
+EVENT_ANY = 'Any'
+EVENT_MACHINE_STATE_CHANGED = 'OnMachineStateChanged'
+EVENT_MACHINE_DATA_CHANGED = 'OnMachineDataChanged'
+EVENT_MACHINE_REGISTERED = 'OnMachineRegistered'
+EVENT_SESSION_STATE_CHANGED = 'OnSessionStateChanged'
+
+# Bytes per guest file read or write request.
+GUEST_FILE_CHUNK_SIZE = 1024 * 1024
+
+# Guest process handles, and bytes per output read.
+GUEST_STDIN = 0
+GUEST_STDOUT = 1
+GUEST_STDERR = 2
+GUEST_OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Bounds of the bytes per log read, see LogTail.
+LOG_CHUNK_MIN = 4 * 1024
+LOG_CHUNK_MAX = 1024 * 1024
+
 DEVICE_TO_CONTROLLER_MAP = {
                             DEVICE_DISK: 'SATA',
                             DEVICE_FLOPPY: 'SATA',
@@ -64,334 +144,2452 @@ DEVICE_TO_CONTROLLER_MAP = {
                            }
 
 
-class VirtualBoxHost:
+class ManagedObjectRefs:
 
-    def __init__(self, **kwargs):
+    # Keeps count of the managed object references vboxwebsrv handed out,
+    # so that they can be released instead of piling up in the server's
+    # object table until the websession ends.
 
-        host = kwargs.get('host', '10.0.2.2')
-        username = kwargs.get('username', '')
-        password = kwargs.get('password', '')
-        port = kwargs.get('port', 18083)
+    def __init__(self, host):
 
-        url = "http://%(host)s:%(port)s" % {'host': host, 'port': port}
+        self.host = host
+        self.lock = threading.Lock()
+        self.outstanding = {}
+        self.local = threading.local()
 
-        self.port = vboxServiceLocator().getvboxServicePort(url)
+    def __len__(self):
 
-        if not (host):
-            raise exception.InvalidInput("'host' is missing")
+        self.lock.acquire()
+        try:
+            return sum(self.outstanding.values())
+        finally:
+            self.lock.release()
 
-        req = IWebsessionManager_logonRequestMsg()
-        req._this = None
-        req._username = username
-        req._password = password
-        val = self.run_command('IWebsessionManager_logon', req)
+    def _scopes(self):
 
-        self.handle = val._returnval
+        try:
+            return self.local.scopes
+        except AttributeError:
+            self.local.scopes = []
+            return self.local.scopes
 
+    def __contains__(self, ref):
 
-    def run_command(self, command, request):
+        self.lock.acquire()
+        try:
+            return ref in self.outstanding
+        finally:
+            self.lock.release()
 
-        method = getattr(self.port, command)
+    def track(self, ref, scoped=True):
+
+        # An unscoped ref is only released by release() or its owner.
+        if not ref:
+            return ref
+
+        self.lock.acquire()
         try:
-            return method(request)
-        except Exception as e:
-            raise exception.PyRemoteVBoxException(e)
+            self.outstanding[ref] = self.outstanding.get(ref, 0) + 1
+        finally:
+            self.lock.release()
 
+        scopes = self._scopes()
+        if scoped and scopes:
+            scopes[-1].append(ref)
+        return ref
 
-    def get_version(self):
+    @contextlib.contextmanager
+    def scope(self):
 
-        req = IVirtualBox_getVersionRequestMsg()
-        req._this = self.handle
-        val = self.run_command('IVirtualBox_getVersion', req)
-        return val._returnval
+        # Refs tracked by this thread inside the block are released,
+        # all together and newest first, when the block exits.
+        refs = []
+        scopes = self._scopes()
+        scopes.append(refs)
+        try:
+            yield refs
+        finally:
+            scopes.pop()
+            self.release(refs[::-1])
+
+    def release(self, refs=None):
+
+        # Release refs, or every outstanding ref.  vboxwebsrv hands out
+        # the same ref for the same object, so a ref tracked more than
+        # once is only released on the server when its last use ends.
+        # Refs already released are skipped, and a ref vboxwebsrv no
+        # longer knows is dropped all the same.
+        released = []
+        self.lock.acquire()
+        try:
+            if refs is None:
+                refs = []
+                for ref, count in self.outstanding.items():
+                    refs.extend([ref] * count)
+            for ref in refs:
+                count = self.outstanding.get(ref, 0)
+                if count > 1:
+                    self.outstanding[ref] = count - 1
+                elif count:
+                    del self.outstanding[ref]
+                    released.append(ref)
+        finally:
+            self.lock.release()
 
-    def find_vm(self, vmname):
+        for ref in released:
+            req = IManagedObjectRef_releaseRequestMsg()
+            req._this = ref
+            try:
+                self.host.run_command('IManagedObjectRef_release', req)
+            except exception.PyRemoteVBoxException:
+                pass
 
-        req = IVirtualBox_findMachineRequestMsg()
-        req._this = self.handle
-        req._nameOrId = vmname
-        val = self.run_command('IVirtualBox_findMachine', req)
-        return VirtualBoxVm(self, val._returnval)
 
-    def _open_medium(self, device_type, location):
+class SessionPool:
 
-        req = IVirtualBox_openMediumRequestMsg()
-        req._this = self.handle
-        req._location = location
-        req._deviceType = device_type
-        req._accessMode = ACCESS_READONLY
-        req._forceNewUuid = False
+    # Unlocked ISession refs, handed out for a lock and taken back once
+    # the machine is unlocked, saving a getSessionObject round trip per
+    # operation.
 
-        val = self.run_command('IVirtualBox_openMedium', req)
-        return val._returnval
+    def __init__(self, host, maxsize=4):
 
-    def _get_medium_location(self, medium_id):
+        self.host = host
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.idle = []
 
-        req = IMedium_getLocationRequestMsg()
-        req._this = medium_id
-        val = self.run_command('IMedium_getLocation', req)
-        return val._returnval
+    def get(self):
 
-class VirtualBoxVm:
+        self.lock.acquire()
+        try:
+            while self.idle:
+                session_id = self.idle.pop()
+                # Skip sessions released behind our back.
+                if session_id in self.host.refs:
+                    return session_id
+        finally:
+            self.lock.release()
 
-    def __init__(self, virtualboxhost, handle):
+        req = IWebsessionManager_getSessionObjectRequestMsg()
+        req._this = None
+        req._refIVirtualBox = self.host.handle
+        val = self.host.run_command('IWebsessionManager_getSessionObject', req)
+        return self.host.refs.track(val._returnval, scoped=False)
 
-        self.host = virtualboxhost
-        self.handle = handle
+    def put(self, session_id):
 
+        self.lock.acquire()
+        try:
+            if len(self.idle) < self.maxsize:
+                self.idle.append(session_id)
+                return
+        finally:
+            self.lock.release()
+        self.discard(session_id)
 
-    def get_power_status(self):
+    def discard(self, session_id):
 
-        req = IVirtualBox_getMachineStatesRequestMsg()
-        req._this = self.host.handle
-        req._machines = [self.handle]
-        val = self.host.run_command('IVirtualBox_getMachineStates', req)
-        state = val._returnval[0]
-        if state not in [STATE_POWERED_OFF, STATE_POWERED_ON]:
-            return STATE_ERROR
-        return state
+        # For sessions left in an unknown state.
+        self.host.refs.release([session_id])
 
+    def clear(self):
 
-    def get_boot_device(self, position=1):
+        self.lock.acquire()
+        try:
+            idle, self.idle = self.idle, []
+        finally:
+            self.lock.release()
+        self.host.refs.release(idle)
 
-        req = IMachine_getBootOrderRequestMsg()
-        req._this = self.handle
-        req._position = position
-        val = self.host.run_command('IMachine_getBootOrder', req)
-        return val._returnval
 
+class MachineCache:
 
-    def _get_session_id(self):
+    # Least recently used machine refs by name or UUID, each kept for at
+    # most ttl seconds.
 
-        req = IWebsessionManager_getSessionObjectRequestMsg()
-        req._this = None
-        req._refIVirtualBox = self.host.handle
-        val = self.host.run_command('IWebsessionManager_getSessionObject', req)
-        session_id = val._returnval
-        return session_id
+    def __init__(self, maxsize=128, ttl=60):
 
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
 
-    def _lock_machine(self, session_id, lock_type=LOCKTYPE_SHARED):
+    def __len__(self):
 
-        req = IMachine_lockMachineRequestMsg()
-        req._this = self.handle
-        req._session = session_id
-        req._lockType = lock_type
-        val = self.host.run_command('IMachine_lockMachine', req)
+        return len(self.entries)
 
+    def get(self, key):
 
-    def _get_mutable_machine(self, session_id):
+        self.lock.acquire()
+        try:
+            try:
+                handle, expires = self.entries.pop(key)
+            except KeyError:
+                return None
+            if self.ttl is not None and expires < time.time():
+                return None
+            self.entries[key] = (handle, expires)
+            return handle
+        finally:
+            self.lock.release()
 
-        # Lock machine
-        self._lock_machine(session_id, LOCKTYPE_WRITE)
+    def put(self, key, handle):
 
-        # Get mutable machine
-        req = ISession_getMachineRequestMsg()
-        req._this = session_id
-        val = self.host.run_command('ISession_getMachine', req)
-        mutable_machine_id = val._returnval
-        return mutable_machine_id
+        if not self.maxsize:
+            return
 
+        expires = None
+        if self.ttl is not None:
+            expires = time.time() + self.ttl
 
-    def _save_settings(self, mutable_machine_id):
+        self.lock.acquire()
+        try:
+            self.entries.pop(key, None)
+            self.entries[key] = (handle, expires)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        finally:
+            self.lock.release()
 
-        req = IMachine_saveSettingsRequestMsg()
-        req._this = mutable_machine_id
-        val = self.host.run_command('IMachine_saveSettings', req)
+    def invalidate(self, handle=None):
 
+        # Drop every entry for the machine ref handle, or all of them.
+        self.lock.acquire()
+        try:
+            if handle is None:
+                self.entries.clear()
+                return
+            for key, (cached, expires) in self.entries.items():
+                if cached == handle:
+                    del self.entries[key]
+        finally:
+            self.lock.release()
 
-    def _unlock_machine(self, session_id):
 
-        req = ISession_unlockMachineRequestMsg()
-        req._this = session_id
-        val = self.host.run_command('ISession_unlockMachine', req)
+class VirtualBoxEvent:
 
+    # An event off the vboxwebsrv event source.  Subclasses list the
+    # attributes to fetch as (name, command, request class).
+    attributes = []
 
-    def attach_device(self, device_type, location):
+    def __init__(self, event_type, **kwargs):
 
-        if self.get_power_status() == STATE_POWERED_ON:
-            raise exception.VmInWrongPowerState(operation='attach_device',
-                                                state='powered on')
+        self.type = event_type
+        self.__dict__.update(kwargs)
 
-        try:
-            self.detach_device(device_type)
-        except Exception:
-            pass
+    def __repr__(self):
 
-        # Get mutable machine
-        session_id = self._get_session_id()
+        return '<%s %r>' % (self.__class__.__name__, self.__dict__)
 
-        controller_name = DEVICE_TO_CONTROLLER_MAP[device_type]
-        medium_id = self.host._open_medium(device_type, location)
 
-        mutable_machine_id = self._get_mutable_machine(session_id)
-        try:
-            req = IMachine_attachDeviceRequestMsg()
-            req._this = mutable_machine_id
-            req._name = controller_name
-            req._controllerPort=0
-            req._device = 0
-            req._type = device_type
-            req._medium = medium_id
+class IMachineStateChangedEvent(VirtualBoxEvent):
 
-            val = self.host.run_command('IMachine_attachDevice', req)
+    attributes = [
+        ('machine_id', 'IMachineEvent_getMachineId',
+         IMachineEvent_getMachineIdRequestMsg),
+        ('state', 'IMachineStateChangedEvent_getState',
+         IMachineStateChangedEvent_getStateRequestMsg),
+    ]
 
-            # Save settings and unlock
-            self._save_settings(mutable_machine_id)
 
-        finally:
-            self._unlock_machine(session_id)
+class ISessionStateChangedEvent(VirtualBoxEvent):
 
+    attributes = [
+        ('machine_id', 'IMachineEvent_getMachineId',
+         IMachineEvent_getMachineIdRequestMsg),
+        ('state', 'ISessionStateChangedEvent_getState',
+         ISessionStateChangedEvent_getStateRequestMsg),
+    ]
 
-    def detach_device(self, device_type):
 
-        if self.get_power_status() == STATE_POWERED_ON:
-            raise exception.VmInWrongPowerState(operation='detach_device',
-                                                state='powered on')
+class IMachineRegisteredEvent(VirtualBoxEvent):
 
-        session_id = self._get_session_id()
+    attributes = [
+        ('machine_id', 'IMachineEvent_getMachineId',
+         IMachineEvent_getMachineIdRequestMsg),
+        ('registered', 'IMachineRegisteredEvent_getRegistered',
+         IMachineRegisteredEvent_getRegisteredRequestMsg),
+    ]
 
-        controller_name = DEVICE_TO_CONTROLLER_MAP[device_type]
 
-        mutable_machine_id = self._get_mutable_machine(session_id)
-        try:
-            req = IMachine_detachDeviceRequestMsg()
-            req._this = mutable_machine_id
-            req._name = controller_name
-            req._controllerPort=0
-            req._device = 0
-            req._type = device_type
+class IMachineDataChangedEvent(VirtualBoxEvent):
+
+    attributes = [
+        ('machine_id', 'IMachineEvent_getMachineId',
+         IMachineEvent_getMachineIdRequestMsg),
+        ('temporary', 'IMachineDataChangedEvent_getTemporary',
+         IMachineDataChangedEvent_getTemporaryRequestMsg),
+    ]
+
+
+EVENT_CLASSES = {
+    EVENT_MACHINE_STATE_CHANGED: IMachineStateChangedEvent,
+    EVENT_SESSION_STATE_CHANGED: ISessionStateChangedEvent,
+    EVENT_MACHINE_REGISTERED: IMachineRegisteredEvent,
+    EVENT_MACHINE_DATA_CHANGED: IMachineDataChangedEvent,
+}
+
+
+class MachineStateCache:
+
+    # A local mirror of every machine's state, session state and the
+    # given attributes (VirtualBoxVm getter names), seeded with one
+    # getMachineStates and kept current by a thread reading the host's
+    # events.  Entries are dicts keyed by machine ref.
+
+    event_types = [EVENT_MACHINE_STATE_CHANGED, EVENT_SESSION_STATE_CHANGED,
+                   EVENT_MACHINE_DATA_CHANGED, EVENT_MACHINE_REGISTERED]
+
+    def __init__(self, host, attributes=(), poll_interval=1, retry_interval=5):
+
+        self.host = host
+        self.attributes = list(attributes)
+        self.poll_interval = poll_interval
+        self.retry_interval = retry_interval
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.ids = {}
+        self.stopped = threading.Event()
+        self.seeded = threading.Event()
+        self.thread = None
 
-            val = self.host.run_command('IMachine_detachDevice', req)
+    def start(self):
 
-            # Save settings and unlock
-            self._save_settings(mutable_machine_id)
+        self.thread = threading.Thread(target=self._run)
+        self.thread.daemon = True
+        self.thread.start()
 
+    def stop(self):
+
+        self.stopped.set()
+        self.seeded.set()
+        if self.thread is not None and \
+                self.thread is not threading.current_thread():
+            self.thread.join()
+
+    def wait(self, timeout=None):
+
+        # Wait for the first seeding to be done.
+        self.seeded.wait(timeout)
+        return self.seeded.is_set()
+
+    def get(self, handle):
+
+        self.lock.acquire()
+        try:
+            entry = self.entries.get(handle)
+            return entry and dict(entry)
         finally:
-            self._unlock_machine(session_id)
+            self.lock.release()
 
+    def get_state(self, handle):
 
-    def get_attached_device(self, device_type):
+        self.lock.acquire()
+        try:
+            entry = self.entries.get(handle)
+            return entry and entry['state']
+        finally:
+            self.lock.release()
 
-        session_id = self._get_session_id()
+    def _run(self):
 
-        controller_name = DEVICE_TO_CONTROLLER_MAP[device_type]
+        while not self.stopped.is_set():
+            stream = self.host._event_stream(self.event_types, None,
+                                             self.poll_interval, self._seed)
+            try:
+                for event in stream:
+                    if self.stopped.is_set():
+                        break
+                    if event is not None:
+                        self._apply(event)
+            except Exception:
+                # vboxwebsrv is away; drop what may be stale and retry.
+                self.lock.acquire()
+                try:
+                    self.entries, self.ids = {}, {}
+                finally:
+                    self.lock.release()
+                self.stopped.wait(self.retry_interval)
+            finally:
+                stream.close()
+
+    def _describe(self, vm):
+
+        entry = {'id': vm.get_id(), 'session_state': vm.get_session_state()}
+        for name in self.attributes:
+            entry[name] = getattr(vm, name)()
+        return entry
+
+    def _seed(self):
+
+        vms = self.host.list_vms()
+        handles = [vm.handle for vm in vms]
+        states = self.host._query_machine_states(handles)
+        described = self.host.map(self._describe, vms)
+
+        entries, ids = {}, {}
+        for vm, state in zip(vms, states):
+            entry, error = described[vm]
+            if error is not None:
+                continue
+            entry['state'] = state
+            entries[vm.handle] = entry
+            ids[entry['id']] = vm.handle
+
+        self.lock.acquire()
+        try:
+            self.entries, self.ids = entries, ids
+        finally:
+            self.lock.release()
+        self.seeded.set()
 
-        req = IMachine_getMediumRequestMsg()
-        req._this = self.handle
-        req._name = controller_name
-        req._controllerPort=0
-        req._device = 0
+    def _apply(self, event):
 
-        val = None
+        # A fault while looking up the machine, say one unregistered again
+        # right after the event, only drops its entry.  Anything else, as
+        # vboxwebsrv going away, is left to _run.
+        machine_id = getattr(event, 'machine_id', None)
         try:
-            val = self.host.run_command('IMachine_getMedium', req)
+            self._apply_event(event, machine_id)
         except exception.PyRemoteVBoxException as e:
-            if 'No storage device attached' in str(e):
-                return None
+            if not _is_fault(e):
+                raise
+            self._forget(machine_id)
 
-        return self.host._get_medium_location(val._returnval)
+    def _apply_event(self, event, machine_id):
 
+        self.lock.acquire()
+        try:
+            handle = self.ids.get(machine_id)
+        finally:
+            self.lock.release()
+
+        if event.type == EVENT_MACHINE_REGISTERED:
+            if not event.registered:
+                self._forget(machine_id)
+                return
+            vm = self.host.find_vm(machine_id)
+            entry = self._describe(vm)
+            entry['state'] = self.host._query_machine_states([vm.handle])[0]
+            self.lock.acquire()
+            try:
+                self.entries[vm.handle] = entry
+                self.ids[entry['id']] = vm.handle
+            finally:
+                self.lock.release()
+            return
 
-    def set_boot_device(self, device, position=1):
+        if handle is None:
+            return
 
-        if self.get_power_status() == STATE_POWERED_ON:
-            raise exception.VmInWrongPowerState(operation='set_boot_device',
-                                                state='powered on')
+        if event.type == EVENT_MACHINE_DATA_CHANGED:
+            changes = {}
+            if self.attributes:
+                vm = VirtualBoxVm(self.host, handle)
+                for name in self.attributes:
+                    changes[name] = getattr(vm, name)()
+        elif event.type == EVENT_MACHINE_STATE_CHANGED:
+            changes = {'state': event.state}
+        elif event.type == EVENT_SESSION_STATE_CHANGED:
+            changes = {'session_state': event.state}
+        else:
+            return
 
-        # Get mutable machine
-        session_id = self._get_session_id()
-        mutable_machine_id = self._get_mutable_machine(session_id)
+        self.lock.acquire()
+        try:
+            entry = self.entries.get(handle)
+            if entry is not None:
+                entry.update(changes)
+        finally:
+            self.lock.release()
 
-        # Change boot order
-        req = IMachine_setBootOrderRequestMsg()
-        req._this = mutable_machine_id
-        req._position = position
-        req._device = device
-        val = self.host.run_command('IMachine_setBootOrder', req)
+    def _forget(self, machine_id):
 
-        # Save settings and unlock
-        self._save_settings(mutable_machine_id)
-        self._unlock_machine(session_id)
+        self.lock.acquire()
+        try:
+            handle = self.ids.pop(machine_id, None)
+            self.entries.pop(handle, None)
+        finally:
+            self.lock.release()
 
 
-    def get_firmware_type(self):
+class OperationFuture:
 
-        session_id = self._get_session_id()
+    # The pending result of an operation handed to VirtualBoxHost.submit.
 
-        req = IMachine_getFirmwareTypeRequestMsg()
-        req._this = self.handle
+    def __init__(self):
 
-        val = self.host.run_command('IMachine_getFirmwareType', req)
-        return val._returnval
+        self.finished = threading.Event()
+        self.lock = threading.Lock()
+        self.callbacks = []
+        self.value = None
+        self.error = None
 
+    def done(self):
 
-    def set_firmware_type(self, firmware_type):
+        return self.finished.is_set()
 
-        if self.get_power_status() == STATE_POWERED_ON:
-            raise exception.VmInWrongPowerState(operation='set_firmware_type',
-                                                state='powered on')
+    def _wait(self, timeout):
 
-        session_id = self._get_session_id()
+        if not self.finished.wait(timeout):
+            raise exception.PyRemoteVBoxException(
+                "Operation did not complete within %s seconds." % timeout)
+
+    def result(self, timeout=None):
+
+        self._wait(timeout)
+        if self.error is not None:
+            raise self.error
+        return self.value
 
-        mutable_machine_id = self._get_mutable_machine(session_id)
+    def exception(self, timeout=None):
+
+        self._wait(timeout)
+        return self.error
+
+    def add_done_callback(self, func):
+
+        # func(future) is called in the worker thread that finishes the
+        # operation, or right away if it is already done.
+        self.lock.acquire()
+        try:
+            if not self.finished.is_set():
+                self.callbacks.append(func)
+                return
+        finally:
+            self.lock.release()
+        func(self)
+
+    def _set(self, value, error):
+
+        self.lock.acquire()
         try:
-            req = IMachine_setFirmwareTypeRequestMsg()
-            req._this = mutable_machine_id
-            req._firmwareType = firmware_type
+            self.value = value
+            self.error = error
+            self.finished.set()
+            callbacks, self.callbacks = self.callbacks, []
+        finally:
+            self.lock.release()
+        for func in callbacks:
+            try:
+                func(self)
+            except Exception:
+                pass
+
+
+class WorkerPool:
+
+    # Daemon threads, started as needed up to max_workers, running the
+    # operations queued by submit.  Any number of operations can be
+    # pending without a thread each.  shutdown() ends the threads, which
+    # must be done before the interpreter exits.
+
+    def __init__(self, max_workers):
+
+        self.max_workers = max_workers
+        self.lock = threading.Lock()
+        self.queue = Queue.Queue()
+        self.threads = []
+        self.idle = 0
+        self.stopped = False
 
-            val = self.host.run_command('IMachine_setFirmwareType', req)
+    def submit(self, func, *args, **kwargs):
 
-            # Save settings and unlock
-            self._save_settings(mutable_machine_id)
+        future = OperationFuture()
 
+        # Idle threads may not have woken up for earlier submits yet, so
+        # compare them with the queue rather than starting none while
+        # any thread is idle.
+        self.lock.acquire()
+        try:
+            if self.stopped:
+                raise exception.PyRemoteVBoxException(
+                    "Operation submitted after shutdown.")
+            self.queue.put((future, func, args, kwargs))
+            if self.queue.qsize() > self.idle and \
+                    len(self.threads) < self.max_workers:
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                thread.start()
+                self.threads.append(thread)
         finally:
-            self._unlock_machine(session_id)
+            self.lock.release()
+        return future
 
+    def shutdown(self, wait=True):
 
-    def start(self, vm_type="gui"):
+        # Let the threads finish the operations already queued, then end
+        # them; with wait, return once they have ended.
+        self.lock.acquire()
+        try:
+            self.stopped = True
+            threads = list(self.threads)
+            for thread in threads:
+                self.queue.put(None)
+        finally:
+            self.lock.release()
+
+        if wait:
+            for thread in threads:
+                if thread is not threading.current_thread():
+                    thread.join()
+
+    def _work(self):
+
+        while True:
+            self.lock.acquire()
+            self.idle += 1
+            self.lock.release()
+            item = self.queue.get()
+            self.lock.acquire()
+            self.idle -= 1
+            self.lock.release()
+            if item is None:
+                return
+
+            future, func, args, kwargs = item
+            try:
+                value = func(*args, **kwargs)
+            except Exception as e:
+                future._set(None, e)
+            else:
+                future._set(value, None)
 
-        if self.get_power_status() == STATE_POWERED_ON:
-            return
 
-        session_id = self._get_session_id()
+def _run_concurrently(func, items, max_workers):
 
-        req = IMachine_launchVMProcessRequestMsg()
-        req._this = self.handle
-        req._type = vm_type
-        req._environment = ""
-        req._session = session_id
-        val=self.host.run_command('IMachine_launchVMProcess', req)
+    # Call func on each item, at most max_workers at a time, and return
+    # a (result, exception) pair for each item, in order.
+    results = [None] * len(items)
+    queue = Queue.Queue()
+    for i in range(len(items)):
+        queue.put(i)
 
-        for i in range(1, 10):
-            time.sleep(2)
+    def worker():
+        while True:
             try:
-                self._unlock_machine(session_id)
-                break
-            except Exception:
-                pass
-        else:
-            raise exception.PyRemoteVBoxException("Failed to unlock machine "
-                                                  "after 10 attempts.")
+                i = queue.get_nowait()
+            except Queue.Empty:
+                return
+            try:
+                results[i] = (func(items[i]), None)
+            except Exception as e:
+                results[i] = (None, e)
+
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        worker()
+    else:
+        threads = []
+        for i in range(workers):
+            thread = threading.Thread(target=worker)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+    return results
+
+
+def _run_pipelined(func, items, depth):
+
+    # Call func on each item, at most depth at a time, and yield the
+    # results in order.  Calls run no more than depth items ahead of the
+    # consumer, so a slow consumer holds them back instead of results
+    # piling up.  The first exception is raised in the consumer.  Once
+    # the generator ends or is closed, no call is left running.
+    items = iter(items)
+    if depth <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    lock = threading.Lock()
+    slots = threading.Semaphore(depth)
+    pending = Queue.Queue()
+    stopped = []
+
+    def worker():
+        while True:
+            slots.acquire()
+            lock.acquire()
+            try:
+                if stopped:
+                    return
+                try:
+                    item = next(items)
+                except StopIteration:
+                    stopped.append(True)
+                    pending.put(None)
+                    return
+                future = OperationFuture()
+                pending.put(future)
+            except Exception as e:
+                # items itself failed.
+                stopped.append(True)
+                future = OperationFuture()
+                future._set(None, e)
+                pending.put(future)
+                return
+            finally:
+                lock.release()
+            try:
+                value = func(item)
+            except Exception as e:
+                future._set(None, e)
+            else:
+                future._set(value, None)
+
+    threads = []
+    for i in range(depth):
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+        threads.append(thread)
+
+    try:
+        while True:
+            future = pending.get()
+            if future is None:
+                return
+            value = future.result()
+            slots.release()
+            yield value
+    finally:
+        # Calls still running must end before the caller goes on to close
+        # whatever they use.
+        lock.acquire()
+        stopped.append(True)
+        lock.release()
+        for thread in threads:
+            slots.release()
+        for thread in threads:
+            thread.join()
+
+
+def _is_fault(error):
+
+    # Did vboxwebsrv answer with a SOAP fault, rather than the call
+    # failing on the way there or back?
+    return bool(error.args) and isinstance(error.args[0], FaultException)
+
+
+def _releases_refs(func):
+
+    # Run a VirtualBoxVm method in a ref scope of its host.
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        with self.host.refs.scope():
+            return func(self, *args, **kwargs)
+    return wrapper
 
 
-    def stop(self):
+class VirtualBoxHost:
 
-        if self.get_power_status() == STATE_POWERED_OFF:
-            return
+    def __init__(self, **kwargs):
 
-        session_id = self._get_session_id()
-        self._lock_machine(session_id, LOCKTYPE_SHARED)
+        host = kwargs.get('host', '10.0.2.2')
+        username = kwargs.get('username', '')
+        password = kwargs.get('password', '')
+        port = kwargs.get('port', 18083)
 
-        req = ISession_getConsoleRequestMsg()
-        req._this = session_id
-        val = self.host.run_command('ISession_getConsole', req)
-        console_id = val._returnval
+        # Seconds to wait for a VirtualBox operation such as a power on
+        # or off to complete, None waits for ever.
+        self.timeout = kwargs.get('timeout', 300)
+
+        # A host may be shared by several threads, each call then uses its
+        # own connection out of the binding's connection pool.
+        threadsafe = kwargs.get('threadsafe', True)
+        self.threadsafe = threadsafe
 
-        req = IConsole_powerDownRequestMsg()
-        req._this = console_id
-        val = self.host.run_command('IConsole_powerDown', req)
+        # Default number of operations map() runs at once; vboxwebsrv
+        # serves a limited number of requests concurrently.
+        self.max_workers = kwargs.get('max_workers', 4)
 
-        # Give a while for VirtualBox to unlock the machine.
-        time.sleep(1)
+        # Runs the operations handed to submit, created on first use.
+        self.lock = threading.Lock()
+        self.executor = None
+
+        # Event-fed machine states, see start_state_cache.
+        self.state_cache = None
+
+        # Guest account a GuestSession logs on as, unless given.
+        self.guest_username = kwargs.get('guest_username', '')
+        self.guest_password = kwargs.get('guest_password', '')
+        self.guest_domain = kwargs.get('guest_domain', '')
+
+        # find_vm results, dropped when a call on the ref finds it stale.
+        self.machines = MachineCache(kwargs.get('vm_cache_size', 128),
+                                     kwargs.get('vm_cache_ttl', 60))
+
+        url = "http://%(host)s:%(port)s" % {'host': host, 'port': port}
+        self.url = url
+
+        # Replies are parsed without building a DOM where possible, and
+        # vboxwebsrv is document/literal, so requests need no id/href.
+        self.port = vboxServiceLocator().getvboxServicePort(
+            url, threadsafe=threadsafe, readerclass=StreamingReader,
+            multiref=False)
+        self.refs = ManagedObjectRefs(self)
+        self.sessions = SessionPool(self, kwargs.get('session_pool_size', 4))
+
+        if not (host):
+            raise exception.InvalidInput("'host' is missing")
+
+        req = IWebsessionManager_logonRequestMsg()
+        req._this = None
+        req._username = username
+        req._password = password
+        val = self.run_command('IWebsessionManager_logon', req)
+
+        self.handle = val._returnval
+
+
+    def run_command(self, command, request):
+
+        method = getattr(self.port, command)
+        try:
+            return method(request)
+        except Exception as e:
+            if 'Invalid managed object reference' in str(e):
+                # The stale ref may be the target or, as for
+                # getMachineStates, one of the machines passed in.
+                handles = [getattr(request, '_this', None)]
+                handles.extend(getattr(request, '_machines', None) or [])
+                for handle in handles:
+                    if handle:
+                        self.machines.invalidate(handle)
+            raise exception.PyRemoteVBoxException(e)
+
+
+    def get_version(self):
+
+        req = IVirtualBox_getVersionRequestMsg()
+        req._this = self.handle
+        val = self.run_command('IVirtualBox_getVersion', req)
+        return val._returnval
+
+    def find_vm(self, vmname):
+
+        handle = self.machines.get(vmname)
+        if handle is None:
+            req = IVirtualBox_findMachineRequestMsg()
+            req._this = self.handle
+            req._nameOrId = vmname
+            val = self.run_command('IVirtualBox_findMachine', req)
+            handle = val._returnval
+            self.machines.put(vmname, handle)
+        return VirtualBoxVm(self, handle)
+
+    def get_power_states(self, vms_or_names):
+
+        # VirtualBoxVm objects or vm names, all queried in one request.
+        vms_or_names = list(vms_or_names)
+        if not vms_or_names:
+            return {}
+
+        handles = []
+        for vm in vms_or_names:
+            if not isinstance(vm, VirtualBoxVm):
+                vm = self.find_vm(vm)
+            handles.append(vm.handle)
+
+        states = self._get_machine_states(handles)
+        return dict(zip(vms_or_names, states))
+
+    def map(self, operation, vms_or_names, max_workers=None, args=(),
+            kwargs=None):
+
+        # Run operation, a VirtualBoxVm method name or a callable taking
+        # the vm, over VirtualBoxVm objects and/or vm names, at most
+        # max_workers at a time.  Returns a dict from each of them to a
+        # (result, exception) pair, one of which is None.
+        items = list(vms_or_names)
+        kwargs = kwargs or {}
+        if max_workers is None:
+            max_workers = self.max_workers
+        if not self.threadsafe:
+            max_workers = 1
+
+        def run(vm):
+            return self._call_operation(operation, vm, args, kwargs)
+
+        return dict(zip(items, _run_concurrently(run, items, max_workers)))
+
+    def submit(self, operation, vm_or_name, args=(), kwargs=None):
+
+        # Queue operation, as for map, for one vm and return at once with
+        # an OperationFuture.  At most max_workers operations run at a
+        # time, however many are pending.
+        self.lock.acquire()
+        try:
+            if self.executor is None:
+                max_workers = self.max_workers
+                if not self.threadsafe:
+                    max_workers = 1
+                self.executor = WorkerPool(max_workers)
+        finally:
+            self.lock.release()
+
+        return self.executor.submit(self._call_operation, operation,
+                                    vm_or_name, args, kwargs or {})
+
+    def close(self):
+
+        # End the threads behind submit and the state cache, then close
+        # the idle connections to vboxwebsrv.  The websession stays
+        # logged on, so the host can still be used.
+        self.lock.acquire()
+        try:
+            executor, self.executor = self.executor, None
+        finally:
+            self.lock.release()
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        self.stop_state_cache()
+        self.port.binding.connpool.clear()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *exc_info):
+
+        self.close()
+
+    def _call_operation(self, operation, vm, args, kwargs):
+
+        if not isinstance(vm, VirtualBoxVm):
+            vm = self.find_vm(vm)
+        if callable(operation):
+            return operation(vm, *args, **kwargs)
+        return getattr(vm, operation)(*args, **kwargs)
+
+    def list_vms(self):
+
+        req = IVirtualBox_getMachinesRequestMsg()
+        req._this = self.handle
+        val = self.run_command('IVirtualBox_getMachines', req)
+        return [VirtualBoxVm(self, handle) for handle in val._returnval]
+
+    def _get_machine_states(self, handles):
+
+        states = []
+        for state in self._query_machine_states(handles):
+            if state not in [STATE_POWERED_OFF, STATE_POWERED_ON]:
+                state = STATE_ERROR
+            states.append(state)
+        return states
+
+    def _query_machine_states(self, handles):
+
+        req = IVirtualBox_getMachineStatesRequestMsg()
+        req._this = self.handle
+        req._machines = handles
+        val = self.run_command('IVirtualBox_getMachineStates', req)
+        return val._returnval
+
+    def collect_metrics(self, metric_names, vms_or_names, period=1, count=60,
+                        size=3600):
+
+        # Set up metric_names, e.g. 'Guest/CPU/Load/User', sampled every
+        # period seconds and kept count deep by VirtualBox, and return a
+        # MetricsCollector that keeps size samples of each locally.
+        vms = []
+        for vm in vms_or_names:
+            if not isinstance(vm, VirtualBoxVm):
+                vm = self.find_vm(vm)
+            vms.append(vm)
+        return MetricsCollector(self, metric_names, vms, period, count, size)
+
+    def start_state_cache(self, attributes=()):
+
+        # Mirror the state of every machine from events, see
+        # MachineStateCache; get_power_status then answers from it.
+        self.lock.acquire()
+        try:
+            if self.state_cache is None:
+                self.state_cache = MachineStateCache(self, attributes)
+                self.state_cache.start()
+            return self.state_cache
+        finally:
+            self.lock.release()
+
+    def stop_state_cache(self):
+
+        self.lock.acquire()
+        try:
+            state_cache, self.state_cache = self.state_cache, None
+        finally:
+            self.lock.release()
+        if state_cache is not None:
+            state_cache.stop()
+
+    def events(self, types=None, timeout=None, poll_interval=5):
+
+        # Yield VirtualBoxEvents of the given types, all by default, for
+        # timeout seconds or for ever.  A passive listener is registered
+        # for the generator's lifetime and re-registered if vboxwebsrv
+        # drops it.
+        for event in self._event_stream(types, timeout, poll_interval):
+            if event is not None:
+                yield event
+
+    def _event_stream(self, types, timeout, poll_interval, on_register=None):
+
+        # As events, but yields None after a poll that found nothing, and
+        # calls on_register() each time the listener is (re-)registered,
+        # as events may have been missed before that.
+        types = list(types or [EVENT_ANY])
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+
+        source_id = listener_id = None
+        try:
+            while True:
+                wait = poll_interval
+                if deadline is not None:
+                    wait = min(wait, deadline - time.time())
+                    if wait < 0:
+                        return
+
+                if listener_id is None:
+                    source_id, listener_id = self._register_listener(types)
+                    if on_register is not None:
+                        on_register()
+
+                req = IEventSource_getEventRequestMsg()
+                req._this = source_id
+                req._listener = listener_id
+                req._timeout = int(wait * 1000)
+                try:
+                    val = self.run_command('IEventSource_getEvent', req)
+                except exception.PyRemoteVBoxException as e:
+                    if 'Invalid managed object reference' not in str(e):
+                        raise
+                    # The listener timed out on the server, start over.
+                    self.refs.release([listener_id, source_id])
+                    source_id = listener_id = None
+                    continue
+
+                event_id = val._returnval
+                if not event_id:
+                    yield None
+                    continue
+
+                with self.refs.scope():
+                    self.refs.track(event_id)
+                    try:
+                        event = self._get_event(event_id)
+                    finally:
+                        req = IEventSource_eventProcessedRequestMsg()
+                        req._this = source_id
+                        req._listener = listener_id
+                        req._event = event_id
+                        self.run_command('IEventSource_eventProcessed', req)
+
+                if event.type == EVENT_MACHINE_REGISTERED:
+                    self.machines.invalidate()
+                yield event
+
+        finally:
+            if listener_id is not None:
+                req = IEventSource_unregisterListenerRequestMsg()
+                req._this = source_id
+                req._listener = listener_id
+                try:
+                    self.run_command('IEventSource_unregisterListener', req)
+                except exception.PyRemoteVBoxException:
+                    pass
+                self.refs.release([listener_id, source_id])
+
+    def _register_listener(self, types):
+
+        req = IVirtualBox_getEventSourceRequestMsg()
+        req._this = self.handle
+        val = self.run_command('IVirtualBox_getEventSource', req)
+        source_id = self.refs.track(val._returnval, scoped=False)
+
+        try:
+            req = IEventSource_createListenerRequestMsg()
+            req._this = source_id
+            val = self.run_command('IEventSource_createListener', req)
+            listener_id = self.refs.track(val._returnval, scoped=False)
+
+            req = IEventSource_registerListenerRequestMsg()
+            req._this = source_id
+            req._listener = listener_id
+            req._interesting = types
+            req._active = False
+            try:
+                self.run_command('IEventSource_registerListener', req)
+            except exception.PyRemoteVBoxException:
+                self.refs.release([listener_id])
+                raise
+        except exception.PyRemoteVBoxException:
+            self.refs.release([source_id])
+            raise
+
+        return source_id, listener_id
+
+    def _get_event(self, event_id):
+
+        req = IEvent_getTypeRequestMsg()
+        req._this = event_id
+        val = self.run_command('IEvent_getType', req)
+        event_type = val._returnval
+
+        cls = EVENT_CLASSES.get(event_type, VirtualBoxEvent)
+        attrs = {}
+        for name, command, request_class in cls.attributes:
+            req = request_class()
+            req._this = event_id
+            val = self.run_command(command, req)
+            attrs[name] = val._returnval
+        return cls(event_type, **attrs)
+
+    def _wait_for_progress(self, progress_id, timeout=None):
+
+        if timeout is None:
+            timeout = self.timeout
+        if timeout is None:
+            timeout_ms = -1
+        else:
+            timeout_ms = int(timeout * 1000)
+
+        req = IProgress_waitForCompletionRequestMsg()
+        req._this = progress_id
+        req._timeout = timeout_ms
+        self.run_command('IProgress_waitForCompletion', req)
+
+        req = IProgress_getCompletedRequestMsg()
+        req._this = progress_id
+        val = self.run_command('IProgress_getCompleted', req)
+        if not val._returnval:
+            raise exception.PyRemoteVBoxException(
+                "Operation did not complete within %s seconds." % timeout)
+
+        req = IProgress_getResultCodeRequestMsg()
+        req._this = progress_id
+        val = self.run_command('IProgress_getResultCode', req)
+        result_code = val._returnval
+        if result_code == 0:
+            return
+
+        req = IProgress_getErrorInfoRequestMsg()
+        req._this = progress_id
+        val = self.run_command('IProgress_getErrorInfo', req)
+        error_info_id = self.refs.track(val._returnval)
+        message = "Operation failed with result code %s." % result_code
+        if error_info_id:
+            req = IVirtualBoxErrorInfo_getTextRequestMsg()
+            req._this = error_info_id
+            val = self.run_command('IVirtualBoxErrorInfo_getText', req)
+            message = "Operation failed with result code %s: %s" % (
+                result_code, val._returnval)
+        raise exception.PyRemoteVBoxException(message)
+
+    def _open_medium(self, device_type, location):
+
+        req = IVirtualBox_openMediumRequestMsg()
+        req._this = self.handle
+        req._location = location
+        req._deviceType = device_type
+        req._accessMode = ACCESS_READONLY
+        req._forceNewUuid = False
+
+        val = self.run_command('IVirtualBox_openMedium', req)
+        return self.refs.track(val._returnval)
+
+    def _get_medium_location(self, medium_id):
+
+        req = IMedium_getLocationRequestMsg()
+        req._this = medium_id
+        val = self.run_command('IMedium_getLocation', req)
+        return val._returnval
+
+class VirtualBoxVm:
+
+    def __init__(self, virtualboxhost, handle):
+
+        self.host = virtualboxhost
+        self.handle = handle
+        self.guest = Guest(self)
+        self.guest_files = GuestFiles(self)
+        self.display = Display(self)
+
+
+    def get_power_status(self):
+
+        state_cache = self.host.state_cache
+        if state_cache is not None:
+            state = state_cache.get_state(self.handle)
+            if state is not None:
+                if state not in [STATE_POWERED_OFF, STATE_POWERED_ON]:
+                    return STATE_ERROR
+                return state
+        return self.host._get_machine_states([self.handle])[0]
+
+
+    def get_id(self):
+
+        req = IMachine_getIdRequestMsg()
+        req._this = self.handle
+        val = self.host.run_command('IMachine_getId', req)
+        return val._returnval
+
+
+    def get_session_state(self):
+
+        req = IMachine_getSessionStateRequestMsg()
+        req._this = self.handle
+        val = self.host.run_command('IMachine_getSessionState', req)
+        return val._returnval
+
+
+    def get_name(self):
+
+        req = IMachine_getNameRequestMsg()
+        req._this = self.handle
+        val = self.host.run_command('IMachine_getName', req)
+        return val._returnval
+
+
+    def get_boot_device(self, position=1):
+
+        req = IMachine_getBootOrderRequestMsg()
+        req._this = self.handle
+        req._position = position
+        val = self.host.run_command('IMachine_getBootOrder', req)
+        return val._returnval
+
+
+    def _get_session_id(self):
+
+        return self.host.sessions.get()
+
+
+    def _lock_machine(self, session_id, lock_type=LOCKTYPE_SHARED):
+
+        req = IMachine_lockMachineRequestMsg()
+        req._this = self.handle
+        req._session = session_id
+        req._lockType = lock_type
+        val = self.host.run_command('IMachine_lockMachine', req)
+
+
+    def _get_mutable_machine(self, session_id):
+
+        # The session must hold the write lock.
+        req = ISession_getMachineRequestMsg()
+        req._this = session_id
+        val = self.host.run_command('ISession_getMachine', req)
+        mutable_machine_id = self.host.refs.track(val._returnval)
+        return mutable_machine_id
+
+
+    def _save_settings(self, mutable_machine_id):
+
+        req = IMachine_saveSettingsRequestMsg()
+        req._this = mutable_machine_id
+        val = self.host.run_command('IMachine_saveSettings', req)
+
+
+    def _unlock_machine(self, session_id):
+
+        req = ISession_unlockMachineRequestMsg()
+        req._this = session_id
+        val = self.host.run_command('ISession_unlockMachine', req)
+
+
+    def _put_session_id(self, session_id):
+
+        # Unlock the session and give it back to the pool.
+        try:
+            self._unlock_machine(session_id)
+        except Exception:
+            self.host.sessions.discard(session_id)
+            raise
+        self.host.sessions.put(session_id)
+
+
+    def reconfigure(self):
+
+        # Changes made on the yielded MutableMachine are saved together,
+        # under one write lock, when the block exits, or discarded if it
+        # raises.
+        return self._reconfigure('reconfigure')
+
+
+    @contextlib.contextmanager
+    def _reconfigure(self, operation):
+
+        with self.host.refs.scope():
+            if self.get_power_status() == STATE_POWERED_ON:
+                raise exception.VmInWrongPowerState(operation=operation,
+                                                    state='powered on')
+
+            # A session that failed to lock is in an unknown state.
+            session_id = self._get_session_id()
+            try:
+                self._lock_machine(session_id, LOCKTYPE_WRITE)
+            except Exception:
+                self.host.sessions.discard(session_id)
+                raise
+
+            try:
+                mutable_machine_id = self._get_mutable_machine(session_id)
+                machine = MutableMachine(self.host, mutable_machine_id)
+                try:
+                    yield machine
+                except Exception:
+                    machine._discard_settings()
+                    raise
+
+                # Save settings
+                self._save_settings(mutable_machine_id)
+
+            except Exception:
+                # Unlock, keeping the original error if that fails too.
+                exc_info = sys.exc_info()
+                try:
+                    self._put_session_id(session_id)
+                except Exception:
+                    pass
+                raise exc_info[0], exc_info[1], exc_info[2]
+
+            self._put_session_id(session_id)
+
+
+    def attach_device(self, device_type, location):
+
+        with self._reconfigure('attach_device') as machine:
+            machine.attach_device(device_type, location)
+
+
+    def detach_device(self, device_type):
+
+        with self._reconfigure('detach_device') as machine:
+            machine.detach_device(device_type)
+
+
+    @_releases_refs
+    def get_attached_device(self, device_type):
+
+        controller_name = DEVICE_TO_CONTROLLER_MAP[device_type]
+
+        req = IMachine_getMediumRequestMsg()
+        req._this = self.handle
+        req._name = controller_name
+        req._controllerPort=0
+        req._device = 0
+
+        val = None
+        try:
+            val = self.host.run_command('IMachine_getMedium', req)
+        except exception.PyRemoteVBoxException as e:
+            if 'No storage device attached' in str(e):
+                return None
+
+        medium_id = self.host.refs.track(val._returnval)
+        return self.host._get_medium_location(medium_id)
+
+
+    def set_boot_device(self, device, position=1):
+
+        with self._reconfigure('set_boot_device') as machine:
+            machine.set_boot_device(device, position)
+
+
+    def get_firmware_type(self):
+
+        req = IMachine_getFirmwareTypeRequestMsg()
+        req._this = self.handle
+
+        val = self.host.run_command('IMachine_getFirmwareType', req)
+        return val._returnval
+
+
+    def set_firmware_type(self, firmware_type):
+
+        with self._reconfigure('set_firmware_type') as machine:
+            machine.set_firmware_type(firmware_type)
+
+
+    def get_log_filename(self, idx=0):
+
+        req = IMachine_queryLogFilenameRequestMsg()
+        req._this = self.handle
+        req._idx = idx
+        val = self.host.run_command('IMachine_queryLogFilename', req)
+        return val._returnval
+
+
+    def read_log(self, idx, offset, size):
+
+        req = IMachine_readLogRequestMsg()
+        req._this = self.handle
+        req._idx = idx
+        req._offset = offset
+        req._size = size
+        val = self.host.run_command('IMachine_readLog', req)
+        return val._returnval or bytearray()
+
+
+    def tail_log(self, idx=0, offset=0, follow=True, poll_interval=1):
+
+        # Iterate over the lines of log idx, 0 being VBox.log, from byte
+        # offset on, then over lines appended to it if follow.
+        return LogTail(self, idx, offset, follow, poll_interval)
+
+
+    @_releases_refs
+    def start(self, vm_type="gui", timeout=None):
+
+        if self.get_power_status() == STATE_POWERED_ON:
+            return
+
+        session_id = self._get_session_id()
+
+        req = IMachine_launchVMProcessRequestMsg()
+        req._this = self.handle
+        req._type = vm_type
+        req._environment = ""
+        req._session = session_id
+        try:
+            val=self.host.run_command('IMachine_launchVMProcess', req)
+        except Exception:
+            self.host.sessions.discard(session_id)
+            raise
+        progress_id = self.host.refs.track(val._returnval)
+
+        # Once the VM process is up the session can be unlocked.
+        try:
+            self.host._wait_for_progress(progress_id, timeout)
+        except Exception:
+            self.host.sessions.discard(session_id)
+            raise
+        self._put_session_id(session_id)
+
+
+    @_releases_refs
+    def stop(self, timeout=None):
+
+        if self.get_power_status() == STATE_POWERED_OFF:
+            return
+
+        # The shared lock is left for VirtualBox to drop as the machine
+        # powers off, so the session does not go back to the pool.
+        session_id = self._get_session_id()
+        try:
+            self._lock_machine(session_id, LOCKTYPE_SHARED)
+
+            req = ISession_getConsoleRequestMsg()
+            req._this = session_id
+            val = self.host.run_command('ISession_getConsole', req)
+            console_id = self.host.refs.track(val._returnval)
+
+            req = IConsole_powerDownRequestMsg()
+            req._this = console_id
+            val = self.host.run_command('IConsole_powerDown', req)
+            progress_id = self.host.refs.track(val._returnval)
+
+            self.host._wait_for_progress(progress_id, timeout)
+
+        finally:
+            self.host.sessions.discard(session_id)
+
+
+class MutableMachine:
+
+    # The mutable machine of a VirtualBoxVm under a write lock, see
+    # VirtualBoxVm.reconfigure.  Nothing is saved until the lock ends.
+
+    def __init__(self, virtualboxhost, handle):
+
+        self.host = virtualboxhost
+        self.handle = handle
+
+
+    def attach_device(self, device_type, location):
+
+        try:
+            self.detach_device(device_type)
+        except Exception:
+            pass
+
+        controller_name = DEVICE_TO_CONTROLLER_MAP[device_type]
+        medium_id = self.host._open_medium(device_type, location)
+
+        req = IMachine_attachDeviceRequestMsg()
+        req._this = self.handle
+        req._name = controller_name
+        req._controllerPort=0
+        req._device = 0
+        req._type = device_type
+        req._medium = medium_id
+        val = self.host.run_command('IMachine_attachDevice', req)
+
+
+    def detach_device(self, device_type):
+
+        controller_name = DEVICE_TO_CONTROLLER_MAP[device_type]
+
+        req = IMachine_detachDeviceRequestMsg()
+        req._this = self.handle
+        req._name = controller_name
+        req._controllerPort=0
+        req._device = 0
+        req._type = device_type
+        val = self.host.run_command('IMachine_detachDevice', req)
+
+
+    def set_boot_device(self, device, position=1):
+
+        req = IMachine_setBootOrderRequestMsg()
+        req._this = self.handle
+        req._position = position
+        req._device = device
+        val = self.host.run_command('IMachine_setBootOrder', req)
+
+
+    def set_firmware_type(self, firmware_type):
+
+        req = IMachine_setFirmwareTypeRequestMsg()
+        req._this = self.handle
+        req._firmwareType = firmware_type
+        val = self.host.run_command('IMachine_setFirmwareType', req)
+
+
+    def _discard_settings(self):
+
+        req = IMachine_discardSettingsRequestMsg()
+        req._this = self.handle
+        try:
+            self.host.run_command('IMachine_discardSettings', req)
+        except exception.PyRemoteVBoxException:
+            pass
+
+
+class LogTail:
+
+    # Lines of a machine log, read from offset on with IMachine_readLog.
+    # Only bytes past offset are fetched.  The read size doubles, up to
+    # LOG_CHUNK_MAX, while reads come back full and halves when they come
+    # back mostly empty.  offset is that of the first line not yet
+    # yielded, so a new LogTail can carry on from it.  A log found shorter
+    # than what was read of it, truncated or rotated, is read again from
+    # its start.
+
+    def __init__(self, vm, idx=0, offset=0, follow=True, poll_interval=1):
+
+        self.vm = vm
+        self.idx = idx
+        self.offset = offset
+        self.follow = follow
+        self.poll_interval = poll_interval
+        self.chunk_size = LOG_CHUNK_MIN
+
+    def __iter__(self):
+
+        # Bytes read past the last newline, kept for the next read.
+        pending = bytearray()
+        while True:
+            size = self.chunk_size
+            data = self.vm.read_log(self.idx, self.offset + len(pending),
+                                    size)
+            if len(data) == size:
+                self.chunk_size = min(size * 2, LOG_CHUNK_MAX)
+            elif len(data) < size / 4:
+                self.chunk_size = max(size / 2, LOG_CHUNK_MIN)
+
+            if not data:
+                # Nothing past the end, check that the last byte read is
+                # still there.
+                position = self.offset + len(pending)
+                if position and not self.vm.read_log(self.idx, position - 1,
+                                                     1):
+                    self.offset = 0
+                    pending = bytearray()
+                    continue
+                if not self.follow:
+                    # A last line without a newline.
+                    if pending:
+                        self.offset += len(pending)
+                        yield str(pending)
+                    return
+                time.sleep(self.poll_interval)
+                continue
+
+            if pending:
+                pending += data
+            else:
+                pending = data
+
+            start = 0
+            while True:
+                end = pending.find('\n', start) + 1
+                if not end:
+                    break
+                # One copy, out of the bytearray into the line.
+                line = str(buffer(pending, start, end - start))
+                self.offset += len(line)
+                start = end
+                yield line
+            del pending[:start]
+
+
+class GuestSession:
+
+    # A guest control session on a running VirtualBoxVm, logged on to the
+    # guest as username.  close() ends it and unlocks the machine; it can
+    # be used in a with statement.
+
+    def __init__(self, vm, username=None, password=None, domain=None,
+                 timeout=None):
+
+        self.vm = vm
+        self.host = vm.host
+        if username is None:
+            username = self.host.guest_username
+        if password is None:
+            password = self.host.guest_password
+        if domain is None:
+            domain = self.host.guest_domain
+
+        # Milliseconds guest requests may block for, the host's timeout
+        # by default.
+        if timeout is None:
+            timeout = self.host.timeout
+        if timeout is None:
+            self.timeout_ms = 0xffffffff
+        else:
+            self.timeout_ms = int(timeout * 1000)
+
+        if vm.get_power_status() != STATE_POWERED_ON:
+            raise exception.VmInWrongPowerState(operation='guest_session',
+                                                state='powered off')
+
+        self.refs = []
+        self.handle = None
+        self.session_id = vm._get_session_id()
+        try:
+            vm._lock_machine(self.session_id, LOCKTYPE_SHARED)
+
+            req = ISession_getConsoleRequestMsg()
+            req._this = self.session_id
+            val = self.host.run_command('ISession_getConsole', req)
+            console_id = self._track(val._returnval)
+
+            req = IConsole_getGuestRequestMsg()
+            req._this = console_id
+            val = self.host.run_command('IConsole_getGuest', req)
+            guest_id = self._track(val._returnval)
+
+            req = IGuest_createSessionRequestMsg()
+            req._this = guest_id
+            req._user = username
+            req._password = password
+            req._domain = domain
+            req._sessionName = 'pyremotevbox'
+            val = self.host.run_command('IGuest_createSession', req)
+            self.handle = self._track(val._returnval)
+
+            # Guest Additions too old for the Start flag are started.
+            req = IGuestSession_waitForArrayRequestMsg()
+            req._this = self.handle
+            req._waitFor = ['Start']
+            req._timeoutMS = self.timeout_ms
+            val = self.host.run_command('IGuestSession_waitForArray', req)
+            if val._returnval not in ['Start', 'WaitFlagNotSupported']:
+                raise exception.PyRemoteVBoxException(
+                    "Guest session did not start: %s." % val._returnval)
+        except Exception:
+            self.close()
+            raise
+
+    def _track(self, ref):
+
+        self.refs.append(self.host.refs.track(ref, scoped=False))
+        return ref
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *exc_info):
+
+        self.close()
+
+    def close(self):
+
+        if self.session_id is None:
+            return
+
+        if self.handle is not None:
+            req = IGuestSession_closeRequestMsg()
+            req._this = self.handle
+            try:
+                self.host.run_command('IGuestSession_close', req)
+            except exception.PyRemoteVBoxException:
+                pass
+
+        self.host.refs.release(self.refs[::-1])
+        self.refs = []
+        self.handle = None
+        session_id, self.session_id = self.session_id, None
+        try:
+            self.vm._put_session_id(session_id)
+        except exception.PyRemoteVBoxException:
+            pass
+
+    def open_file(self, path, open_mode='r', disposition='oe',
+                  creation_mode=0644):
+
+        req = IGuestSession_fileOpenRequestMsg()
+        req._this = self.handle
+        req._path = path
+        req._openMode = open_mode
+        req._disposition = disposition
+        req._creationMode = creation_mode
+        val = self.host.run_command('IGuestSession_fileOpen', req)
+        return GuestFile(self, self.host.refs.track(val._returnval,
+                                                    scoped=False))
+
+    def create_process(self, cmd, environment=(), flags=(), timeout=None):
+
+        # cmd is the executable followed by its arguments.  The guest
+        # kills the process after timeout seconds, if given.
+        req = IGuestSession_processCreateRequestMsg()
+        req._this = self.handle
+        req._command = cmd[0]
+        req._arguments = list(cmd[1:])
+        req._environment = list(environment)
+        req._flags = list(flags)
+        req._timeoutMS = 0
+        if timeout is not None:
+            req._timeoutMS = int(timeout * 1000)
+        val = self.host.run_command('IGuestSession_processCreate', req)
+        return self.host.refs.track(val._returnval, scoped=False)
+
+
+class GuestFile:
+
+    # A file opened in a GuestSession.  Reads and writes are positioned,
+    # so several of them can be in flight at once.
+
+    def __init__(self, session, handle):
+
+        self.session = session
+        self.host = session.host
+        self.handle = handle
+
+    def read_at(self, offset, size):
+
+        # Read up to size bytes into a bytearray, fewer only at the end of
+        # the file.  The guest may return less per request than asked.
+        data = None
+        while size > 0:
+            req = IFile_readAtRequestMsg()
+            req._this = self.handle
+            req._offset = offset
+            req._toRead = size
+            req._timeoutMS = self.session.timeout_ms
+            val = self.host.run_command('IFile_readAt', req)
+            chunk = val._returnval or bytearray()
+            if data is None:
+                data = chunk
+            else:
+                data += chunk
+            if not chunk:
+                break
+            offset += len(chunk)
+            size -= len(chunk)
+        return data or bytearray()
+
+    def write_at(self, offset, data):
+
+        # Write all of data, however many requests the guest needs.
+        written = 0
+        while written < len(data):
+            req = IFile_writeAtRequestMsg()
+            req._this = self.handle
+            req._offset = offset + written
+            req._data = data[written:] if written else data
+            req._timeoutMS = self.session.timeout_ms
+            val = self.host.run_command('IFile_writeAt', req)
+            if not val._returnval:
+                raise exception.PyRemoteVBoxException(
+                    "Guest wrote nothing at offset %s." % (offset + written))
+            written += val._returnval
+        return written
+
+    def close(self):
+
+        req = IFile_closeRequestMsg()
+        req._this = self.handle
+        try:
+            self.host.run_command('IFile_close', req)
+        finally:
+            self.host.refs.release([self.handle])
+
+
+class GuestFiles:
+
+    # Copies files out of and into the guest of a running VirtualBoxVm,
+    # chunk_size bytes per request with up to depth requests in flight,
+    # the host's max_workers by default.  Memory use is bounded by
+    # depth chunks, whatever the size of the file.
+
+    def __init__(self, vm):
+
+        self.vm = vm
+
+    def _depth(self, depth):
+
+        host = self.vm.host
+        if not host.threadsafe:
+            return 1
+        return depth or host.max_workers
+
+    def download(self, path, dest, chunk_size=GUEST_FILE_CHUNK_SIZE,
+                 depth=None, **kwargs):
+
+        # Copy the guest file path to dest, a file name or an object with
+        # a write method.  kwargs are passed to GuestSession.  Returns the
+        # number of bytes copied.
+        with GuestSession(self.vm, **kwargs) as session:
+            guest_file = session.open_file(path, 'r', 'oe')
+            try:
+                with _open_local(dest, 'wb') as out:
+                    def read(offset):
+                        return guest_file.read_at(offset, chunk_size)
+
+                    total = 0
+                    offsets = itertools.count(0, chunk_size)
+                    for data in _run_pipelined(read, offsets,
+                                               self._depth(depth)):
+                        out.write(data)
+                        total += len(data)
+                        if len(data) < chunk_size:
+                            break
+                    return total
+            finally:
+                guest_file.close()
+
+    def upload(self, source, path, chunk_size=GUEST_FILE_CHUNK_SIZE,
+               depth=None, creation_mode=0644, **kwargs):
+
+        # Copy source, a file name or an object with a read method, to
+        # the guest file path, replacing it.  Returns the number of bytes
+        # copied.
+        with GuestSession(self.vm, **kwargs) as session:
+            guest_file = session.open_file(path, 'w', 'ca', creation_mode)
+            try:
+                with _open_local(source, 'rb') as src:
+                    def chunks():
+                        offset = 0
+                        while True:
+                            data = src.read(chunk_size)
+                            if not data:
+                                return
+                            yield offset, data
+                            offset += len(data)
+
+                    def write(chunk):
+                        offset, data = chunk
+                        return guest_file.write_at(offset, data)
+
+                    return sum(_run_pipelined(write, chunks(),
+                                              self._depth(depth)))
+            finally:
+                guest_file.close()
+
+
+class Guest:
+
+    # Runs processes in the guest of a running VirtualBoxVm.
+
+    def __init__(self, vm):
+
+        self.vm = vm
+
+    def run(self, cmd, stdin=None, environment=(), timeout=None,
+            poll_interval=5, **kwargs):
+
+        # Start cmd, a list of the executable's path and its arguments,
+        # and return a GuestProcess, which yields its output as it comes.
+        # stdin, a string or an object with a read method, is written
+        # while the output is read; otherwise GuestProcess.write feeds
+        # it.  kwargs are passed to GuestSession.
+        session = GuestSession(self.vm, **kwargs)
+        try:
+            process = GuestProcess(session, cmd, environment, timeout,
+                                   poll_interval)
+        except Exception:
+            session.close()
+            raise
+        if stdin is not None:
+            process.write(stdin, eof=True)
+        return process
+
+
+class GuestProcess:
+
+    # A process started by Guest.run.  Iterating over it yields
+    # (GUEST_STDOUT or GUEST_STDERR, bytearray) pairs until the process
+    # ends, then exit_code and status are set and the GuestSession is
+    # closed.  Waits are IProcess waitFor calls on the output flags, at
+    # most poll_interval seconds each, rather than sleeps.  A process
+    # that is not iterated to its end should be closed, or used in a
+    # with statement.
+
+    def __init__(self, session, cmd, environment=(), timeout=None,
+                 poll_interval=5):
+
+        self.session = session
+        self.host = session.host
+        self.poll_interval_ms = int(poll_interval * 1000)
+        self.exit_code = None
+        self.status = None
+
+        # Stdin writes queued by write, done in order by one thread.
+        self.lock = threading.Lock()
+        self.stdin_queue = Queue.Queue()
+        self.stdin_thread = None
+        self.closing = False
+
+        self.handle = session.create_process(
+            cmd, environment, ['WaitForStdOut', 'WaitForStdErr'], timeout)
+
+    def __iter__(self):
+
+        try:
+            while True:
+                result = self._wait(['StdOut', 'StdErr', 'Terminate'],
+                                    self.poll_interval_ms)
+                if result == 'StdOut':
+                    data = self._read(GUEST_STDOUT)
+                    if data:
+                        yield GUEST_STDOUT, data
+                elif result == 'StdErr':
+                    data = self._read(GUEST_STDERR)
+                    if data:
+                        yield GUEST_STDERR, data
+                elif result in ['Terminate', 'Error'] or \
+                        self._ended(self._get_status()):
+                    # Whatever output is left is still buffered.
+                    for handle in [GUEST_STDOUT, GUEST_STDERR]:
+                        while True:
+                            data = self._read(handle)
+                            if not data:
+                                break
+                            yield handle, data
+                    self._finish()
+                    return
+                elif result == 'WaitFlagNotSupported':
+                    # Old Guest Additions, let the read do the waiting.
+                    for handle in [GUEST_STDOUT, GUEST_STDERR]:
+                        data = self._read(handle, self.poll_interval_ms / 2)
+                        if data:
+                            yield handle, data
+        finally:
+            self.close()
+
+    def wait(self):
+
+        # Discard the rest of the output and return the exit code.
+        for handle, data in self:
+            pass
+        return self.exit_code
+
+    def write(self, data, eof=False):
+
+        # Queue data, a string or an object with a read method, for the
+        # process' stdin, closing it after if eof.  Returns at once with
+        # an OperationFuture of the number of bytes written.
+        future = OperationFuture()
+        if not self.host.threadsafe:
+            if self.closing:
+                future._set(None, self._closed_error())
+            else:
+                self._feed(future, data, eof)
+            return future
+
+        self.lock.acquire()
+        try:
+            if self.closing:
+                future._set(None, self._closed_error())
+                return future
+            self.stdin_queue.put((future, data, eof))
+            if self.stdin_thread is None:
+                self.stdin_thread = threading.Thread(target=self._feeder)
+                self.stdin_thread.daemon = True
+                self.stdin_thread.start()
+        finally:
+            self.lock.release()
+        return future
+
+    def close_stdin(self):
+
+        return self.write('', eof=True)
+
+    def close(self):
+
+        # Stop the process if it still runs and end its session.  The
+        # stdin thread is stopped first: a write in progress gives up at
+        # its next wait, writes still queued fail.
+        self.lock.acquire()
+        try:
+            self.closing = True
+            thread, self.stdin_thread = self.stdin_thread, None
+            if thread is not None:
+                self.stdin_queue.put(None)
+        finally:
+            self.lock.release()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        if self.session.session_id is None:
+            return
+        if self.status is None:
+            req = IProcess_terminateRequestMsg()
+            req._this = self.handle
+            try:
+                self.host.run_command('IProcess_terminate', req)
+            except exception.PyRemoteVBoxException:
+                pass
+        self.host.refs.release([self.handle])
+        self.session.close()
+
+    def __enter__(self):
+
+        return self
+
+    def __exit__(self, *exc_info):
+
+        self.close()
+
+    def _closed_error(self):
+
+        return exception.PyRemoteVBoxException(
+            "Guest process was closed before its input was written.")
+
+    def _feeder(self):
+
+        while True:
+            item = self.stdin_queue.get()
+            if item is None:
+                return
+            future, data, eof = item
+            if self.closing:
+                future._set(None, self._closed_error())
+            else:
+                self._feed(future, data, eof)
+
+    def _feed(self, future, data, eof):
+
+        try:
+            written = 0
+            if hasattr(data, 'read'):
+                while True:
+                    chunk = data.read(GUEST_OUTPUT_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    if self.closing:
+                        raise self._closed_error()
+                    written += self._write(chunk)
+            elif data:
+                written = self._write(data)
+            if eof:
+                self._write('', 1)
+        except Exception as e:
+            future._set(None, e)
+        else:
+            future._set(written, None)
+
+    def _write(self, data, flags=0):
+
+        # Write all of data, waiting for the guest to take more while its
+        # stdin pipe is full.
+        written = 0
+        while True:
+            req = IProcess_writeRequestMsg()
+            req._this = self.handle
+            req._handle = GUEST_STDIN
+            req._flags = flags
+            req._data = data[written:] if written else data
+            req._timeoutMS = self.poll_interval_ms
+            val = self.host.run_command('IProcess_write', req)
+            written += val._returnval
+            if written >= len(data):
+                return written
+            if self._wait(['StdIn'], self.poll_interval_ms) in \
+                    ['Terminate', 'Error'] or self.closing:
+                raise exception.PyRemoteVBoxException(
+                    "Guest process ended with %s bytes of input left." %
+                    (len(data) - written))
+
+    def _wait(self, flags, timeout_ms):
+
+        req = IProcess_waitForArrayRequestMsg()
+        req._this = self.handle
+        req._waitFor = flags
+        req._timeoutMS = timeout_ms
+        val = self.host.run_command('IProcess_waitForArray', req)
+        return val._returnval
+
+    def _read(self, handle, timeout_ms=0):
+
+        req = IProcess_readRequestMsg()
+        req._this = self.handle
+        req._handle = handle
+        req._toRead = GUEST_OUTPUT_CHUNK_SIZE
+        req._timeoutMS = timeout_ms
+        val = self.host.run_command('IProcess_read', req)
+        return val._returnval
+
+    def _get_status(self):
+
+        req = IProcess_getStatusRequestMsg()
+        req._this = self.handle
+        val = self.host.run_command('IProcess_getStatus', req)
+        return val._returnval
+
+    def _ended(self, status):
+
+        return status not in ['Undefined', 'Starting', 'Started', 'Paused',
+                              'Terminating']
+
+    def _finish(self):
+
+        status = self._get_status()
+        if status == 'Error':
+            raise exception.PyRemoteVBoxException(
+                "Guest process could not be run.")
+        req = IProcess_getExitCodeRequestMsg()
+        req._this = self.handle
+        val = self.host.run_command('IProcess_getExitCode', req)
+        self.exit_code = val._returnval
+        self.status = status
+
+
+class Screenshot:
+
+    # A frame of a guest screen taken at time.  data is a (height, width,
+    # 4) uint8 NumPy array of the pixels, a bytearray of them without
+    # NumPy, or the PNG file as a bytearray if png.
+
+    def __init__(self, taken, screen_id, width, height, data, png=False):
+
+        self.time = taken
+        self.screen_id = screen_id
+        self.width = width
+        self.height = height
+        self.data = data
+        self.png = png
+
+
+class Display:
+
+    # Captures the screens of a running VirtualBoxVm.
+
+    def __init__(self, vm):
+
+        self.vm = vm
+        self.host = vm.host
+
+    def screenshots(self, interval=1, screen_id=0, png=False,
+                    thumbnail=None, timeout=None):
+
+        # Yield a Screenshot of screen_id at most every interval seconds,
+        # for timeout seconds or for ever, skipping frames identical to
+        # the last one yielded.  Frames are only taken when the consumer
+        # asks for the next one, so a slow consumer lowers the rate
+        # rather than frames queueing up.  If thumbnail is a (width,
+        # height) size, a thumbnail that size is taken first and the
+        # full frame only fetched when the thumbnail changed, which saves
+        # the transfer on an idle screen at the risk of missing changes
+        # too small to show in it.
+        if self.vm.get_power_status() != STATE_POWERED_ON:
+            raise exception.VmInWrongPowerState(operation='screenshots',
+                                                state='powered off')
+
+        deadline = None
+        if timeout is not None:
+            deadline = time.time() + timeout
+
+        refs = []
+        session_id = self.vm._get_session_id()
+        try:
+            self.vm._lock_machine(session_id, LOCKTYPE_SHARED)
+
+            req = ISession_getConsoleRequestMsg()
+            req._this = session_id
+            val = self.host.run_command('ISession_getConsole', req)
+            refs.append(self.host.refs.track(val._returnval, scoped=False))
+
+            req = IConsole_getDisplayRequestMsg()
+            req._this = refs[-1]
+            val = self.host.run_command('IConsole_getDisplay', req)
+            display_id = self.host.refs.track(val._returnval, scoped=False)
+            refs.append(display_id)
+
+            last_thumbnail = last_digest = None
+            next_time = time.time()
+            while True:
+                wait = next_time - time.time()
+                if deadline is not None and time.time() + wait > deadline:
+                    return
+                if wait > 0:
+                    time.sleep(wait)
+                taken = time.time()
+                next_time = taken + interval
+
+                width, height = self._get_resolution(display_id, screen_id)
+                thumbnail_data = None
+                if thumbnail:
+                    thumbnail_data = self._take(display_id, screen_id,
+                                                thumbnail[0], thumbnail[1],
+                                                False)
+                    if thumbnail_data == last_thumbnail:
+                        continue
+
+                data = self._take(display_id, screen_id, width, height, png)
+                if not png and len(data) != width * height * 4:
+                    # The resolution changed in between, try again.
+                    continue
+                digest = hashlib.sha1(data).digest()
+                if digest == last_digest:
+                    continue
+
+                # Only a frame that is yielded counts as seen.
+                last_thumbnail = thumbnail_data
+                last_digest = digest
+
+                if numpy is not None and not png:
+                    data = numpy.frombuffer(data, dtype=numpy.uint8)
+                    data = data.reshape((height, width, 4))
+                yield Screenshot(taken, screen_id, width, height, data, png)
+
+        finally:
+            self.host.refs.release(refs[::-1])
+            try:
+                self.vm._put_session_id(session_id)
+            except exception.PyRemoteVBoxException:
+                pass
+
+    def _get_resolution(self, display_id, screen_id):
+
+        req = IDisplay_getScreenResolutionRequestMsg()
+        req._this = display_id
+        req._screenId = screen_id
+        val = self.host.run_command('IDisplay_getScreenResolution', req)
+        return val._width, val._height
+
+    def _take(self, display_id, screen_id, width, height, png):
+
+        if png:
+            command = 'IDisplay_takeScreenShotPNGToArray'
+            req = IDisplay_takeScreenShotPNGToArrayRequestMsg()
+        else:
+            command = 'IDisplay_takeScreenShotToArray'
+            req = IDisplay_takeScreenShotToArrayRequestMsg()
+        req._this = display_id
+        req._screenId = screen_id
+        req._width = width
+        req._height = height
+        val = self.host.run_command(command, req)
+        return val._returnval or bytearray()
+
+
+@contextlib.contextmanager
+def _open_local(file_or_name, mode):
+
+    # Open a local file by name, or pass a file object through unclosed.
+    if isinstance(file_or_name, basestring):
+        f = open(file_or_name, mode)
+        try:
+            yield f
+        finally:
+            f.close()
+    else:
+        yield file_or_name
+
+
+class VirtualBoxFleet:
+
+    # VirtualBoxHosts on several vboxwebsrv endpoints.  Queries go out to
+    # all of them at once, so a sweep takes as long as the slowest host.
+
+    def __init__(self, endpoints, **kwargs):
+
+        # endpoints are dicts of VirtualBoxHost arguments, kwargs are
+        # common to all of them.
+        def logon(endpoint):
+            args = dict(kwargs)
+            args.update(endpoint)
+            return VirtualBoxHost(**args)
+
+        endpoints = list(endpoints)
+        results = _run_concurrently(logon, endpoints, len(endpoints))
+
+        self.hosts = []
+        self.errors = []
+        for endpoint, (host, error) in zip(endpoints, results):
+            if error is None:
+                self.hosts.append(host)
+            else:
+                self.errors.append((endpoint, error))
+
+        if not self.hosts and self.errors:
+            raise exception.PyRemoteVBoxException(self.errors[0][1])
+
+        self.lock = threading.Lock()
+        self.index = {}
+        self.duplicates = {}
+
+        # Names a rescan did not find, not looked for again for as long
+        # as a host keeps a find_vm result.
+        self.missing = MachineCache(kwargs.get('vm_cache_size', 128),
+                                    kwargs.get('vm_cache_ttl', 60))
+
+
+    def _fan_out(self, func, hosts=None):
+
+        if hosts is None:
+            hosts = self.hosts
+        results = _run_concurrently(func, hosts, len(hosts))
+        return dict(zip(hosts, results))
+
+
+    def get_versions(self):
+
+        # Dict of VirtualBoxHost to a (version, exception) pair.
+        return self._fan_out(lambda host: host.get_version())
+
+
+    def list_vms(self):
+
+        # Dict of VirtualBoxHost to a (list of vm names, exception) pair.
+        # Rebuilds the vm name index on the way and forgets which names
+        # were missing from it.
+        def names(host):
+            vms = host.list_vms()
+            results = host.map('get_name', vms)
+            found = []
+            for vm in vms:
+                name, error = results[vm]
+                if error is None:
+                    found.append((name, vm))
+            return found
+
+        self.missing.invalidate()
+        results = self._fan_out(names)
+        index = {}
+        duplicates = {}
+        merged = {}
+        for host, (found, error) in results.items():
+            if error is not None:
+                merged[host] = (None, error)
+                continue
+            for name, vm in found:
+                if name in duplicates:
+                    duplicates[name].append(host.url)
+                elif name in index:
+                    duplicates[name] = [index.pop(name).host.url, host.url]
+                else:
+                    index[name] = vm
+            merged[host] = ([name for name, vm in found], None)
+
+        self.lock.acquire()
+        try:
+            self.index = index
+            self.duplicates = duplicates
+        finally:
+            self.lock.release()
+        return merged
+
+
+    def _lookup(self, vmnames):
+
+        # Dict of vm name to a (VirtualBoxVm, exception) pair.  The index
+        # is rebuilt once if any of the names is new to it; names still
+        # missing afterwards are not looked for again until list_vms()
+        # or until they have been missing for vm_cache_ttl seconds.
+        self.lock.acquire()
+        try:
+            index = self.index
+            duplicates = self.duplicates
+        finally:
+            self.lock.release()
+
+        for vmname in vmnames:
+            if vmname not in index and vmname not in duplicates and \
+                    not self.missing.get(vmname):
+                self.list_vms()
+                break
+
+        self.lock.acquire()
+        try:
+            index = self.index
+            duplicates = self.duplicates
+        finally:
+            self.lock.release()
+        for vmname in vmnames:
+            if vmname not in index and vmname not in duplicates:
+                self.missing.put(vmname, True)
+
+        vms = {}
+        for vmname in vmnames:
+            if vmname in duplicates:
+                vms[vmname] = (None, exception.PyRemoteVBoxException(
+                    "Found vm '%s' on several hosts: %s." %
+                    (vmname, ', '.join(sorted(duplicates[vmname])))))
+            elif vmname in index:
+                vms[vmname] = (index[vmname], None)
+            else:
+                vms[vmname] = (None, exception.PyRemoteVBoxException(
+                    "Could not find vm '%s' on any host." % vmname))
+        return vms
+
+
+    def find_vm(self, vmname):
 
+        vm, error = self._lookup([vmname])[vmname]
+        if error is not None:
+            raise error
+        return vm
+
+
+    def get_power_states(self, vmnames):
+
+        # Dict of vm name to a (state, exception) pair; each host gets
+        # one getMachineStates request for all of its vms.
+        vmnames = list(vmnames)
+        vms = self._lookup(vmnames)
+
+        by_host = {}
+        results = {}
+        for vmname in vmnames:
+            vm, error = vms[vmname]
+            if error is not None:
+                results[vmname] = (None, error)
+                continue
+            by_host.setdefault(vm.host, []).append((vmname, vm))
+
+        def states(host):
+            vms = by_host[host]
+            return host.get_power_states([vm for vmname, vm in vms])
+
+        for host, (host_states, error) in self._fan_out(
+                states, by_host.keys()).items():
+            for vmname, vm in by_host[host]:
+                if error is None:
+                    results[vmname] = (host_states[vm], None)
+                else:
+                    results[vmname] = (None, error)
+        return results
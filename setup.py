@@ -32,6 +32,7 @@ setup(
                  'pyremotevbox.ZSI': 'pyremotevbox/ZSI'},
     include_package_data=True,
     install_requires=requirements,
+    extras_require={'metrics': ['numpy'], 'display': ['numpy']},
     license="Apache",
     zip_safe=False,
     keywords='pyremotevbox',
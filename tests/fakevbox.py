@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+"""
+fakevbox
+----------------------------------
+
+A local stand-in for vboxwebsrv.  Each operation is answered by a
+handler from `FakeVBox.handlers`, called with a dict of argument name to
+list of values.  A handler returns the returnval, or a dict of response
+fields, with lists for arrays, and raises to send a SOAP fault.
+"""
+
+import BaseHTTPServer
+import SocketServer
+import socket
+import threading
+from xml.dom import minidom
+
+from pyremotevbox import vbox
+
+
+SOAP_ENV = 'http://schemas.xmlsoap.org/soap/envelope/'
+
+ENVELOPE = (
+    '<?xml version="1.0" encoding="UTF-8"?><SOAP-ENV:Envelope'
+    ' xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' xmlns:vbox="http://www.virtualbox.org/"><SOAP-ENV:Body>%s'
+    '</SOAP-ENV:Body></SOAP-ENV:Envelope>')
+
+
+def response(op, value):
+    if not isinstance(value, dict):
+        value = {'returnval': value}
+    fields = []
+    for name, v in sorted(value.items()):
+        if v is None:
+            continue
+        if not isinstance(v, list):
+            v = [v]
+        fields.extend((name, item) for item in v)
+    body = ''.join('<%s>%s</%s>' % (k, v, k) for k, v in fields)
+    return ENVELOPE % ('<vbox:%sResponse>%s</vbox:%sResponse>' %
+                       (op, body, op))
+
+
+def fault(message):
+    return ENVELOPE % ('<SOAP-ENV:Fault><faultcode>SOAP-ENV:Client'
+                       '</faultcode><faultstring>%s</faultstring>'
+                       '</SOAP-ENV:Fault>' % message)
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # Buffered, so a reply goes out in one segment.
+    wbufsize = -1
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        fake = self.server.fake
+        data = self.rfile.read(int(self.headers['content-length']))
+        body = minidom.parseString(data).getElementsByTagNameNS(
+            SOAP_ENV, 'Body')[0]
+        op = [e for e in body.childNodes if e.nodeType == 1][0]
+        args = {}
+        for child in op.childNodes:
+            if child.nodeType == 1:
+                text = ''.join(t.data for t in child.childNodes
+                               if t.nodeType == 3)
+                args.setdefault(child.localName, []).append(text)
+
+        fake.lock.acquire()
+        try:
+            fake.requests.append((op.localName, args))
+            fake.cookies.append(self.headers.getheaders('cookie'))
+            handler = fake.handlers.get(op.localName)
+            set_cookie = fake.set_cookie
+        finally:
+            fake.lock.release()
+
+        try:
+            if handler is None:
+                raise Exception('no handler for %s' % op.localName)
+            out, code = response(op.localName, handler(args)), 200
+        except Exception as e:
+            out, code = fault(e), 500
+        self.send_response(code)
+        self.send_header('Content-Type', 'text/xml; charset=utf-8')
+        self.send_header('Content-Length', str(len(out)))
+        if set_cookie is not None:
+            self.send_header('Set-Cookie', set_cookie(op.localName, args))
+        self.end_headers()
+        self.wfile.write(out)
+
+
+class Server(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, *args):
+        BaseHTTPServer.HTTPServer.__init__(self, *args)
+        self.connections = {}
+        self.closed = False
+
+    def process_request_thread(self, request, client_address):
+        self.connections[request] = threading.current_thread()
+        try:
+            SocketServer.ThreadingMixIn.process_request_thread(
+                self, request, client_address)
+        finally:
+            self.connections.pop(request, None)
+
+    def handle_error(self, request, client_address):
+        # Clients dropping keep-alive connections are not errors.
+        if not self.closed:
+            BaseHTTPServer.HTTPServer.handle_error(
+                self, request, client_address)
+
+    def close(self):
+        # Stop serving, then end the connections still kept alive so
+        # that no handler thread outlives the test.
+        self.closed = True
+        self.shutdown()
+        self.server_close()
+        for request, thread in self.connections.items():
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            thread.join()
+
+
+class FakeVBox:
+
+    def __init__(self):
+
+        self.lock = threading.Lock()
+        self.requests = []
+        # The Cookie headers of each request, and a function of the
+        # operation and arguments returning a Set-Cookie for the reply.
+        self.cookies = []
+        self.set_cookie = None
+        self.handlers = {
+            'IWebsessionManager_logon': lambda args: 'vbox1',
+            'IWebsessionManager_logoff': lambda args: None,
+            'IManagedObjectRef_release': lambda args: None,
+        }
+        self.server = Server(('127.0.0.1', 0), Handler)
+        self.server.fake = self
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       args=(0.05,))
+        self.thread.daemon = True
+        self.thread.start()
+
+    def ops(self, *names):
+        # The operations requested so far, limited to names if given.
+        self.lock.acquire()
+        try:
+            return [op for op, args in self.requests
+                    if not names or op in names]
+        finally:
+            self.lock.release()
+
+    def args(self, name):
+        # The arguments of each request for operation name.
+        self.lock.acquire()
+        try:
+            return [args for op, args in self.requests if op == name]
+        finally:
+            self.lock.release()
+
+    def host(self, **kwargs):
+        kwargs.setdefault('timeout', 5)
+        return vbox.VirtualBoxHost(host='127.0.0.1', port=self.port,
+                                   **kwargs)
+
+    def close(self):
+        self.server.close()
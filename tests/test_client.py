@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_client
+----------------------------------
+
+Tests for the keep-alive connection handling of `pyremotevbox.ZSI.client`:
+the connection pool, which failures resend a request, and bindings
+shared by several threads.
+"""
+
+import httplib
+import random
+import re
+import socket
+import struct
+import threading
+import time
+import unittest
+
+from pyremotevbox import VirtualBox_client
+from pyremotevbox.ZSI import client
+from tests import fakevbox
+
+
+REPLY = fakevbox.response('IVirtualBox_getVersion', '4.3.0')
+OK = ('HTTP/1.1 200 OK\r\nContent-Type: text/xml\r\n'
+      'Content-Length: %d\r\n\r\n%s' % (len(REPLY), REPLY))
+
+
+class ScriptedServer:
+
+    # Accepts connections and answers each request read from them with
+    # the next of actions:
+    #   'ok' -- reply and keep the connection open
+    #   'ok-close' -- reply, then close the connection
+    #   'ok-reset' -- reply, then reset the connection
+    #   'drop' -- close the connection without a reply
+    #   'partial' -- send half a reply, then close the connection
+    #   'garbage' -- send the start of a status line, then close
+    #   'hang' -- never reply
+
+    def __init__(self, actions):
+
+        self.actions = list(actions)
+        self.connections = 0
+        self.requests = []
+        self.lock = threading.Lock()
+        self.sockets = []
+        self.listener = socket.socket()
+        self.listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(5)
+        self.port = self.listener.getsockname()[1]
+        self.threads = []
+        thread = threading.Thread(target=self._accept)
+        thread.daemon = True
+        thread.start()
+        self.threads.append(thread)
+
+    def _accept(self):
+
+        while True:
+            try:
+                sock, address = self.listener.accept()
+            except socket.error:
+                return
+            self.lock.acquire()
+            try:
+                self.connections += 1
+                self.sockets.append(sock)
+            finally:
+                self.lock.release()
+            thread = threading.Thread(target=self._serve, args=(sock,))
+            thread.daemon = True
+            thread.start()
+            self.threads.append(thread)
+
+    def _read_request(self, f):
+
+        headers = {}
+        line = f.readline()
+        if not line:
+            return None
+        while True:
+            header = f.readline()
+            if header in ['\r\n', '\n', '']:
+                break
+            name, value = header.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+        return f.read(int(headers['content-length']))
+
+    def _serve(self, sock):
+
+        f = sock.makefile('rb')
+        try:
+            while True:
+                body = self._read_request(f)
+                if body is None:
+                    return
+                self.lock.acquire()
+                try:
+                    self.requests.append(body)
+                    action = self.actions.pop(0)
+                finally:
+                    self.lock.release()
+
+                if action == 'hang':
+                    return
+                elif action == 'partial':
+                    sock.sendall(OK[:len(OK) // 2])
+                elif action == 'garbage':
+                    sock.sendall('HTTP/1.1 2')
+                elif action.startswith('ok'):
+                    sock.sendall(OK)
+                if action == 'ok-reset':
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER,
+                                    struct.pack('ii', 1, 0))
+                if action != 'ok':
+                    sock.close()
+                    return
+        except socket.error:
+            pass
+
+    def close(self):
+
+        self.listener.close()
+        self.lock.acquire()
+        try:
+            sockets = list(self.sockets)
+        finally:
+            self.lock.release()
+        for sock in sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            sock.close()
+        for thread in self.threads[1:]:
+            thread.join()
+
+
+class FakeConnection:
+
+    def __init__(self):
+        self.sock = object()
+
+    def connect(self):
+        pass
+
+    def close(self):
+        self.sock = None
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def test_reuse_most_recent_first(self):
+        pool = client.ConnectionPool()
+        first, second = FakeConnection(), FakeConnection()
+        pool.put('key', first)
+        pool.put('key', second)
+        self.assertEqual((second, True), pool.get('key', FakeConnection))
+        self.assertEqual((first, True), pool.get('key', FakeConnection))
+        conn, reused = pool.get('key', FakeConnection)
+        self.assertFalse(reused)
+        self.assertFalse(conn in [first, second])
+
+    def test_keys_are_separate(self):
+        pool = client.ConnectionPool()
+        conn = FakeConnection()
+        pool.put('key', conn)
+        self.assertFalse(pool.get('other', FakeConnection)[1])
+        self.assertEqual((conn, True), pool.get('key', FakeConnection))
+
+    def test_maxsize(self):
+        pool = client.ConnectionPool(maxsize=2)
+        conns = [FakeConnection() for i in range(3)]
+        for conn in conns:
+            pool.put('key', conn)
+        self.assertEqual(None, conns[2].sock)
+        self.assertEqual(2, len(pool._idle['key']))
+
+    def test_idle_eviction(self):
+        pool = client.ConnectionPool(idletimeout=0.05)
+        old = FakeConnection()
+        pool.put('key', old)
+        time.sleep(0.1)
+        conn, reused = pool.get('key', FakeConnection)
+        self.assertFalse(reused)
+        self.assertEqual(None, old.sock)
+
+    def test_closed_connection_skipped(self):
+        pool = client.ConnectionPool()
+        conn = FakeConnection()
+        pool.put('key', conn)
+        conn.sock = None
+        self.assertFalse(pool.get('key', FakeConnection)[1])
+        pool.put('key', conn)
+        self.assertFalse('key' in pool._idle and pool._idle['key'])
+
+    def test_clear(self):
+        pool = client.ConnectionPool()
+        conn = FakeConnection()
+        pool.put('key', conn)
+        pool.clear()
+        self.assertEqual(None, conn.sock)
+        self.assertFalse(pool.get('key', FakeConnection)[1])
+
+
+class TestResend(unittest.TestCase):
+
+    def call(self, actions, calls, pause=0.1):
+        # Make calls getVersion calls on one binding, return the results
+        # or exceptions, and the server.
+        server = ScriptedServer(actions)
+        self.addCleanup(server.close)
+        port = VirtualBox_client.vboxServiceLocator().getvboxServicePort(
+            'http://127.0.0.1:%d/' % server.port,
+            transdict={'timeout': 0.5})
+        self.addCleanup(port.binding.connpool.clear)
+        results = []
+        for i in range(calls):
+            req = VirtualBox_client.IVirtualBox_getVersionRequestMsg()
+            req._this = 'vbox1'
+            try:
+                results.append(port.IVirtualBox_getVersion(req)._returnval)
+            except Exception as e:
+                results.append(e)
+            # Let a close or reset reach the client.
+            time.sleep(pause)
+        return results, server
+
+    def test_keep_alive(self):
+        results, server = self.call(['ok', 'ok', 'ok'], 3)
+        self.assertEqual(['4.3.0'] * 3, results)
+        self.assertEqual(1, server.connections)
+
+    def test_resend_on_closed_reused_connection(self):
+        results, server = self.call(['ok-close', 'ok'], 2)
+        self.assertEqual(['4.3.0'] * 2, results)
+        self.assertEqual(2, server.connections)
+        self.assertEqual(2, len(server.requests))
+
+    def test_resend_on_reset_reused_connection(self):
+        results, server = self.call(['ok-reset', 'ok'], 2)
+        self.assertEqual(['4.3.0'] * 2, results)
+        self.assertEqual(2, server.connections)
+
+    def test_no_resend_on_new_connection(self):
+        results, server = self.call(['drop', 'ok'], 1)
+        self.assertTrue(isinstance(results[0], httplib.BadStatusLine))
+        self.assertEqual(1, len(server.requests))
+
+    def test_no_resend_after_partial_reply(self):
+        results, server = self.call(['ok', 'partial', 'ok'], 2)
+        self.assertEqual('4.3.0', results[0])
+        self.assertTrue(isinstance(results[1], httplib.IncompleteRead))
+        self.assertEqual(2, len(server.requests))
+
+    def test_no_resend_after_partial_status_line(self):
+        results, server = self.call(['ok', 'garbage', 'ok'], 2)
+        self.assertTrue(isinstance(results[1], httplib.BadStatusLine))
+        self.assertEqual(2, len(server.requests))
+
+    def test_no_resend_after_timeout(self):
+        results, server = self.call(['ok', 'hang', 'ok'], 2)
+        self.assertTrue(isinstance(results[1], socket.timeout))
+        self.assertEqual(2, len(server.requests))
+
+
+class TestThreadSafe(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = fakevbox.FakeVBox()
+        self.addCleanup(self.fake.close)
+        self.fake.handlers['IMachine_getName'] = self.get_name
+        self.fake.set_cookie = lambda op, args: 'last=' + args['_this'][0]
+        self.port = VirtualBox_client.vboxServiceLocator().getvboxServicePort(
+            'http://127.0.0.1:%d/' % self.fake.port, threadsafe=True,
+            transdict={'timeout': 5})
+        self.addCleanup(self.port.binding.connpool.clear)
+
+    def get_name(self, args):
+        # Keep calls in flight together.
+        time.sleep(random.random() * 0.005)
+        return 'name-' + args['_this'][0]
+
+    def call(self, handle):
+        req = VirtualBox_client.IMachine_getNameRequestMsg()
+        req._this = handle
+        return self.port.IMachine_getName(req)._returnval
+
+    def parallel(self, threads=8, calls=40):
+        # Make calls calls from each of threads threads, return the
+        # handles and results, or exceptions.
+        results = []
+
+        def run(n):
+            for i in range(calls):
+                handle = 'm%d-%d' % (n, i)
+                try:
+                    results.append((handle, self.call(handle)))
+                except Exception as e:
+                    results.append((handle, e))
+
+        threads = [threading.Thread(target=run, args=(n,))
+                   for n in range(threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_parallel_calls(self):
+        results = self.parallel()
+        self.assertEqual(320, len(results))
+        for handle, name in results:
+            self.assertEqual('name-' + handle, name)
+        # The calls did overlap.
+        self.assertTrue(len(self.port.binding.connpool._idle.values()[0]) > 1)
+
+    def test_parallel_cookies(self):
+        # Cookies set by replies in other threads are sent whole.
+        self.parallel()
+        for headers in self.fake.cookies:
+            self.assertTrue(len(headers) <= 1)
+            for header in headers:
+                self.assertTrue(re.match(r'^last=m\d+-\d+$', header), header)
+        self.assertTrue(re.match(r'^m\d+-\d+$',
+                                 self.port.binding.cookies['last'].value))
+        self.assertEqual(320, len(self.fake.cookies))
+        self.assertTrue(len([h for h in self.fake.cookies if h]) > 300)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_metrics
+----------------------------------
+
+Tests for `pyremotevbox.metrics`, with NumPy if it is installed and
+always with the plain list fallback.
+"""
+
+import unittest
+
+from pyremotevbox import exception
+from pyremotevbox import metrics
+from tests import fakevbox
+
+
+NUMPY = metrics.numpy
+
+
+class NumPyMixin:
+
+    numpy = NUMPY
+
+    def setUp(self):
+        self.addCleanup(setattr, metrics, 'numpy', metrics.numpy)
+        metrics.numpy = self.numpy
+
+
+class RingBufferTests(NumPyMixin):
+
+    def test_empty(self):
+        buf = metrics.RingBuffer(4)
+        self.assertEqual(0, len(buf))
+        self.assertEqual([], list(buf.values()))
+        self.assertRaises(exception.PyRemoteVBoxException, buf.mean)
+        self.assertRaises(exception.PyRemoteVBoxException, buf.max)
+        self.assertRaises(exception.PyRemoteVBoxException,
+                          buf.percentile, 50)
+
+    def test_partly_filled(self):
+        buf = metrics.RingBuffer(4)
+        buf.extend([1.0, 2.0])
+        buf.extend([])
+        self.assertEqual(2, len(buf))
+        self.assertEqual([1.0, 2.0], list(buf.values()))
+
+    def test_wraparound(self):
+        buf = metrics.RingBuffer(4)
+        buf.extend([1.0, 2.0, 3.0])
+        buf.extend([4.0, 5.0])
+        self.assertEqual(4, len(buf))
+        self.assertEqual([2.0, 3.0, 4.0, 5.0], list(buf.values()))
+        buf.extend([6.0, 7.0, 8.0])
+        self.assertEqual([5.0, 6.0, 7.0, 8.0], list(buf.values()))
+
+    def test_extend_past_size(self):
+        buf = metrics.RingBuffer(4)
+        buf.extend([1.0])
+        buf.extend([float(v) for v in range(10)])
+        self.assertEqual(4, len(buf))
+        self.assertEqual([6.0, 7.0, 8.0, 9.0], list(buf.values()))
+        buf.extend([10.0])
+        self.assertEqual([7.0, 8.0, 9.0, 10.0], list(buf.values()))
+
+    def test_statistics(self):
+        buf = metrics.RingBuffer(8)
+        buf.extend([4.0, 1.0, 3.0, 2.0])
+        self.assertEqual(2.5, buf.mean())
+        self.assertEqual(4.0, buf.max())
+        self.assertEqual(1.0, buf.percentile(0))
+        self.assertEqual(1.75, buf.percentile(25))
+        self.assertEqual(2.5, buf.percentile(50))
+        self.assertEqual(4.0, buf.percentile(100))
+
+    def test_statistics_after_wraparound(self):
+        # Only the samples still held count.
+        buf = metrics.RingBuffer(3)
+        buf.extend([100.0, 1.0, 2.0])
+        buf.extend([3.0])
+        self.assertEqual(2.0, buf.mean())
+        self.assertEqual(3.0, buf.max())
+        self.assertEqual(2.0, buf.percentile(50))
+
+
+@unittest.skipIf(NUMPY is None, 'NumPy is not installed')
+class TestRingBufferNumPy(RingBufferTests, unittest.TestCase):
+
+    pass
+
+
+class TestRingBufferList(RingBufferTests, unittest.TestCase):
+
+    numpy = None
+
+
+class MetricsCollectorTests(NumPyMixin):
+
+    def setUp(self):
+        NumPyMixin.setUp(self)
+        self.fake = fakevbox.FakeVBox()
+        self.addCleanup(self.fake.close)
+        self.replies = []
+        self.fake.handlers.update({
+            'IVirtualBox_getPerformanceCollector':
+                lambda args: 'collector1',
+            'IPerformanceCollector_setupMetrics': lambda args: ['metric1'],
+            'IPerformanceCollector_queryMetricsData':
+                lambda args: self.replies.pop(0),
+        })
+        self.host = self.fake.host()
+        self.collector = metrics.MetricsCollector(
+            self.host, ['CPU/Load/User'], ['machine-a', 'machine-b'],
+            size=4)
+
+    def reply(self, *series):
+        # One queryMetricsData reply of (object, scale, first sequence
+        # number, values) series.
+        reply = {'returnMetricNames': [], 'returnObjects': [],
+                 'returnUnits': [], 'returnScales': [],
+                 'returnSequenceNumbers': [], 'returnDataIndices': [],
+                 'returnDataLengths': [], 'returnval': []}
+        for obj, scale, first, values in series:
+            reply['returnMetricNames'].append('CPU/Load/User')
+            reply['returnObjects'].append(obj)
+            reply['returnUnits'].append('%')
+            reply['returnScales'].append(scale)
+            reply['returnSequenceNumbers'].append(first)
+            reply['returnDataIndices'].append(len(reply['returnval']))
+            reply['returnDataLengths'].append(len(values))
+            reply['returnval'].extend(values)
+        self.replies.append(reply)
+
+    def values(self, obj):
+        return list(self.collector.buffer(obj, 'CPU/Load/User').values())
+
+    def test_setup(self):
+        args = self.fake.args('IPerformanceCollector_setupMetrics')[0]
+        self.assertEqual(['collector1'], args['_this'])
+        self.assertEqual(['machine-a', 'machine-b'], args['objects'])
+        self.assertEqual(['metric1'],
+                         self.fake.args('IManagedObjectRef_release')[0]
+                         ['_this'])
+
+    def test_poll(self):
+        self.reply(('machine-a', 1, 0, [10, 20, 30]),
+                   ('machine-b', 100, 0, [150, 250]))
+        self.assertEqual(5, self.collector.poll())
+        self.assertEqual([10.0, 20.0, 30.0], self.values('machine-a'))
+        self.assertEqual([1.5, 2.5], self.values('machine-b'))
+        self.assertEqual(20.0, self.collector.mean('machine-a',
+                                                   'CPU/Load/User'))
+        self.assertEqual(2.5, self.collector.max('machine-b',
+                                                 'CPU/Load/User'))
+        self.assertEqual(25.0, self.collector.percentile(
+            'machine-a', 'CPU/Load/User', 75))
+
+    def test_poll_skips_samples_seen(self):
+        # Each reply repeats the samples still held by VirtualBox.
+        self.reply(('machine-a', 1, 0, [10, 20, 30]))
+        self.reply(('machine-a', 1, 1, [20, 30, 40]))
+        self.reply(('machine-a', 1, 1, [20, 30, 40]))
+        self.reply(('machine-a', 1, 3, [40, 50, 60]))
+        self.assertEqual(3, self.collector.poll())
+        self.assertEqual(1, self.collector.poll())
+        self.assertEqual(0, self.collector.poll())
+        self.assertEqual(2, self.collector.poll())
+        self.assertEqual([30.0, 40.0, 50.0, 60.0], self.values('machine-a'))
+
+    def test_poll_after_gap(self):
+        # Samples lost between polls are not waited for.
+        self.reply(('machine-a', 1, 0, [10, 20]))
+        self.reply(('machine-a', 1, 10, [30, 40]))
+        self.assertEqual(2, self.collector.poll())
+        self.assertEqual(2, self.collector.poll())
+        self.assertEqual([10.0, 20.0, 30.0, 40.0], self.values('machine-a'))
+
+    def test_no_samples(self):
+        self.reply()
+        self.assertEqual(0, self.collector.poll())
+        self.assertRaises(exception.PyRemoteVBoxException,
+                          self.collector.mean, 'machine-a', 'CPU/Load/User')
+
+    def test_close(self):
+        self.collector.close()
+        self.assertEqual(['collector1'],
+                         self.fake.args('IManagedObjectRef_release')[-1]
+                         ['_this'])
+
+
+@unittest.skipIf(NUMPY is None, 'NumPy is not installed')
+class TestMetricsCollectorNumPy(MetricsCollectorTests, unittest.TestCase):
+
+    pass
+
+
+class TestMetricsCollectorList(MetricsCollectorTests, unittest.TestCase):
+
+    numpy = None
+
+
+if __name__ == '__main__':
+    unittest.main()
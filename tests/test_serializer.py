@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_serializer
+----------------------------------
+
+Tests that `ElementSerializer` writes request messages byte for byte
+like `SoapWriter`, and leaves the ones it can not write to it, and that
+`SoapWriter` without multiref writes every reference out.
+"""
+
+import unittest
+
+from pyremotevbox import VirtualBox_client
+from pyremotevbox.ZSI import EvaluateException, TC, TCcompound
+from pyremotevbox.ZSI.parse import ParsedSoap
+from pyremotevbox.ZSI.writer import ElementSerializer, SoapWriter
+
+
+def request(op, **kwargs):
+    msg = getattr(VirtualBox_client, op + 'RequestMsg')()
+    for name, value in kwargs.items():
+        setattr(msg, name, value)
+    return msg
+
+
+def soap_writer(msg):
+    sw = SoapWriter(header=True)
+    sw.serialize(msg, TC.Any(pname='request', aslist=False))
+    return str(sw)
+
+
+class Named(str):
+
+    typecode = TC.String(pname='name')
+
+
+class TestElementSerializer(unittest.TestCase):
+
+    def serialize(self, msg):
+        serializer = ElementSerializer.Get(msg.typecode)
+        self.assertTrue(serializer is not None)
+        return serializer.serialize(msg)
+
+    def assertSameOutput(self, msg):
+        data = self.serialize(msg)
+        self.assertEqual(soap_writer(msg), data)
+        return data
+
+    def test_string(self):
+        data = self.assertSameOutput(
+            request('IMachine_setName', _this='m1', _name='vm1'))
+        self.assertTrue('<_this>m1</_this><name>vm1</name>' in data)
+
+    def test_array(self):
+        self.assertSameOutput(
+            request('IVirtualBox_getMachineStates', _this='vb',
+                    _machines=['m1', 'm2', 'm3']))
+        self.assertSameOutput(
+            request('IVirtualBox_getMachineStates', _this='vb',
+                    _machines=('m1',)))
+
+    def test_empty_array(self):
+        self.assertSameOutput(
+            request('IVirtualBox_getMachineStates', _this='vb',
+                    _machines=[]))
+
+    def test_empty_element(self):
+        self.assertSameOutput(
+            request('IMachine_setName', _this='m1', _name=''))
+
+    def test_missing_optional_element(self):
+        self.assertSameOutput(
+            request('IVirtualBox_getMachineStates', _this='vb',
+                    _machines=None))
+
+    def test_entities(self):
+        data = self.assertSameOutput(
+            request('IMachine_setName', _this='m1',
+                    _name='<a&b> "c" \'d\' ]]>\r\n\t'))
+        self.assertTrue('&lt;a&amp;b&gt;' in data)
+
+    def test_unicode(self):
+        self.assertSameOutput(
+            request('IMachine_setName', _this='m1',
+                    _name=u'\xe9€ \U0001f4bb'))
+        self.assertSameOutput(
+            request('IMachine_setName', _this='m1',
+                    _name='\xc3\xa9\xe2\x82\xac'))
+
+    def test_not_a_string(self):
+        self.assertSameOutput(
+            request('IMachine_setName', _this='m1', _name=5))
+
+    def test_integer(self):
+        self.assertSameOutput(
+            request('IMachine_setBootOrder', _this='m1', _position=1,
+                    _device='HardDisk'))
+        self.assertSameOutput(
+            request('IFile_writeAt', _this='f1', _offset=2 ** 40,
+                    _data='', _timeoutMS=0))
+
+    def test_integer_overflow(self):
+        # Neither checks ranges on the way out.
+        for value in [2 ** 32, 2 ** 70, -1]:
+            self.assertSameOutput(
+                request('IMachine_setMemorySize', _this='m1',
+                        _memorySize=value))
+
+    def test_boolean(self):
+        for value in [True, False, 0, 1]:
+            self.assertSameOutput(
+                request('IMachine_setAccelerate3DEnabled', _this='m1',
+                        _accelerate3DEnabled=value))
+
+    def test_base64(self):
+        data = ''.join(chr(i) for i in range(256)) * 4
+        for value in [data, bytearray(data), '', bytearray()]:
+            self.assertSameOutput(
+                request('IFile_writeAt', _this='f1', _offset=0,
+                        _data=value, _timeoutMS=0))
+
+    def test_extra_children(self):
+        msg = request('IMachine_setName', _this='m1', _name='vm1')
+        msg.extra = 'ignored'
+        self.assertSameOutput(msg)
+
+    def test_fallback_nil(self):
+        msg = request('IMachine_setName', _this='m1', _name=None)
+        self.assertEqual(None, self.serialize(msg))
+        self.assertRaises(EvaluateException, soap_writer, msg)
+
+    def test_fallback_self_describing(self):
+        msg = request('IMachine_setName', _this='m1', _name=Named('vm1'))
+        self.assertEqual(None, self.serialize(msg))
+
+    def test_fallback_typecode(self):
+        msg = request('IMachine_setName', _this='m1', _name='vm1')
+        msg.typecode = msg.typecode
+        self.assertEqual(None, self.serialize(msg))
+
+
+class Pair:
+
+    pass
+
+
+class TestMultiref(unittest.TestCase):
+
+    typecode = TCcompound.ComplexType(Pair, [
+        TC.String(pname='first', aname='first', unique=False),
+        TC.String(pname='second', aname='second', unique=False),
+        TC.String(pname='third', aname='third', unique=False),
+    ], pname=('urn:test', 'Pair'))
+
+    def serialize(self, pyobj, **kw):
+        sw = SoapWriter(header=False, **kw)
+        sw.serialize(pyobj, self.typecode)
+        return str(sw)
+
+    def pair(self):
+        pyobj = Pair()
+        pyobj.first = pyobj.second = pyobj.third = 'shared value'
+        return pyobj
+
+    def test_default_multiref(self):
+        pyobj = self.pair()
+        data = self.serialize(pyobj)
+        objid = 'o%x' % id(pyobj.first)
+        self.assertTrue('<first id="%s" xsi:type="xsd:string">shared value'
+                        '</first><second href="#%s"></second>'
+                        '<third href="#%s"></third>' % ((objid,) * 3)
+                        in data)
+
+    def test_multiref_off(self):
+        data = self.serialize(self.pair(), multiref=False)
+        self.assertTrue('<first xsi:type="xsd:string">shared value</first>'
+                        '<second xsi:type="xsd:string">shared value</second>'
+                        '<third xsi:type="xsd:string">shared value</third>'
+                        in data)
+        self.assertFalse(' id="' in data)
+        self.assertFalse('href=' in data)
+
+    def test_multiref_off_parses(self):
+        pyobj = ParsedSoap(self.serialize(self.pair(), multiref=False)).Parse(
+            self.typecode)
+        self.assertEqual(['shared value'] * 3,
+                         [pyobj.first, pyobj.second, pyobj.third])
+
+    def test_multiref_is_per_writer(self):
+        pyobj = self.pair()
+        self.assertFalse('href=' in self.serialize(pyobj, multiref=False))
+        self.assertTrue('href=' in self.serialize(pyobj))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_streaming
+----------------------------------
+
+Tests that `StreamingReader` parses replies to the same results, and
+fails with the same errors, as the DOM reader.
+"""
+
+import unittest
+
+from pyremotevbox import VirtualBox_client
+from pyremotevbox.ZSI import TC, TCcompound
+from pyremotevbox.ZSI.parse import ParsedSoap, StreamingReader
+
+
+ENVELOPE = (
+    '<SOAP-ENV:Envelope'
+    ' xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' xmlns:xsd="http://www.w3.org/2001/XMLSchema"'
+    ' xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"'
+    ' xmlns:vbox="http://www.virtualbox.org/">'
+    '%s<SOAP-ENV:Body>%s</SOAP-ENV:Body></SOAP-ENV:Envelope>')
+
+
+def reply(op, content, header=''):
+    return ENVELOPE % (header, '<vbox:%sResponse>%s</vbox:%sResponse>' %
+                       (op, content, op))
+
+
+def result_typecode(op):
+    return getattr(VirtualBox_client, op + 'ResultMsg').typecode
+
+
+def parse(message, typecode, readerclass):
+    ps = ParsedSoap(message, readerclass=readerclass)
+    try:
+        result = ps.Parse(typecode)
+    except Exception as e:
+        # The element trace is written differently by the two readers.
+        return ps, (e.__class__, str(e).split('\n')[0])
+    return ps, getattr(result, '__dict__', result)
+
+
+class TestStreamingReader(unittest.TestCase):
+
+    def assertSameResult(self, message, typecode, streamed=True):
+        dom_ps, expected = parse(message, typecode, None)
+        ps, result = parse(message, typecode, StreamingReader)
+        self.assertEqual(expected, result)
+        self.assertEqual(type(expected), type(result))
+        self.assertEqual(streamed, ps.dom is None)
+        return result
+
+    def assertSameError(self, message, typecode, error):
+        result = self.assertSameResult(message, typecode)
+        self.assertEqual(error, result[1])
+
+    def test_string(self):
+        result = self.assertSameResult(
+            reply('IMachine_getName', '<returnval>vm1</returnval>'),
+            result_typecode('IMachine_getName'))
+        self.assertEqual({'_returnval': 'vm1'}, result)
+
+    def test_array(self):
+        self.assertSameResult(
+            reply('IVirtualBox_getMachines',
+                  '<returnval>m1</returnval><returnval/>'
+                  '<returnval>m3</returnval>'),
+            result_typecode('IVirtualBox_getMachines'))
+        self.assertSameResult(
+            reply('IVirtualBox_getMachineStates',
+                  '<returnval>Running</returnval>'
+                  '<returnval>PoweredOff</returnval>'),
+            result_typecode('IVirtualBox_getMachineStates'))
+
+    def test_empty_array(self):
+        result = self.assertSameResult(
+            reply('IVirtualBox_getMachines', ''),
+            result_typecode('IVirtualBox_getMachines'))
+        self.assertEqual({'_returnval': []}, result)
+
+    def test_empty_element(self):
+        result = self.assertSameResult(
+            reply('IMachine_getName', '<returnval/>'),
+            result_typecode('IMachine_getName'))
+        self.assertEqual({'_returnval': ''}, result)
+        self.assertSameError(
+            reply('IMachine_getMemorySize', '<returnval></returnval>'),
+            result_typecode('IMachine_getMemorySize'),
+            'Requiredinteger missing')
+
+    def test_missing_element(self):
+        self.assertSameError(
+            reply('IMachine_getName', ''),
+            result_typecode('IMachine_getName'),
+            'Element "_returnval" missing from complexType')
+
+    def test_entities(self):
+        result = self.assertSameResult(
+            reply('IMachine_getName',
+                  '<returnval>&lt;a&amp;b&gt; &quot;&#233;&#x20ac;</returnval>'),
+            result_typecode('IMachine_getName'))
+        self.assertEqual({'_returnval': '<a&b> "\xc3\xa9\xe2\x82\xac'}, result)
+
+    def test_unicode(self):
+        self.assertSameResult(
+            reply('IMachine_getName',
+                  '<returnval>\xc3\xa9\xe2\x82\xac \xf0\x9f\x92\xbb</returnval>'),
+            result_typecode('IMachine_getName'))
+
+    def test_boolean(self):
+        for text in ['true', 'TRUE', '0']:
+            self.assertSameResult(
+                reply('IMachine_getAccessible',
+                      '<returnval>%s</returnval>' % text),
+                result_typecode('IMachine_getAccessible'))
+
+    def test_integer(self):
+        self.assertSameResult(
+            reply('IMachine_getMemorySize', '<returnval>4294967295</returnval>'),
+            result_typecode('IMachine_getMemorySize'))
+
+    def test_integer_overflow(self):
+        self.assertSameError(
+            reply('IMachine_getMemorySize', '<returnval>4294967296</returnval>'),
+            result_typecode('IMachine_getMemorySize'),
+            'Overflow, greater than 4294967295L')
+        self.assertSameError(
+            reply('IMachine_getMemorySize', '<returnval>-1</returnval>'),
+            result_typecode('IMachine_getMemorySize'),
+            'Underflow, less than 0')
+
+    def test_base64(self):
+        data = ''.join(chr(i) for i in range(256)) * 40
+        text = data.encode('base64')
+        result = self.assertSameResult(
+            reply('IMachine_readLog', '<returnval>%s</returnval>' % text),
+            result_typecode('IMachine_readLog'))
+        self.assertEqual(bytearray(data), result['_returnval'])
+
+    def test_empty_base64(self):
+        result = self.assertSameResult(
+            reply('IMachine_readLog', '<returnval/>'),
+            result_typecode('IMachine_readLog'))
+        self.assertEqual(bytearray(), result['_returnval'])
+
+    def test_nil(self):
+        typecode = TCcompound.ComplexType(None, [
+            TC.String(pname='name', aname='name', nillable=True),
+            TC.Integer(pname='size', aname='size', nillable=True),
+        ], pname=('urn:test', 'Result'))
+        self.assertSameResult(
+            ENVELOPE % ('', '<t:Result xmlns:t="urn:test">'
+                            '<name xsi:nil="true"/><size xsi:nil="1"/>'
+                            '</t:Result>'),
+            typecode)
+
+    def test_nil_not_nillable(self):
+        self.assertSameError(
+            reply('IMachine_getName', '<returnval xsi:nil="true"/>'),
+            result_typecode('IMachine_getName'),
+            'Non-nillable element is NIL')
+
+    def test_extra_children(self):
+        result = self.assertSameResult(
+            reply('IMachine_getName',
+                  '<returnval>vm1</returnval><extra><more>x</more></extra>'),
+            result_typecode('IMachine_getName'))
+        self.assertEqual({'_returnval': 'vm1'}, result)
+
+    def test_fallback_xsi_type(self):
+        self.assertSameResult(
+            reply('IMachine_getName',
+                  '<returnval xsi:type="xsd:string">vm1</returnval>'),
+            result_typecode('IMachine_getName'), streamed=False)
+
+    def test_fallback_header(self):
+        self.assertSameResult(
+            reply('IMachine_getName', '<returnval>vm1</returnval>',
+                  header='<SOAP-ENV:Header></SOAP-ENV:Header>'),
+            result_typecode('IMachine_getName'), streamed=False)
+
+    def test_fallback_fault(self):
+        message = ENVELOPE % ('', '<SOAP-ENV:Fault><faultcode>SOAP-ENV:Server'
+                                  '</faultcode><faultstring>failed'
+                                  '</faultstring></SOAP-ENV:Fault>')
+        ps = ParsedSoap(message, readerclass=StreamingReader)
+        self.assertTrue(ps.dom is not None)
+        self.assertTrue(ps.IsAFault())
+
+
+if __name__ == '__main__':
+    unittest.main()
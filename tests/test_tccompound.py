@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_tccompound
+----------------------------------
+
+Tests that `ComplexType.parse` finds children by name the same way
+whether it looks them up by local name or, for inorder complexTypes and
+global element declarations, visits every child.
+"""
+
+import unittest
+
+from pyremotevbox.ZSI import EvaluateException, TC, TCcompound
+from pyremotevbox.ZSI.parse import ParsedSoap
+from pyremotevbox.ZSI.schema import ElementDeclaration
+
+
+NS = 'urn:test-tccompound'
+
+ENVELOPE = (
+    '<SOAP-ENV:Envelope'
+    ' xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"'
+    ' xmlns:t="%s"><SOAP-ENV:Body><t:Result>%%s</t:Result>'
+    '</SOAP-ENV:Body></SOAP-ENV:Envelope>' % NS)
+
+
+class NameDecl(TC.String, ElementDeclaration):
+
+    schema = NS
+    literal = 'name'
+
+    def __init__(self, **kw):
+        kw.setdefault('pname', (self.schema, self.literal))
+        kw.setdefault('aname', '_name')
+        TC.String.__init__(self, **kw)
+
+
+class AliasDecl(TC.String, ElementDeclaration):
+
+    schema = NS
+    literal = 'alias'
+    substitutionGroup = (NS, 'name')
+
+    def __init__(self, **kw):
+        kw.setdefault('pname', (self.schema, self.literal))
+        kw.setdefault('aname', '_alias')
+        TC.String.__init__(self, **kw)
+
+
+def fields(declared):
+    # The same fields, name as a global element declaration if declared.
+    if declared:
+        name = NameDecl(minOccurs=0)
+    else:
+        name = TC.String(pname=(NS, 'name'), aname='_name', minOccurs=0)
+    return [
+        name,
+        TC.Integer(pname=(NS, 'size'), aname='_size', minOccurs=0),
+        TC.String(pname=(NS, 'item'), aname='_item', minOccurs=0,
+                  maxOccurs='unbounded'),
+    ]
+
+
+def result(ofwhat, **kw):
+    return TCcompound.ComplexType(None, ofwhat, pname=(NS, 'Result'), **kw)
+
+
+def parse(content, typecode):
+    return ParsedSoap(ENVELOPE % content).Parse(typecode)
+
+
+class TestComplexTypeParse(unittest.TestCase):
+
+    def assertSameResult(self, content, any=False):
+        # Parse content looking children up by name, and visiting all of
+        # them for the name field, return the result.
+        results = []
+        for declared in [False, True]:
+            ofwhat = fields(declared)
+            if any:
+                ofwhat.append(TC.AnyElement(aname='_any', minOccurs=0,
+                                            maxOccurs='unbounded',
+                                            processContents='lax'))
+            results.append(parse(content, result(ofwhat)))
+        self.assertEqual(results[0], results[1])
+        return results[0]
+
+    def test_in_order(self):
+        self.assertEqual(
+            {'_name': 'vm1', '_size': 2, '_item': ['a', 'b']},
+            self.assertSameResult('<t:name>vm1</t:name><t:size>2</t:size>'
+                                  '<t:item>a</t:item><t:item>b</t:item>'))
+
+    def test_out_of_order(self):
+        self.assertEqual(
+            {'_name': 'vm1', '_size': 2, '_item': ['a']},
+            self.assertSameResult('<t:item>a</t:item><t:size>2</t:size>'
+                                  '<t:name>vm1</t:name>'))
+
+    def test_repeated_element(self):
+        # Repeated fields keep document order, others take the first.
+        self.assertEqual(
+            {'_name': 'vm1', '_item': ['a', 'b', 'c']},
+            self.assertSameResult('<t:item>a</t:item><t:name>vm1</t:name>'
+                                  '<t:item>b</t:item><t:name>vm2</t:name>'
+                                  '<t:item>c</t:item>'))
+
+    def test_other_namespace(self):
+        self.assertEqual(
+            {'_name': 'vm1'},
+            self.assertSameResult('<name xmlns="urn:other">other</name>'
+                                  '<t:name>vm1</t:name>'))
+
+    def test_unknown_element(self):
+        self.assertEqual(
+            {'_name': 'vm1'},
+            self.assertSameResult('<t:extra>x</t:extra><t:name>vm1</t:name>'))
+
+    def test_unknown_element_any(self):
+        value = self.assertSameResult(
+            '<t:extra>x</t:extra><t:name>vm1</t:name><t:size>2</t:size>'
+            '<t:name>vm2</t:name>', any=True)
+        self.assertEqual('vm1', value['_name'])
+        self.assertEqual(2, value['_size'])
+        self.assertEqual(2, len(value['_any']))
+
+    def test_any_without_leftovers(self):
+        value = self.assertSameResult('<t:name>vm1</t:name>', any=True)
+        self.assertEqual([], value['_any'])
+
+    def test_missing_element(self):
+        typecode = result([TC.String(pname=(NS, 'name'), aname='_name')])
+        try:
+            parse('<t:size>2</t:size>', typecode)
+        except EvaluateException as e:
+            self.assertEqual('Element "_name" missing from complexType',
+                             str(e).split('\n')[0])
+        else:
+            self.fail('no EvaluateException')
+
+    def test_substitution_group(self):
+        # Only found by visiting every child.
+        self.assertEqual(
+            {'_name': 'vm1'},
+            parse('<t:alias>vm1</t:alias>', result([NameDecl()])))
+
+    def test_inorder(self):
+        ofwhat = fields(False)
+        self.assertEqual(
+            {'_name': 'vm1', '_size': 2, '_item': ['a']},
+            parse('<t:name>vm1</t:name><t:size>2</t:size><t:item>a</t:item>',
+                  result(ofwhat, inorder=True)))
+        self.assertRaises(EvaluateException, parse,
+                          '<t:size>2</t:size><t:name>vm1</t:name>',
+                          result(ofwhat, inorder=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
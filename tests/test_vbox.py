@@ -0,0 +1,775 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_vbox
+----------------------------------
+
+Tests for `pyremotevbox.vbox` against a local fake vboxwebsrv.
+"""
+
+import Queue
+import itertools
+import threading
+import time
+import unittest
+
+from pyremotevbox import exception
+from pyremotevbox import vbox
+from tests import fakevbox
+
+
+class FakeVBoxTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.fake = fakevbox.FakeVBox()
+        self.addCleanup(self.fake.close)
+        self.handlers = self.fake.handlers
+        sessions = itertools.count()
+        self.handlers.update({
+            'IVirtualBox_findMachine':
+                lambda args: 'machine-' + args['nameOrId'][0],
+            'IWebsessionManager_getSessionObject':
+                lambda args: 'session%d' % next(sessions),
+            'IMachine_lockMachine': lambda args: None,
+            'ISession_unlockMachine': lambda args: None,
+        })
+        self.host = self.fake.host()
+
+
+class TestProgress(FakeVBoxTestCase):
+
+    def setUp(self):
+        super(TestProgress, self).setUp()
+        self.handlers.update({
+            'IVirtualBox_getMachineStates':
+                lambda args: ['PoweredOff' for m in args['machines']],
+            'IMachine_launchVMProcess': lambda args: 'progress1',
+            'IProgress_waitForCompletion': lambda args: None,
+            'IProgress_getCompleted': lambda args: 'true',
+            'IProgress_getResultCode': lambda args: '0',
+        })
+        self.vm = self.host.find_vm('vm1')
+
+    def test_start(self):
+        self.vm.start()
+        self.assertEqual(['5000'], self.fake.args(
+            'IProgress_waitForCompletion')[0]['timeout'])
+        self.assertFalse('progress1' in self.host.refs)
+
+    def test_failed_progress_reports_code_and_text(self):
+        self.handlers.update({
+            'IProgress_getResultCode': lambda args: '-2135228409',
+            'IProgress_getErrorInfo': lambda args: 'errorinfo1',
+            'IVirtualBoxErrorInfo_getText':
+                lambda args: 'VM failed to start',
+        })
+        try:
+            self.vm.start()
+        except exception.PyRemoteVBoxException as e:
+            self.assertTrue('-2135228409' in str(e))
+            self.assertTrue('VM failed to start' in str(e))
+        else:
+            self.fail('start() did not fail')
+        self.assertFalse('progress1' in self.host.refs)
+        self.assertFalse('errorinfo1' in self.host.refs)
+
+    def test_failed_progress_without_error_info(self):
+        self.handlers.update({
+            'IProgress_getResultCode': lambda args: '-2135228409',
+            'IProgress_getErrorInfo': lambda args: '',
+        })
+        try:
+            self.vm.start()
+        except exception.PyRemoteVBoxException as e:
+            self.assertTrue('result code -2135228409.' in str(e))
+        else:
+            self.fail('start() did not fail')
+
+    def test_timeout(self):
+        self.handlers['IProgress_getCompleted'] = lambda args: 'false'
+        try:
+            self.vm.start(timeout=0.5)
+        except exception.PyRemoteVBoxException as e:
+            self.assertTrue('within 0.5 seconds' in str(e))
+        else:
+            self.fail('start() did not fail')
+        self.assertEqual(['500'], self.fake.args(
+            'IProgress_waitForCompletion')[-1]['timeout'])
+
+
+class TestGuestProcess(FakeVBoxTestCase):
+
+    def setUp(self):
+        super(TestGuestProcess, self).setUp()
+        self.write_started = threading.Event()
+        self.write_done = threading.Event()
+        self.handlers.update({
+            'IVirtualBox_getMachineStates':
+                lambda args: ['Running' for m in args['machines']],
+            'ISession_getConsole': lambda args: 'console1',
+            'IConsole_getGuest': lambda args: 'guest1',
+            'IGuest_createSession': lambda args: 'guestsession1',
+            'IGuestSession_waitForArray': lambda args: 'Start',
+            'IGuestSession_processCreate': lambda args: 'process1',
+            'IGuestSession_close': lambda args: None,
+            'IProcess_write': self.write,
+            'IProcess_waitForArray': lambda args: 'Timeout',
+            'IProcess_terminate': lambda args: None,
+        })
+        self.vm = self.host.find_vm('vm1')
+
+    def write(self, args):
+        self.write_started.set()
+        self.write_done.wait(5)
+        return len(args['data'][0].decode('base64'))
+
+    def test_close_stops_stdin_first(self):
+        process = self.vm.guest.run(['/bin/cat'])
+        futures = [process.write(data) for data in ['one', 'two', 'six']]
+        self.assertTrue(self.write_started.wait(5))
+
+        closer = threading.Thread(target=process.close)
+        closer.start()
+        while not process.closing:
+            time.sleep(0.01)
+        self.write_done.set()
+        closer.join()
+
+        self.assertEqual(3, futures[0].result(5))
+        for future in futures[1:]:
+            self.assertTrue(isinstance(future.exception(5),
+                                       exception.PyRemoteVBoxException))
+        self.assertEqual(
+            ['IProcess_write', 'IProcess_terminate', 'IGuestSession_close'],
+            self.fake.ops('IProcess_write', 'IProcess_terminate',
+                          'IGuestSession_close'))
+        self.assertFalse('process1' in self.host.refs)
+        self.assertFalse('guestsession1' in self.host.refs)
+
+        future = process.write('late')
+        self.assertTrue(isinstance(future.exception(5),
+                                   exception.PyRemoteVBoxException))
+        self.assertEqual(1, len(self.fake.args('IProcess_write')))
+
+    def test_with_closes_session(self):
+        self.write_done.set()
+        with self.vm.guest.run(['/bin/true']) as process:
+            self.assertTrue('process1' in self.host.refs)
+        self.assertEqual(None, process.session.session_id)
+        self.assertEqual(['IProcess_terminate', 'IGuestSession_close'],
+                         self.fake.ops('IProcess_terminate',
+                                       'IGuestSession_close'))
+        self.assertFalse('process1' in self.host.refs)
+
+
+class TestWorkerPool(unittest.TestCase):
+
+    def test_shutdown_runs_queued_operations(self):
+        pool = vbox.WorkerPool(2)
+        futures = [pool.submit(time.sleep, 0.01) for i in range(6)]
+        pool.shutdown(wait=True)
+        self.assertTrue(all(future.done() for future in futures))
+        self.assertFalse(any(thread.is_alive() for thread in pool.threads))
+
+    def test_submit_after_shutdown(self):
+        pool = vbox.WorkerPool(2)
+        pool.shutdown()
+        self.assertRaises(exception.PyRemoteVBoxException,
+                          pool.submit, time.sleep, 0)
+
+
+class TestHostClose(FakeVBoxTestCase):
+
+    def test_close(self):
+        self.handlers['IMachine_getName'] = lambda args: 'vm1'
+        with self.host as host:
+            futures = [host.submit('get_name', 'vm1') for i in range(8)]
+            threads = list(host.executor.threads)
+        self.assertEqual(['vm1'] * 8,
+                         [future.result(5) for future in futures])
+        self.assertEqual(None, self.host.executor)
+        self.assertFalse(any(thread.is_alive() for thread in threads))
+        self.assertEqual({}, self.host.port.binding.connpool._idle)
+
+        # The websession is still logged on.
+        self.assertEqual('vm1', self.host.find_vm('vm1').get_name())
+
+
+class TestDisplay(FakeVBoxTestCase):
+
+    def setUp(self):
+        super(TestDisplay, self).setUp()
+        # Each tick takes the resolution, a thumbnail and a full frame.
+        self.ticks = [
+            (2, 'T1', 'a' * 8),
+            # The resolution changes between getScreenResolution and the
+            # full frame, which is then skipped.
+            (2, 'T2', 'b' * 16),
+            (4, 'T2', 'b' * 16),
+        ]
+        self.tick = None
+        self.handlers.update({
+            'IVirtualBox_getMachineStates':
+                lambda args: ['Running' for m in args['machines']],
+            'ISession_getConsole': lambda args: 'console1',
+            'IConsole_getDisplay': lambda args: 'display1',
+            'IDisplay_getScreenResolution': self.resolution,
+            'IDisplay_takeScreenShotToArray': self.screenshot,
+        })
+        self.vm = self.host.find_vm('vm1')
+
+    def resolution(self, args):
+        self.tick = self.ticks.pop(0)
+        return {'width': self.tick[0], 'height': 1, 'bitsPerPixel': 32,
+                'xOrigin': 0, 'yOrigin': 0}
+
+    def screenshot(self, args):
+        if args['width'] == ['1']:
+            return self.tick[1].encode('base64')
+        return self.tick[2].encode('base64')
+
+    def test_frame_skipped_for_resolution_change_is_taken_again(self):
+        frames = self.vm.display.screenshots(interval=0, thumbnail=(1, 1),
+                                             timeout=5)
+        try:
+            first = next(frames)
+            second = next(frames)
+        finally:
+            frames.close()
+        self.assertEqual((2, 'a' * 8), (first.width, str(bytearray(
+            first.data))))
+        self.assertEqual((4, 'b' * 16), (second.width, str(bytearray(
+            second.data))))
+        self.assertEqual([], self.ticks)
+
+
+class TestFleet(unittest.TestCase):
+
+    def setUp(self):
+        self.vms = [['a', 'b'], ['c', 'b']]
+        self.fakes = []
+        for i, names in enumerate(self.vms):
+            fake = fakevbox.FakeVBox()
+            self.addCleanup(fake.close)
+            fake.handlers.update({
+                'IVirtualBox_getMachines': self.machines(i),
+                'IMachine_getName':
+                    lambda args: args['_this'][0].split('-', 1)[1],
+                'IVirtualBox_getMachineStates':
+                    lambda args: ['Running' for m in args['machines']],
+            })
+            self.fakes.append(fake)
+
+    def machines(self, i):
+        return lambda args: ['h%d-%s' % (i, name) for name in self.vms[i]]
+
+    def fleet(self, **kwargs):
+        return vbox.VirtualBoxFleet(
+            [dict(host='127.0.0.1', port=fake.port) for fake in self.fakes],
+            timeout=5, **kwargs)
+
+    def scans(self):
+        return sum(len(fake.ops('IVirtualBox_getMachines'))
+                   for fake in self.fakes)
+
+    def test_find_vm(self):
+        fleet = self.fleet()
+        self.assertEqual(fleet.hosts[1].url, fleet.find_vm('c').host.url)
+        states = fleet.get_power_states(['a', 'c'])
+        self.assertEqual(('Running', None), states['a'])
+        self.assertEqual(('Running', None), states['c'])
+
+    def test_duplicate_names(self):
+        fleet = self.fleet()
+        try:
+            fleet.find_vm('b')
+        except exception.PyRemoteVBoxException as e:
+            self.assertTrue('several hosts' in str(e))
+        else:
+            self.fail('find_vm() did not fail')
+        state, error = fleet.get_power_states(['b'])['b']
+        self.assertEqual(None, state)
+        self.assertTrue('several hosts' in str(error))
+
+    def test_missing_names_are_remembered(self):
+        fleet = self.fleet()
+        self.assertRaises(exception.PyRemoteVBoxException,
+                          fleet.find_vm, 'new')
+        scans = self.scans()
+        self.assertRaises(exception.PyRemoteVBoxException,
+                          fleet.find_vm, 'new')
+        state, error = fleet.get_power_states(['new'])['new']
+        self.assertTrue('Could not find' in str(error))
+        self.assertEqual(scans, self.scans())
+
+        # Until the next list_vms().
+        self.vms[0].append('new')
+        fleet.list_vms()
+        self.assertEqual(fleet.hosts[0].url, fleet.find_vm('new').host.url)
+
+    def test_missing_names_expire(self):
+        fleet = self.fleet(vm_cache_ttl=0.1)
+        self.assertRaises(exception.PyRemoteVBoxException,
+                          fleet.find_vm, 'new')
+        self.vms[1].append('new')
+        time.sleep(0.2)
+        self.assertEqual(fleet.hosts[1].url, fleet.find_vm('new').host.url)
+
+
+class RecordingHost:
+
+    # Stands in for a VirtualBoxHost, recording the refs released.
+
+    def __init__(self):
+        self.released = []
+
+    def run_command(self, command, request):
+        self.released.append(request._this)
+
+
+class TestManagedObjectRefs(unittest.TestCase):
+
+    def setUp(self):
+        self.host = RecordingHost()
+        self.refs = vbox.ManagedObjectRefs(self.host)
+
+    def test_scope(self):
+        with self.refs.scope():
+            self.refs.track('a')
+            self.refs.track('b')
+            self.refs.track('unscoped', scoped=False)
+        self.assertEqual(['b', 'a'], self.host.released)
+        self.assertEqual(1, len(self.refs))
+        self.assertTrue('unscoped' in self.refs)
+
+    def test_nested_scopes(self):
+        with self.refs.scope():
+            self.refs.track('outer')
+            with self.refs.scope():
+                self.refs.track('inner')
+                # Shared with the outer scope, so it stays.
+                self.refs.track('outer')
+            self.assertEqual(['inner'], self.host.released)
+            self.assertTrue('outer' in self.refs)
+        self.assertEqual(['inner', 'outer'], self.host.released)
+        self.assertEqual(0, len(self.refs))
+
+    def test_double_release(self):
+        self.refs.track('a', scoped=False)
+        self.refs.release(['a'])
+        self.refs.release(['a'])
+        self.assertEqual(['a'], self.host.released)
+
+    def test_release_on_last_use(self):
+        self.refs.track('a', scoped=False)
+        self.refs.track('a', scoped=False)
+        self.refs.release(['a'])
+        self.assertEqual([], self.host.released)
+        self.refs.release(['a'])
+        self.assertEqual(['a'], self.host.released)
+
+    def test_release_on_exception(self):
+        try:
+            with self.refs.scope():
+                self.refs.track('a')
+                with self.refs.scope():
+                    self.refs.track('b')
+                    raise ValueError()
+        except ValueError:
+            pass
+        self.assertEqual(['b', 'a'], self.host.released)
+        self.assertEqual(0, len(self.refs))
+
+    def test_release_all(self):
+        self.refs.track('a', scoped=False)
+        self.refs.track('a', scoped=False)
+        self.refs.track('b', scoped=False)
+        self.refs.release()
+        self.assertEqual(['a', 'b'], sorted(self.host.released))
+        self.assertEqual(0, len(self.refs))
+
+    def test_scopes_are_per_thread(self):
+        def other():
+            self.refs.track('other')
+        with self.refs.scope():
+            thread = threading.Thread(target=other)
+            thread.start()
+            thread.join()
+        self.assertEqual([], self.host.released)
+        self.assertTrue('other' in self.refs)
+
+
+class TestSessionPool(FakeVBoxTestCase):
+
+    def setUp(self):
+        super(TestSessionPool, self).setUp()
+        self.handlers.update({
+            'IVirtualBox_getMachineStates':
+                lambda args: ['PoweredOff' for m in args['machines']],
+            'ISession_getMachine': lambda args: 'mutable1',
+            'IMachine_saveSettings': lambda args: None,
+            'IMachine_discardSettings': lambda args: None,
+        })
+        self.vm = self.host.find_vm('vm1')
+
+    def locked_sessions(self):
+        return [args['session'][0]
+                for args in self.fake.args('IMachine_lockMachine')]
+
+    def fault(self, args):
+        raise Exception('VBOX_E_INVALID_OBJECT_STATE')
+
+    def reconfigure(self):
+        with self.vm.reconfigure():
+            pass
+
+    def test_reuse(self):
+        for i in range(3):
+            self.reconfigure()
+        self.assertEqual(['session0'] * 3, self.locked_sessions())
+        self.assertEqual(['session0'] * 3, [
+            args['_this'][0]
+            for args in self.fake.args('ISession_unlockMachine')])
+        self.assertEqual(
+            1, len(self.fake.ops('IWebsessionManager_getSessionObject')))
+        self.assertEqual(['session0'], self.host.sessions.idle)
+
+    def test_reuse_after_error_in_block(self):
+        try:
+            with self.vm.reconfigure():
+                raise ValueError()
+        except ValueError:
+            pass
+        self.reconfigure()
+        self.assertEqual(['session0'] * 2, self.locked_sessions())
+        self.assertEqual(1, len(self.fake.ops('IMachine_discardSettings')))
+
+    def test_discard_after_lock_fault(self):
+        self.handlers['IMachine_lockMachine'] = self.fault
+        self.assertRaises(exception.PyRemoteVBoxException, self.reconfigure)
+        self.assertFalse('session0' in self.host.refs)
+        self.assertEqual([], self.host.sessions.idle)
+
+        self.handlers['IMachine_lockMachine'] = lambda args: None
+        self.reconfigure()
+        self.assertEqual(['session0', 'session1'], self.locked_sessions())
+        self.assertTrue(
+            {'_this': ['session0']} in self.fake.args(
+                'IManagedObjectRef_release'))
+
+    def test_discard_after_unlock_fault(self):
+        self.handlers['ISession_unlockMachine'] = self.fault
+        self.assertRaises(exception.PyRemoteVBoxException, self.reconfigure)
+        self.assertFalse('session0' in self.host.refs)
+        self.assertEqual([], self.host.sessions.idle)
+
+    def test_maxsize(self):
+        pool = self.host.sessions
+        sessions = [pool.get() for i in range(pool.maxsize + 1)]
+        for session_id in sessions:
+            pool.put(session_id)
+        self.assertEqual(sessions[:-1], pool.idle)
+        self.assertFalse(sessions[-1] in self.host.refs)
+
+    def test_skip_released_session(self):
+        session_id = self.host.sessions.get()
+        self.host.sessions.put(session_id)
+        self.host.refs.release([session_id])
+        self.assertNotEqual(session_id, self.host.sessions.get())
+
+
+class TestMachineCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = vbox.MachineCache(maxsize=2)
+        cache.put('a', 'ref-a')
+        cache.put('b', 'ref-b')
+        self.assertEqual('ref-a', cache.get('a'))
+        cache.put('c', 'ref-c')
+        self.assertEqual(None, cache.get('b'))
+        self.assertEqual('ref-a', cache.get('a'))
+        self.assertEqual('ref-c', cache.get('c'))
+
+    def test_ttl_expiry(self):
+        cache = vbox.MachineCache(ttl=0.05)
+        cache.put('a', 'ref-a')
+        self.assertEqual('ref-a', cache.get('a'))
+        time.sleep(0.1)
+        self.assertEqual(None, cache.get('a'))
+        self.assertEqual(0, len(cache))
+
+    def test_no_ttl(self):
+        cache = vbox.MachineCache(ttl=None)
+        cache.put('a', 'ref-a')
+        self.assertEqual('ref-a', cache.get('a'))
+
+    def test_disabled(self):
+        cache = vbox.MachineCache(maxsize=0)
+        cache.put('a', 'ref-a')
+        self.assertEqual(None, cache.get('a'))
+
+    def test_invalidate(self):
+        cache = vbox.MachineCache()
+        cache.put('a', 'ref-a')
+        cache.put('uuid-a', 'ref-a')
+        cache.put('b', 'ref-b')
+        cache.invalidate('ref-a')
+        self.assertEqual(None, cache.get('a'))
+        self.assertEqual(None, cache.get('uuid-a'))
+        self.assertEqual('ref-b', cache.get('b'))
+        cache.invalidate()
+        self.assertEqual(0, len(cache))
+
+
+class TestStaleMachineRefs(FakeVBoxTestCase):
+
+    def setUp(self):
+        super(TestStaleMachineRefs, self).setUp()
+        self.stale = set()
+        self.found = itertools.count()
+        self.handlers.update({
+            'IVirtualBox_findMachine': self.find,
+            'IMachine_getName': self.name,
+            'IVirtualBox_getMachineStates': self.states,
+        })
+
+    def find(self, args):
+        return 'machine%d-%s' % (next(self.found), args['nameOrId'][0])
+
+    def check(self, ref):
+        if ref in self.stale:
+            raise Exception('Invalid managed object reference "%s"' % ref)
+
+    def name(self, args):
+        self.check(args['_this'][0])
+        return args['_this'][0].split('-', 1)[1]
+
+    def states(self, args):
+        for ref in args['machines']:
+            self.check(ref)
+        return ['PoweredOff' for ref in args['machines']]
+
+    def test_cached(self):
+        self.assertEqual(self.host.find_vm('vm1').handle,
+                         self.host.find_vm('vm1').handle)
+        self.assertEqual(1, len(self.fake.ops('IVirtualBox_findMachine')))
+
+    def test_stale_target(self):
+        vm = self.host.find_vm('vm1')
+        self.stale.add(vm.handle)
+        self.assertRaises(exception.PyRemoteVBoxException, vm.get_name)
+        vm = self.host.find_vm('vm1')
+        self.assertEqual('machine1-vm1', vm.handle)
+        self.assertEqual('vm1', vm.get_name())
+
+    def test_stale_argument(self):
+        vms = [self.host.find_vm('vm1'), self.host.find_vm('vm2')]
+        self.stale.add(vms[1].handle)
+        self.assertRaises(exception.PyRemoteVBoxException,
+                          self.host.get_power_states, vms)
+        # The fault does not say which ref is stale, so all are dropped.
+        self.assertEqual('machine2-vm1', self.host.find_vm('vm1').handle)
+        self.assertEqual('machine3-vm2', self.host.find_vm('vm2').handle)
+
+    def test_other_faults_keep_cache(self):
+        vm = self.host.find_vm('vm1')
+        self.handlers['IMachine_getName'] = self.fault
+        self.assertRaises(exception.PyRemoteVBoxException, vm.get_name)
+        self.assertEqual(vm.handle, self.host.find_vm('vm1').handle)
+
+    def fault(self, args):
+        raise Exception('VBOX_E_OBJECT_NOT_FOUND')
+
+
+class TestMachineStateCache(FakeVBoxTestCase):
+
+    def setUp(self):
+        super(TestMachineStateCache, self).setUp()
+        self.machines = {'a': 'PoweredOff', 'b': 'Running'}
+        self.events = Queue.Queue()
+        self.event_attrs = {}
+        self.event_ids = itertools.count()
+        self.handlers.update({
+            'IVirtualBox_getMachines': lambda args: [
+                'machine-' + name for name in sorted(self.machines)],
+            'IVirtualBox_findMachine': self.find,
+            'IMachine_getId': lambda args: 'id-' + self.name(args),
+            'IMachine_getName': self.name,
+            'IMachine_getSessionState': lambda args: 'Unlocked',
+            'IVirtualBox_getMachineStates': lambda args: [
+                self.machines[ref.split('-', 1)[1]]
+                for ref in args['machines']],
+            'IVirtualBox_getEventSource': lambda args: 'source1',
+            'IEventSource_createListener': lambda args: 'listener1',
+            'IEventSource_registerListener': lambda args: None,
+            'IEventSource_unregisterListener': lambda args: None,
+            'IEventSource_eventProcessed': lambda args: None,
+            'IEventSource_getEvent': self.get_event,
+            'IEvent_getType': self.event_attr('type'),
+            'IMachineEvent_getMachineId': self.event_attr('machine_id'),
+            'IMachineStateChangedEvent_getState': self.event_attr('state'),
+            'ISessionStateChangedEvent_getState': self.event_attr('state'),
+            'IMachineRegisteredEvent_getRegistered':
+                self.event_attr('registered'),
+        })
+        self.cache = vbox.MachineStateCache(self.host, ['get_name'],
+                                            poll_interval=0.05)
+        self.addCleanup(self.cache.stop)
+        self.cache.start()
+        self.assertTrue(self.cache.wait(5))
+
+    def find(self, args):
+        name = args['nameOrId'][0].replace('id-', '')
+        if name not in self.machines:
+            raise Exception('VBOX_E_OBJECT_NOT_FOUND')
+        return 'machine-' + name
+
+    def name(self, args):
+        return args['_this'][0].split('-', 1)[1]
+
+    def get_event(self, args):
+        try:
+            event = self.events.get(timeout=0.05)
+        except Queue.Empty:
+            return ''
+        if isinstance(event, Exception):
+            raise event
+        event_id = 'event%d' % next(self.event_ids)
+        self.event_attrs[event_id] = event
+        return event_id
+
+    def event_attr(self, name):
+        return lambda args: self.event_attrs[args['_this'][0]][name]
+
+    def send(self, event_type, machine, **attrs):
+        attrs.update(type=event_type, machine_id='id-' + machine)
+        self.events.put(attrs)
+
+    def until(self, condition):
+        deadline = time.time() + 5
+        while not condition():
+            self.assertTrue(time.time() < deadline, 'timed out')
+            time.sleep(0.01)
+
+    def test_seed(self):
+        self.assertEqual({'id': 'id-a', 'session_state': 'Unlocked',
+                          'get_name': 'a', 'state': 'PoweredOff'},
+                         self.cache.get('machine-a'))
+        self.assertEqual('Running', self.cache.get_state('machine-b'))
+        self.assertEqual(None, self.cache.get('machine-c'))
+
+    def test_machine_state_changed(self):
+        self.send('OnMachineStateChanged', 'a', state='Running')
+        self.until(lambda: self.cache.get_state('machine-a') == 'Running')
+
+        # get_power_status answers from the cache.
+        self.host.state_cache = self.cache
+        self.addCleanup(setattr, self.host, 'state_cache', None)
+        calls = len(self.fake.ops('IVirtualBox_getMachineStates'))
+        vm = vbox.VirtualBoxVm(self.host, 'machine-a')
+        self.assertEqual('Running', vm.get_power_status())
+        self.assertEqual(
+            calls, len(self.fake.ops('IVirtualBox_getMachineStates')))
+
+    def test_session_state_changed(self):
+        self.send('OnSessionStateChanged', 'b', state='Locked')
+        self.until(lambda: self.cache.get('machine-b')['session_state'] ==
+                   'Locked')
+
+    def test_machine_registered(self):
+        self.machines['c'] = 'PoweredOff'
+        self.send('OnMachineRegistered', 'c', registered='true')
+        self.until(lambda: self.cache.get('machine-c') is not None)
+        self.assertEqual('c', self.cache.get('machine-c')['get_name'])
+
+        self.send('OnMachineRegistered', 'a', registered='false')
+        self.until(lambda: self.cache.get('machine-a') is None)
+        self.assertTrue(self.cache.get('machine-b') is not None)
+
+    def test_failed_lookup_drops_one_entry(self):
+        # Unregistered again before the event is looked at.
+        self.send('OnMachineRegistered', 'gone', registered='true')
+        self.send('OnMachineStateChanged', 'b', state='PoweredOff')
+        self.until(lambda: self.cache.get_state('machine-b') == 'PoweredOff')
+        self.assertTrue(self.cache.get('machine-a') is not None)
+
+    def test_live_calls_after_event_thread_fails(self):
+        self.host.state_cache = self.cache
+        self.addCleanup(setattr, self.host, 'state_cache', None)
+        self.events.put(Exception('vboxwebsrv went away'))
+        self.until(lambda: self.cache.get('machine-a') is None)
+
+        self.machines['a'] = 'Running'
+        calls = len(self.fake.ops('IVirtualBox_getMachineStates'))
+        vm = vbox.VirtualBoxVm(self.host, 'machine-a')
+        self.assertEqual('Running', vm.get_power_status())
+        self.assertEqual(
+            calls + 1, len(self.fake.ops('IVirtualBox_getMachineStates')))
+
+
+class TestLogTail(FakeVBoxTestCase):
+
+    def setUp(self):
+        super(TestLogTail, self).setUp()
+        self.log = ''
+        self.handlers['IMachine_readLog'] = self.read_log
+        self.vm = self.host.find_vm('vm1')
+
+    def read_log(self, args):
+        offset, size = int(args['offset'][0]), int(args['size'][0])
+        return self.log[offset:offset + size].encode('base64')
+
+    def test_lines(self):
+        # Lines across reads of every size.
+        self.log = ''.join('line %d %s\n' % (i, 'x' * (i % 300))
+                           for i in range(2000))
+        self.log += 'last'
+        tail = self.vm.tail_log(follow=False)
+        lines = list(tail)
+        self.assertEqual(2001, len(lines))
+        self.assertTrue(all(type(line) is str for line in lines))
+        self.assertEqual(self.log, ''.join(lines))
+        self.assertEqual('last', lines[-1])
+        self.assertEqual(len(self.log), tail.offset)
+        self.assertTrue(tail.chunk_size > vbox.LOG_CHUNK_MIN)
+
+    def test_follow(self):
+        self.log = 'one\ntwo\nthr'
+        tail = self.vm.tail_log(follow=True, poll_interval=0.01)
+        lines = iter(tail)
+        self.assertEqual(['one\n', 'two\n'], [next(lines), next(lines)])
+        self.log += 'ee\n'
+        self.assertEqual('three\n', next(lines))
+        self.assertEqual(14, tail.offset)
+
+        # A new LogTail carries on from offset.
+        self.log += 'four\n'
+        self.assertEqual(['four\n'], list(self.vm.tail_log(
+            offset=tail.offset, follow=False)))
+
+    def test_truncated(self):
+        self.log = 'old one\nold two\n'
+        lines = iter(self.vm.tail_log(follow=True, poll_interval=0.01))
+        self.assertEqual('old one\n', next(lines))
+        self.assertEqual('old two\n', next(lines))
+
+        # Rotated, to a log shorter than what was read.
+        self.log = 'new\n'
+        self.assertEqual('new\n', next(lines))
+
+    def test_truncated_within_pending(self):
+        self.log = 'one\ntw'
+        lines = iter(self.vm.tail_log(follow=True, poll_interval=0.01))
+        self.assertEqual('one\n', next(lines))
+        self.log = 'new\n'
+        self.assertEqual('new\n', next(lines))
+
+    def test_offset_past_end(self):
+        self.log = 'one\n'
+        self.assertEqual(['one\n'],
+                         list(self.vm.tail_log(offset=10, follow=False)))
+
+
+if __name__ == '__main__':
+    unittest.main()